@@ -324,6 +324,7 @@ class MediaLakeStack(cdk.Stack):
                 asset_table_file_hash_index_arn=props.base_infrastructure.asset_table_file_hash_index_arn,
                 asset_table_asset_id_index_arn=props.base_infrastructure.asset_table_asset_id_index_arn,
                 asset_table_s3_path_index_arn=props.base_infrastructure.asset_table_s3_path_index_arn,
+                asset_table_file_hash_path_index_arn=props.base_infrastructure.asset_table_file_hash_path_index_arn,
                 pipelines_event_bus=props.base_infrastructure.pipelines_event_bus,
                 application_service_events_internal_event_bus=props.base_infrastructure.application_service_events_internal_event_bus,
                 asset_table=props.base_infrastructure.asset_table,
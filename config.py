@@ -615,6 +615,12 @@ class CDKConfig(BaseModel):
         default_factory=DeploymentOptionsConfig
     )
     container_nodes_enabled: bool = False  # Opt-in for container-based pipeline nodes
+    # Number of pipeline executions table GSIs to deploy (0-5). New
+    # deployments create all five with the table. CloudFormation adds only one
+    # GSI per update to an existing table, so a deployment upgraded from a
+    # table without them sets this to the number it already has and raises it
+    # by one per deploy; executions listings use table scans until then.
+    pipeline_executions_index_count: int = Field(default=5, ge=0, le=5)
     upload_portals: UploadPortalsConfig = Field(default_factory=UploadPortalsConfig)
 
     # ── Multi-deployment naming helpers ──────────────────────────────────
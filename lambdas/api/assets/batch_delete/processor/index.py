@@ -1,23 +1,29 @@
 """
 Bulk Delete Step Functions Worker
 ==================================
-Processes single asset deletion within Step Functions Distributed Map.
-Called by Step Functions for each asset in parallel.
+Processes asset deletions within Step Functions Distributed Map.
+Called by Step Functions for each batch of assets in parallel; a whole batch is
+deleted in one pass with AssetDeletionService.delete_assets.
 
-Input:
+Input (Distributed Map ItemBatcher):
 {
-    "jobId": "uuid",
-    "assetId": "inventory-id",
-    "userId": "user-id"
+    "Items": [{"assetId": "inventory-id"}, ...],
+    "BatchInput": {"jobId": "uuid", "userId": "user-id", "totalAssets": 100}
 }
 
 Output:
 {
     "jobId": "uuid",
-    "assetId": "inventory-id",
-    "status": "success" | "error",
-    "error": "error message" (optional)
+    "status": "success" | "error" | "skipped",
+    "results": [
+        {"assetId": "inventory-id", "status": "success" | "error",
+         "error": "error message" (optional)},
+        ...
+    ]
 }
+
+A single-asset input ({"jobId", "assetId", "userId"}) is still accepted and
+answered with the single-asset output ({"jobId", "assetId", "status", ...}).
 """
 
 from __future__ import annotations
@@ -99,15 +105,16 @@ def get_job_key(job_id: str, user_id: str) -> Dict[str, str]:
 @tracer.capture_method
 @tracer.capture_method
 def update_job_progress(
-    job_id: str, user_id: str, success: bool, total_assets: int
+    job_id: str, user_id: str, successful: int, failed: int, total_assets: int
 ) -> None:
     """
-    Atomically increment job progress counters after processing an asset.
+    Atomically increment job progress counters after processing assets.
 
     Args:
         job_id: The job ID
         user_id: The user ID
-        success: Whether the asset was successfully deleted
+        successful: Number of assets successfully deleted
+        failed: Number of assets that failed to delete
         total_assets: Total number of assets in the job
     """
     try:
@@ -119,7 +126,7 @@ def update_job_progress(
         update_expr_parts = [
             "SET #status = :status",
             "updatedAt = :timestamp",
-            "processedAssets = if_not_exists(processedAssets, :zero) + :one",
+            "processedAssets = if_not_exists(processedAssets, :zero) + :processed",
         ]
 
         expr_attr_names = {"#status": "status"}
@@ -127,18 +134,20 @@ def update_job_progress(
             ":status": "PROCESSING",
             ":timestamp": timestamp,
             ":zero": 0,
-            ":one": 1,
+            ":processed": successful + failed,
         }
 
-        # Increment success or failure counter
-        if success:
+        # Increment success and failure counters
+        if successful:
             update_expr_parts.append(
-                "successfulAssets = if_not_exists(successfulAssets, :zero) + :one"
+                "successfulAssets = if_not_exists(successfulAssets, :zero) + :successful"
             )
-        else:
+            expr_attr_values[":successful"] = successful
+        if failed:
             update_expr_parts.append(
-                "failedAssets = if_not_exists(failedAssets, :zero) + :one"
+                "failedAssets = if_not_exists(failedAssets, :zero) + :failed"
             )
+            expr_attr_values[":failed"] = failed
 
         update_expression = ", ".join(update_expr_parts)
 
@@ -167,7 +176,8 @@ def update_job_progress(
             f"Updated job {job_id} progress",
             extra={
                 "job_id": job_id,
-                "success": success,
+                "successful": successful,
+                "failed": failed,
                 "progress": progress if total_assets > 0 else 0,
             },
         )
@@ -211,14 +221,107 @@ def check_job_cancelled(job_id: str, user_id: str) -> bool:
         return False
 
 
+@tracer.capture_method
+def process_batch(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Delete a Distributed Map batch of assets in one pass.
+
+    Args:
+        event: ItemBatcher input with "Items" and "BatchInput"
+
+    Returns:
+        Batch result with a per-asset status
+    """
+    batch_input = event.get("BatchInput") or {}
+    job_id = batch_input.get("jobId")
+    user_id = batch_input.get("userId")
+    total_assets = batch_input.get("totalAssets", 0)
+    asset_ids = [item["assetId"] for item in event.get("Items", [])]
+    timestamp = datetime.utcnow().isoformat()
+
+    logger.info(
+        f"Processing deletion of {len(asset_ids)} assets in job {job_id}",
+        extra={"job_id": job_id, "asset_count": len(asset_ids), "user_id": user_id},
+    )
+
+    # Check if job has been cancelled before proceeding
+    if check_job_cancelled(job_id, user_id):
+        logger.info(f"Skipping deletion of {len(asset_ids)} assets - job cancelled")
+        metrics.add_metric("AssetDeletionsSkipped", MetricUnit.Count, len(asset_ids))
+        return {
+            "jobId": job_id,
+            "userId": user_id,
+            "status": "skipped",
+            "reason": "Job cancelled",
+            "results": [
+                {"assetId": asset_id, "status": "skipped"} for asset_id in asset_ids
+            ],
+            "timestamp": timestamp,
+        }
+
+    deletion_service = AssetDeletionService(
+        dynamodb_table_name=ASSET_TABLE_NAME,
+        logger=logger,
+        metrics=metrics,
+        tracer=tracer,
+    )
+    batch = deletion_service.delete_assets(asset_ids, publish_event=True)
+
+    results = []
+    for result in batch.results:
+        entry = {
+            "assetId": result.inventory_id,
+            "status": "success" if result.success else "error",
+        }
+        if result.success:
+            entry["details"] = {
+                "s3ObjectsDeleted": result.s3_objects_deleted,
+                "vectorsDeleted": result.vectors_deleted,
+            }
+        else:
+            entry["error"] = result.error
+        results.append(entry)
+
+    metrics.add_metric(
+        "AssetDeletionsProcessed", MetricUnit.Count, len(batch.succeeded)
+    )
+    if batch.failed:
+        logger.error(
+            f"Failed to delete {len(batch.failed)} assets in job {job_id}",
+            extra={"failed": [r for r in results if r["status"] == "error"]},
+        )
+        metrics.add_metric("AssetDeletionErrors", MetricUnit.Count, len(batch.failed))
+
+    # Update job progress in DynamoDB
+    if jobs_table and job_id and user_id:
+        update_job_progress(
+            job_id,
+            user_id,
+            successful=len(batch.succeeded),
+            failed=len(batch.failed),
+            total_assets=total_assets,
+        )
+
+    return {
+        "jobId": job_id,
+        "userId": user_id,
+        "status": "error" if batch.failed else "success",
+        "results": results,
+        "openSearchDocsDeleted": batch.opensearch_docs_deleted,
+        "timestamp": timestamp,
+    }
+
+
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
 @metrics.log_metrics(capture_cold_start_metric=True)
 def lambda_handler(event: Dict[str, Any], _ctx: LambdaContext) -> Dict[str, Any]:
     """
-    Lambda handler for processing single asset deletion in Step Functions.
+    Lambda handler for processing asset deletions in Step Functions.
 
-    Input from Step Functions Distributed Map:
+    Batches from the Distributed Map ItemBatcher are handled by process_batch.
+
+    Single-asset input:
     {
         "jobId": "uuid",
         "assetId": "inventory-id",
@@ -233,6 +336,35 @@ def lambda_handler(event: Dict[str, Any], _ctx: LambdaContext) -> Dict[str, Any]
         "error": "error message" (optional)
     }
     """
+    if "Items" in event:
+        try:
+            return process_batch(event)
+        except Exception as e:
+            # delete_assets reports per-asset failures itself; this is a
+            # failure of the batch as a whole
+            logger.error(f"Unexpected error deleting batch: {e}", exc_info=True)
+            metrics.add_metric("ProcessorErrors", MetricUnit.Count, 1)
+            batch_input = event.get("BatchInput") or {}
+            asset_ids = [item.get("assetId") for item in event.get("Items", [])]
+            if jobs_table and batch_input.get("jobId") and batch_input.get("userId"):
+                update_job_progress(
+                    batch_input["jobId"],
+                    batch_input["userId"],
+                    successful=0,
+                    failed=len(asset_ids),
+                    total_assets=batch_input.get("totalAssets", 0),
+                )
+            return {
+                "jobId": batch_input.get("jobId"),
+                "userId": batch_input.get("userId"),
+                "status": "error",
+                "error": f"Unexpected error: {str(e)}",
+                "results": [
+                    {"assetId": asset_id, "status": "error"} for asset_id in asset_ids
+                ],
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
     job_id = event.get("jobId")
     asset_id = event.get("assetId")
     user_id = event.get("userId")
@@ -285,7 +417,7 @@ def lambda_handler(event: Dict[str, Any], _ctx: LambdaContext) -> Dict[str, Any]
         # Update job progress in DynamoDB
         if jobs_table and job_id and user_id:
             update_job_progress(
-                job_id, user_id, success=True, total_assets=total_assets
+                job_id, user_id, successful=1, failed=0, total_assets=total_assets
             )
 
         # Return success result
@@ -309,7 +441,7 @@ def lambda_handler(event: Dict[str, Any], _ctx: LambdaContext) -> Dict[str, Any]
         # Update job progress in DynamoDB (mark as failed)
         if jobs_table and job_id and user_id:
             update_job_progress(
-                job_id, user_id, success=False, total_assets=total_assets
+                job_id, user_id, successful=0, failed=1, total_assets=total_assets
             )
 
         # Return error result
@@ -329,7 +461,7 @@ def lambda_handler(event: Dict[str, Any], _ctx: LambdaContext) -> Dict[str, Any]
         # Update job progress in DynamoDB (mark as failed)
         if jobs_table and job_id and user_id:
             update_job_progress(
-                job_id, user_id, success=False, total_assets=total_assets
+                job_id, user_id, successful=0, failed=1, total_assets=total_assets
             )
 
         # Return error result
@@ -0,0 +1,141 @@
+"""
+Unit tests for batch asset deletion.
+
+Tests that AssetDeletionService.delete_assets deletes S3 objects first and only
+removes OpenSearch documents, vectors, external entries and the DynamoDB record
+of assets whose S3 objects are gone.
+"""
+
+import os
+from unittest.mock import MagicMock
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import asset_deletion_service
+import pytest
+from asset_deletion_service import AssetDeletionService
+from botocore.exceptions import ClientError
+
+
+def _asset(inventory_id):
+    return {"InventoryID": inventory_id}
+
+
+def _client_error(code):
+    return ClientError({"Error": {"Code": code, "Message": code}}, "DeleteObjects")
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Service whose AWS calls and downstream deletions are mocks."""
+    monkeypatch.setattr(
+        asset_deletion_service, "MediaLakeExternalServiceManager", MagicMock()
+    )
+    monkeypatch.setattr(asset_deletion_service, "eventbridge", MagicMock())
+    asset_deletion_service.eventbridge.put_events.side_effect = lambda Entries: {
+        "Entries": [{} for _ in Entries]
+    }
+    delete_objects = MagicMock(return_value=[])
+    monkeypatch.setattr(asset_deletion_service, "delete_objects", delete_objects)
+
+    svc = AssetDeletionService(dynamodb_table_name="assets")
+    svc.table = MagicMock()
+    svc.deleted_records = []
+    writer = svc.table.batch_writer.return_value.__enter__.return_value
+    writer.delete_item.side_effect = lambda Key: svc.deleted_records.append(
+        Key["InventoryID"]
+    )
+    svc.delete_objects = delete_objects
+    svc._fetch_assets = MagicMock(
+        side_effect=lambda ids: {i: _asset(i) for i in ids if i != "missing"}
+    )
+    svc._plan_s3_keys = MagicMock(
+        side_effect=lambda asset: [("media", f"{asset['InventoryID']}.mp4")]
+    )
+    svc._delete_opensearch_docs = MagicMock(return_value=4)
+    svc._delete_s3_vectors = MagicMock(return_value=2)
+    svc._delete_external_services = MagicMock(return_value=["coactive"])
+    return svc
+
+
+def _vector_ids(svc):
+    return sorted(c.args[0] for c in svc._delete_s3_vectors.call_args_list)
+
+
+def _external_ids(svc):
+    return sorted(c.args[1] for c in svc._delete_external_services.call_args_list)
+
+
+class TestDeleteAssets:
+    """Test suite for AssetDeletionService.delete_assets"""
+
+    def test_every_asset_is_deleted(self, service):
+        """Test that a clean batch deletes everything and publishes events"""
+        batch = service.delete_assets(["a", "b"])
+
+        assert [r.inventory_id for r in batch.succeeded] == ["a", "b"]
+        assert all(r.event_published and r.vectors_deleted == 2 for r in batch.results)
+        assert service.deleted_records == ["a", "b"]
+        service._delete_opensearch_docs.assert_called_once_with(["a", "b"])
+        assert batch.opensearch_docs_deleted == 4
+
+    def test_s3_key_error_leaves_only_that_asset_intact(self, service):
+        """Test that an asset whose S3 objects remain is not deleted downstream"""
+        service.delete_objects.return_value = [
+            {"bucket": "media", "key": "b.mp4", "code": "AccessDenied", "message": ""}
+        ]
+
+        batch = service.delete_assets(["a", "b"])
+
+        assert [r.inventory_id for r in batch.succeeded] == ["a"]
+        assert "AccessDenied" in batch.failed[0].error
+        service._delete_opensearch_docs.assert_called_once_with(["a"])
+        assert _vector_ids(service) == ["a"]
+        assert _external_ids(service) == ["a"]
+        assert service.deleted_records == ["a"]
+
+    def test_failed_s3_request_skips_every_downstream_deletion(self, service):
+        """Test that nothing else is deleted when the S3 request itself fails"""
+        service.delete_objects.side_effect = _client_error("AccessDenied")
+
+        batch = service.delete_assets(["a", "b"])
+
+        assert batch.succeeded == []
+        service._delete_opensearch_docs.assert_not_called()
+        service._delete_s3_vectors.assert_not_called()
+        service._delete_external_services.assert_not_called()
+        service.table.batch_writer.assert_not_called()
+
+    def test_failed_planning_skips_only_that_asset(self, service):
+        """Test that an asset whose keys cannot be listed is left intact"""
+
+        def plan(asset):
+            if asset["InventoryID"] == "b":
+                raise _client_error("SlowDown")
+            return [("media", "a.mp4")]
+
+        service._plan_s3_keys.side_effect = plan
+
+        batch = service.delete_assets(["a", "b"])
+
+        assert [r.inventory_id for r in batch.failed] == ["b"]
+        assert _vector_ids(service) == ["a"]
+        assert service.deleted_records == ["a"]
+
+    def test_missing_bucket_counts_as_deleted(self, service):
+        """Test that a bucket that no longer exists does not block deletion"""
+        service.delete_objects.side_effect = _client_error("NoSuchBucket")
+
+        batch = service.delete_assets(["a"])
+
+        assert [r.inventory_id for r in batch.succeeded] == ["a"]
+        assert batch.results[0].opensearch_docs_deleted == 4
+
+    def test_missing_asset_is_reported(self, service):
+        """Test that an unknown inventory ID fails without touching anything"""
+        batch = service.delete_assets(["a", "missing"])
+
+        assert "not found" in batch.failed[0].error
+        assert _vector_ids(service) == ["a"]
+        assert service.deleted_records == ["a"]
@@ -1,11 +1,14 @@
 """
 Bulk Download Append to Zip Lambda
 
-This Lambda function appends files to an existing zip file on shared storage (EFS) by:
-1. Downloading the file from S3
-2. Appending it to the existing zip file using streaming
+This Lambda function appends a file to a bulk download archive by:
+1. Range-reading the file from S3
+2. Streaming it into a self-contained ZIP64 entry segment in S3
 3. Updating the job progress in DynamoDB
 
+Each file is written to its own segment, so files are appended in parallel
+without locking; init_multipart stitches the segments into the final archive.
+
 The function implements AWS best practices including:
 - Structured logging with AWS Lambda Powertools
 - Tracing with AWS X-Ray
@@ -13,9 +16,8 @@ The function implements AWS best practices including:
 - Metrics and monitoring
 """
 
+import json
 import os
-import time
-import zipfile
 from datetime import datetime
 from typing import Any, Dict, Tuple
 from urllib.parse import urlparse
@@ -25,6 +27,7 @@ from aws_lambda_powertools import Logger, Metrics, Tracer
 from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.exceptions import ClientError
+from zip_stream import ZIP_STORED, ZipEntryEncoder
 
 # Initialize AWS Lambda Powertools
 logger = Logger(service="bulk-download-append-to-zip")
@@ -36,7 +39,6 @@ metrics = Metrics(
 # Initialize AWS clients
 dynamodb = boto3.resource("dynamodb")
 s3 = boto3.client("s3")
-s3_resource = boto3.resource("s3")
 
 # Get environment variables
 USER_TABLE_NAME = os.environ[
@@ -44,7 +46,6 @@ USER_TABLE_NAME = os.environ[
 ]  # User table now stores bulk download jobs
 ASSET_TABLE = os.environ["ASSET_TABLE"]
 MEDIA_ASSETS_BUCKET = os.environ["MEDIA_ASSETS_BUCKET"]
-EFS_MOUNT_PATH = os.environ["EFS_MOUNT_PATH"]
 
 # Initialize DynamoDB tables
 user_table = dynamodb.Table(USER_TABLE_NAME)  # User table for bulk download jobs
@@ -54,6 +55,8 @@ asset_table = dynamodb.Table(ASSET_TABLE)
 MAX_RETRIES = 3  # Maximum number of retries for S3 operations
 CHUNK_SIZE_MB = int(os.environ.get("CHUNK_SIZE_MB", "100"))
 CHUNK_SIZE = CHUNK_SIZE_MB * 1024 * 1024  # Convert MB to bytes for streaming
+SEGMENT_PART_SIZE_MB = int(os.environ.get("SEGMENT_PART_SIZE_MB", "16"))
+SEGMENT_PART_SIZE = SEGMENT_PART_SIZE_MB * 1024 * 1024  # >= S3 5 MB part minimum
 
 
 @tracer.capture_method
@@ -73,6 +76,19 @@ def split_s3_uri(s3_uri: str) -> Tuple[str, str]:
     return bucket, key
 
 
+def segments_prefix_for(zip_path: str) -> str:
+    """
+    S3 prefix holding the entry segments of an archive.
+
+    Args:
+        zip_path: Logical S3 key of the archive, as set by init_zip
+
+    Returns:
+        Prefix under which segments and their sidecars are written
+    """
+    return f"{os.path.dirname(zip_path)}/segments"
+
+
 @tracer.capture_method
 def get_job_details(job_id: str, user_id: str) -> Dict[str, Any]:
     """
@@ -166,25 +182,21 @@ def get_asset_details(asset_id: str) -> Dict[str, Any]:
 
 
 @tracer.capture_method
-def update_job_progress(
-    job_id: str, user_id: str, processed_count: int, total_count: int
-) -> None:
+def update_job_progress(job_id: str, user_id: str, total_count: int) -> int:
     """
     Update job progress in the user table for zip creation phase (0-50%).
 
+    Files are appended by concurrent workers, so the processed file count is
+    an atomic counter rather than a read-modify-write of the job record.
+
     Args:
         job_id: ID of the job to update
         user_id: ID of the user who owns the job
-        processed_count: Number of files processed
         total_count: Total number of files to process
 
-    Raises:
-        Exception: If job update fails
+    Returns:
+        Number of files processed so far, or 0 if the update failed
     """
-    # Calculate zip creation progress (0-50% of total progress)
-    zip_phase_progress = (processed_count / total_count) if total_count > 0 else 0
-    progress = int(zip_phase_progress * 50)  # Map to 0-50% range
-
     try:
         # Query to find the job item
         formatted_user_id = f"USER#{user_id}"
@@ -200,28 +212,49 @@ def update_job_progress(
 
         if not response.get("Items"):
             logger.error(f"Job {job_id} not found for user {user_id}")
-            return
+            return 0
 
         item = response["Items"][0]
         item_key = item["itemKey"]
 
-        # Update the job progress
-        user_table.update_item(
+        # Use atomic counter to increment processed files
+        response = user_table.update_item(
             Key={"userId": formatted_user_id, "itemKey": item_key},
-            UpdateExpression="SET #status = :status, #progress = :progress, #processedFiles = :processedFiles, #updatedAt = :updatedAt",
+            UpdateExpression="ADD #processedFiles :increment SET #status = :status, #updatedAt = :updatedAt",
             ExpressionAttributeNames={
-                "#status": "status",
-                "#progress": "progress",
                 "#processedFiles": "processedFiles",
+                "#status": "status",
                 "#updatedAt": "updatedAt",
             },
             ExpressionAttributeValues={
+                ":increment": 1,
                 ":status": "PROCESSING",
-                ":progress": progress,
-                ":processedFiles": processed_count,
                 ":updatedAt": datetime.utcnow().isoformat(),
             },
+            ReturnValues="UPDATED_NEW",
         )
+        processed_count = int(response["Attributes"].get("processedFiles", 0))
+
+        # Calculate zip creation progress (0-50% of total progress)
+        zip_phase_progress = (processed_count / total_count) if total_count > 0 else 0
+        # Map to 0-50% range; retried appends can push the counter past the total
+        progress = min(int(zip_phase_progress * 50), 50)
+
+        # Only move progress forward; workers can finish out of order
+        try:
+            user_table.update_item(
+                Key={"userId": formatted_user_id, "itemKey": item_key},
+                UpdateExpression="SET #progress = :progress",
+                ConditionExpression="attribute_not_exists(#progress) OR #progress < :progress",
+                ExpressionAttributeNames={"#progress": "progress"},
+                ExpressionAttributeValues={":progress": progress},
+            )
+        except ClientError as e:
+            if (
+                e.response.get("Error", {}).get("Code")
+                != "ConditionalCheckFailedException"
+            ):
+                raise
 
         logger.info(
             "Updated zip creation progress in user table",
@@ -236,6 +269,8 @@ def update_job_progress(
             },
         )
 
+        return processed_count
+
     except ClientError as e:
         logger.error(
             "Failed to update job progress in user table",
@@ -246,163 +281,163 @@ def update_job_progress(
             },
         )
         # Continue processing even if update fails
+        return 0
+
+
+class SegmentWriter:
+    """
+    Buffer encoded bytes and upload them to a single S3 object.
+
+    A multipart upload is only started once the buffer exceeds one part, so
+    small files are written with a single PutObject.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.size = 0
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._parts = []
+
+    def write(self, data: bytes) -> None:
+        self._buffer += data
+        self.size += len(data)
+        if len(self._buffer) >= SEGMENT_PART_SIZE:
+            self._flush_part()
+
+    def _flush_part(self) -> None:
+        if self._upload_id is None:
+            response = s3.create_multipart_upload(
+                Bucket=MEDIA_ASSETS_BUCKET, Key=self.key
+            )
+            self._upload_id = response["UploadId"]
+        part_number = len(self._parts) + 1
+        response = s3.upload_part(
+            Bucket=MEDIA_ASSETS_BUCKET,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+        self._buffer = bytearray()
+
+    def close(self) -> None:
+        if self._upload_id is None:
+            s3.put_object(
+                Bucket=MEDIA_ASSETS_BUCKET, Key=self.key, Body=bytes(self._buffer)
+            )
+            self._buffer = bytearray()
+            return
+        if self._buffer:
+            self._flush_part()
+        s3.complete_multipart_upload(
+            Bucket=MEDIA_ASSETS_BUCKET,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    def abort(self) -> None:
+        if self._upload_id is None:
+            return
+        try:
+            s3.abort_multipart_upload(
+                Bucket=MEDIA_ASSETS_BUCKET, Key=self.key, UploadId=self._upload_id
+            )
+        except ClientError as e:
+            logger.warning(
+                "Failed to abort segment upload",
+                extra={"error": str(e), "segmentKey": self.key},
+            )
 
 
 @tracer.capture_method
-def append_file_to_zip(bucket: str, key: str, zip_path: str, archive_name: str) -> bool:
+def append_file_to_zip(
+    bucket: str, key: str, segments_prefix: str, item_index: int, archive_name: str
+) -> Dict[str, Any]:
     """
-    Append a file from S3 to an existing zip file using streaming with file locking.
+    Stream a file from S3 into a zip entry segment stored in S3.
+
+    The entry (local header, data and data descriptor) is written to its own
+    segment object keyed by the file's position in the job, and its metadata
+    to a JSON sidecar next to it. Segments do not depend on each other, so
+    files are appended in parallel and a retry simply overwrites the segment.
+    init_multipart later stitches the segments together with the central
+    directory.
 
     Args:
         bucket: S3 bucket name
         key: S3 object key
-        zip_path: Path to the existing zip file
+        segments_prefix: S3 prefix holding the job's segments
+        item_index: Position of the file in the archive
         archive_name: Name to use in the archive
 
     Returns:
-        True if appending was successful, False otherwise
+        Entry metadata as written to the sidecar
     """
-    lock_file_path = f"{zip_path}.lock"
-    max_lock_retries = 10
-    lock_retry_delay = 0.5  # Start with 500ms delay
+    segment_key = f"{segments_prefix}/{item_index:08d}.seg"
 
-    for lock_attempt in range(max_lock_retries):
-        try:
-            # Try to acquire lock by creating a lock file atomically
-            lock_fd = os.open(lock_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    # Get object size
+    response = s3.head_object(Bucket=bucket, Key=key)
+    content_length = response.get("ContentLength", 0)
 
-            try:
-                # Write process info to lock file for debugging
-                os.write(lock_fd, f"PID: {os.getpid()}, Time: {time.time()}\n".encode())
-                os.close(lock_fd)
+    encoder = ZipEntryEncoder(archive_name)
+    writer = SegmentWriter(segment_key)
 
-                # We have the lock, proceed with zip operation
-                logger.info(
-                    "Acquired zip file lock, appending file",
-                    extra={
-                        "bucket": bucket,
-                        "key": key,
-                        "archiveName": archive_name,
-                        "zipPath": zip_path,
-                        "lockAttempt": lock_attempt + 1,
-                    },
-                )
+    try:
+        writer.write(encoder.header())
 
-                # Get object size
-                response = s3.head_object(Bucket=bucket, Key=key)
-                content_length = response.get("ContentLength", 0)
-
-                # Ensure the zip file exists and is accessible
-                if not os.path.exists(zip_path):
-                    logger.error(f"Zip file does not exist: {zip_path}")
-                    return False
-
-                # Directly append to the existing zip file
-                with zipfile.ZipFile(zip_path, "a", zipfile.ZIP_DEFLATED) as zipf:
-                    # Create a ZipInfo object to store file info
-                    zip_info = zipfile.ZipInfo(archive_name)
-                    zip_info.compress_type = zipfile.ZIP_DEFLATED
-                    zip_info.date_time = time.localtime(time.time())[:6]
-
-                    # Stream the file in chunks
-                    with zipf.open(zip_info, "w") as dest_file:
-                        # Get the S3 object
-                        s3_object = s3_resource.Object(bucket, key)
-
-                        # Stream the object in chunks
-                        offset = 0
-                        while offset < content_length:
-                            end = min(offset + CHUNK_SIZE, content_length)
-                            range_str = f"bytes={offset}-{end-1}"
-
-                            response = s3_object.get(Range=range_str)
-                            data = response["Body"].read()
-                            dest_file.write(data)
-
-                            offset = end
-
-                logger.info(
-                    "Successfully appended file to zip",
-                    extra={
-                        "bucket": bucket,
-                        "key": key,
-                        "archiveName": archive_name,
-                        "zipPath": zip_path,
-                        "size": content_length,
-                    },
-                )
+        # Stream the object in chunks
+        offset = 0
+        while offset < content_length:
+            end = min(offset + CHUNK_SIZE, content_length)
+            range_str = f"bytes={offset}-{end-1}"
 
-                return True
+            response = s3.get_object(Bucket=bucket, Key=key, Range=range_str)
+            writer.write(encoder.update(response["Body"].read()))
 
-            finally:
-                # Always release the lock
-                try:
-                    os.unlink(lock_file_path)
-                    logger.debug(f"Released zip file lock: {lock_file_path}")
-                except OSError as e:
-                    logger.warning(f"Failed to remove lock file: {e}")
+            offset = end
 
-        except OSError as e:
-            if e.errno == 17:  # File exists (lock is held by another process)
-                logger.info(
-                    f"Zip file is locked, retrying in {lock_retry_delay}s (attempt {lock_attempt + 1}/{max_lock_retries})",
-                    extra={
-                        "zipPath": zip_path,
-                        "lockFile": lock_file_path,
-                        "attempt": lock_attempt + 1,
-                    },
-                )
-                time.sleep(lock_retry_delay)
-                # Exponential backoff with jitter
-                lock_retry_delay = min(
-                    lock_retry_delay * 1.5 + (time.time() % 0.1), 5.0
-                )
-                continue
-            else:
-                logger.error(
-                    "Failed to create lock file",
-                    extra={
-                        "error": str(e),
-                        "errno": e.errno,
-                        "lockFile": lock_file_path,
-                    },
-                )
-                return False
-        except Exception as e:
-            logger.error(
-                "Failed to append file to zip",
-                extra={
-                    "error": str(e),
-                    "bucket": bucket,
-                    "key": key,
-                    "zipPath": zip_path,
-                },
-            )
-            # Clean up lock file if we created it
-            try:
-                os.unlink(lock_file_path)
-            except OSError:
-                pass
-            return False
-
-    # If we get here, we failed to acquire the lock after all retries
-    logger.error(
-        "Failed to acquire zip file lock after all retries",
+        writer.write(encoder.finish())
+        writer.close()
+    except Exception:
+        writer.abort()
+        raise
+
+    entry = encoder.metadata()
+    entry["index"] = item_index
+    entry["segmentKey"] = segment_key
+
+    # The sidecar is written last, so its presence marks a complete segment
+    s3.put_object(
+        Bucket=MEDIA_ASSETS_BUCKET,
+        Key=f"{segment_key}.json",
+        Body=json.dumps(entry),
+        ContentType="application/json",
+    )
+
+    logger.info(
+        "Successfully appended file to zip",
         extra={
-            "zipPath": zip_path,
-            "maxRetries": max_lock_retries,
             "bucket": bucket,
             "key": key,
+            "archiveName": archive_name,
+            "segmentKey": segment_key,
+            "size": content_length,
+            "encodedSize": entry["encodedSize"],
+            "method": "STORED" if entry["method"] == ZIP_STORED else "DEFLATED",
         },
     )
-    return False
+
+    return entry
 
 
 @tracer.capture_lambda_handler
 @metrics.log_metrics(capture_cold_start_metric=True)
 def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
     """
-    Lambda handler for appending a file to an existing zip file.
+    Lambda handler for appending a file to the job's zip archive.
 
     Args:
         event: Event containing job details and asset information
@@ -416,6 +451,7 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
     asset_id = event.get("assetId", "")
     output_location = event.get("outputLocation", "")
     type = event.get("type", "")
+    item_index = event.get("itemIndex")
 
     if not job_id:
         raise ValueError("Missing jobId in event")
@@ -449,25 +485,8 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         if not zip_path:
             raise ValueError(f"No zip path found for job {job_id}")
 
-        # Ensure the zip file exists
-        if not os.path.exists(zip_path):
-            raise ValueError(f"Zip file not found at {zip_path}")
-
-        # Log zip file status
-        zip_stat = os.stat(zip_path)
-        logger.info(
-            "Zip file status before append",
-            extra={
-                "zipPath": zip_path,
-                "zipSize": zip_stat.st_size,
-                "zipMtime": zip_stat.st_mtime,
-                "jobId": job_id,
-                "userId": user_id,
-                "assetId": asset_id,
-                "outputLocation": output_location,
-                "type": type,
-            },
-        )
+        if item_index is None:
+            raise ValueError("Missing itemIndex in event")
 
         # Determine whether we need to get the asset location from DynamoDB or
         # have a direct S3 URI
@@ -541,62 +560,54 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         # Get file name from path
         file_name = os.path.basename(file_path)
 
-        # Append the file to the zip
-        if append_file_to_zip(bucket, file_path, zip_path, file_name):
-            # Log zip file status after append
-            zip_stat = os.stat(zip_path)
-            logger.info(
-                "Zip file status after successful append",
-                extra={
-                    "zipPath": zip_path,
-                    "zipSize": zip_stat.st_size,
-                    "zipMtime": zip_stat.st_mtime,
-                    "jobId": job_id,
-                    "userId": user_id,
-                    "assetId": asset_id,
-                    "outputLocation": output_location,
-                    "type": type,
-                    "fileName": file_name,
-                },
-            )
+        # Append the file to the zip as its own segment
+        entry = append_file_to_zip(
+            bucket,
+            file_path,
+            segments_prefix_for(zip_path),
+            int(item_index),
+            file_name,
+        )
 
-            # Update job progress
-            processed_count = job.get("processedFiles", 0) + 1
-            total_count = job.get("totalFiles", 0)
-            update_job_progress(job_id, user_id, processed_count, total_count)
+        # Update job progress
+        total_count = job.get("totalFiles", 0)
+        processed_count = update_job_progress(job_id, user_id, total_count)
 
-            # Add metrics
-            metrics.add_metric(
-                name="FilesAppendedToZip", unit=MetricUnit.Count, value=1
-            )
-
-            logger.info(
-                "Successfully completed append operation",
-                extra={
-                    "jobId": job_id,
-                    "userId": user_id,
-                    "assetId": asset_id,
-                    "outputLocation": output_location,
-                    "type": type,
-                    "fileName": file_name,
-                    "processedCount": processed_count,
-                    "totalCount": total_count,
-                },
-            )
+        # Add metrics
+        metrics.add_metric(name="FilesAppendedToZip", unit=MetricUnit.Count, value=1)
+        metrics.add_metric(
+            name="ZipBytesAppended",
+            unit=MetricUnit.Bytes,
+            value=entry["encodedSize"],
+        )
 
-            return {
+        logger.info(
+            "Successfully completed append operation",
+            extra={
                 "jobId": job_id,
                 "userId": user_id,
                 "assetId": asset_id,
                 "outputLocation": output_location,
                 "type": type,
-                "status": "APPENDED",
-                "zipPath": zip_path,
+                "fileName": file_name,
+                "itemIndex": item_index,
                 "processedCount": processed_count,
                 "totalCount": total_count,
-            }
-        else:
-            raise Exception(f"Failed to append file {file_path} to zip {zip_path}")
+            },
+        )
+
+        return {
+            "jobId": job_id,
+            "userId": user_id,
+            "assetId": asset_id,
+            "outputLocation": output_location,
+            "type": type,
+            "status": "APPENDED",
+            "zipPath": zip_path,
+            "segmentKey": entry["segmentKey"],
+            "processedCount": processed_count,
+            "totalCount": total_count,
+        }
 
     except Exception as e:
         logger.error(
@@ -0,0 +1,148 @@
+"""
+Unit tests for bulk download segment streaming.
+
+Tests that a source object is range-read into its own ZIP64 entry segment,
+that large segments are written as a multipart upload and small ones with a
+single PutObject, and that a failed stream aborts its upload and writes no
+sidecar.
+"""
+
+import io
+import json
+import os
+import zipfile
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("USER_TABLE_NAME", "users")
+os.environ.setdefault("ASSET_TABLE", "assets")
+os.environ.setdefault("MEDIA_ASSETS_BUCKET", "media-assets")
+
+import index
+import pytest
+from zip_stream import build_central_directory
+
+
+class FakeS3:
+    """In-memory S3 supporting ranged reads and multipart uploads"""
+
+    def __init__(self, objects=None):
+        self.objects = dict(objects or {})
+        self.ranges = []
+        self.uploads = {}
+        self.aborted = []
+        self.fail_after_reads = None
+
+    def head_object(self, Bucket, Key):
+        return {"ContentLength": len(self.objects[(Bucket, Key)])}
+
+    def get_object(self, Bucket, Key, Range=None):
+        if self.fail_after_reads == len(self.ranges):
+            raise ConnectionError("read timed out")
+        data = self.objects[(Bucket, Key)]
+        start, end = (int(part) for part in Range[len("bytes=") :].split("-"))
+        self.ranges.append((start, end))
+        return {"Body": io.BytesIO(data[start : end + 1])}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[(Bucket, Key)] = Body if isinstance(Body, bytes) else Body.encode()
+
+    def create_multipart_upload(self, Bucket, Key):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        self.objects[(Bucket, Key)] = b"".join(
+            parts[part["PartNumber"]] for part in MultipartUpload["Parts"]
+        )
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.append(UploadId)
+        self.uploads.pop(UploadId)
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    fake = FakeS3()
+    monkeypatch.setattr(index, "s3", fake)
+    monkeypatch.setattr(index, "CHUNK_SIZE", 1000)
+    monkeypatch.setattr(index, "SEGMENT_PART_SIZE", 4000)
+    return fake
+
+
+def _segment(s3, key):
+    return s3.objects[(index.MEDIA_ASSETS_BUCKET, key)]
+
+
+class TestAppendFileToZip:
+    """Test suite for streaming a source object into an entry segment"""
+
+    def test_segment_is_a_readable_archive_entry(self, s3):
+        """Test that the segment plus a central directory is a valid archive"""
+        data = os.urandom(2500)
+        s3.objects[("source", "clip.mp4")] = data
+
+        entry = index.append_file_to_zip(
+            "source", "clip.mp4", "job/segments", 3, "a.mp4"
+        )
+
+        segment = _segment(s3, "job/segments/00000003.seg")
+        sidecar = json.loads(_segment(s3, "job/segments/00000003.seg.json"))
+        assert sidecar == entry
+        assert entry["encodedSize"] == len(segment)
+        assert s3.ranges == [(0, 999), (1000, 1999), (2000, 2499)]
+
+        entry["offset"] = 0
+        archive = segment + build_central_directory([entry], len(segment))
+        assert zipfile.ZipFile(io.BytesIO(archive)).read("a.mp4") == data
+
+    def test_small_segment_is_one_put(self, s3):
+        """Test that a segment below one part skips the multipart upload"""
+        s3.objects[("source", "notes.txt")] = b"hello" * 10
+
+        index.append_file_to_zip("source", "notes.txt", "job/segments", 0, "notes.txt")
+
+        assert s3.uploads == {}
+        assert _segment(s3, "job/segments/00000000.seg")
+
+    def test_large_segment_is_uploaded_in_parts(self, s3, monkeypatch):
+        """Test that encoded bytes are flushed as parts once a part fills up"""
+        uploaded = []
+        original = s3.upload_part
+
+        def record(**kwargs):
+            uploaded.append(len(kwargs["Body"]))
+            return original(**kwargs)
+
+        monkeypatch.setattr(s3, "upload_part", record)
+        data = os.urandom(10000)
+        s3.objects[("source", "clip.mp4")] = data
+
+        entry = index.append_file_to_zip(
+            "source", "clip.mp4", "job/segments", 1, "c.mp4"
+        )
+
+        assert len(uploaded) == 3
+        assert all(size >= index.SEGMENT_PART_SIZE for size in uploaded[:-1])
+        assert sum(uploaded) == entry["encodedSize"]
+        assert s3.uploads == {}
+
+    def test_failed_stream_aborts_the_upload(self, s3):
+        """Test that a read failure aborts the segment and leaves no sidecar"""
+        s3.objects[("source", "clip.mp4")] = os.urandom(10000)
+        s3.fail_after_reads = 6
+
+        with pytest.raises(ConnectionError):
+            index.append_file_to_zip("source", "clip.mp4", "job/segments", 2, "c.mp4")
+
+        assert s3.aborted == ["upload-0"]
+        assert (
+            index.MEDIA_ASSETS_BUCKET,
+            "job/segments/00000002.seg.json",
+        ) not in s3.objects
@@ -0,0 +1,177 @@
+"""
+Unit tests for the streaming ZIP64 archive helpers.
+
+Tests that independently encoded entries plus the central directory form an
+archive the standard library reads back, that the end records carry ZIP64
+values once offsets pass 4 GB, and that archive byte ranges map onto the
+right pieces of the stored segments.
+"""
+
+import io
+import struct
+import zipfile
+
+import pytest
+from zip_stream import (
+    ZIP_DEFLATED,
+    ZIP_STORED,
+    ZipEntryEncoder,
+    build_central_directory,
+    compression_for,
+    pieces_for_range,
+)
+
+FILES = {
+    "clip.mp4": b"\x00\x01\x02" * 50000,
+    "notes/readme.txt": b"hello bulk download\n" * 2000,
+    "empty.txt": b"",
+    "café/résumé.json": b'{"ok": true}',
+}
+
+
+def _encode(name, data, chunk_size=4096):
+    encoder = ZipEntryEncoder(name, timestamp=0)
+    out = encoder.header()
+    for position in range(0, len(data), chunk_size):
+        out += encoder.update(data[position : position + chunk_size])
+    out += encoder.finish()
+    return out, encoder.metadata()
+
+
+def _archive(files):
+    """Encode files as separate segments and return (segments, layout)"""
+    segments = {}
+    entries = []
+    layout = []
+    offset = 0
+    for name, data in files.items():
+        encoded, entry = _encode(name, data)
+        key = f"segments/{len(entries):08d}.seg"
+        segments[key] = encoded
+        entry["offset"] = offset
+        entries.append(entry)
+        layout.append({"key": key, "start": offset, "size": len(encoded)})
+        offset += len(encoded)
+    segments["central_directory.bin"] = build_central_directory(entries, offset)
+    layout.append(
+        {
+            "key": "central_directory.bin",
+            "start": offset,
+            "size": len(segments["central_directory.bin"]),
+        }
+    )
+    return segments, layout
+
+
+def _assemble(segments, layout, start_byte, end_byte):
+    return b"".join(
+        segments[piece["key"]][piece["startByte"] : piece["endByte"] + 1]
+        for piece in pieces_for_range(layout, start_byte, end_byte)
+    )
+
+
+class TestZipEntryEncoder:
+    """Test suite for encoding self-contained archive entries"""
+
+    def test_precompressed_media_is_stored(self):
+        """Test that media is STORED and other files are DEFLATED"""
+        assert compression_for("clip.MP4") == ZIP_STORED
+        assert compression_for("photo.jpeg") == ZIP_STORED
+        assert compression_for("notes.txt") == ZIP_DEFLATED
+        assert compression_for("no_extension") == ZIP_DEFLATED
+
+    def test_encoded_size_matches_the_bytes_produced(self):
+        """Test that encodedSize is the exact length of the segment"""
+        for name, data in FILES.items():
+            encoded, entry = _encode(name, data)
+
+            assert entry["encodedSize"] == len(encoded)
+            assert entry["uncompressedSize"] == len(data)
+
+    def test_deflated_entry_is_smaller_than_its_source(self):
+        """Test that text is compressed and video is copied as-is"""
+        _, text = _encode("notes/readme.txt", FILES["notes/readme.txt"])
+        _, video = _encode("clip.mp4", FILES["clip.mp4"])
+
+        assert text["compressedSize"] < text["uncompressedSize"]
+        assert video["compressedSize"] == video["uncompressedSize"]
+
+
+class TestArchiveAssembly:
+    """Test suite for stitching segments and the central directory together"""
+
+    def test_standard_library_reads_the_archive(self):
+        """Test that zipfile lists, decompresses and CRC-checks every entry"""
+        segments, layout = _archive(FILES)
+        size = layout[-1]["start"] + layout[-1]["size"]
+
+        archive = zipfile.ZipFile(io.BytesIO(_assemble(segments, layout, 0, size - 1)))
+
+        assert archive.testzip() is None
+        assert archive.namelist() == list(FILES)
+        for name, data in FILES.items():
+            assert archive.read(name) == data
+        assert archive.getinfo("clip.mp4").compress_type == ZIP_STORED
+        assert archive.getinfo("notes/readme.txt").compress_type == ZIP_DEFLATED
+
+    def test_parts_reassemble_to_the_whole_archive(self):
+        """Test that ranged parts crossing segment boundaries lose no bytes"""
+        segments, layout = _archive(FILES)
+        size = layout[-1]["start"] + layout[-1]["size"]
+        whole = _assemble(segments, layout, 0, size - 1)
+        part_size = 7777
+
+        parts = [
+            _assemble(segments, layout, start, min(start + part_size, size) - 1)
+            for start in range(0, size, part_size)
+        ]
+
+        assert b"".join(parts) == whole
+
+    def test_end_records_use_zip64_past_4_gb(self):
+        """Test that offsets beyond 32 bits live only in the ZIP64 records"""
+        _, entry = _encode("big.mov", b"x")
+        entry["offset"] = 5 * 1024**3
+        cd_offset = entry["offset"] + entry["encodedSize"]
+
+        records = build_central_directory([entry], cd_offset)
+
+        end = struct.unpack("<IHHHHIIH", records[-22:])
+        assert end[6] == 0xFFFFFFFF
+        locator = struct.unpack("<IIQI", records[-42:-22])
+        zip64_end_offset = locator[2] - cd_offset
+        zip64_end = struct.unpack(
+            "<IQHHIIQQQQ", records[zip64_end_offset : zip64_end_offset + 56]
+        )
+        assert zip64_end[0] == 0x06064B50
+        assert zip64_end[-1] == cd_offset
+        # The entry offset is the last field of the central header's ZIP64 extra
+        extra_offset = records[zip64_end_offset - 8 : zip64_end_offset]
+        assert struct.unpack("<Q", extra_offset)[0] == entry["offset"]
+
+
+class TestPiecesForRange:
+    """Test suite for mapping archive ranges onto stored objects"""
+
+    @pytest.fixture
+    def layout(self):
+        return [
+            {"key": "a", "start": 0, "size": 10},
+            {"key": "empty", "start": 10, "size": 0},
+            {"key": "b", "start": 10, "size": 5},
+            {"key": "c", "start": 15, "size": 10},
+        ]
+
+    def test_range_spanning_objects(self, layout):
+        """Test that a range is split at object boundaries, skipping empties"""
+        assert pieces_for_range(layout, 8, 16) == [
+            {"key": "a", "startByte": 8, "endByte": 9},
+            {"key": "b", "startByte": 0, "endByte": 4},
+            {"key": "c", "startByte": 0, "endByte": 1},
+        ]
+
+    def test_range_inside_one_object(self, layout):
+        """Test that a range within an object yields a single piece"""
+        assert pieces_for_range(layout, 17, 20) == [
+            {"key": "c", "startByte": 2, "endByte": 5}
+        ]
@@ -17,7 +17,6 @@ The function implements AWS best practices including:
 
 import json
 import os
-import shutil
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
@@ -45,7 +44,6 @@ USER_TABLE_NAME = os.environ[
     "USER_TABLE_NAME"
 ]  # User table now stores bulk download jobs
 MEDIA_ASSETS_BUCKET = os.environ["MEDIA_ASSETS_BUCKET"]
-EFS_MOUNT_PATH = os.environ["EFS_MOUNT_PATH"]
 
 # Initialize DynamoDB table
 user_table = dynamodb.Table(USER_TABLE_NAME)  # User table for bulk download jobs
@@ -506,11 +504,27 @@ def cleanup_temp_files(job_id: str) -> None:
         job_id: Job ID
     """
     try:
-        # Remove job working directory
-        job_dir = os.path.join(EFS_MOUNT_PATH, job_id)
-        if os.path.exists(job_dir):
-            shutil.rmtree(job_dir)
-            logger.info("Removed job directory", extra={"jobDir": job_dir})
+        # Remove the zip segments, central directory and archive layout
+        working_prefix = f"{MULTIPART_WORKING_PREFIX}/{job_id}/"
+        deleted = 0
+        paginator = s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=MEDIA_ASSETS_BUCKET, Prefix=working_prefix
+        ):
+            objects = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+            if not objects:
+                continue
+            # A listing page holds at most 1000 keys, the DeleteObjects limit
+            s3.delete_objects(
+                Bucket=MEDIA_ASSETS_BUCKET,
+                Delete={"Objects": objects, "Quiet": True},
+            )
+            deleted += len(objects)
+
+        logger.info(
+            "Removed job working objects",
+            extra={"workingPrefix": working_prefix, "deletedObjects": deleted},
+        )
 
     except Exception as e:
         logger.warning(
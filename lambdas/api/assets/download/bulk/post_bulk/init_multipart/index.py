@@ -2,10 +2,12 @@
 Bulk Download Initialize Multipart Upload Lambda
 
 This Lambda function initializes a multipart upload for a zip file by:
-1. Creating a multipart upload in S3
-2. Calculating the part sizes based on the file size
-3. Creating a manifest of parts to be uploaded
-4. Returning the upload ID and manifest key
+1. Laying out the entry segments written by append_to_zip and writing the
+   central directory that closes the archive
+2. Creating a multipart upload in S3
+3. Calculating the part sizes based on the archive size
+4. Creating a manifest of parts to be uploaded
+5. Returning the upload ID and manifest key
 
 The function implements AWS best practices including:
 - Structured logging with AWS Lambda Powertools
@@ -17,8 +19,9 @@ The function implements AWS best practices including:
 import json
 import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import boto3
 from aws_lambda_powertools import Logger, Metrics, Tracer
@@ -26,6 +29,7 @@ from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.config import Config
 from botocore.exceptions import ClientError
+from zip_stream import build_central_directory
 
 # Initialize AWS Lambda Powertools
 logger = Logger(service="bulk-download-init-multipart")
@@ -44,7 +48,6 @@ USER_TABLE_NAME = os.environ[
     "USER_TABLE_NAME"
 ]  # User table now stores bulk download jobs
 MEDIA_ASSETS_BUCKET = os.environ["MEDIA_ASSETS_BUCKET"]
-EFS_MOUNT_PATH = os.environ["EFS_MOUNT_PATH"]
 
 # Initialize DynamoDB table
 user_table = dynamodb.Table(USER_TABLE_NAME)  # User table for bulk download jobs
@@ -54,27 +57,114 @@ PART_SIZE_MB = 25  # 25 MB per part
 PART_SIZE = PART_SIZE_MB * 1024 * 1024  # Convert to bytes
 FINAL_ZIP_PREFIX = "temp/zip/final"
 MULTIPART_WORKING_PREFIX = "temp/zip/multipart"
+SIDECAR_READ_CONCURRENCY = 16
 
 
 @tracer.capture_method
-def get_file_size(file_path: str) -> int:
+def list_segment_entries(segments_prefix: str) -> List[Dict[str, Any]]:
     """
-    Get the size of a file in bytes.
+    Load the metadata of every completed segment, in archive order.
 
     Args:
-        file_path: Path to the file
+        segments_prefix: S3 prefix holding the job's segments
 
     Returns:
-        Size of the file in bytes
+        List of entry metadata dictionaries sorted by item index
+    """
+    sidecar_keys = []
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(
+        Bucket=MEDIA_ASSETS_BUCKET, Prefix=f"{segments_prefix}/"
+    ):
+        for obj in page.get("Contents", []):
+            if obj["Key"].endswith(".seg.json"):
+                sidecar_keys.append(obj["Key"])
+
+    def read_sidecar(key: str) -> Dict[str, Any]:
+        response = s3.get_object(Bucket=MEDIA_ASSETS_BUCKET, Key=key)
+        return json.loads(response["Body"].read().decode("utf-8"))
+
+    with ThreadPoolExecutor(max_workers=SIDECAR_READ_CONCURRENCY) as executor:
+        entries = list(executor.map(read_sidecar, sidecar_keys))
+
+    return sorted(entries, key=lambda entry: entry["index"])
+
+
+@tracer.capture_method
+def create_archive_layout(job_id: str, zip_path: str) -> Tuple[str, int, int]:
+    """
+    Assign archive offsets to the segments and write the central directory.
+
+    The layout lists the S3 objects that make up the archive, in order, with
+    their archive offsets. upload_part uses it to assemble each part.
+
+    Args:
+        job_id: Job ID
+        zip_path: Logical S3 key of the zip file, as set by init_zip
+
+    Returns:
+        Tuple of layout key, archive size in bytes and number of entries
     """
     try:
-        return os.path.getsize(file_path)
+        working_prefix = os.path.dirname(zip_path)
+        entries = list_segment_entries(f"{working_prefix}/segments")
+
+        layout = []
+        offset = 0
+        for entry in entries:
+            entry["offset"] = offset
+            layout.append(
+                {
+                    "key": entry["segmentKey"],
+                    "start": offset,
+                    "size": entry["encodedSize"],
+                }
+            )
+            offset += entry["encodedSize"]
+
+        central_directory = build_central_directory(entries, offset)
+        central_directory_key = f"{working_prefix}/central_directory.bin"
+        s3.put_object(
+            Bucket=MEDIA_ASSETS_BUCKET,
+            Key=central_directory_key,
+            Body=central_directory,
+        )
+        layout.append(
+            {
+                "key": central_directory_key,
+                "start": offset,
+                "size": len(central_directory),
+            }
+        )
+        file_size = offset + len(central_directory)
+
+        layout_key = f"{working_prefix}/archive_layout.json"
+        s3.put_object(
+            Bucket=MEDIA_ASSETS_BUCKET,
+            Key=layout_key,
+            Body=json.dumps(layout),
+            ContentType="application/json",
+        )
+
+        logger.info(
+            "Created archive layout",
+            extra={
+                "jobId": job_id,
+                "layoutKey": layout_key,
+                "numEntries": len(entries),
+                "fileSize": file_size,
+            },
+        )
+
+        return layout_key, file_size, len(entries)
+
     except Exception as e:
         logger.error(
-            "Failed to get file size",
+            "Failed to create archive layout",
             extra={
                 "error": str(e),
-                "filePath": file_path,
+                "jobId": job_id,
+                "zipPath": zip_path,
             },
         )
         raise
@@ -156,7 +246,7 @@ def create_multipart_upload(s3_key: str) -> str:
 
 @tracer.capture_method
 def create_parts_manifest(
-    job_id: str, parts: List[Dict[str, Any]], local_path: str
+    job_id: str, parts: List[Dict[str, Any]], layout_key: str
 ) -> str:
     """
     Create a manifest of parts to be uploaded.
@@ -164,15 +254,15 @@ def create_parts_manifest(
     Args:
         job_id: Job ID
         parts: List of parts
-        local_path: Local path to the file
+        layout_key: S3 key of the archive layout
 
     Returns:
         S3 key of the manifest file
     """
     try:
-        # Add local path to each part
+        # Add the archive layout to each part
         for part in parts:
-            part["localPath"] = local_path
+            part["layoutKey"] = layout_key
 
         # Create the manifest file
         manifest_key = f"{MULTIPART_WORKING_PREFIX}/{job_id}/parts_manifest.json"
@@ -344,8 +434,8 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         if not job_id or not user_id or not zip_path:
             raise ValueError("Missing required parameters in event")
 
-        # Get the file size
-        file_size = get_file_size(zip_path)
+        # Stitch the segments and central directory into the archive layout
+        layout_key, file_size, num_entries = create_archive_layout(job_id, zip_path)
 
         # Calculate the parts
         parts = calculate_parts(file_size, PART_SIZE)
@@ -355,7 +445,7 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         upload_id = create_multipart_upload(s3_key)
 
         # Create a manifest of parts to be uploaded
-        manifest_key = create_parts_manifest(job_id, parts, zip_path)
+        manifest_key = create_parts_manifest(job_id, parts, layout_key)
 
         # Update the job record with multipart upload information
         update_job_multipart_info(
@@ -373,6 +463,9 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         metrics.add_metric(
             name="MultipartUploadsInitialized", unit=MetricUnit.Count, value=1
         )
+        metrics.add_metric(
+            name="ZipEntriesStitched", unit=MetricUnit.Count, value=num_entries
+        )
 
         return {
             "jobId": job_id,
@@ -1,10 +1,12 @@
 """
 Bulk Download Initialize Zip Lambda
 
-This Lambda function initializes a zip file on shared storage (EFS) by:
-1. Creating a directory structure for the job
-2. Creating an empty zip file
-3. Updating the job record with the zip file path
+This Lambda function initializes a bulk download archive by:
+1. Assigning the S3 working location for the job's zip segments
+2. Updating the job record with the zip path
+
+The archive itself is assembled in S3: append_to_zip writes one segment per
+file and init_multipart stitches them together with the central directory.
 
 The function implements AWS best practices including:
 - Structured logging with AWS Lambda Powertools
@@ -14,7 +16,6 @@ The function implements AWS best practices including:
 """
 
 import os
-import zipfile
 from datetime import datetime
 from typing import Any, Dict
 
@@ -36,11 +37,13 @@ dynamodb = boto3.resource("dynamodb")
 USER_TABLE_NAME = os.environ[
     "USER_TABLE_NAME"
 ]  # User table now stores bulk download jobs
-EFS_MOUNT_PATH = os.environ["EFS_MOUNT_PATH"]
 
 # Initialize DynamoDB table
 user_table = dynamodb.Table(USER_TABLE_NAME)  # User table for bulk download jobs
 
+# Constants
+MULTIPART_WORKING_PREFIX = "temp/zip/multipart"
+
 
 @tracer.capture_method
 def update_job_with_zip_path(user_id: str, job_id: str, zip_path: str) -> None:
@@ -50,7 +53,7 @@ def update_job_with_zip_path(user_id: str, job_id: str, zip_path: str) -> None:
     Args:
         user_id: ID of the user who owns the job
         job_id: ID of the job to update
-        zip_path: Path to the zip file
+        zip_path: Logical S3 key of the zip file
 
     Raises:
         Exception: If job update fails
@@ -129,7 +132,7 @@ def update_job_with_zip_path(user_id: str, job_id: str, zip_path: str) -> None:
 @metrics.log_metrics(capture_cold_start_metric=True)
 def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
     """
-    Lambda handler for initializing a zip file on shared storage.
+    Lambda handler for initializing a zip archive.
 
     Args:
         event: Event containing job details
@@ -146,22 +149,10 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
     if not user_id:
         raise ValueError("Missing userId in event")
 
-    # Create job directory on EFS
-    job_dir = os.path.join(EFS_MOUNT_PATH, job_id)
-    os.makedirs(job_dir, exist_ok=True)
-
-    # Create zip directory
-    zip_dir = os.path.join(job_dir, "zip")
-    os.makedirs(zip_dir, exist_ok=True)
-
-    # Create an empty zip file
-    zip_path = os.path.join(zip_dir, f"{job_id}.zip")
+    # Segments are written under the archive's working prefix in S3
+    zip_path = f"{MULTIPART_WORKING_PREFIX}/{job_id}/{job_id}.zip"
 
     try:
-        # Create an empty zip file
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as _:
-            pass
-
         # Update job record with zip path
         update_job_with_zip_path(user_id, job_id, zip_path)
 
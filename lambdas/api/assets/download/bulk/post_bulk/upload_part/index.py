@@ -1,9 +1,11 @@
 """
 Bulk Download Upload Part Lambda
 
-This Lambda function uploads a part of a file for a multipart upload:
-1. Reads the specified part from the local file
-2. Uploads the part to S3
+This Lambda function uploads a part of a zip archive for a multipart upload:
+1. Maps the part's byte range onto the archive layout (entry segments and
+   central directory) written by init_multipart
+2. Copies the part server-side when it lies within a single segment, otherwise
+   range-reads the pieces and uploads them as one part
 3. Returns the ETag of the uploaded part
 
 The function implements AWS best practices including:
@@ -15,8 +17,9 @@ The function implements AWS best practices including:
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import boto3
 from aws_lambda_powertools import Logger, Metrics, Tracer
@@ -24,6 +27,7 @@ from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.config import Config
 from botocore.exceptions import ClientError
+from zip_stream import pieces_for_range
 
 # Initialize AWS Lambda Powertools
 logger = Logger(service="bulk-download-upload-part")
@@ -41,12 +45,17 @@ USER_TABLE_NAME = os.environ[
     "USER_TABLE_NAME"
 ]  # User table now stores bulk download jobs
 MEDIA_ASSETS_BUCKET = os.environ["MEDIA_ASSETS_BUCKET"]
-EFS_MOUNT_PATH = os.environ["EFS_MOUNT_PATH"]
 SQS_QUEUE_URL = os.environ.get("SQS_QUEUE_URL", "")
 
 # Initialize DynamoDB table
 user_table = dynamodb.Table(USER_TABLE_NAME)  # User table for bulk download jobs
 
+# Constants
+PIECE_READ_CONCURRENCY = 8
+
+# Archive layouts are immutable once written, so cache them per container
+_layout_cache: Dict[str, List[Dict[str, Any]]] = {}
+
 
 @tracer.capture_method
 def update_job_progress(
@@ -219,46 +228,128 @@ def upload_part(
 
 
 @tracer.capture_method
-def read_part_from_file(file_path: str, start_byte: int, end_byte: int) -> bytes:
+def load_archive_layout(layout_key: str) -> List[Dict[str, Any]]:
     """
-    Read a part from a file.
+    Load the archive layout written by init_multipart.
 
     Args:
-        file_path: Path to the file
-        start_byte: Start byte
-        end_byte: End byte
+        layout_key: S3 key of the archive layout
 
     Returns:
-        Part data
+        List of objects making up the archive, with their archive offsets
     """
-    try:
-        with open(file_path, "rb") as f:
-            f.seek(start_byte)
-            data = f.read(end_byte - start_byte + 1)
+    if layout_key not in _layout_cache:
+        response = s3.get_object(Bucket=MEDIA_ASSETS_BUCKET, Key=layout_key)
+        _layout_cache[layout_key] = json.loads(
+            response["Body"].read().decode("utf-8")
+        )
+    return _layout_cache[layout_key]
 
-        logger.info(
-            "Read part from file",
-            extra={
-                "filePath": file_path,
-                "startByte": start_byte,
-                "endByte": end_byte,
-                "size": len(data),
-            },
+
+@tracer.capture_method
+def stage_part(
+    bucket: str,
+    key: str,
+    upload_id: str,
+    part_number: int,
+    layout_key: str,
+    start_byte: int,
+    end_byte: int,
+) -> Dict[str, Any]:
+    """
+    Upload one part of the archive from the objects that make it up.
+
+    A part that falls within a single segment is copied server-side with
+    UploadPartCopy, so its bytes never pass through the Lambda. A part that
+    spans several segments (many small files, or the central directory) is
+    range-read and uploaded as one part.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 key
+        upload_id: Upload ID
+        part_number: Part number
+        layout_key: S3 key of the archive layout
+        start_byte: First archive byte of the part
+        end_byte: Last archive byte of the part
+
+    Returns:
+        Dictionary containing the ETag of the uploaded part
+    """
+    pieces = pieces_for_range(load_archive_layout(layout_key), start_byte, end_byte)
+    if not pieces:
+        raise ValueError(
+            f"Part {part_number} ({start_byte}-{end_byte}) is outside the archive"
         )
 
-        return data
+    if len(pieces) == 1:
+        piece = pieces[0]
+        try:
+            response = s3.upload_part_copy(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                CopySource={"Bucket": MEDIA_ASSETS_BUCKET, "Key": piece["key"]},
+                CopySourceRange=f"bytes={piece['startByte']}-{piece['endByte']}",
+            )
 
-    except Exception as e:
-        logger.error(
-            "Failed to read part from file",
-            extra={
-                "error": str(e),
-                "filePath": file_path,
-                "startByte": start_byte,
-                "endByte": end_byte,
-            },
+            logger.info(
+                "Copied part",
+                extra={
+                    "bucket": bucket,
+                    "key": key,
+                    "uploadId": upload_id,
+                    "partNumber": part_number,
+                    "sourceKey": piece["key"],
+                    "size": end_byte - start_byte + 1,
+                    "etag": response["CopyPartResult"]["ETag"],
+                },
+            )
+            metrics.add_metric(name="PartsCopied", unit=MetricUnit.Count, value=1)
+
+            return {
+                "PartNumber": part_number,
+                "ETag": response["CopyPartResult"]["ETag"],
+            }
+
+        except Exception as e:
+            logger.error(
+                "Failed to copy part",
+                extra={
+                    "error": str(e),
+                    "bucket": bucket,
+                    "key": key,
+                    "uploadId": upload_id,
+                    "partNumber": part_number,
+                    "sourceKey": piece["key"],
+                },
+            )
+            raise
+
+    def read_piece(piece: Dict[str, Any]) -> bytes:
+        response = s3.get_object(
+            Bucket=MEDIA_ASSETS_BUCKET,
+            Key=piece["key"],
+            Range=f"bytes={piece['startByte']}-{piece['endByte']}",
         )
-        raise
+        return response["Body"].read()
+
+    with ThreadPoolExecutor(max_workers=PIECE_READ_CONCURRENCY) as executor:
+        body = b"".join(executor.map(read_piece, pieces))
+
+    logger.info(
+        "Read part from archive segments",
+        extra={
+            "partNumber": part_number,
+            "startByte": start_byte,
+            "endByte": end_byte,
+            "numPieces": len(pieces),
+            "size": len(body),
+        },
+    )
+
+    return upload_part(bucket, key, upload_id, part_number, body)
 
 
 @tracer.capture_method
@@ -490,7 +581,7 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
                     part_number = part_info.get("partNumber")
                     start_byte = part_info.get("startByte")
                     end_byte = part_info.get("endByte")
-                    local_path = part_info.get("localPath")
+                    layout_key = part_info.get("layoutKey")
 
                     if not all(
                         [
@@ -502,7 +593,7 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
                             part_number is not None,
                             start_byte is not None,
                             end_byte is not None,
-                            local_path is not None,
+                            layout_key is not None,
                         ]
                     ):
                         raise ValueError("Missing required parameters in part info")
@@ -526,7 +617,7 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
                     part_number = part_info.get("partNumber")
                     start_byte = part_info.get("startByte")
                     end_byte = part_info.get("endByte")
-                    local_path = part_info.get("localPath")
+                    layout_key = part_info.get("layoutKey")
                     manifest_key = part_info.get("manifestKey")
 
                     if not all(
@@ -538,7 +629,7 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
                             part_number is not None,
                             start_byte is not None,
                             end_byte is not None,
-                            local_path is not None,
+                            layout_key is not None,
                             manifest_key is not None,
                         ]
                     ):
@@ -550,12 +641,15 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
                     # Get total parts count from manifest
                     total_parts = get_total_parts_from_manifest(manifest_key)
 
-                    # Read the part from the file
-                    part_data = read_part_from_file(local_path, start_byte, end_byte)
-
-                    # Upload the part to S3
-                    result = upload_part(
-                        MEDIA_ASSETS_BUCKET, s3_key, upload_id, part_number, part_data
+                    # Upload the part to S3 from the archive segments
+                    result = stage_part(
+                        MEDIA_ASSETS_BUCKET,
+                        s3_key,
+                        upload_id,
+                        part_number,
+                        layout_key,
+                        start_byte,
+                        end_byte,
                     )
 
                     # Update job progress with accurate total parts count
@@ -618,14 +712,14 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
             part_number = part_info.get("partNumber")
             start_byte = part_info.get("startByte")
             end_byte = part_info.get("endByte")
-            local_path = part_info.get("localPath")
+            layout_key = part_info.get("layoutKey")
 
             if not all(
                 [
                     part_number is not None,
                     start_byte is not None,
                     end_byte is not None,
-                    local_path,
+                    layout_key,
                 ]
             ):
                 raise ValueError("Missing required parameters in part info")
@@ -633,12 +727,15 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
             # Get total parts count from manifest
             total_parts = get_total_parts_from_manifest(manifest_key)
 
-            # Read the part from the file
-            part_data = read_part_from_file(local_path, start_byte, end_byte)
-
-            # Upload the part to S3
-            result = upload_part(
-                MEDIA_ASSETS_BUCKET, s3_key, upload_id, part_number, part_data
+            # Upload the part to S3 from the archive segments
+            result = stage_part(
+                MEDIA_ASSETS_BUCKET,
+                s3_key,
+                upload_id,
+                part_number,
+                layout_key,
+                start_byte,
+                end_byte,
             )
 
             # Update job progress
@@ -667,14 +764,17 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
             part_number = part["partNumber"]
             start_byte = part["startByte"]
             end_byte = part["endByte"]
-            local_path = part["localPath"]
-
-            # Read the part from the file
-            part_data = read_part_from_file(local_path, start_byte, end_byte)
-
-            # Upload the part to S3
-            result = upload_part(
-                MEDIA_ASSETS_BUCKET, s3_key, upload_id, part_number, part_data
+            layout_key = part["layoutKey"]
+
+            # Upload the part to S3 from the archive segments
+            result = stage_part(
+                MEDIA_ASSETS_BUCKET,
+                s3_key,
+                upload_id,
+                part_number,
+                layout_key,
+                start_byte,
+                end_byte,
             )
 
             # Add the result to the list
@@ -14,6 +14,8 @@ It implements AWS best practices including:
 import copy
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from http import HTTPStatus
 from typing import Any, Dict, List
@@ -25,6 +27,7 @@ from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.exceptions import ClientError
+from s3_copy_engine import copy_object, delete_objects
 
 # Initialize AWS Lambda Powertools
 logger = Logger(service="asset-rename-service")
@@ -34,8 +37,27 @@ metrics = Metrics(namespace="AssetRenameService", service="asset-rename-service"
 # Initialize AWS clients with X-Ray tracing
 dynamodb = boto3.resource("dynamodb")
 s3 = boto3.client("s3")
+lambda_client = boto3.client("lambda")
 table = dynamodb.Table(os.environ["MEDIALAKE_ASSET_TABLE"])
 
+# Representations are copied concurrently; large ones are additionally split
+# into parallel part copies by s3_copy_engine
+RENAME_COPY_CONCURRENCY = int(os.environ.get("RENAME_COPY_CONCURRENCY", "8"))
+# Masters larger than this are renamed by an asynchronous self-invocation
+# instead of inside the API request, which API Gateway cuts off after 29s
+RENAME_SYNC_MAX_BYTES = int(
+    os.environ.get("RENAME_SYNC_MAX_BYTES", str(2 * 1024 * 1024 * 1024))
+)
+
+# Asynchronous renames record their progress on the asset record, where
+# GET /assets/{id} returns it: {"status", "newName", "startedAt", ...}
+RENAME_JOB_ATTRIBUTE = "RenameJob"
+RENAME_IN_PROGRESS = "IN_PROGRESS"
+RENAME_COMPLETED = "COMPLETED"
+RENAME_FAILED = "FAILED"
+# A job still IN_PROGRESS after the 15 minute Lambda timeout was lost
+RENAME_JOB_STALE_AFTER = timedelta(minutes=16)
+
 
 def join_key(base_path: str, name: str) -> str:
     """
@@ -304,13 +326,13 @@ def copy_s3_object_with_tags(
             if is_master and master_id:
                 tags.append({"Key": "MasterID", "Value": master_id})
 
-        # Copy object with tags
-        s3.copy_object(
-            Bucket=dest_bucket,
-            CopySource={"Bucket": source_bucket, "Key": source_key},
-            Key=dest_key,
-            TaggingDirective="REPLACE",
-            Tagging=format_tags_for_copy(tags),
+        # Copy object with tags (multipart above the engine's size threshold)
+        size = copy_object(
+            source_bucket,
+            source_key,
+            dest_bucket,
+            dest_key,
+            tagging=format_tags_for_copy(tags),
         )
 
         logger.info(
@@ -320,6 +342,7 @@ def copy_s3_object_with_tags(
                 "source_key": source_key,
                 "dest_bucket": dest_bucket,
                 "dest_key": dest_key,
+                "size_bytes": size,
                 "tags_count": len(tags),
                 "inventory_id": inventory_id,
                 "master_id": master_id if is_master else None,
@@ -485,18 +508,18 @@ def copy_s3_objects(asset: Dict[str, Any], new_name: str) -> List[Dict[str, Any]
             },
         )
 
-        # Copy main representation with both inventory ID and master ID tags
-        copy_s3_object_with_tags(
-            source_bucket,
-            source_path,
-            source_bucket,
-            new_path,
-            inventory_id,
-            master_id,
-            is_master=True,  # This is the master representation
-        )
-
-        successful_copies.append({"bucket": source_bucket, "key": new_path})
+        # Main representation is copied with both inventory ID and master ID tags
+        copy_tasks = [
+            {
+                "source_bucket": source_bucket,
+                "source_key": source_path,
+                "dest_bucket": source_bucket,
+                "dest_key": new_path,
+                "inventory_id": inventory_id,
+                "master_id": master_id,
+                "is_master": True,  # This is the master representation
+            }
+        ]
 
         # Copy derived representations (only with inventory ID)
         for idx, derived in enumerate(
@@ -559,7 +582,7 @@ def copy_s3_objects(asset: Dict[str, Any], new_name: str) -> List[Dict[str, Any]
             derived["Name"] = new_derived_name
 
             logger.info(
-                f"Copying derived representation {idx + 1}",
+                f"Queueing derived representation {idx + 1}",
                 extra={
                     "derived_index": idx,
                     "source_bucket": derived_bucket,
@@ -571,20 +594,17 @@ def copy_s3_objects(asset: Dict[str, Any], new_name: str) -> List[Dict[str, Any]
                 },
             )
 
-            # Copy derived representation with only inventory ID tag
-            copy_s3_object_with_tags(
-                derived_bucket,
-                derived_path,
-                derived_bucket,
-                new_derived_path,
-                inventory_id,
-                is_master=False,  # This is not the master representation
-            )
-
-            successful_copies.append(
-                {"bucket": derived_bucket, "key": new_derived_path}
+            # Derived representations are copied with only the inventory ID tag
+            copy_tasks.append(
+                {
+                    "source_bucket": derived_bucket,
+                    "source_key": derived_path,
+                    "dest_bucket": derived_bucket,
+                    "dest_key": new_derived_path,
+                    "inventory_id": inventory_id,
+                    "is_master": False,  # This is not the master representation
+                }
             )
-        logger.info("Copy Derived Representations")
         # — now ALSO copy the top-level DerivedRepresentations —
 
         for dr in asset.get("DerivedRepresentations", []):
@@ -601,12 +621,18 @@ def copy_s3_objects(asset: Dict[str, Any], new_name: str) -> List[Dict[str, Any]
             storage["ObjectKey"]["FullPath"] = new_full
             storage["ObjectKey"]["Name"] = new_filename
 
-            # now copy it
-            logger.info(f"Copying {old_full} to {new_full} in {bucket}")
-            copy_s3_object_with_tags(
-                bucket, old_full, bucket, new_full, inventory_id, is_master=False
+            copy_tasks.append(
+                {
+                    "source_bucket": bucket,
+                    "source_key": old_full,
+                    "dest_bucket": bucket,
+                    "dest_key": new_full,
+                    "inventory_id": inventory_id,
+                    "is_master": False,
+                }
             )
-            successful_copies.append({"bucket": bucket, "key": new_full})
+
+        run_copy_tasks(copy_tasks, successful_copies)
 
         return successful_copies, orig_derived_paths
 
@@ -627,6 +653,47 @@ def copy_s3_objects(asset: Dict[str, Any], new_name: str) -> List[Dict[str, Any]
         raise AssetRenameError(f"Failed to copy S3 objects: {str(e)}")
 
 
+@tracer.capture_method
+def run_copy_tasks(
+    copy_tasks: List[Dict[str, Any]], successful_copies: List[Dict[str, Any]]
+) -> None:
+    """
+    Runs copy_s3_object_with_tags for every task concurrently.
+
+    Each completed copy is appended to successful_copies so the caller can
+    roll it back. If any copy fails, the first error is raised once all
+    in-flight copies have finished.
+    """
+    logger.info(
+        f"Copying {len(copy_tasks)} representations",
+        extra={"object_count": len(copy_tasks), "operation": "copy_representations"},
+    )
+
+    first_error = None
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(RENAME_COPY_CONCURRENCY, len(copy_tasks)))
+    ) as executor:
+        futures = {
+            executor.submit(copy_s3_object_with_tags, **task): task
+            for task in copy_tasks
+        }
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                future.result()
+                successful_copies.append(
+                    {"bucket": task["dest_bucket"], "key": task["dest_key"]}
+                )
+            except Exception as e:
+                first_error = first_error or e
+                # Copies that have not started yet would only be rolled back
+                for pending in futures:
+                    pending.cancel()
+
+    if first_error:
+        raise first_error
+
+
 @tracer.capture_method
 def cleanup_copied_objects(copies: List[Dict[str, Any]]) -> None:
     """Deletes any successfully copied objects during rollback."""
@@ -638,22 +705,16 @@ def cleanup_copied_objects(copies: List[Dict[str, Any]]) -> None:
         extra={"operation": "cleanup_rollback", "object_count": len(copies)},
     )
 
-    cleanup_errors = []
-    for i, copied_obj in enumerate(copies):
-        try:
-            s3.delete_object(Bucket=copied_obj["bucket"], Key=copied_obj["key"])
-            logger.info(
-                f"Successfully cleaned up copied object {i+1}/{len(copies)}",
-                extra={
-                    "bucket": copied_obj["bucket"],
-                    "key": copied_obj["key"],
-                    "operation": "cleanup_success",
-                },
+    try:
+        cleanup_errors = [
+            f"Failed to cleanup copied object {error['bucket']}/{error['key']}: "
+            f"{error['code']} {error['message']}"
+            for error in delete_objects(
+                (copied_obj["bucket"], copied_obj["key"]) for copied_obj in copies
             )
-        except ClientError as e:
-            error_msg = f"Failed to cleanup copied object {copied_obj['bucket']}/{copied_obj['key']}: {str(e)}"
-            logger.error(error_msg)
-            cleanup_errors.append(error_msg)
+        ]
+    except ClientError as e:
+        cleanup_errors = [f"Failed to cleanup copied objects: {str(e)}"]
 
     if cleanup_errors:
         logger.error(
@@ -731,8 +792,21 @@ def delete_original_objects(asset: Dict[str, Any]) -> None:
                 }
             )
 
+        # — also delete the top-level DerivedRepresentations files —
+        for idx, dr in enumerate(asset.get("DerivedRepresentations", [])):
+            loc = dr["StorageInfo"]["PrimaryLocation"]
+            objects_to_delete.append(
+                {
+                    "bucket": loc["Bucket"],
+                    "key": loc["ObjectKey"]["FullPath"],
+                    "type": "derived",
+                    "index": idx,
+                    "critical": True,
+                }
+            )
+
         logger.info(
-            f"Starting atomic deletion of {len(objects_to_delete)} original objects",
+            f"Starting batched deletion of {len(objects_to_delete)} original objects",
             extra={
                 "inventory_id": inventory_id,
                 "total_objects": len(objects_to_delete),
@@ -740,100 +814,35 @@ def delete_original_objects(asset: Dict[str, Any]) -> None:
             },
         )
 
-        # Delete objects one by one - fail fast on any error
-        deleted_objects = []
-        for obj in objects_to_delete:
-            try:
-                logger.info(
-                    f"Deleting {obj['type']} representation",
-                    extra={
-                        "inventory_id": inventory_id,
-                        "bucket": obj["bucket"],
-                        "key": obj["key"],
-                        "type": obj["type"],
-                        "index": obj["index"],
-                        "operation": f"delete_{obj['type']}_representation",
-                    },
-                )
-
-                # Verify object exists before attempting deletion
-                if not check_object_exists(obj["bucket"], obj["key"]):
-                    logger.warning(
-                        f"{obj['type']} object already deleted or doesn't exist",
-                        extra={
-                            "inventory_id": inventory_id,
-                            "bucket": obj["bucket"],
-                            "key": obj["key"],
-                            "type": obj["type"],
-                            "operation": f"delete_{obj['type']}_already_gone",
-                        },
-                    )
-                    # Continue - object is already gone, which is what we want
-                    continue
-
-                # Perform the deletion
-                s3.delete_object(Bucket=obj["bucket"], Key=obj["key"])
-                deleted_objects.append(obj)
-
-                # Verify deletion was successful
-                if check_object_exists(obj["bucket"], obj["key"]):
-                    raise ClientError(
-                        error_response={
-                            "Error": {
-                                "Code": "DeletionVerificationFailed",
-                                "Message": f"Object still exists after deletion: {obj['key']}",
-                            }
-                        },
-                        operation_name="delete_object",
-                    )
-
-                logger.info(
-                    f"Successfully deleted and verified {obj['type']} representation",
-                    extra={
-                        "inventory_id": inventory_id,
-                        "bucket": obj["bucket"],
-                        "key": obj["key"],
-                        "type": obj["type"],
-                        "index": obj["index"],
-                        "operation": f"delete_{obj['type']}_representation_success",
-                    },
-                )
-
-            except ClientError as e:
-                error_code = e.response.get("Error", {}).get("Code", "Unknown")
-                error_msg = f"Failed to delete {obj['type']} object {obj['bucket']}/{obj['key']}: {str(e)}"
-
+        # DeleteObjects reports failures per key; keys that are already gone
+        # count as deleted, which is what we want
+        errors = delete_objects(
+            (obj["bucket"], obj["key"]) for obj in objects_to_delete
+        )
+        if errors:
+            for error in errors:
                 logger.error(
-                    f"CRITICAL: Deletion failed for {obj['type']} representation",
+                    "CRITICAL: Deletion failed for representation",
                     extra={
                         "inventory_id": inventory_id,
-                        "bucket": obj["bucket"],
-                        "key": obj["key"],
-                        "type": obj["type"],
-                        "index": obj["index"],
-                        "error_code": error_code,
-                        "error_message": str(e),
-                        "deleted_so_far": len(deleted_objects),
-                        "operation": f"delete_{obj['type']}_error_critical",
+                        "bucket": error["bucket"],
+                        "key": error["key"],
+                        "error_code": error["code"],
+                        "error_message": error["message"],
+                        "operation": "delete_representation_error_critical",
                     },
                 )
-
-                # FAIL FAST: Any deletion failure is now critical
-                raise Exception(f"Critical deletion failure: {error_msg}")
-
-        # — also delete the top-level DerivedRepresentations files —
-        for dr in asset.get("DerivedRepresentations", []):
-            loc = dr["StorageInfo"]["PrimaryLocation"]
-            bucket = loc["Bucket"]
-            key = loc["ObjectKey"]["FullPath"]
-            s3.delete_object(Bucket=bucket, Key=key)
+            # FAIL FAST: Any deletion failure is critical
+            raise Exception(
+                f"Critical deletion failure: {len(errors)} of "
+                f"{len(objects_to_delete)} objects could not be deleted"
+            )
 
         logger.info(
-            f"Successfully deleted all {len(objects_to_delete)} original objects atomically",
+            f"Successfully deleted all {len(objects_to_delete)} original objects",
             extra={
                 "inventory_id": inventory_id,
                 "total_objects": len(objects_to_delete),
-                "deleted_objects": len(deleted_objects),
                 "operation": "delete_completed_success",
             },
         )
@@ -992,6 +1001,141 @@ def check_object_exists(bucket: str, key: str) -> bool:
             raise
 
 
+def get_master_size(asset: Dict[str, Any]) -> int:
+    """Size of the master object in bytes, or 0 if it cannot be read."""
+    storage = asset["DigitalSourceAsset"]["MainRepresentation"]["StorageInfo"][
+        "PrimaryLocation"
+    ]
+    try:
+        return s3.head_object(
+            Bucket=storage["Bucket"], Key=storage["ObjectKey"]["FullPath"]
+        )["ContentLength"]
+    except ClientError:
+        # A missing master is handled (and reported) by copy_s3_objects
+        return 0
+
+
+def rename_in_progress(asset: Dict[str, Any]) -> bool:
+    """Whether an asynchronous rename of the asset is still running."""
+    job = asset.get(RENAME_JOB_ATTRIBUTE) or {}
+    if job.get("status") != RENAME_IN_PROGRESS:
+        return False
+    stale_before = datetime.now(timezone.utc) - RENAME_JOB_STALE_AFTER
+    return job.get("startedAt", "") >= stale_before.isoformat()
+
+
+@tracer.capture_method
+def mark_rename_started(inventory_id: str, new_name: str) -> None:
+    """
+    Records an IN_PROGRESS rename job on the asset record.
+
+    The write is conditional so that two renames of the same asset cannot
+    run at once; a job that outlived the Lambda timeout does not block.
+    """
+    now = datetime.now(timezone.utc)
+    try:
+        table.update_item(
+            Key={"InventoryID": inventory_id},
+            UpdateExpression="SET #job = :job",
+            ConditionExpression=(
+                "attribute_exists(InventoryID) AND (attribute_not_exists(#job) "
+                "OR #job.#status <> :in_progress OR #job.startedAt < :stale_before)"
+            ),
+            ExpressionAttributeNames={
+                "#job": RENAME_JOB_ATTRIBUTE,
+                "#status": "status",
+            },
+            ExpressionAttributeValues={
+                ":job": {
+                    "status": RENAME_IN_PROGRESS,
+                    "newName": new_name,
+                    "startedAt": now.isoformat(),
+                },
+                ":in_progress": RENAME_IN_PROGRESS,
+                ":stale_before": (now - RENAME_JOB_STALE_AFTER).isoformat(),
+            },
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            raise AssetRenameError(
+                "A rename of this asset is already in progress", HTTPStatus.CONFLICT
+            )
+        raise AssetRenameError(f"Failed to start rename job: {str(e)}")
+
+
+@tracer.capture_method
+def mark_rename_finished(inventory_id: str, error: str = None) -> None:
+    """Records the outcome of an asynchronous rename on the asset record."""
+    update_expression = "SET #job.#status = :status, #job.finishedAt = :finished_at"
+    values: Dict[str, Any] = {
+        ":status": RENAME_FAILED if error else RENAME_COMPLETED,
+        ":finished_at": datetime.now(timezone.utc).isoformat(),
+    }
+    if error:
+        update_expression += ", #job.#error = :error"
+        values[":error"] = error
+    try:
+        table.update_item(
+            Key={"InventoryID": inventory_id},
+            UpdateExpression=update_expression,
+            ConditionExpression="attribute_exists(#job)",
+            ExpressionAttributeNames={
+                "#job": RENAME_JOB_ATTRIBUTE,
+                "#status": "status",
+                **({"#error": "error"} if error else {}),
+            },
+            ExpressionAttributeValues=values,
+        )
+    except ClientError as e:
+        logger.error(
+            "Failed to record rename job outcome",
+            extra={"inventory_id": inventory_id, "error": str(e)},
+        )
+
+
+@tracer.capture_method
+def start_rename_job(
+    context: LambdaContext, asset: Dict[str, Any], new_name: str
+) -> None:
+    """
+    Hands the rename off to an asynchronous invocation of this function.
+
+    The target conflict check runs here so that a 409 still reaches the
+    caller instead of being lost in the background job. The job's progress
+    is recorded on the asset record for the caller to poll.
+    """
+    storage = asset["DigitalSourceAsset"]["MainRepresentation"]["StorageInfo"][
+        "PrimaryLocation"
+    ]
+    new_object_name = get_object_name_from_path(new_name)
+    new_path = join_key(
+        get_object_path(storage["ObjectKey"]["FullPath"]), new_object_name
+    )
+    if check_object_exists(storage["Bucket"], new_path):
+        raise AssetRenameError(
+            f"Cannot rename asset: target file '{new_object_name}' already exists.",
+            HTTPStatus.CONFLICT,
+        )
+
+    mark_rename_started(asset["InventoryID"], new_name)
+    try:
+        lambda_client.invoke(
+            FunctionName=context.invoked_function_arn,
+            InvocationType="Event",
+            Payload=json.dumps(
+                {
+                    "renameJob": {
+                        "inventoryId": asset["InventoryID"],
+                        "newName": new_name,
+                    }
+                }
+            ).encode("utf-8"),
+        )
+    except ClientError as e:
+        mark_rename_finished(asset["InventoryID"], error=str(e))
+        raise AssetRenameError(f"Failed to start rename job: {str(e)}")
+
+
 def create_response(
     status_code: int, message: str, data: Dict[str, Any] = None
 ) -> Dict[str, Any]:
@@ -1020,23 +1164,57 @@ def lambda_handler(
     event: APIGatewayProxyEvent, context: LambdaContext
 ) -> Dict[str, Any]:
     """Lambda handler for asset renaming: 1) update DB paths, 2) copy S3 objects, 3) delete originals."""
+    inventory_id = None
+    rename_job = event.get("renameJob")
     try:
-        # 1) Extract and validate InventoryID
-        inventory_id = event.get("pathParameters", {}).get("id")
-        if not inventory_id:
-            raise AssetRenameError("Missing inventory ID", HTTPStatus.BAD_REQUEST)
-
-        # 2) Parse and validate newName
-        body = json.loads(event.get("body", "{}"))
-        new_name = body.get("newName")
-        if new_name is None:
-            raise AssetRenameError(
-                "Missing newName in request body", HTTPStatus.BAD_REQUEST
-            )
+        if rename_job:
+            # Asynchronous continuation of a rename too large for the API request
+            inventory_id = rename_job["inventoryId"]
+            new_name = rename_job["newName"]
+        else:
+            # 1) Extract and validate InventoryID
+            inventory_id = (event.get("pathParameters") or {}).get("id")
+            if not inventory_id:
+                raise AssetRenameError("Missing inventory ID", HTTPStatus.BAD_REQUEST)
+
+            # 2) Parse and validate newName
+            body = json.loads(event.get("body") or "{}")
+            new_name = body.get("newName")
+            if new_name is None:
+                raise AssetRenameError(
+                    "Missing newName in request body", HTTPStatus.BAD_REQUEST
+                )
         validate_name(new_name)
 
         # 3) Load current asset metadata and snapshot for S3 operations
         asset = get_asset(inventory_id)
+
+        if not rename_job:
+            if rename_in_progress(asset):
+                raise AssetRenameError(
+                    "A rename of this asset is already in progress",
+                    HTTPStatus.CONFLICT,
+                )
+            master_size = get_master_size(asset)
+            if master_size > RENAME_SYNC_MAX_BYTES:
+                start_rename_job(context, asset, new_name)
+                logger.info(
+                    "Handed off rename of large master to an asynchronous job",
+                    extra={"inventory_id": inventory_id, "size_bytes": master_size},
+                )
+                metrics.add_metric(
+                    name="AsyncAssetRenames", unit=MetricUnit.Count, value=1
+                )
+                return create_response(
+                    HTTPStatus.ACCEPTED,
+                    "Asset rename started; poll the asset for RenameJob.status",
+                    {
+                        "inventoryId": inventory_id,
+                        "newName": new_name,
+                        "status": RENAME_IN_PROGRESS,
+                    },
+                )
+
         original_asset = copy.deepcopy(asset)
 
         logger.info(
@@ -1055,6 +1233,8 @@ def lambda_handler(
         delete_original_objects(original_asset)
 
         # 7) Record successful rename
+        if rename_job:
+            mark_rename_finished(inventory_id)
         metrics.add_metric(name="AssetRenames", unit=MetricUnit.Count, value=1)
         return create_response(HTTPStatus.OK, "Asset renamed successfully")
 
@@ -1063,13 +1243,23 @@ def lambda_handler(
             f"Asset rename failed: {e}",
             extra={"inventory_id": inventory_id, "error_code": e.status_code},
         )
+        if rename_job and inventory_id:
+            mark_rename_finished(inventory_id, error=str(e))
+            metrics.add_metric(
+                name="AsyncAssetRenameFailures", unit=MetricUnit.Count, value=1
+            )
         return create_response(e.status_code, str(e))
 
     except Exception as e:
         logger.error(
             f"Unexpected error during asset rename: {e}",
-            extra={"inventory_id": event.get("pathParameters", {}).get("id")},
+            extra={"inventory_id": inventory_id},
         )
+        if rename_job and inventory_id:
+            mark_rename_finished(inventory_id, error="Internal server error")
+            metrics.add_metric(
+                name="AsyncAssetRenameFailures", unit=MetricUnit.Count, value=1
+            )
         metrics.add_metric(name="UnexpectedErrors", unit=MetricUnit.Count, value=1)
         return create_response(
             HTTPStatus.INTERNAL_SERVER_ERROR, "Internal server error"
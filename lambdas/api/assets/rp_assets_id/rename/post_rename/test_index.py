@@ -0,0 +1,167 @@
+"""
+Unit tests for asynchronous asset renames.
+
+Tests that large renames record a pollable RenameJob on the asset record, that
+the background job reports its outcome there, and that a second rename is
+refused while one is in progress.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("MEDIALAKE_ASSET_TABLE", "assets")
+
+import index
+import pytest
+from botocore.exceptions import ClientError
+
+
+def _asset(rename_job=None):
+    asset = {
+        "InventoryID": "asset-1",
+        "DigitalSourceAsset": {
+            "MainRepresentation": {
+                "StorageInfo": {
+                    "PrimaryLocation": {
+                        "Bucket": "media",
+                        "ObjectKey": {"FullPath": "clips/a.mp4", "Name": "a.mp4"},
+                    }
+                }
+            }
+        },
+    }
+    if rename_job:
+        asset[index.RENAME_JOB_ATTRIBUTE] = rename_job
+    return asset
+
+
+def _api_event(new_name="b.mp4"):
+    return {
+        "pathParameters": {"id": "asset-1"},
+        "body": json.dumps({"newName": new_name}),
+    }
+
+
+def _job_event():
+    return {"renameJob": {"inventoryId": "asset-1", "newName": "b.mp4"}}
+
+
+def _conditional_check_failed():
+    return ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+        "UpdateItem",
+    )
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    """Asset table, Lambda client and rename steps replaced with mocks."""
+    table, lambda_client, copy_s3_objects = MagicMock(), MagicMock(), MagicMock()
+    monkeypatch.setattr(index, "table", table)
+    monkeypatch.setattr(index, "lambda_client", lambda_client)
+    monkeypatch.setattr(index, "get_asset", lambda inventory_id: _asset())
+    monkeypatch.setattr(index, "check_object_exists", lambda bucket, key: False)
+    monkeypatch.setattr(index, "update_asset_paths", MagicMock())
+    monkeypatch.setattr(index, "copy_s3_objects", copy_s3_objects)
+    monkeypatch.setattr(index, "delete_original_objects", MagicMock())
+    return table, lambda_client, copy_s3_objects
+
+
+@pytest.fixture
+def context():
+    ctx = MagicMock()
+    ctx.invoked_function_arn = "arn:aws:lambda:us-east-1:123:function:rename"
+    return ctx
+
+
+def _job_status_updates(table):
+    return [
+        c.kwargs["ExpressionAttributeValues"]
+        for c in table.update_item.call_args_list
+    ]
+
+
+class TestAsyncRename:
+    """Test suite for renames handed off to a background job"""
+
+    def test_large_rename_records_a_pollable_job(self, aws, context):
+        """Test that a 202 rename writes an IN_PROGRESS RenameJob first"""
+        table, lambda_client, _ = aws
+        with patch.object(index, "get_master_size", return_value=2**40):
+            response = index.lambda_handler(_api_event(), context)
+
+        assert response["statusCode"] == 202
+        assert json.loads(response["body"])["data"]["status"] == "IN_PROGRESS"
+        job = _job_status_updates(table)[0][":job"]
+        assert (job["status"], job["newName"]) == ("IN_PROGRESS", "b.mp4")
+        lambda_client.invoke.assert_called_once()
+
+    def test_concurrent_rename_is_refused(self, aws, context):
+        """Test that the conditional job write turns into a 409"""
+        table, lambda_client, _ = aws
+        table.update_item.side_effect = _conditional_check_failed()
+        with patch.object(index, "get_master_size", return_value=2**40):
+            response = index.lambda_handler(_api_event(), context)
+
+        assert response["statusCode"] == 409
+        lambda_client.invoke.assert_not_called()
+
+    def test_failed_handoff_marks_the_job_failed(self, aws, context):
+        """Test that a failed self-invocation is recorded and reported"""
+        table, lambda_client, _ = aws
+        lambda_client.invoke.side_effect = ClientError(
+            {"Error": {"Code": "TooManyRequestsException", "Message": ""}}, "Invoke"
+        )
+        with patch.object(index, "get_master_size", return_value=2**40):
+            response = index.lambda_handler(_api_event(), context)
+
+        assert response["statusCode"] == 500
+        assert _job_status_updates(table)[-1][":status"] == "FAILED"
+
+    def test_job_records_completion(self, aws, context):
+        """Test that a finished background rename marks the job COMPLETED"""
+        table, _, _ = aws
+
+        response = index.lambda_handler(_job_event(), context)
+
+        assert response["statusCode"] == 200
+        assert _job_status_updates(table)[-1][":status"] == "COMPLETED"
+
+    def test_job_records_failure(self, aws, context):
+        """Test that a failed background rename marks the job FAILED with the error"""
+        table, _, copy_s3_objects = aws
+        copy_s3_objects.side_effect = index.AssetRenameError("copy failed")
+
+        index.lambda_handler(_job_event(), context)
+
+        values = _job_status_updates(table)[-1]
+        assert (values[":status"], values[":error"]) == ("FAILED", "copy failed")
+
+
+class TestRenameInProgress:
+    """Test suite for detecting a running rename job"""
+
+    def test_running_job_blocks_a_synchronous_rename(self, aws, context):
+        """Test that a small rename is refused while a job is running"""
+        started = datetime.now(timezone.utc).isoformat()
+        running = _asset({"status": "IN_PROGRESS", "startedAt": started})
+        with patch.object(index, "get_asset", return_value=running):
+            response = index.lambda_handler(_api_event(), context)
+
+        assert response["statusCode"] == 409
+
+    @pytest.mark.parametrize(
+        "job",
+        [
+            None,
+            {"status": "COMPLETED", "startedAt": "2026-01-01T00:00:00+00:00"},
+            {"status": "IN_PROGRESS", "startedAt": "2020-01-01T00:00:00+00:00"},
+        ],
+    )
+    def test_finished_or_stale_jobs_do_not_block(self, job):
+        """Test that only a recent IN_PROGRESS job counts as running"""
+        assert not index.rename_in_progress(_asset(job))
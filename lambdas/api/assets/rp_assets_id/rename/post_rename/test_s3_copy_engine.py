@@ -0,0 +1,198 @@
+"""
+Unit tests for the s3_copy_engine copy and delete helpers used by renames.
+
+Tests that part ranges cover an object exactly within the S3 multipart limits,
+that large objects are copied as pinned parallel part copies, that a failed
+part aborts the upload, and that deletes are deduplicated and batched.
+"""
+
+import os
+from unittest.mock import MagicMock
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import pytest
+import s3_copy_engine
+from botocore.exceptions import ClientError
+from s3_copy_engine import (
+    MAX_PARTS,
+    MIN_PART_SIZE_BYTES,
+    copy_object,
+    delete_objects,
+    part_ranges,
+)
+
+MIB = 1024 * 1024
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """S3 client stand-in with a 12 MiB source that copies in three parts."""
+    client = MagicMock()
+    client.head_object.return_value = {
+        "ContentLength": 12 * MIB,
+        "ETag": '"source-etag"',
+        "ContentType": "video/mp4",
+        "Metadata": {"origin": "camera"},
+    }
+    client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    client.get_object_tagging.return_value = {
+        "TagSet": [{"Key": "project", "Value": "demo reel"}]
+    }
+    client.upload_part_copy.side_effect = lambda **kwargs: {
+        "CopyPartResult": {"ETag": f'"part-{kwargs["PartNumber"]}"'}
+    }
+    monkeypatch.setattr(s3_copy_engine, "s3", client)
+    monkeypatch.setattr(s3_copy_engine, "MULTIPART_THRESHOLD_BYTES", 8 * MIB)
+    monkeypatch.setattr(s3_copy_engine, "PART_SIZE_BYTES", 5 * MIB)
+    return client
+
+
+def _client_error(code):
+    return ClientError({"Error": {"Code": code, "Message": code}}, "UploadPartCopy")
+
+
+class TestPartRanges:
+    """Test suite for splitting an object into part copy ranges"""
+
+    @pytest.mark.parametrize("size", [1, 5 * MIB, 5 * MIB + 1, 12 * MIB])
+    def test_ranges_cover_the_object_exactly(self, size):
+        """Test that ranges are contiguous, inclusive and end at the last byte"""
+        ranges = part_ranges(size, 5 * MIB)
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == size - 1
+        assert all(end + 1 == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+    def test_part_size_is_raised_to_the_s3_minimum(self):
+        """Test that parts are never smaller than 5 MiB, except the last"""
+        ranges = part_ranges(12 * MIB, 1)
+
+        assert [end - start + 1 for start, end in ranges] == [
+            MIN_PART_SIZE_BYTES,
+            MIN_PART_SIZE_BYTES,
+            2 * MIB,
+        ]
+
+    def test_part_count_stays_within_the_s3_limit(self):
+        """Test that a huge object is split into at most 10,000 parts"""
+        size = 5 * 1024 * 1024 * MIB
+
+        ranges = part_ranges(size, 5 * MIB)
+
+        assert len(ranges) <= MAX_PARTS
+        assert ranges[-1][1] == size - 1
+
+
+class TestCopyObject:
+    """Test suite for single-request and multipart copies"""
+
+    def test_small_object_uses_copy_object(self, s3):
+        """Test that objects below the threshold are one pinned CopyObject"""
+        s3.head_object.return_value = {"ContentLength": MIB, "ETag": '"small"'}
+
+        assert copy_object("src", "a.mp4", "dst", "b.mp4", tagging="k=v") == MIB
+
+        s3.copy_object.assert_called_once_with(
+            Bucket="dst",
+            Key="b.mp4",
+            CopySource={"Bucket": "src", "Key": "a.mp4"},
+            CopySourceIfMatch='"small"',
+            TaggingDirective="REPLACE",
+            Tagging="k=v",
+        )
+        s3.create_multipart_upload.assert_not_called()
+
+    def test_large_object_is_copied_in_pinned_parts(self, s3):
+        """Test that every part is pinned to the source ETag and completed in order"""
+        progress = MagicMock()
+
+        copy_object("src", "a.mp4", "dst", "b.mp4", progress=progress)
+
+        s3.create_multipart_upload.assert_called_once_with(
+            Bucket="dst",
+            Key="b.mp4",
+            ContentType="video/mp4",
+            Metadata={"origin": "camera"},
+            Tagging="project=demo+reel",
+        )
+        part_calls = s3.upload_part_copy.call_args_list
+        assert sorted(
+            (c.kwargs["PartNumber"], c.kwargs["CopySourceRange"]) for c in part_calls
+        ) == [
+            (1, f"bytes=0-{5 * MIB - 1}"),
+            (2, f"bytes={5 * MIB}-{10 * MIB - 1}"),
+            (3, f"bytes={10 * MIB}-{12 * MIB - 1}"),
+        ]
+        assert {c.kwargs["CopySourceIfMatch"] for c in part_calls} == {
+            '"source-etag"'
+        }
+        s3.complete_multipart_upload.assert_called_once_with(
+            Bucket="dst",
+            Key="b.mp4",
+            UploadId="upload-1",
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": n, "ETag": f'"part-{n}"'} for n in (1, 2, 3)
+                ]
+            },
+        )
+        s3.abort_multipart_upload.assert_not_called()
+        assert progress.call_args.args == (12 * MIB, 12 * MIB)
+
+    def test_failed_part_aborts_the_upload(self, s3):
+        """Test that a part failure aborts the multipart upload and re-raises"""
+
+        def upload_part_copy(**kwargs):
+            if kwargs["PartNumber"] == 2:
+                raise _client_error("PreconditionFailed")
+            return {"CopyPartResult": {"ETag": '"ok"'}}
+
+        s3.upload_part_copy.side_effect = upload_part_copy
+
+        with pytest.raises(ClientError):
+            copy_object("src", "a.mp4", "dst", "b.mp4")
+
+        s3.complete_multipart_upload.assert_not_called()
+        s3.abort_multipart_upload.assert_called_once_with(
+            Bucket="dst", Key="b.mp4", UploadId="upload-1"
+        )
+
+    def test_failed_complete_aborts_the_upload(self, s3):
+        """Test that a failed CompleteMultipartUpload also aborts the upload"""
+        s3.complete_multipart_upload.side_effect = _client_error("InternalError")
+
+        with pytest.raises(ClientError):
+            copy_object("src", "a.mp4", "dst", "b.mp4")
+
+        s3.abort_multipart_upload.assert_called_once()
+
+
+class TestDeleteObjects:
+    """Test suite for batched DeleteObjects requests"""
+
+    def test_keys_are_deduplicated_and_batched_per_bucket(self, s3, monkeypatch):
+        """Test that duplicate keys are sent once, in batches per bucket"""
+        monkeypatch.setattr(s3_copy_engine, "DELETE_BATCH_SIZE", 2)
+        s3.delete_objects.return_value = {}
+
+        errors = delete_objects(
+            [("a", "1"), ("a", "2"), ("b", "1"), ("a", "1"), ("a", "3")]
+        )
+
+        assert errors == []
+        assert [
+            (c.kwargs["Bucket"], [o["Key"] for o in c.kwargs["Delete"]["Objects"]])
+            for c in s3.delete_objects.call_args_list
+        ] == [("a", ["1", "2"]), ("a", ["3"]), ("b", ["1"])]
+
+    def test_per_key_errors_are_returned(self, s3):
+        """Test that keys S3 failed to delete are reported with their bucket"""
+        s3.delete_objects.return_value = {
+            "Errors": [{"Key": "1", "Code": "AccessDenied", "Message": "denied"}]
+        }
+
+        assert delete_objects([("a", "1")]) == [
+            {"bucket": "a", "key": "1", "code": "AccessDenied", "message": "denied"}
+        ]
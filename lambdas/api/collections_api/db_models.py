@@ -177,6 +177,10 @@ class CollectionItemModel(Model):
     GSI2_PK = UnicodeAttribute(null=True)  # ITEM#{item_id} or ASSET#{asset_id}
     GSI2_SK = UnicodeAttribute(null=True)  # COLL#{collection_id}
 
+    # GSI7 - Asset to membership rows (full file, clips and legacy rows alike)
+    GSI7_PK = UnicodeAttribute(null=True)  # ASSET#{asset_id}
+    GSI7_SK = UnicodeAttribute(null=True)  # COLL#{collection_id}
+
 
 class ShareModel(Model):
     """
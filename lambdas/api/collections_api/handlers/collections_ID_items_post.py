@@ -14,6 +14,7 @@ from aws_lambda_powertools.utilities.parser import ValidationError, parse
 from collection_activity import record_collection_activity
 from collections_utils import (
     COLLECTION_PK_PREFIX,
+    asset_membership_keys,
     create_error_response,
     require_collection_role,
 )
@@ -123,6 +124,13 @@ def register_route(app):
                 item.GSI2_PK = item_data["SK"]
                 item.GSI2_SK = f"{COLLECTION_PK_PREFIX}{collection_id}"
 
+                # Set GSI7 so asset deletion can find every row for the asset
+                membership_keys = asset_membership_keys(
+                    item_data["assetId"], collection_id
+                )
+                item.GSI7_PK = membership_keys["GSI7_PK"]
+                item.GSI7_SK = membership_keys["GSI7_SK"]
+
                 try:
                     item.save()
 
@@ -1579,6 +1579,9 @@ def create_connector(createconnector: S3Connector) -> dict:
             asset_table_s3_path_index_arn = os.environ.get(
                 "MEDIALAKE_ASSET_TABLE_S3_PATH_INDEX"
             )
+            asset_table_file_hash_path_index_arn = os.environ.get(
+                "MEDIALAKE_ASSET_TABLE_FILE_HASH_PATH_INDEX"
+            )
             layer_arn = os.environ.get("INGEST_MEDIA_PROCESSOR_LAYER")
 
             # Get current AWS account ID (needed for resource ARNs)
@@ -1726,6 +1729,8 @@ def create_connector(createconnector: S3Connector) -> dict:
                 asset_table_asset_id_index_arn,
                 asset_table_s3_path_index_arn,
             ]
+            if asset_table_file_hash_path_index_arn:
+                dynamodb_resources.append(asset_table_file_hash_path_index_arn)
 
             # Add system settings table if configured
             if system_settings_table:
@@ -1758,6 +1763,15 @@ def create_connector(createconnector: S3Connector) -> dict:
                 user_table_arn = f"arn:aws:dynamodb:{bucket_region}:{account_id}:table/{user_table_name}"
                 dynamodb_resources.append(user_table_arn)
 
+            # Add vector key registry so deletes can resolve vector keys
+            # without listing the vector index.
+            vector_key_registry_table_name = os.environ.get(
+                "VECTOR_KEY_REGISTRY_TABLE_NAME", ""
+            )
+            if vector_key_registry_table_name:
+                vector_key_registry_table_arn = f"arn:aws:dynamodb:{bucket_region}:{account_id}:table/{vector_key_registry_table_name}"
+                dynamodb_resources.append(vector_key_registry_table_arn)
+
             dynamodb_policy = {
                 "Version": "2012-10-17",
                 "Statement": [
@@ -1994,6 +2008,9 @@ def create_connector(createconnector: S3Connector) -> dict:
                         "VECTOR_INDEX_NAME": os.environ.get(
                             "VECTOR_INDEX_NAME", "media-vectors"
                         ),
+                        "VECTOR_KEY_REGISTRY_TABLE_NAME": os.environ.get(
+                            "VECTOR_KEY_REGISTRY_TABLE_NAME", ""
+                        ),
                         # System settings table for external service manager
                         "SYSTEM_SETTINGS_TABLE_NAME": os.environ.get(
                             "SYSTEM_SETTINGS_TABLE_NAME", ""
@@ -1,7 +1,8 @@
 import base64
+import hashlib
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from aws_lambda_powertools import Logger, Metrics, Tracer
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver
@@ -10,6 +11,16 @@ from aws_lambda_powertools.logging import correlation_paths
 from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from models import PipelineExecution
+from pipeline_execution_index import (
+    EXECUTION_STATUSES,
+    OBJECT_KEY_INDEX,
+    PIPELINE_NAME_INDEX,
+    START_MONTH_INDEX,
+    STATUS_INDEX,
+    deployed_indexes,
+    recent_months,
+)
+from pynamodb.expressions.condition import Condition
 
 # Initialize Powertools
 logger = Logger()
@@ -37,46 +48,48 @@ app = APIGatewayRestResolver(
 # Default pagination values
 DEFAULT_PAGE_SIZE = 50
 
+# Sort orders served by an index
+SORTABLE_FIELDS = ("start_time", "status")
+# Sort orders no index serves; every match is read and sorted in memory.
+# Anything else falls back to start_time.
+MEMORY_SORTED_FIELDS = ("end_time", "duration_seconds", "pipeline_name")
+# Months of history walked by the unfiltered listing and object name search
+HISTORY_MONTHS = int(os.environ.get("EXECUTIONS_HISTORY_MONTHS", "13"))
+# Upper bound on items read per request when filters are applied after the Query
+MAX_ITEMS_SCANNED = int(os.environ.get("EXECUTIONS_MAX_ITEMS_SCANNED", "500"))
+
 
 class PipelineExecutionError(Exception):
     """Custom exception for pipeline execution errors"""
 
 
-def encode_last_evaluated_key(
-    last_evaluated_key: Dict,
-    sort_by: str = None,
-    sort_order: str = None,
-    last_sort_value: Any = None,
-) -> str:
-    """Encode the LastEvaluatedKey and sort parameters to a base64 string"""
-    # Create token data - last_key can be empty dict for client-side pagination
-    token_data = {
-        "last_key": last_evaluated_key if last_evaluated_key else {},
-        "sort_by": sort_by,
-        "sort_order": sort_order,
-        "last_sort_value": last_sort_value,
-    }
+def encode_next_token(position: Dict[str, Any], fingerprint: str) -> str:
+    """
+    Encode a listing position as a page token: a keyset position (segment +
+    LastEvaluatedKey) for index-ordered listings, an offset for sorted ones.
+    """
+    token_data = {**position, "query": fingerprint}
     return base64.b64encode(json.dumps(token_data).encode()).decode()
 
 
-def decode_last_evaluated_key(encoded_key: str) -> Dict:
-    """Decode the base64 string back to LastEvaluatedKey and sort parameters"""
+def decode_next_token(encoded_key: str, fingerprint: str) -> Optional[Dict]:
+    """
+    Decode a page token issued for the same filters and sort order.
+
+    Returns None for missing, malformed or stale tokens (issued before the
+    filters or sort order changed), which restarts pagination from the top.
+    """
     if not encoded_key:
         return None
     try:
         token_data = json.loads(base64.b64decode(encoded_key.encode()).decode())
-        # Handle old format (just the last_key) for backward compatibility
-        if isinstance(token_data, dict) and "last_key" in token_data:
-            return token_data
-        # Old format - just return as last_key
-        return {
-            "last_key": token_data,
-            "sort_by": None,
-            "sort_order": None,
-            "last_sort_value": None,
-        }
-    except:
+    except (ValueError, UnicodeDecodeError):
+        logger.warning("Ignoring malformed pagination token")
         return None
+    if not isinstance(token_data, dict) or token_data.get("query") != fingerprint:
+        logger.warning("Filters or sort order changed. Resetting pagination.")
+        return None
+    return token_data
 
 
 @tracer.capture_method
@@ -145,6 +158,283 @@ def format_execution_response(execution: PipelineExecution) -> Dict[str, Any]:
     return response
 
 
+class _Segment:
+    """
+    One key-ordered run of executions: a Query on a single index partition.
+
+    A listing is a sequence of segments read back to back, e.g. one per month
+    for the unfiltered list or one per status when sorting by status.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        index: Any,
+        hash_key: str,
+        range_key_condition: Optional[Condition] = None,
+        scan_forward: bool = False,
+        key_attributes: Tuple[str, ...] = (),
+    ):
+        self.name = name
+        # PipelineExecution itself for the table, or one of its GSIs
+        self.index = index
+        self.hash_key = hash_key
+        self.range_key_condition = range_key_condition
+        self.scan_forward = scan_forward
+        self.key_attributes = key_attributes
+
+    def query(
+        self, last_key: Optional[Dict], page_size: int
+    ) -> Iterable[PipelineExecution]:
+        return self.index.query(
+            self.hash_key,
+            self.range_key_condition,
+            scan_index_forward=self.scan_forward,
+            last_evaluated_key=last_key,
+            page_size=page_size,
+        )
+
+    def last_key(self, item: PipelineExecution) -> Dict[str, Dict[str, str]]:
+        """LastEvaluatedKey that resumes this segment after item"""
+        key = {
+            "execution_id": {"S": item.execution_id},
+            "start_time": {"N": str(item.start_time)},
+        }
+        for name in self.key_attributes:
+            key[name] = {"S": getattr(item, name)}
+        return key
+
+
+class _ScanSegment(_Segment):
+    """
+    A filtered table Scan, used while a listing's index is not yet deployed.
+
+    Scans return items in no particular order, so listings read through one
+    are always sorted in memory.
+    """
+
+    def __init__(self, filter_condition: Optional[Condition] = None):
+        super().__init__("scan", PipelineExecution, "")
+        self.filter_condition = filter_condition
+
+    def query(
+        self, last_key: Optional[Dict], page_size: int
+    ) -> Iterable[PipelineExecution]:
+        return PipelineExecution.scan(
+            self.filter_condition, last_evaluated_key=last_key, page_size=page_size
+        )
+
+
+def _month_segments(scan_forward: bool) -> List[_Segment]:
+    months = recent_months(HISTORY_MONTHS)
+    if scan_forward:
+        months.reverse()
+    return [
+        _Segment(
+            f"month#{month}",
+            PipelineExecution.start_month_index,
+            month,
+            scan_forward=scan_forward,
+            key_attributes=("start_month",),
+        )
+        for month in months
+    ]
+
+
+def _search_segments(search: str) -> List[_Segment]:
+    """Exact execution ID match first, then object name prefix, newest month first"""
+    prefix = search.lower()
+    segments = [_Segment("execution_id", PipelineExecution, search)]
+    for month in recent_months(HISTORY_MONTHS):
+        segments.append(
+            _Segment(
+                f"object#{month}",
+                PipelineExecution.object_key_index,
+                month,
+                PipelineExecution.object_key_name_lower.startswith(prefix),
+                key_attributes=("start_month", "object_key_name_lower"),
+            )
+        )
+    return segments
+
+
+def _filter_condition(filters: Dict[str, str]) -> Optional[Condition]:
+    """Equality condition on every non-empty filter, or None"""
+    condition = None
+    for name, value in filters.items():
+        if not value:
+            continue
+        clause = getattr(PipelineExecution, name) == value
+        condition = clause if condition is None else condition & clause
+    return condition
+
+
+def build_segments(
+    sort_by: str,
+    sort_order: str,
+    status: str = None,
+    pipeline_name: str = None,
+    search: str = None,
+    indexes: Iterable[str] = None,
+) -> Tuple[List[_Segment], Dict[str, str]]:
+    """
+    Pick the index partitions that serve a listing request.
+
+    indexes are the GSIs deployed so far (default: EXECUTIONS_TABLE_INDEXES
+    from the environment). When the one a request needs is missing, the
+    request is served by a single filtered table scan instead.
+
+    Returns:
+        The segments in read order, and the filters that the chosen index
+        does not cover and that must be applied to the items it returns
+    """
+    scan_forward = sort_order == "asc"
+    indexes = deployed_indexes() if indexes is None else set(indexes)
+
+    if search:
+        residual = {"status": status, "pipeline_name": pipeline_name}
+        if OBJECT_KEY_INDEX not in indexes:
+            matches = (PipelineExecution.execution_id == search) | (
+                PipelineExecution.object_key_name_lower.startswith(search.lower())
+            )
+            return [_ScanSegment(matches)], residual
+        return _search_segments(search), residual
+
+    if pipeline_name:
+        if PIPELINE_NAME_INDEX not in indexes:
+            filters = {"status": status, "pipeline_name": pipeline_name}
+            return [_ScanSegment(_filter_condition(filters))], {}
+        segment = _Segment(
+            "pipeline",
+            PipelineExecution.pipeline_name_index,
+            pipeline_name,
+            scan_forward=scan_forward,
+            key_attributes=("pipeline_name",),
+        )
+        return [segment], {"status": status}
+
+    if status or sort_by == "status":
+        if STATUS_INDEX not in indexes:
+            return [_ScanSegment(_filter_condition({"status": status}))], {}
+        statuses = [status] if status else list(EXECUTION_STATUSES)
+        if sort_by == "status" and not scan_forward:
+            statuses.reverse()
+        # Status order follows sortOrder; within a status, newest first unless
+        # the listing itself is sorted by start time
+        within_forward = scan_forward if sort_by == "start_time" else False
+        return [
+            _Segment(
+                f"status#{value}",
+                PipelineExecution.status_index,
+                value,
+                scan_forward=within_forward,
+                key_attributes=("status",),
+            )
+            for value in statuses
+        ], {}
+
+    if START_MONTH_INDEX not in indexes:
+        return [_ScanSegment()], {}
+    return _month_segments(scan_forward), {}
+
+
+def _matches(item: PipelineExecution, filters: Dict[str, str]) -> bool:
+    return all(getattr(item, name) == value for name, value in filters.items())
+
+
+def read_page(
+    segments: List[_Segment],
+    page_size: int,
+    residual_filters: Dict[str, str],
+    start_segment: str = None,
+    last_key: Dict = None,
+) -> Tuple[List[PipelineExecution], Optional[str], Optional[Dict]]:
+    """
+    Read up to page_size executions from segments, starting at a keyset position.
+
+    Items are checked against residual_filters as they are read. At most
+    MAX_ITEMS_SCANNED items are read per request, so a sparse filter can
+    return a short page with a token rather than walking the whole index.
+
+    Returns:
+        The page, and the segment name and last key to resume from (None
+        when every segment has been read)
+    """
+    filters = {name: value for name, value in residual_filters.items() if value}
+    position = 0
+    if start_segment:
+        names = [segment.name for segment in segments]
+        if start_segment not in names:
+            # The segment aged out of the history window between requests
+            return [], None, None
+        position = names.index(start_segment)
+    else:
+        last_key = None
+
+    items: List[PipelineExecution] = []
+    scanned = 0
+    while position < len(segments):
+        segment = segments[position]
+        for item in segment.query(last_key, page_size):
+            scanned += 1
+            if _matches(item, filters):
+                items.append(item)
+            if len(items) >= page_size or scanned >= MAX_ITEMS_SCANNED:
+                return items, segment.name, segment.last_key(item)
+        position += 1
+        last_key = None
+    return items, None, None
+
+
+def _duration(item: PipelineExecution) -> int:
+    """Stored duration, else end - start; 0 while the execution is running"""
+    try:
+        if item.duration_seconds is not None:
+            return int(item.duration_seconds)
+        if item.end_time is not None:
+            return int(item.end_time) - int(item.start_time)
+    except (ValueError, TypeError):
+        pass
+    return 0
+
+
+# Sort keys for orders served in memory; ties go to the newest execution
+_SORT_KEYS: Dict[str, Callable[[PipelineExecution], Any]] = {
+    "start_time": lambda item: int(item.start_time),
+    "end_time": lambda item: int(item.end_time or 0),
+    "duration_seconds": _duration,
+    "pipeline_name": lambda item: (item.pipeline_name or "").lower(),
+    "status": lambda item: (item.status or "").lower(),
+}
+
+
+def read_sorted(
+    segments: List[_Segment],
+    residual_filters: Dict[str, str],
+    sort_by: str,
+    sort_order: str,
+) -> List[PipelineExecution]:
+    """
+    Read every matching execution and sort it in memory.
+
+    Used for orders no index serves (end_time, duration_seconds,
+    pipeline_name) and while a listing's index is not yet deployed. The
+    cost grows with the number of matches rather than the page size.
+    """
+    filters = {name: value for name, value in residual_filters.items() if value}
+    items = [
+        item
+        for segment in segments
+        for item in segment.query(None, MAX_ITEMS_SCANNED)
+        if _matches(item, filters)
+    ]
+    sort_key = _SORT_KEYS.get(sort_by, _SORT_KEYS["start_time"])
+    # Stable sorts: newest first within equal keys, whatever the sort order
+    items.sort(key=lambda item: (int(item.start_time), item.execution_id), reverse=True)
+    items.sort(key=sort_key, reverse=sort_order != "asc")
+    return items
+
+
 @tracer.capture_method
 def get_pipeline_executions(
     page_size: int,
@@ -153,237 +443,71 @@ def get_pipeline_executions(
     sort_by: str = "start_time",
     sort_order: str = "desc",
     search: str = None,
+    pipeline_name: str = None,
 ) -> Dict[str, Any]:
     """
-    Retrieve paginated pipeline executions from DynamoDB using PynamoDB
+    Retrieve a page of pipeline executions through the executions table GSIs.
+
+    start_time and status (then start_time) orders are read page by page
+    from an index. end_time, duration_seconds and pipeline_name orders are
+    sorted in memory; other sortBy values fall back to start_time. search
+    matches an execution ID exactly or an object name by case-insensitive
+    prefix.
+
+    Sorted listings report the exact number of matches in totalResults.
+    Index-ordered listings are never counted up front (that would read every
+    partition on the first page): totalResults is the number of executions
+    returned up to and including this page, and hasMore says whether another
+    page follows.
     """
     try:
+        sort_order = "asc" if sort_order == "asc" else "desc"
+        if sort_by not in SORTABLE_FIELDS + MEMORY_SORTED_FIELDS:
+            sort_by = "start_time"
+        search = (search or "").strip() or None
         logger.info(
-            f"Getting pipeline executions with search: {search}, status: {status}, sort_by: {sort_by}, sort_order: {sort_order}"
+            f"Getting pipeline executions with search: {search}, status: {status}, pipeline_name: {pipeline_name}, sort_by: {sort_by}, sort_order: {sort_order}"
         )
 
-        # Decode and validate token if provided
-        token_data = None
-        last_sort_value = None
-        if next_token:
-            token_data = decode_last_evaluated_key(next_token)
-            if token_data:
-                # Check if sort parameters changed - if so, ignore token
-                token_sort_by = token_data.get("sort_by")
-                token_sort_order = token_data.get("sort_order")
-                if token_sort_by != sort_by or token_sort_order != sort_order:
-                    logger.warning(
-                        f"Sort parameters changed (was {token_sort_by}/{token_sort_order}, now {sort_by}/{sort_order}). Resetting pagination."
-                    )
-                    token_data = None
-                else:
-                    last_sort_value = token_data.get("last_sort_value")
-
-        # Configure scan parameters
-        scan_kwargs = {}
-
-        # Add status filter if provided
-        if status:
-            scan_kwargs["filter_condition"] = PipelineExecution.status == status
-
-        # For initial request (no token): scan ALL items to ensure correct sorting
-        # DynamoDB scan returns items in arbitrary order, so we must retrieve all items
-        # to sort properly by any field (start_time, end_time, pipeline_name, status, etc.)
-        # For subsequent pages: continue from where we left off using last_sort_value filtering
-        if token_data and token_data.get("last_key"):
-            last_key = token_data["last_key"]
-            # Only use DynamoDB last_evaluated_key if it's not an empty placeholder
-            if last_key:  # Check if not empty dict
-                scan_kwargs["last_evaluated_key"] = last_key
-                scan_kwargs["limit"] = page_size * 3  # Limit for subsequent pages
-        # else: no limit - scan all items for proper sorting across any sortable field
-
-        # Execute scan
-        executions = []
-        count = 0
-        total_scanned = 0
-
-        # Perform the scan
-        scan_operation = PipelineExecution.scan(**scan_kwargs)
-
-        # Get items and apply search filter if provided
-        for item in scan_operation:
-            total_scanned += 1
-
-            # Apply search filter if search term is provided
-            if search:
-                search_term = search.lower()
-                # Search across multiple fields
-                searchable_fields = [
-                    item.pipeline_name or "",
-                    item.status or "",
-                    item.execution_id or "",
-                    getattr(item, "dsa_type", "") or "",
-                    getattr(item, "object_key_name", "") or "",
-                    getattr(item, "pipeline_trace_id", "") or "",
-                    getattr(item, "stepname", "") or "",
-                    getattr(item, "stepresult", "") or "",
-                    getattr(item, "stepstatus", "") or "",
-                ]
-
-                # Check if search term is found in any of the searchable fields
-                if not any(search_term in field.lower() for field in searchable_fields):
-                    continue
-
-            executions.append(item)
-            count += 1
-
-        if search:
-            logger.info(
-                f"Search filtering: scanned {total_scanned} items, found {count} matches for term '{search}'"
-            )
+        fingerprint = hashlib.sha256(
+            json.dumps([sort_by, sort_order, status, pipeline_name, search]).encode()
+        ).hexdigest()[:16]
+        token_data = decode_next_token(next_token, fingerprint) or {}
 
-        # Sort based on the provided sort parameters
-        reverse_order = sort_order.lower() == "desc"
-
-        if sort_by == "start_time":
-            executions.sort(key=lambda x: int(x.start_time), reverse=reverse_order)
-        elif sort_by == "end_time":
-            executions.sort(
-                key=lambda x: (
-                    int(x.end_time)
-                    if hasattr(x, "end_time") and x.end_time is not None
-                    else 0
-                ),
-                reverse=reverse_order,
-            )
-        elif sort_by == "pipeline_name":
-            executions.sort(
-                key=lambda x: x.pipeline_name.lower(), reverse=reverse_order
-            )
-        elif sort_by == "status":
-            executions.sort(key=lambda x: x.status.lower(), reverse=reverse_order)
-        elif sort_by == "execution_id":
-            executions.sort(key=lambda x: x.execution_id.lower(), reverse=reverse_order)
-        elif sort_by == "duration_seconds":
-            # Sort by duration - prefer stored value over calculated
-            def get_duration(x):
-                if hasattr(x, "duration_seconds") and x.duration_seconds is not None:
-                    try:
-                        return int(x.duration_seconds)
-                    except (ValueError, TypeError):
-                        return 0
-                elif hasattr(x, "end_time") and x.end_time is not None:
-                    try:
-                        return int(x.end_time) - int(x.start_time)
-                    except (ValueError, TypeError):
-                        return 0
-                return 0
-
-            executions.sort(key=get_duration, reverse=reverse_order)
-        elif sort_by == "dsa_type":
-            executions.sort(
-                key=lambda x: (x.dsa_type or "").lower(), reverse=reverse_order
-            )
-        elif sort_by == "object_key_name":
-            executions.sort(
-                key=lambda x: (x.object_key_name or "").lower(), reverse=reverse_order
-            )
-        elif sort_by == "pipeline_trace_id":
-            executions.sort(
-                key=lambda x: (x.pipeline_trace_id or "").lower(), reverse=reverse_order
-            )
-        elif sort_by == "stepname":
-            executions.sort(
-                key=lambda x: (x.stepname or "").lower(), reverse=reverse_order
-            )
-        elif sort_by == "stepresult":
-            executions.sort(
-                key=lambda x: (x.stepresult or "").lower(), reverse=reverse_order
-            )
-        elif sort_by == "stepstatus":
-            executions.sort(
-                key=lambda x: (x.stepstatus or "").lower(), reverse=reverse_order
-            )
+        segments, residual_filters = build_segments(
+            sort_by, sort_order, status, pipeline_name, search
+        )
+        next_position = None
+        if sort_by in MEMORY_SORTED_FIELDS or isinstance(segments[0], _ScanSegment):
+            matches = read_sorted(segments, residual_filters, sort_by, sort_order)
+            total_results = len(matches)
+            offset = token_data.get("offset", 0)
+            executions = matches[offset : offset + page_size]
+            if offset + page_size < total_results:
+                next_position = {"offset": offset + page_size}
         else:
-            # Default to start_time if unknown sort field
-            executions.sort(key=lambda x: int(x.start_time), reverse=reverse_order)
-
-        # Apply pagination to sorted results
-        # If we have a last_sort_value from previous page, filter out items we've already seen
-        if last_sort_value is not None and len(executions) > 0:
-            reverse_order = sort_order.lower() == "desc"
-            filtered_executions = []
-
-            for execution in executions:
-                if sort_by == "start_time":
-                    current_value = int(execution.start_time)
-                    if reverse_order:
-                        # desc: include items older than last value
-                        if current_value < last_sort_value:
-                            filtered_executions.append(execution)
-                    else:
-                        # asc: include items newer than last value
-                        if current_value > last_sort_value:
-                            filtered_executions.append(execution)
-                elif sort_by == "end_time":
-                    if (
-                        hasattr(execution, "end_time")
-                        and execution.end_time is not None
-                    ):
-                        current_value = int(execution.end_time)
-                        if reverse_order:
-                            if current_value < last_sort_value:
-                                filtered_executions.append(execution)
-                        else:
-                            if current_value > last_sort_value:
-                                filtered_executions.append(execution)
-                # Add other sort fields as needed
-                else:
-                    # For string comparisons, just add all (fallback)
-                    filtered_executions.append(execution)
-
-            executions = filtered_executions
-
-        # Limit to requested page size
-        has_more = len(executions) > page_size
-        executions = executions[:page_size]
-
-        # Format executions for response
+            executions, segment, last_key = read_page(
+                segments,
+                page_size,
+                residual_filters,
+                start_segment=token_data.get("segment"),
+                last_key=token_data.get("last_key"),
+            )
+            total_results = token_data.get("returned", 0) + len(executions)
+            if segment is not None:
+                next_position = {
+                    "segment": segment,
+                    "last_key": last_key,
+                    "returned": total_results,
+                }
+
         formatted_executions = [
             format_execution_response(execution) for execution in executions
         ]
 
-        # Get the next token for pagination
         next_token = None
-        if has_more and len(executions) > 0:
-            # Get the last item's sort value for next page filtering
-            last_execution = executions[-1]
-            last_sort_val = None
-
-            if sort_by == "start_time":
-                last_sort_val = int(last_execution.start_time)
-            elif (
-                sort_by == "end_time"
-                and hasattr(last_execution, "end_time")
-                and last_execution.end_time
-            ):
-                last_sort_val = int(last_execution.end_time)
-
-            # Create next token with last_evaluated_key if available (for subsequent pages)
-            # or with empty dict (for initial full scan) - the last_sort_value is what matters
-            last_key = None
-            if (
-                hasattr(scan_operation, "last_evaluated_key")
-                and scan_operation.last_evaluated_key
-            ):
-                last_key = scan_operation.last_evaluated_key
-            else:
-                # For initial full scan, use empty dict as placeholder
-                # The last_sort_value will handle pagination
-                last_key = {}
-
-            next_token = encode_last_evaluated_key(
-                last_key,
-                sort_by,
-                sort_order,
-                last_sort_val,
-            )
+        if next_position is not None:
+            next_token = encode_next_token(next_position, fingerprint)
 
         # Add metrics for monitoring
         metrics.add_metric(name="SuccessfulQueries", unit="Count", value=1)
@@ -393,9 +517,10 @@ def get_pipeline_executions(
             "message": "ok",
             "data": {
                 "searchMetadata": {
-                    "totalResults": count,
+                    "totalResults": total_results,
                     "pageSize": page_size,
                     "nextToken": next_token,
+                    "hasMore": next_token is not None,
                 },
                 "executions": formatted_executions,
             },
@@ -430,6 +555,9 @@ def handle_get_executions() -> Dict[str, Any]:
         # Get status filter if provided
         status = query_string.get("status")
 
+        # Get pipeline name filter if provided
+        pipeline_name = query_string.get("pipelineName")
+
         # Get search parameter if provided
         search = query_string.get("search")
 
@@ -438,7 +566,7 @@ def handle_get_executions() -> Dict[str, Any]:
         sort_order = query_string.get("sortOrder", "desc")
 
         return get_pipeline_executions(
-            page_size, next_token, status, sort_by, sort_order, search
+            page_size, next_token, status, sort_by, sort_order, search, pipeline_name
         )
     except PipelineExecutionError as e:
         logger.exception("Error processing pipeline executions request")
@@ -450,6 +578,7 @@ def handle_get_executions() -> Dict[str, Any]:
                     "totalResults": 0,
                     "pageSize": DEFAULT_PAGE_SIZE,
                     "nextToken": None,
+                    "hasMore": False,
                 },
                 "executions": [],
             },
@@ -483,6 +612,7 @@ def lambda_handler(
                         "totalResults": 0,
                         "pageSize": DEFAULT_PAGE_SIZE,
                         "nextToken": None,
+                        "hasMore": False,
                     },
                     "executions": [],
                 },
@@ -1,7 +1,50 @@
+from pipeline_execution_index import (
+    OBJECT_KEY_INDEX,
+    PIPELINE_NAME_INDEX,
+    START_MONTH_INDEX,
+    STATUS_INDEX,
+)
 from pynamodb.attributes import MapAttribute, NumberAttribute, UnicodeAttribute
+from pynamodb.indexes import AllProjection, GlobalSecondaryIndex
 from pynamodb.models import Model
 
 
+class StartMonthIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = START_MONTH_INDEX
+        projection = AllProjection()
+
+    start_month = UnicodeAttribute(hash_key=True)
+    start_time = NumberAttribute(range_key=True)
+
+
+class StatusIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = STATUS_INDEX
+        projection = AllProjection()
+
+    status = UnicodeAttribute(hash_key=True)
+    start_time = NumberAttribute(range_key=True)
+
+
+class PipelineNameIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = PIPELINE_NAME_INDEX
+        projection = AllProjection()
+
+    pipeline_name = UnicodeAttribute(hash_key=True)
+    start_time = NumberAttribute(range_key=True)
+
+
+class ObjectKeyIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = OBJECT_KEY_INDEX
+        projection = AllProjection()
+
+    start_month = UnicodeAttribute(hash_key=True)
+    object_key_name_lower = UnicodeAttribute(range_key=True)
+
+
 class PipelineExecution(Model):
     class Meta:
         table_name = "pipelines_executions_dev"  # Will be overridden by env var
@@ -29,3 +72,12 @@ class PipelineExecution(Model):
     stepresult = UnicodeAttribute(null=True)
     stepstatus = UnicodeAttribute(null=True)
     metadata = MapAttribute(null=True)
+
+    # GSI keys derived by the executions event processor
+    start_month = UnicodeAttribute(null=True)
+    object_key_name_lower = UnicodeAttribute(null=True)
+
+    start_month_index = StartMonthIndex()
+    status_index = StatusIndex()
+    pipeline_name_index = PipelineNameIndex()
+    object_key_index = ObjectKeyIndex()
@@ -0,0 +1,291 @@
+"""
+Unit tests for the pipeline executions listing.
+
+Tests that listings are mapped onto the right index partitions, that keyset
+pagination walks every segment exactly once, that sorted listings report
+exact totals, and that index-ordered listings page without counting.
+"""
+
+import os
+from unittest.mock import MagicMock
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import index
+import pytest
+from index import (
+    _ScanSegment,
+    _Segment,
+    build_segments,
+    decode_next_token,
+    get_pipeline_executions,
+    read_page,
+)
+from models import PipelineExecution
+from pipeline_execution_index import EXECUTION_STATUSES, EXECUTIONS_TABLE_INDEXES
+
+
+def _execution(execution_id, start_time, status="SUCCEEDED", **attributes):
+    return PipelineExecution(
+        execution_id=execution_id,
+        start_time=start_time,
+        status=status,
+        pipeline_name=attributes.pop("pipeline_name", "ingest"),
+        start_month=attributes.pop("start_month", "2026-10"),
+        **attributes,
+    )
+
+
+class FakeIndex:
+    """In-memory stand-in for a GSI: partitions of items in ascending key order"""
+
+    def __init__(self, partitions):
+        self.partitions = partitions
+
+    def query(
+        self,
+        hash_key,
+        range_key_condition=None,
+        scan_index_forward=None,
+        last_evaluated_key=None,
+        page_size=None,
+    ):
+        items = list(self.partitions.get(hash_key, []))
+        if scan_index_forward is False:
+            items.reverse()
+        if last_evaluated_key:
+            last_id = last_evaluated_key["execution_id"]["S"]
+            ids = [item.execution_id for item in items]
+            items = items[ids.index(last_id) + 1 :]
+        return iter(items)
+
+
+def _month_listing():
+    """Two month segments, each read oldest first, five executions in total"""
+    fake = FakeIndex(
+        {
+            "2026-10": [_execution(f"oct-{i}", 1000 + i) for i in range(3)],
+            "2026-09": [_execution(f"sep-{i}", 500 + i) for i in range(2)],
+        }
+    )
+    segments = [
+        _Segment(
+            f"month#{month}",
+            fake,
+            month,
+            scan_forward=True,
+            key_attributes=("start_month",),
+        )
+        for month in ("2026-10", "2026-09")
+    ]
+    return fake, segments
+
+
+def _read_all(segments, page_size, residual_filters=None):
+    """Follow keyset positions until read_page reports the end"""
+    pages = []
+    segment, last_key = None, None
+    while True:
+        page, segment, last_key = read_page(
+            segments,
+            page_size,
+            residual_filters or {},
+            start_segment=segment,
+            last_key=last_key,
+        )
+        pages.append([item.execution_id for item in page])
+        if segment is None:
+            return pages
+
+
+class TestBuildSegments:
+    """Test suite for mapping a listing request onto index partitions"""
+
+    def test_unfiltered_listing_reads_months_newest_first(self):
+        """Test that the default listing walks one partition per month"""
+        segments, residual = build_segments("start_time", "desc")
+
+        assert all(s.index is PipelineExecution.start_month_index for s in segments)
+        assert [s.hash_key for s in segments] == sorted(
+            (s.hash_key for s in segments), reverse=True
+        )
+        assert len(segments) == index.HISTORY_MONTHS
+        assert not segments[0].scan_forward
+        assert residual == {}
+
+    def test_ascending_listing_reads_months_oldest_first(self):
+        """Test that sortOrder=asc reverses both month and in-month order"""
+        segments, _ = build_segments("start_time", "asc")
+
+        assert [s.hash_key for s in segments] == sorted(s.hash_key for s in segments)
+        assert all(s.scan_forward for s in segments)
+
+    def test_status_filter_reads_one_partition(self):
+        """Test that a status filter is served by the status index"""
+        segments, residual = build_segments("start_time", "desc", status="FAILED")
+
+        assert [(s.index, s.hash_key) for s in segments] == [
+            (PipelineExecution.status_index, "FAILED")
+        ]
+        assert residual == {}
+
+    def test_sort_by_status_reads_every_status(self):
+        """Test that sortBy=status reads one segment per status, newest first"""
+        segments, _ = build_segments("status", "desc")
+
+        assert [s.hash_key for s in segments] == list(reversed(EXECUTION_STATUSES))
+        assert not any(s.scan_forward for s in segments)
+
+    def test_pipeline_name_filter_keeps_status_as_residual(self):
+        """Test that filters the pipeline index does not cover are residual"""
+        segments, residual = build_segments(
+            "start_time", "desc", status="FAILED", pipeline_name="ingest"
+        )
+
+        assert [(s.index, s.hash_key) for s in segments] == [
+            (PipelineExecution.pipeline_name_index, "ingest")
+        ]
+        assert residual == {"status": "FAILED"}
+
+    def test_search_tries_execution_id_then_object_names(self):
+        """Test that search reads the table key before object name prefixes"""
+        segments, residual = build_segments(
+            "start_time", "desc", status="FAILED", search="clip"
+        )
+
+        assert (segments[0].index, segments[0].hash_key) == (PipelineExecution, "clip")
+        assert all(s.index is PipelineExecution.object_key_index for s in segments[1:])
+        assert residual == {"status": "FAILED", "pipeline_name": None}
+
+    @pytest.mark.parametrize(
+        "request_args",
+        [
+            {},
+            {"status": "FAILED"},
+            {"pipeline_name": "ingest"},
+            {"search": "clip"},
+        ],
+    )
+    def test_missing_index_falls_back_to_a_scan(self, request_args):
+        """Test that listings use a table scan until their index is deployed"""
+        segments, _ = build_segments(
+            "start_time", "desc", indexes=EXECUTIONS_TABLE_INDEXES[:1], **request_args
+        )
+
+        assert len(segments) == 1
+        assert isinstance(segments[0], _ScanSegment)
+
+
+class TestReadPage:
+    """Test suite for keyset pagination across segments"""
+
+    def test_pages_cover_every_segment_once(self):
+        """Test that following tokens returns every item once, in order"""
+        _, segments = _month_listing()
+
+        pages = _read_all(segments, page_size=2)
+
+        assert pages == [
+            ["oct-0", "oct-1"],
+            ["oct-2", "sep-0"],
+            ["sep-1"],
+        ]
+
+    def test_last_key_resumes_the_segment(self):
+        """Test that the returned position is the last item's index key"""
+        _, segments = _month_listing()
+
+        _, segment, last_key = read_page(segments, 2, {})
+
+        assert segment == "month#2026-10"
+        assert last_key == {
+            "execution_id": {"S": "oct-1"},
+            "start_time": {"N": "1001"},
+            "start_month": {"S": "2026-10"},
+        }
+
+    def test_residual_filters_are_applied(self):
+        """Test that items not matching the residual filters are skipped"""
+        fake = FakeIndex(
+            {
+                "ingest": [
+                    _execution("a", 1, status="FAILED"),
+                    _execution("b", 2),
+                    _execution("c", 3, status="FAILED"),
+                ]
+            }
+        )
+        segments = [_Segment("pipeline", fake, "ingest", scan_forward=True)]
+
+        pages = _read_all(segments, page_size=5, residual_filters={"status": "FAILED"})
+
+        assert pages == [["a", "c"]]
+
+    def test_scan_budget_returns_a_short_page(self, monkeypatch):
+        """Test that a sparse filter stops after MAX_ITEMS_SCANNED items"""
+        monkeypatch.setattr(index, "MAX_ITEMS_SCANNED", 3)
+        _, segments = _month_listing()
+
+        page, segment, last_key = read_page(segments, 10, {"status": "FAILED"})
+
+        assert page == []
+        assert segment == "month#2026-10"
+        assert last_key["execution_id"] == {"S": "oct-2"}
+
+    def test_unknown_segment_ends_the_listing(self):
+        """Test that a token for a segment that aged out returns no more pages"""
+        _, segments = _month_listing()
+
+        assert read_page(segments, 2, {}, start_segment="month#2024-01") == (
+            [],
+            None,
+            None,
+        )
+
+
+class TestGetPipelineExecutions:
+    """Test suite for totals and sorted listings"""
+
+    def test_indexed_listing_is_not_counted_up_front(self, monkeypatch):
+        """Test that totalResults counts returned items and hasMore ends paging"""
+        fake, segments = _month_listing()
+        monkeypatch.setattr(index, "build_segments", lambda *args: (segments, {}))
+        fake.count = MagicMock()
+
+        pages = [get_pipeline_executions(2)["data"]["searchMetadata"]]
+        while pages[-1]["hasMore"]:
+            token = pages[-1]["nextToken"]
+            pages.append(get_pipeline_executions(2, token)["data"]["searchMetadata"])
+
+        assert [page["totalResults"] for page in pages] == [2, 4, 5]
+        assert pages[-1]["nextToken"] is None
+        fake.count.assert_not_called()
+
+    def test_end_time_sort_is_served_in_memory(self, monkeypatch):
+        """Test that end_time order spans segments and pages by offset"""
+        fake = FakeIndex(
+            {
+                "2026-10": [
+                    _execution("a", 1, end_time=30),
+                    _execution("b", 2, end_time=10),
+                ],
+                "2026-09": [_execution("c", 0, end_time=20)],
+            }
+        )
+        segments = [_Segment(f"month#{m}", fake, m) for m in ("2026-10", "2026-09")]
+        monkeypatch.setattr(index, "build_segments", lambda *args: (segments, {}))
+
+        first = get_pipeline_executions(2, sort_by="end_time")["data"]
+        token = first["searchMetadata"]["nextToken"]
+        second = get_pipeline_executions(2, token, sort_by="end_time")["data"]
+
+        assert [e["execution_id"] for e in first["executions"]] == ["a", "c"]
+        assert [e["execution_id"] for e in second["executions"]] == ["b"]
+        assert first["searchMetadata"]["totalResults"] == 3
+        assert second["searchMetadata"]["nextToken"] is None
+        assert not second["searchMetadata"]["hasMore"]
+
+    def test_token_for_other_filters_restarts_pagination(self):
+        """Test that a token issued for a different listing is ignored"""
+        assert decode_next_token("not-a-token", "abc") is None
@@ -1246,6 +1246,27 @@ def create_eventbridge_rule(
                     ],
                 }
 
+                # Distributed admission control: acquire/release slots in the
+                # pipeline concurrency table instead of listing executions
+                concurrency_table_arn = os.environ.get(
+                    "PIPELINE_CONCURRENCY_TABLE_ARN", ""
+                )
+                if concurrency_table_arn:
+                    policy_document["Statement"].append(
+                        {
+                            "Effect": "Allow",
+                            "Action": [
+                                "dynamodb:GetItem",
+                                "dynamodb:PutItem",
+                                "dynamodb:UpdateItem",
+                                "dynamodb:DeleteItem",
+                                "dynamodb:ConditionCheckItem",
+                                "dynamodb:Query",
+                            ],
+                            "Resource": [concurrency_table_arn],
+                        }
+                    )
+
                 iam_client.put_role_policy(
                     RoleName=role_name,
                     PolicyName=f"{role_name}_policy",
@@ -1295,6 +1316,9 @@ def create_eventbridge_rule(
                             "SERVICE": "Trigger",  # node Title
                             "STEP_NAME": "Pipeline Trigger",  # friendly name of the node
                             "DEFAULT_STATE_MACHINE_ARN": state_machine_arn,  # Add default state machine ARN
+                            "PIPELINE_CONCURRENCY_TABLE_NAME": os.environ.get(
+                                "PIPELINE_CONCURRENCY_TABLE_NAME", ""
+                            ),
                         }
                     },
                 }
@@ -1071,6 +1071,11 @@ def create_lambda_function(
                     "PIPELINE_GROUPS_TABLE_NAME": os.environ.get(
                         "PIPELINE_GROUPS_TABLE_NAME", ""
                     ),
+                    # Vector key registry for the s3_vector_store node — keeps
+                    # asset deletion from listing the whole vector index
+                    "VECTOR_KEY_REGISTRY_TABLE_NAME": os.environ.get(
+                        "VECTOR_KEY_REGISTRY_TABLE_NAME", ""
+                    ),
                     # CloudFront domain for portal URL generation
                     "CLOUDFRONT_DOMAIN": _resolve_cloudfront_domain(),
                     # SES configuration for portal email notifications
@@ -1262,6 +1267,12 @@ def create_lambda_function(
                             f"Set legacy CUSTOM_CODE for backward compatibility: {post_custom_code_path}"
                         )
 
+                    # Per-node read timeout for the shared HTTP session; without
+                    # one, partner calls have no read timeout (see http_client)
+                    read_timeout = integration_config.get("read_timeout_seconds")
+                    if read_timeout:
+                        env_vars["HTTP_READ_TIMEOUT_SECONDS"] = str(read_timeout)
+
                     # Add additional environment variables
                     env_vars.update(
                         {
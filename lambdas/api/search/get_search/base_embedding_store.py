@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional
 
 import boto3
 from api_utils import get_api_key, get_search_provider_config
+from embedding_cache import EmbeddingCache
 from twelvelabs import TwelveLabs
 
 # Module-level cached AWS clients for reuse across invocations
@@ -19,6 +20,9 @@ _aws_region = os.environ.get("AWS_REGION", "us-west-2")
 _bedrock_runtime_client = boto3.client("bedrock-runtime", region_name=_aws_region)
 _s3_client = boto3.client("s3", region_name=_aws_region)
 
+# Model used by the TwelveLabs API embedding path; also part of its cache key
+TWELVELABS_API_MODEL = "Marengo-retrieval-2.7"
+
 
 @dataclass
 class SearchResult:
@@ -98,10 +102,23 @@ class BaseEmbeddingStore(ABC):
         )
         self.logger.info(f"Using search provider type: {provider_type}")
 
+        cache = EmbeddingCache(self.logger, self.metrics)
         if provider_type in ["twelvelabs-bedrock", "twelvelabs-bedrock-3-0"]:
-            return self._generate_embedding_via_bedrock(query_text, start_time)
+            return cache.get_or_compute(
+                provider_type,
+                self._get_regional_inference_profile(),
+                query_text,
+                lambda text: self._generate_embedding_via_bedrock(text, start_time),
+            )
         else:
-            return self._generate_embedding_via_twelvelabs_api(query_text, start_time)
+            return cache.get_or_compute(
+                provider_type,
+                TWELVELABS_API_MODEL,
+                query_text,
+                lambda text: self._generate_embedding_via_twelvelabs_api(
+                    text, start_time
+                ),
+            )
 
     def _get_regional_inference_profile(self) -> str:
         """
@@ -290,7 +307,7 @@ class BaseEmbeddingStore(ABC):
                 f"[PERF] Starting TwelveLabs API embedding creation for query: {query_text}"
             )
             res = twelve_labs_client.embed.create(
-                model_name="Marengo-retrieval-2.7",
+                model_name=TWELVELABS_API_MODEL,
                 text=query_text,
             )
             self.logger.info(
@@ -6,6 +6,7 @@ import os
 import time
 from typing import Dict, List
 
+from embedding_cache import EmbeddingCache
 from opensearchpy import (
     OpenSearch,
     RequestsAWSV4SignerAuth,
@@ -224,8 +225,14 @@ class BedrockTwelveLabsSearchProvider(ProviderPlusStoreSearchProvider):
     def generate_embeddings(self, query_text: str) -> List[float]:
         """
         Generate embeddings using Bedrock TwelveLabs model directly.
+        Embeddings are served from the shared query-embedding cache when possible.
         """
-        return self._generate_embedding_via_bedrock(query_text)
+        return EmbeddingCache(self.logger, self.metrics).get_or_compute(
+            self.config.provider,
+            self.embedding_model,
+            query_text,
+            self._generate_embedding_via_bedrock,
+        )
 
     def _get_regional_inference_profile(self) -> str:
         """
@@ -436,19 +443,17 @@ class BedrockTwelveLabsSearchProvider(ProviderPlusStoreSearchProvider):
 
             params = MockParams(query)
 
-            # Build semantic query - let S3VectorEmbeddingStore generate embeddings internally
-            # But we already have embeddings, so we need to override them
+            # Build semantic query with our Bedrock-generated embedding so the
+            # store doesn't generate (and pay for) a second one
             search_modes = getattr(query, "search_modes", None)
             semantic_query = s3_vector_store.build_semantic_query(
                 params,
                 allowed_embedding_types=self.get_allowed_clip_embedding_types(
                     search_modes=search_modes
                 ),
+                embedding=embeddings,
             )
 
-            # Override the embedding with our Bedrock-generated one
-            semantic_query["embedding"] = embeddings
-
             # Execute search
             search_start = time.time()
             store_result = s3_vector_store.execute_search(semantic_query, params)
@@ -0,0 +1,173 @@
+"""
+Query-embedding cache shared by all semantic search providers.
+
+Text embeddings for a query only depend on (provider, model, query text), so
+repeated and paginated searches can reuse a previously computed vector instead
+of calling Bedrock / TwelveLabs again.
+
+Tiers:
+- In-process LRU, shared by every provider and store in the container
+- DynamoDB table (EMBEDDING_CACHE_TABLE_NAME) with a TTL attribute, shared
+  across containers so a later page served by another container does not
+  embed the query again. Items are keyed by a SHA-256 of the cache key and
+  store the vector as packed float64 bytes, so every container ranks with
+  exactly the vector the first one computed. The tier is skipped when the
+  variable is unset.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+import boto3
+from aws_lambda_powertools.metrics import MetricUnit
+
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.environ.get("EMBEDDING_CACHE_MAX_ENTRIES", "512"))
+EMBEDDING_CACHE_TTL_SECONDS = int(
+    os.environ.get("EMBEDDING_CACHE_TTL_SECONDS", str(24 * 60 * 60))
+)
+EMBEDDING_CACHE_TABLE_NAME = os.environ.get("EMBEDDING_CACHE_TABLE_NAME", "")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# (provider, model, normalized text) -> (expires_at, embedding)
+_memory_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, List[float]]]" = (
+    OrderedDict()
+)
+_memory_cache_lock = threading.Lock()
+_dynamodb_table = None
+
+
+def normalize_query_text(query_text: str) -> str:
+    """
+    Collapse whitespace so trivially different spacings share an entry.
+
+    Case and Unicode form are kept as typed: the embedding models are not
+    guaranteed to be insensitive to either.
+    """
+    return _WHITESPACE_RE.sub(" ", query_text or "").strip()
+
+
+def _get_dynamodb_table():
+    """Return the shared tier table, or None when the tier is disabled."""
+    global _dynamodb_table
+    if not EMBEDDING_CACHE_TABLE_NAME:
+        return None
+    if _dynamodb_table is None:
+        _dynamodb_table = boto3.resource("dynamodb").Table(EMBEDDING_CACHE_TABLE_NAME)
+    return _dynamodb_table
+
+
+class EmbeddingCache:
+    """Two-tier (memory + shared DynamoDB) cache for query embeddings."""
+
+    def __init__(self, logger, metrics):
+        self.logger = logger
+        self.metrics = metrics
+
+    def get_or_compute(
+        self,
+        provider: str,
+        model: str,
+        query_text: str,
+        compute: Callable[[str], List[float]],
+    ) -> List[float]:
+        """
+        Return the cached embedding for the query, computing and storing it on a miss.
+
+        Args:
+            provider: Provider identifier (e.g. "bedrock_twelvelabs")
+            model: Model or inference profile identifier
+            query_text: Raw query text as typed by the user
+            compute: Called with the raw query text on a cache miss
+
+        Returns:
+            The embedding vector
+        """
+        key = (provider, model, normalize_query_text(query_text))
+
+        embedding = self._get_from_memory(key)
+        if embedding is not None:
+            self._record("EmbeddingCacheHit", provider, "memory")
+            return embedding
+
+        embedding = self._get_from_dynamodb(key)
+        if embedding is not None:
+            self._put_in_memory(key, embedding)
+            self._record("EmbeddingCacheHit", provider, "dynamodb")
+            return embedding
+
+        self._record("EmbeddingCacheMiss", provider)
+        embedding = compute(query_text)
+        self._put_in_memory(key, embedding)
+        self._put_in_dynamodb(key, embedding)
+        return embedding
+
+    def _get_from_memory(self, key: Tuple[str, str, str]) -> Optional[List[float]]:
+        with _memory_cache_lock:
+            entry = _memory_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, embedding = entry
+            if expires_at < time.time():
+                del _memory_cache[key]
+                return None
+            _memory_cache.move_to_end(key)
+            return embedding
+
+    def _put_in_memory(self, key: Tuple[str, str, str], embedding: List[float]):
+        with _memory_cache_lock:
+            _memory_cache[key] = (time.time() + EMBEDDING_CACHE_TTL_SECONDS, embedding)
+            _memory_cache.move_to_end(key)
+            while len(_memory_cache) > EMBEDDING_CACHE_MAX_ENTRIES:
+                _memory_cache.popitem(last=False)
+
+    @staticmethod
+    def _item_key(key: Tuple[str, str, str]) -> str:
+        return hashlib.sha256("\x1f".join(key).encode("utf-8")).hexdigest()
+
+    def _get_from_dynamodb(self, key: Tuple[str, str, str]) -> Optional[List[float]]:
+        table = _get_dynamodb_table()
+        if table is None:
+            return None
+        try:
+            item = table.get_item(Key={"cacheKey": self._item_key(key)}).get("Item")
+            # DynamoDB TTL deletion is lazy, so expired items can still be returned
+            if not item or int(item.get("ttl", 0)) < time.time():
+                return None
+            return array("d", bytes(item["embedding"])).tolist()
+        except Exception as e:
+            self.logger.warning(f"Embedding cache read failed: {str(e)}")
+            return None
+
+    def _put_in_dynamodb(self, key: Tuple[str, str, str], embedding: List[float]):
+        table = _get_dynamodb_table()
+        if table is None:
+            return
+        try:
+            table.put_item(
+                Item={
+                    "cacheKey": self._item_key(key),
+                    "provider": key[0],
+                    "model": key[1],
+                    "embedding": array("d", embedding).tobytes(),
+                    "ttl": int(time.time()) + EMBEDDING_CACHE_TTL_SECONDS,
+                }
+            )
+        except Exception as e:
+            self.logger.warning(f"Embedding cache write failed: {str(e)}")
+
+    def _record(self, metric_name: str, provider: str, tier: str = ""):
+        self.logger.info(
+            f"{metric_name} for provider {provider}" + (f" ({tier})" if tier else ""),
+            extra={"embedding_cache": metric_name, "provider": provider, "tier": tier},
+        )
+        try:
+            self.metrics.add_metric(name=metric_name, unit=MetricUnit.Count, value=1)
+        except Exception as e:
+            self.logger.debug(f"Failed to record metric {metric_name}: {e}")
@@ -0,0 +1,89 @@
+"""
+Cache for keyword-search facet aggregations.
+
+Facet counts depend only on the match set, not on which page is being shown,
+so GET /search/facets computes them once per query and serves repeats from
+here. Entries are keyed by a SHA-256 of the normalized query, its filters, the
+caller's personal-asset scope and the metadata-fields config version, and
+expire after FACET_CACHE_TTL_SECONDS so newly ingested assets show up in the
+counts without an explicit invalidation. Entries live in an in-process LRU.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from aws_lambda_powertools.metrics import MetricUnit
+
+FACET_CACHE_MAX_ENTRIES = int(os.environ.get("FACET_CACHE_MAX_ENTRIES", "256"))
+FACET_CACHE_TTL_SECONDS = int(os.environ.get("FACET_CACHE_TTL_SECONDS", "300"))
+
+# cache key -> (expires_at, facet payload)
+_memory_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+
+def facet_cache_key(key_parts: Dict[str, Any]) -> str:
+    payload = json.dumps(key_parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FacetCache:
+    """In-process cache for facet aggregations."""
+
+    def __init__(self, logger, metrics):
+        self.logger = logger
+        self.metrics = metrics
+
+    def get_or_compute(
+        self, key: str, compute: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Return the cached facets for key, computing and storing them on a miss.
+
+        Args:
+            key: Cache key from facet_cache_key()
+            compute: Runs the aggregation query on a cache miss
+
+        Returns:
+            The facet payload
+        """
+        payload = self._get_from_memory(key)
+        if payload is not None:
+            self._record("FacetCacheHit")
+            return payload
+
+        self._record("FacetCacheMiss")
+        payload = compute()
+        self._put_in_memory(key, payload)
+        return payload
+
+    def _get_from_memory(self, key: str) -> Optional[Dict[str, Any]]:
+        with _memory_cache_lock:
+            entry = _memory_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at < time.time():
+                del _memory_cache[key]
+                return None
+            _memory_cache.move_to_end(key)
+            return payload
+
+    def _put_in_memory(self, key: str, payload: Dict[str, Any]):
+        with _memory_cache_lock:
+            _memory_cache[key] = (time.time() + FACET_CACHE_TTL_SECONDS, payload)
+            _memory_cache.move_to_end(key)
+            while len(_memory_cache) > FACET_CACHE_MAX_ENTRIES:
+                _memory_cache.popitem(last=False)
+
+    def _record(self, metric_name: str):
+        self.logger.info(metric_name, extra={"facet_cache": metric_name})
+        try:
+            self.metrics.add_metric(name=metric_name, unit=MetricUnit.Count, value=1)
+        except Exception as e:
+            self.logger.debug(f"Failed to record metric {metric_name}: {e}")
@@ -22,6 +22,7 @@ from opensearchpy import (
     RequestsAWSV4SignerAuth,
     RequestsHttpConnection,
 )
+from facet_cache import FacetCache, facet_cache_key
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -30,6 +31,12 @@ from pydantic import (
     field_validator,
     model_validator,
 )
+from search_cursor import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    query_fingerprint,
+)
 from search_utils import parse_search_query
 
 # Import unified search components
@@ -49,6 +56,14 @@ THUMBNAIL_INDEX = int(os.getenv("THUMBNAIL_INDEX", "2"))
 DEFAULT_PAGE_SIZE = 50
 MAX_PAGE_SIZE = 500
 
+# Upper bound on hit counting for page requests; exact totals come from facets
+PAGE_TRACK_TOTAL_HITS = int(os.getenv("SEARCH_TRACK_TOTAL_HITS", "10000"))
+
+# Cursor pagination: how long a point in time stays open between pages
+CURSOR_KEEP_ALIVE = os.getenv("SEARCH_CURSOR_KEEP_ALIVE", "5m")
+# Unique keyword field that makes the search_after sort a total order
+CURSOR_TIEBREAKER_FIELD = "DigitalSourceAsset.ID"
+
 # Required source fields returned for every search hit
 REQUIRED_SOURCE_FIELDS: List[str] = [
     "InventoryID",
@@ -106,6 +121,18 @@ def _get_embedding_store_factory():
     return _embedding_store_factory
 
 
+# Module-level singleton for the facet aggregation cache
+_facet_cache = None
+
+
+def _get_facet_cache() -> FacetCache:
+    """Get or create the singleton FacetCache instance."""
+    global _facet_cache
+    if _facet_cache is None:
+        _facet_cache = FacetCache(logger, metrics)
+    return _facet_cache
+
+
 # Initialize unified search orchestrator
 unified_search_orchestrator = None
 
@@ -181,6 +208,12 @@ class SearchParams(BaseModelWithConfig):
     # Semantic search modality (Marengo 3.0): comma-separated visual,audio,transcript
     searchModality: Optional[str] = Field(default="visual")
 
+    # Cursor pagination: "*" for the first page, then the previous nextCursor
+    cursor: Optional[str] = None
+
+    # False skips facet aggregations; fetch them once from /search/facets instead
+    facets: bool = Field(default=True)
+
     @field_validator("filters", mode="before")
     @classmethod
     def parse_filters(cls, v: Any) -> Optional[List[Dict]]:
@@ -318,6 +351,7 @@ class SearchMetadata(BaseModelWithConfig):
     pageSize: int
     facets: Optional[Dict[str, Any]] = None
     facetsInfo: Optional[Dict[str, Any]] = None
+    nextCursor: Optional[str] = None
 
 
 class SearchResponse(BaseModelWithConfig):
@@ -513,6 +547,84 @@ def map_sort_field_to_opensearch_path(field_name: str) -> str:
     return field_mapping.get(field_name, field_name)
 
 
+def build_cursor_sort(params: SearchParams) -> List[Dict]:
+    """Sort for search_after paging: the requested order plus a unique tiebreaker."""
+    tiebreaker = {
+        CURSOR_TIEBREAKER_FIELD: {
+            "order": "asc",
+            "missing": "_last",
+            "unmapped_type": "keyword",
+        }
+    }
+    if params.sort_by:
+        sort_field = map_sort_field_to_opensearch_path(params.sort_by)
+        return [{sort_field: {"order": params.sort_direction or "desc"}}, tiebreaker]
+    if params.q.startswith("storageIdentifier:"):
+        # Explorer listings have no meaningful relevance, so skip scoring
+        return [tiebreaker]
+    return [{"_score": {"order": "desc"}}, tiebreaker]
+
+
+def apply_cursor(query_body: Dict, params: SearchParams, cursor_state: Dict) -> Dict:
+    """Turn a from/size query body into a search_after page over a point in time.
+
+    The point in time pins the result set, so every page costs the same no
+    matter how deep it is. Totals and facets are only computed for the first
+    page; later pages carry the total forward in the cursor.
+    """
+    body = {k: v for k, v in query_body.items() if k != "from"}
+    body["size"] = params.size
+    body["sort"] = build_cursor_sort(params)
+    body["pit"] = {"id": cursor_state["pit"], "keep_alive": CURSOR_KEEP_ALIVE}
+    if cursor_state.get("sa"):
+        body["search_after"] = cursor_state["sa"]
+        body["track_total_hits"] = False
+        body.pop("aggs", None)
+    return body
+
+
+def open_point_in_time(client: OpenSearch, index_name: str) -> str:
+    """Open a point in time on index_name and return its ID."""
+    response = client.transport.perform_request(
+        "POST",
+        f"/{index_name}/_search/point_in_time",
+        params={"keep_alive": CURSOR_KEEP_ALIVE},
+    )
+    return response["pit_id"]
+
+
+def close_point_in_time(client: OpenSearch, pit_id: str) -> None:
+    """Release a point in time once its cursor is exhausted."""
+    try:
+        client.transport.perform_request(
+            "DELETE", "/_search/point_in_time", body={"pit_id": [pit_id]}
+        )
+    except Exception as e:
+        # Not fatal: the point in time expires after CURSOR_KEEP_ALIVE anyway
+        logger.warning(f"Failed to close point in time: {str(e)}")
+
+
+def _invalid_cursor_response(
+    params: SearchParams, details: str, error: str = "INVALID_CURSOR"
+) -> Dict:
+    return {
+        "status": "400",
+        "message": "Invalid search cursor",
+        "data": {
+            "error": error,
+            "details": details,
+            "guidance": "Restart pagination with cursor=*",
+            "searchMetadata": {
+                "totalResults": 0,
+                "page": params.page,
+                "pageSize": params.pageSize,
+                "searchTerm": params.q,
+            },
+            "results": [],
+        },
+    }
+
+
 def _hit_bucket(hit: Dict) -> str:
     """Extract the S3 Bucket from a raw OpenSearch hit's _source."""
     return (
@@ -675,12 +787,14 @@ def build_search_query(
                 },
                 "from": (params.page - 1) * params.pageSize,
                 "size": params.pageSize,
+                "track_total_hits": PAGE_TRACK_TOTAL_HITS,
             }
         else:
             query_body = {
                 "query": bucket_clause,
                 "from": (params.page - 1) * params.pageSize,
                 "size": params.pageSize,
+                "track_total_hits": PAGE_TRACK_TOTAL_HITS,
             }
 
         # Add sort clause if sort parameters are present
@@ -946,6 +1060,7 @@ def build_search_query(
         "min_score": params.min_score,
         "size": params.size,
         "from": params.from_,
+        "track_total_hits": PAGE_TRACK_TOTAL_HITS,
         "aggs": {
             "asset_types": {
                 "terms": {"field": "DigitalSourceAsset.Type.keyword", "size": 20}
@@ -988,7 +1103,10 @@ def build_search_query(
 
     # Merge dynamic aggregations from metadata fields config
     facets_info = None
-    if metadata_fields_config is not None:
+    if not params.facets:
+        # Facets are served by /search/facets, computed once per query
+        del query_body["aggs"]
+    elif metadata_fields_config is not None:
         aggs_start = time.time()
         dynamic_aggs, facets_info = build_dynamic_aggregations(metadata_fields_config)
         query_body["aggs"].update(dynamic_aggs)
@@ -1491,14 +1609,17 @@ def create_search_metadata(
     params: SearchParams,
     aggregations=None,
     facets_info=None,
+    page: Optional[int] = None,
+    next_cursor: Optional[str] = None,
 ) -> SearchMetadata:
     """Create search metadata object"""
     return SearchMetadata(
         totalResults=total_results,
-        page=params.page,
+        page=page or params.page,
         pageSize=params.pageSize,
         facets=_clean_aggregations(aggregations),
         facetsInfo=facets_info,
+        nextCursor=next_cursor,
     )
 
 
@@ -1537,13 +1658,30 @@ def perform_search(params: SearchParams, user_sub: Optional[str] = None) -> Dict
                 },
             }
 
+    # Cursor mode (keyword search only): search_after over a point in time
+    # instead of from/size, so deep pages do not get progressively slower
+    cursor_state = None
+    fingerprint = None
+    if params.cursor and not params.semantic:
+        fingerprint = query_fingerprint({**params.model_dump(), "user_sub": user_sub})
+        try:
+            cursor_state = decode_cursor(params.cursor, fingerprint)
+        except InvalidCursorError as e:
+            logger.warning(f"Rejected search cursor: {str(e)}")
+            return _invalid_cursor_response(params, str(e))
+    page = cursor_state.get("p", 1) if cursor_state is not None else params.page
+    next_cursor = None
+
     try:
-        metadata_config_start = time.time()
-        metadata_fields_config = fetch_metadata_fields_config()
-        logger.info(
-            f"[PERF] Metadata fields config retrieval took: "
-            f"{time.time() - metadata_config_start:.3f}s"
-        )
+        # The metadata fields config only feeds facet aggregations
+        metadata_fields_config = None
+        if params.facets:
+            metadata_config_start = time.time()
+            metadata_fields_config = fetch_metadata_fields_config()
+            logger.info(
+                f"[PERF] Metadata fields config retrieval took: "
+                f"{time.time() - metadata_config_start:.3f}s"
+            )
 
         query_build_start = time.time()
         search_body, facets_info = build_search_query(
@@ -1577,8 +1715,16 @@ def perform_search(params: SearchParams, user_sub: Optional[str] = None) -> Dict
             )
             opensearch_start = time.time()
 
+            # Searches against a point in time must not name an index
+            search_index = index_name
+            if cursor_state is not None:
+                if "pit" not in cursor_state:
+                    cursor_state = {"pit": open_point_in_time(client, index_name)}
+                search_body = apply_cursor(search_body, params, cursor_state)
+                search_index = None
+
             try:
-                response = client.search(body=search_body, index=index_name)
+                response = client.search(body=search_body, index=search_index)
             except Exception as e:
                 # Handle "too many nested clauses" error with a simpler fallback query
                 if "too_many_nested_clauses" in str(e) or "maxClauseCount" in str(e):
@@ -1635,9 +1781,13 @@ def perform_search(params: SearchParams, user_sub: Optional[str] = None) -> Dict
                     fallback_query["query"]["bool"]["must_not"].extend(
                         build_personal_assets_filter(user_sub)
                     )
+                    if cursor_state is not None:
+                        fallback_query = apply_cursor(
+                            fallback_query, params, cursor_state
+                        )
 
                     logger.info("Executing simplified fallback query")
-                    response = client.search(body=fallback_query, index=index_name)
+                    response = client.search(body=fallback_query, index=search_index)
                 else:
                     # Re-raise other exceptions
                     raise e
@@ -1672,8 +1822,28 @@ def perform_search(params: SearchParams, user_sub: Optional[str] = None) -> Dict
                 )
 
             hits = response.get("hits", {}).get("hits", [])
-            total_results = response["hits"]["total"]["value"]
             aggregations = response.get("aggregations")
+            if cursor_state is not None and cursor_state.get("sa"):
+                total_results = cursor_state.get("t", 0)
+            else:
+                total_results = response["hits"]["total"]["value"]
+
+            # The next page resumes after the last raw hit, so compute the
+            # cursor before the same-page backstops below drop anything
+            if cursor_state is not None:
+                pit_id = response.get("pit_id", cursor_state["pit"])
+                if len(hits) < params.size:
+                    close_point_in_time(client, pit_id)
+                else:
+                    next_cursor = encode_cursor(
+                        {
+                            "pit": pit_id,
+                            "sa": hits[-1]["sort"],
+                            "t": total_results,
+                            "p": page + 1,
+                        },
+                        fingerprint,
+                    )
 
             logger.info(
                 f"OpenSearch returned {len(hits)} hits from {total_results} total"
@@ -1706,11 +1876,11 @@ def perform_search(params: SearchParams, user_sub: Optional[str] = None) -> Dict
                     f"{params.page} (total {total_results})"
                 )
 
-            # Validate page range
+            # Validate page range (cursor pages cannot run past the end)
             total_pages = (
                 math.ceil(total_results / params.pageSize) if total_results > 0 else 0
             )
-            if params.page > total_pages and total_pages > 0:
+            if cursor_state is None and params.page > total_pages and total_pages > 0:
                 logger.warning(
                     f"Page {params.page} is out of range. Total pages: {total_pages}"
                 )
@@ -1930,6 +2100,8 @@ def perform_search(params: SearchParams, user_sub: Optional[str] = None) -> Dict
                 params,
                 aggregations,
                 facets_info=facets_info,
+                page=page,
+                next_cursor=next_cursor,
             )
 
             return {
@@ -1944,6 +2116,15 @@ def perform_search(params: SearchParams, user_sub: Optional[str] = None) -> Dict
     except (RequestError, NotFoundError) as e:
         logger.warning(f"OpenSearch error: {str(e)}")
 
+        # Continuation pages search a point in time rather than an index, so a
+        # 404 means the cursor's point in time has expired
+        if cursor_state and cursor_state.get("sa") and isinstance(e, NotFoundError):
+            return _invalid_cursor_response(
+                params,
+                "Cursor has expired",
+                error="CURSOR_EXPIRED",
+            )
+
         empty_metadata = create_search_metadata(0, params)
 
         # Check for bucket-specific errors
@@ -2018,6 +2199,84 @@ def perform_search(params: SearchParams, user_sub: Optional[str] = None) -> Dict
         raise SearchException("An unexpected error occurred")
 
 
+# SearchParams fields that do not change the set of hits facets are counted over
+_NON_FACET_PARAMS = {
+    "q",
+    "page",
+    "pageSize",
+    "cursor",
+    "facets",
+    "search_fields",
+    "sort",
+    "sort_by",
+    "sort_direction",
+}
+
+
+def perform_facet_search(params: SearchParams, user_sub: Optional[str] = None) -> Dict:
+    """Compute facet aggregations and the exact total for a keyword query.
+
+    Page requests sent with facets=false skip aggregations entirely, so facets
+    are computed once per query here and cached by the normalized query, its
+    filters, the caller's personal-asset scope and the metadata-fields version.
+    """
+    if params.semantic:
+        return {
+            "status": "400",
+            "message": "Facets are only available for keyword search",
+            "data": None,
+        }
+
+    start_time = time.time()
+    metadata_fields_config = fetch_metadata_fields_config()
+    # Only the personal-asset filter depends on the caller
+    user_scope = user_sub if os.environ.get("PERSONAL_ASSETS_BUCKET") else None
+    cache_key = facet_cache_key(
+        {
+            "query": params.model_dump(exclude=_NON_FACET_PARAMS),
+            "q": " ".join(params.q.split()),
+            "user": user_scope,
+            "metadata_fields_version": _metadata_fields_cache_version,
+        }
+    )
+
+    def compute_facets() -> Dict[str, Any]:
+        query_body, facets_info = build_search_query(
+            params.model_copy(update={"facets": True, "cursor": None}),
+            user_sub,
+            metadata_fields_config,
+        )
+        facet_body = {
+            k: v for k, v in query_body.items() if k not in ("from", "sort", "_source")
+        }
+        facet_body["size"] = 0
+        facet_body["track_total_hits"] = True
+        response = get_opensearch_client().search(
+            body=facet_body, index=os.environ["OPENSEARCH_INDEX"]
+        )
+        return {
+            "totalResults": response["hits"]["total"]["value"],
+            "facets": _clean_aggregations(response.get("aggregations")),
+            "facetsInfo": facets_info,
+        }
+
+    try:
+        facets = _get_facet_cache().get_or_compute(cache_key, compute_facets)
+    except (RequestError, NotFoundError) as e:
+        logger.warning(f"OpenSearch error computing facets: {str(e)}")
+        facets = {"totalResults": 0, "facets": None, "facetsInfo": None}
+    except Exception as e:
+        logger.error(f"Unexpected error computing facets: {str(e)}")
+        raise SearchException("An unexpected error occurred")
+
+    logger.info(f"[PERF] Facet search took: {time.time() - start_time:.3f}s")
+    return {
+        "status": "200",
+        "message": "ok",
+        "data": {"searchMetadata": {**facets, "searchTerm": params.q}},
+    }
+
+
 def _get_user_sub_from_event(event: Dict) -> Optional[str]:
     """Extract user sub from API Gateway authorizer context."""
     try:
@@ -2104,6 +2363,37 @@ def handle_search():
         }
 
 
+@app.get("/search/facets")
+def handle_search_facets():
+    """Return facet aggregations for a keyword query, separately from its pages."""
+    try:
+        query_params = dict(app.current_event.get("queryStringParameters") or {})
+        if "q" not in query_params:
+            return {
+                "status": "400",
+                "message": "Missing required parameter 'q'",
+                "data": None,
+            }
+
+        user_sub = _get_user_sub_from_event(app.current_event.raw_event)
+        orchestrator = get_unified_search_orchestrator()
+        return orchestrator.facets(query_params, user_sub=user_sub)
+
+    except ValueError as e:
+        logger.warning(f"Invalid input parameters: {str(e)}")
+        return {"status": "400", "message": str(e), "data": None}
+    except SearchException as e:
+        logger.error(f"Facet search error: {str(e)}")
+        return {"status": "500", "message": str(e), "data": None}
+    except Exception as e:
+        logger.error(f"Unexpected error in facet search: {str(e)}")
+        return {
+            "status": "500",
+            "message": "Search service temporarily unavailable",
+            "data": None,
+        }
+
+
 @app.get("/search/providers/status")
 def handle_provider_status():
     """Get status of all configured search providers."""
@@ -12,14 +12,19 @@ Current Implementation:
 - Uses topK=100 for comprehensive search coverage
 - Combines S3 Vectors for similarity with OpenSearch for metadata filtering
 - Supports diverse asset discovery with multiple query rounds
+- Fans out per-asset clip queries concurrently (optionally folding several
+  inventory IDs into one $in-filtered query)
 """
 
+import concurrent.futures
 import os
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
+from aws_lambda_powertools.metrics import MetricUnit
 from base_embedding_store import BaseEmbeddingStore, SearchResult
+from botocore.config import Config
 from opensearchpy import (
     OpenSearch,
     RequestsAWSV4SignerAuth,
@@ -30,6 +35,21 @@ from search_utils import normalize_distance
 # Sentinel to distinguish "caller didn't pass allowed_embedding_types" from explicit None (all modes)
 _EMBEDDING_TYPES_DEFAULT = object()
 
+# S3 Vectors GA maximum results per query_vectors call
+_VECTOR_TOP_K = 100
+
+# Per-asset clip fan-out tuning
+FANOUT_MAX_WORKERS = int(os.environ.get("S3_VECTOR_FANOUT_MAX_WORKERS", "10"))
+# Wall-clock budget for the whole fan-out; stragglers are dropped, not awaited
+FANOUT_TIMEOUT_SECONDS = float(os.environ.get("S3_VECTOR_FANOUT_TIMEOUT_SECONDS", "8"))
+# Per-call socket timeout for query_vectors
+QUERY_READ_TIMEOUT_SECONDS = float(
+    os.environ.get("S3_VECTOR_QUERY_READ_TIMEOUT_SECONDS", "5")
+)
+# Expected clip hits per asset when folding several inventory IDs into one
+# $in query. 0 disables folding (one query per asset, the original behaviour).
+FANOUT_CLIPS_PER_ASSET = int(os.environ.get("S3_VECTOR_FANOUT_CLIPS_PER_ASSET", "0"))
+
 
 class S3VectorEmbeddingStore(BaseEmbeddingStore):
     """S3 Vector implementation of embedding store"""
@@ -42,8 +62,16 @@ class S3VectorEmbeddingStore(BaseEmbeddingStore):
     def _get_s3_vector_client(self):
         """Create and return a cached S3 Vector client"""
         if self._s3_vector_client is None:
+            # Pool must be at least as large as the fan-out worker count,
+            # otherwise concurrent queries queue on the connection pool.
+            client_config = Config(
+                connect_timeout=2,
+                read_timeout=QUERY_READ_TIMEOUT_SECONDS,
+                retries={"max_attempts": 2, "mode": "standard"},
+                max_pool_connections=max(10, FANOUT_MAX_WORKERS),
+            )
             self._s3_vector_client = boto3.client(
-                "s3vectors", region_name=os.environ["AWS_REGION"]
+                "s3vectors", region_name=os.environ["AWS_REGION"], config=client_config
             )
         return self._s3_vector_client
 
@@ -105,6 +133,7 @@ class S3VectorEmbeddingStore(BaseEmbeddingStore):
         self,
         params,
         allowed_embedding_types: Optional[List[str]] = _EMBEDDING_TYPES_DEFAULT,
+        embedding: Optional[List[float]] = None,
     ) -> Dict[str, Any]:
         """
         Build S3 Vector semantic query using Twelve Labs embeddings.
@@ -114,14 +143,17 @@ class S3VectorEmbeddingStore(BaseEmbeddingStore):
             allowed_embedding_types: List of embedding types to include (e.g., ["visual-text"]).
                                     None means no filtering (all modes / search everything).
                                     If not passed, defaults to ["visual-text"].
+            embedding: Precomputed query embedding. When omitted it is generated
+                       via the shared query-embedding cache.
         """
         start_time = time.time()
         self.logger.info(
             f"[PERF] Starting S3 Vector semantic query build for: {params.q}"
         )
 
-        # Use centralized embedding generation
-        embedding = self.generate_text_embedding(params.q)
+        # Use centralized embedding generation unless the caller already has one
+        if embedding is None:
+            embedding = self.generate_text_embedding(params.q)
 
         # Resolve sentinel: if caller didn't pass anything, default to visual-text
         if allowed_embedding_types is _EMBEDDING_TYPES_DEFAULT:
@@ -159,7 +191,7 @@ class S3VectorEmbeddingStore(BaseEmbeddingStore):
             # S3 Vector GA supports up to 100 results per query (increased from 30 in preview)
             # Strategy: Do multiple queries (each topK=100) with exclusion filters
             # to discover diverse assets (videos with many clips can dominate results)
-            vector_topK = 100
+            vector_topK = _VECTOR_TOP_K
             max_discovery_rounds = 3
             min_unique_assets = 5
 
@@ -170,7 +202,10 @@ class S3VectorEmbeddingStore(BaseEmbeddingStore):
                 f"Starting diverse asset discovery (target: {min_unique_assets} unique assets, max {max_discovery_rounds} rounds of topK={vector_topK})"
             )
 
+            # Discovery rounds stay sequential: each round's exclusion filter
+            # depends on the assets found by the previous one.
             for round_num in range(max_discovery_rounds):
+                round_start = time.time()
                 # Build exclusion filter using $and + multiple $ne conditions
                 if discovered_inventory_ids:
                     # Exclude already-discovered assets using separate $ne conditions
@@ -212,6 +247,13 @@ class S3VectorEmbeddingStore(BaseEmbeddingStore):
                         f"  Round {round_num + 1} query failed: {e}, stopping discovery"
                     )
                     break
+                finally:
+                    self._record_timing(
+                        "S3VectorDiscoveryRoundLatency",
+                        time.time() - round_start,
+                        f"S3 Vector discovery round {round_num + 1}",
+                        {"round": round_num + 1},
+                    )
 
                 if not round_results:
                     self.logger.info(
@@ -276,7 +318,6 @@ class S3VectorEmbeddingStore(BaseEmbeddingStore):
                 return SearchResult(hits=[], total_results=0)
 
             # Step 3: Query S3 Vector Store for each valid inventory_id to get clips and parent assets
-            all_results = []
             allowed_types = query.get("allowed_embedding_types", ["visual-text"])
 
             # Create a mapping of inventory_id to asset type for conditional filtering
@@ -287,54 +328,12 @@ class S3VectorEmbeddingStore(BaseEmbeddingStore):
                 if inv_id:
                     inventory_type_map[inv_id] = asset_type
 
-            for inventory_id in valid_inventory_ids:
-                # Get asset type for this inventory_id
-                asset_type = inventory_type_map.get(inventory_id, "Unknown")
-
-                # Build filter based on asset type and allowed_types:
-                # - allowed_types=None means all modes selected — no embedding_option filter
-                # - For Video with specific modes: Apply allowed_embedding_types filter
-                # - For Image/Audio: Only filter by inventory_id (no embedding type restriction)
-                if allowed_types is not None and asset_type == "Video":
-                    # Filter out unwanted embedding types (e.g., audio, visual-image for video clips)
-                    vector_filter = {
-                        "$and": [
-                            {"inventory_id": {"$eq": inventory_id}},
-                            {"embedding_option": {"$in": allowed_types}},
-                        ]
-                    }
-                else:
-                    # No embedding_option filter: all modes selected, or non-video asset
-                    vector_filter = {"inventory_id": {"$eq": inventory_id}}
-
-                # Log the filter being applied
-                self.logger.info(
-                    f"Querying {inventory_id} (type={asset_type}) with filter: {vector_filter}"
-                )
-
-                # Query for this specific inventory_id with conditional filter
-                filtered_response = s3_vector_client.query_vectors(
-                    vectorBucketName=bucket_name,
-                    indexName=index_name,
-                    queryVector={"float32": query["embedding"]},
-                    topK=vector_topK,
-                    filter=vector_filter,
-                    returnMetadata=True,
-                    returnDistance=True,  # GA feature: accurate similarity scoring
-                )
-
-                filtered_results = filtered_response.get("vectors", [])
-                self.logger.info(
-                    f"–– Debug: filtered_results for {inventory_id}: {len(filtered_results)} hits"
-                )
-                for fr in filtered_results:
-                    key = fr.get("key")
-                    dist = fr.get("distance")
-                    scope = fr.get("metadata", {}).get("embedding_scope")
-                    self.logger.info(
-                        f"    [Filtered {inventory_id}] key={key}   scope={scope}   distance={dist}"
-                    )
-                all_results.extend(filtered_results)
+            all_results = self._fan_out_clip_queries(
+                query,
+                [inv_id for inv_id in valid_inventory_ids if inv_id],
+                inventory_type_map,
+                allowed_types,
+            )
 
             s3_vector_time = time.time() - s3_vector_start
             self.logger.info(
@@ -375,6 +374,228 @@ class S3VectorEmbeddingStore(BaseEmbeddingStore):
             self.logger.exception("Error performing S3 Vector search")
             raise Exception(f"S3 Vector search error: {str(e)}")
 
+    def _record_timing(
+        self,
+        metric_name: str,
+        elapsed: float,
+        label: str,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Emit a [PERF] log line with structured fields and a matching metric."""
+        elapsed_ms = elapsed * 1000
+        self.logger.info(
+            f"[PERF] {label} took: {elapsed:.3f}s",
+            extra={
+                "perf_metric": metric_name,
+                "duration_ms": elapsed_ms,
+                **(details or {}),
+            },
+        )
+        try:
+            self.metrics.add_metric(
+                name=metric_name, unit=MetricUnit.Milliseconds, value=elapsed_ms
+            )
+        except Exception as e:
+            self.logger.debug(f"Failed to record metric {metric_name}: {e}")
+
+    @staticmethod
+    def _build_clip_filter(
+        inventory_ids: List[str], allowed_types: Optional[List[str]], is_video: bool
+    ) -> Dict[str, Any]:
+        """
+        Build the query_vectors filter for one fan-out task.
+
+        - allowed_types=None means all modes selected — no embedding_option filter
+        - For Video with specific modes: Apply allowed_embedding_types filter
+        - For Image/Audio: Only filter by inventory_id (no embedding type restriction)
+        """
+        if len(inventory_ids) == 1:
+            id_filter = {"inventory_id": {"$eq": inventory_ids[0]}}
+        else:
+            id_filter = {"inventory_id": {"$in": list(inventory_ids)}}
+
+        if allowed_types is not None and is_video:
+            return {"$and": [id_filter, {"embedding_option": {"$in": allowed_types}}]}
+        return id_filter
+
+    def _plan_clip_queries(
+        self,
+        inventory_ids: List[str],
+        inventory_type_map: Dict[str, str],
+        allowed_types: Optional[List[str]],
+    ) -> List[Tuple[List[str], Dict[str, Any]]]:
+        """
+        Group inventory IDs into fan-out tasks.
+
+        With FANOUT_CLIPS_PER_ASSET unset every asset gets its own query.
+        Otherwise assets sharing the same filter shape are folded into a
+        single $in query, as many per query as the topK budget allows.
+        """
+        batch_size = 1
+        if FANOUT_CLIPS_PER_ASSET > 0:
+            batch_size = max(1, _VECTOR_TOP_K // FANOUT_CLIPS_PER_ASSET)
+
+        # Video assets need the embedding_option restriction, others don't,
+        # so only assets of the same kind can share a filter.
+        groups: Dict[bool, List[str]] = {True: [], False: []}
+        for inventory_id in inventory_ids:
+            groups[inventory_type_map.get(inventory_id) == "Video"].append(inventory_id)
+
+        tasks = []
+        for is_video, ids in groups.items():
+            for i in range(0, len(ids), batch_size):
+                chunk = ids[i : i + batch_size]
+                tasks.append(
+                    (chunk, self._build_clip_filter(chunk, allowed_types, is_video))
+                )
+        return tasks
+
+    def _run_clip_query(
+        self, query: Dict[str, Any], vector_filter: Dict[str, Any]
+    ) -> List[Dict]:
+        """Run one clip query_vectors call."""
+        response = self._get_s3_vector_client().query_vectors(
+            vectorBucketName=query["bucket_name"],
+            indexName=query["index_name"],
+            queryVector={"float32": query["embedding"]},
+            topK=_VECTOR_TOP_K,
+            filter=vector_filter,
+            returnMetadata=True,
+            returnDistance=True,  # GA feature: accurate similarity scoring
+        )
+        return response.get("vectors", [])
+
+    def _fan_out_clip_queries(
+        self,
+        query: Dict[str, Any],
+        inventory_ids: List[str],
+        inventory_type_map: Dict[str, str],
+        allowed_types: Optional[List[str]],
+    ) -> List[Dict]:
+        """
+        Fetch clips and parent vectors for the given assets concurrently.
+
+        Tasks run on a bounded thread pool under a shared deadline. Failed or
+        timed-out tasks are logged and skipped so the search still returns
+        whatever completed. Assets from a failed batched query, or from one
+        that came back saturated (topK hits) without any of their vectors,
+        are re-queried on their own so they are not starved by their siblings.
+        """
+        if not inventory_ids:
+            return []
+
+        fanout_start = time.time()
+        tasks = self._plan_clip_queries(
+            inventory_ids, inventory_type_map, allowed_types
+        )
+        self.logger.info(
+            f"Fanning out {len(tasks)} clip queries for {len(inventory_ids)} assets "
+            f"(max_workers={FANOUT_MAX_WORKERS}, timeout={FANOUT_TIMEOUT_SECONDS}s)"
+        )
+
+        all_results: List[Dict] = []
+        failed = 0
+        timed_out = 0
+        deadline = fanout_start + FANOUT_TIMEOUT_SECONDS
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(FANOUT_MAX_WORKERS, len(tasks)))
+        )
+        try:
+            pending = {
+                executor.submit(self._run_clip_query, query, vector_filter): (
+                    ids,
+                    time.time(),
+                )
+                for ids, vector_filter in tasks
+            }
+            retry_ids: List[str] = []
+
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending,
+                    timeout=max(0.0, deadline - time.time()),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+
+                for future in done:
+                    ids, submitted_at = pending.pop(future)
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        if len(ids) > 1:
+                            # Split a failed batch so one bad asset can't sink the rest
+                            self.logger.warning(
+                                f"Batched clip query for {ids} failed, retrying individually: {e}"
+                            )
+                            retry_ids.extend(ids)
+                        else:
+                            failed += 1
+                            self.logger.warning(
+                                f"Clip query for {ids} failed, skipping: {e}"
+                            )
+                        continue
+
+                    self.logger.info(
+                        f"[PERF] Clip query for {len(ids)} asset(s) returned "
+                        f"{len(results)} hits in {time.time() - submitted_at:.3f}s"
+                    )
+                    all_results.extend(results)
+
+                    if len(ids) > 1 and len(results) >= _VECTOR_TOP_K:
+                        returned = {
+                            r.get("metadata", {}).get("inventory_id") for r in results
+                        }
+                        retry_ids.extend(i for i in ids if i not in returned)
+
+                # Starved assets from saturated batches get their own query
+                for inventory_id in retry_ids:
+                    vector_filter = self._build_clip_filter(
+                        [inventory_id],
+                        allowed_types,
+                        inventory_type_map.get(inventory_id) == "Video",
+                    )
+                    future = executor.submit(self._run_clip_query, query, vector_filter)
+                    pending[future] = ([inventory_id], time.time())
+                retry_ids = []
+
+            if pending:
+                timed_out = len(pending)
+                self.logger.warning(
+                    f"Clip fan-out deadline of {FANOUT_TIMEOUT_SECONDS}s reached, "
+                    f"returning partial results without "
+                    f"{[ids for ids, _ in pending.values()]}"
+                )
+        finally:
+            # Do not block the response on stragglers
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self._record_timing(
+            "S3VectorClipFanOutLatency",
+            time.time() - fanout_start,
+            "S3 Vector clip fan-out",
+            {
+                "fanout_tasks": len(tasks),
+                "fanout_assets": len(inventory_ids),
+                "fanout_failed": failed,
+                "fanout_timed_out": timed_out,
+                "fanout_hits": len(all_results),
+            },
+        )
+        if failed or timed_out:
+            try:
+                self.metrics.add_metric(
+                    name="S3VectorClipFanOutIncomplete",
+                    unit=MetricUnit.Count,
+                    value=failed + timed_out,
+                )
+            except Exception as e:
+                self.logger.debug(f"Failed to record fan-out metric: {e}")
+
+        return all_results
+
     def _convert_s3_vector_results(self, results: List[Dict]) -> List[Dict]:
         """Convert S3 Vector results to OpenSearch-like format for compatibility"""
         hits = []
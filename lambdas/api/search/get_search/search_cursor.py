@@ -0,0 +1,72 @@
+"""
+Opaque pagination cursors for GET /search.
+
+A client opts into cursor paging by sending cursor=* and then passes back the
+nextCursor from each response until it is null. The cursor is URL-safe base64
+of a small JSON document; its contents differ per backend:
+
+    OpenSearch keyword search: {"pit": id, "sa": [sort values], "t": total,
+                                "p": page number}
+    Provider (semantic) search: {"o": offset}
+
+Every cursor also carries a fingerprint ("k") of the query it was issued for,
+so it cannot be replayed against a different query or filter set.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from typing import Any, Dict, Iterable
+
+CURSOR_START = "*"
+CURSOR_VERSION = 1
+
+# Request parameters that move through a result set rather than define it
+PAGING_PARAMS = frozenset({"page", "pageSize", "cursor"})
+
+
+class InvalidCursorError(ValueError):
+    """Raised for cursors that are malformed or belong to another query."""
+
+
+def query_fingerprint(
+    params: Dict[str, Any], exclude: Iterable[str] = PAGING_PARAMS
+) -> str:
+    """Stable short hash of the parameters that define a result set."""
+    excluded = set(exclude)
+    defining = {k: v for k, v in params.items() if k not in excluded}
+    payload = json.dumps(defining, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(state: Dict[str, Any], fingerprint: str) -> str:
+    payload = json.dumps(
+        {**state, "v": CURSOR_VERSION, "k": fingerprint}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, fingerprint: str) -> Dict[str, Any]:
+    """
+    Decode a cursor issued for the query identified by fingerprint.
+
+    Returns:
+        The cursor state, or an empty dict for the CURSOR_START sentinel
+
+    Raises:
+        InvalidCursorError: if the cursor is malformed, from another cursor
+            version or was issued for a different query
+    """
+    if cursor == CURSOR_START:
+        return {}
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+    if not isinstance(state, dict) or state.get("v") != CURSOR_VERSION:
+        raise InvalidCursorError("Unsupported cursor version")
+    if state.get("k") != fingerprint:
+        raise InvalidCursorError("Cursor does not belong to this query")
+    return state
@@ -0,0 +1,157 @@
+"""
+Unit tests for the query-embedding cache.
+
+Tests that query text is normalized only by collapsing whitespace, that
+repeated queries are served from memory, and that the shared DynamoDB tier
+serves a query embedded by another container without embedding it again.
+"""
+
+import os
+import time
+from unittest.mock import MagicMock
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import embedding_cache
+import pytest
+from boto3.dynamodb.types import Binary
+from embedding_cache import EmbeddingCache, normalize_query_text
+
+EMBEDDING = [0.1, -0.25, 1e-7]
+
+
+class FakeTable:
+    """Dict-backed stand-in for the shared cache table"""
+
+    def __init__(self):
+        self.items = {}
+
+    def get_item(self, Key):
+        item = self.items.get(Key["cacheKey"])
+        return {"Item": item} if item else {}
+
+    def put_item(self, Item):
+        # The resource API hands binary attributes back as Binary
+        self.items[Item["cacheKey"]] = {**Item, "embedding": Binary(Item["embedding"])}
+
+
+@pytest.fixture
+def table(monkeypatch):
+    """Empty memory tier in front of a fake shared table."""
+    fake = FakeTable()
+    embedding_cache._memory_cache.clear()
+    monkeypatch.setattr(embedding_cache, "EMBEDDING_CACHE_TABLE_NAME", "cache")
+    monkeypatch.setattr(embedding_cache, "_dynamodb_table", fake)
+    yield fake
+    embedding_cache._memory_cache.clear()
+
+
+def _cache():
+    return EmbeddingCache(MagicMock(), MagicMock())
+
+
+def _compute():
+    return MagicMock(return_value=list(EMBEDDING))
+
+
+class TestNormalizeQueryText:
+    """Test suite for cache key normalization"""
+
+    def test_whitespace_is_collapsed_and_trimmed(self):
+        """Test that spacing differences share one key"""
+        assert normalize_query_text("  red \t car\n") == "red car"
+
+    def test_case_and_unicode_form_are_kept(self):
+        """Test that case and Unicode form are not folded"""
+        assert normalize_query_text("Red Car") == "Red Car"
+        assert normalize_query_text("ﬁsh") != normalize_query_text("fish")
+
+    def test_missing_text_is_empty(self):
+        """Test that None normalizes to an empty string"""
+        assert normalize_query_text(None) == ""
+
+
+class TestEmbeddingCache:
+    """Test suite for EmbeddingCache.get_or_compute"""
+
+    def test_miss_computes_and_stores_in_both_tiers(self, table):
+        """Test that a miss embeds the raw query once and fills both tiers"""
+        compute = _compute()
+
+        embedding = _cache().get_or_compute("bedrock", "marengo", " red  car ", compute)
+
+        assert embedding == EMBEDDING
+        compute.assert_called_once_with(" red  car ")
+        (item,) = table.items.values()
+        assert (item["provider"], item["model"]) == ("bedrock", "marengo")
+        assert item["ttl"] > time.time()
+
+    def test_repeat_is_served_from_memory(self, table):
+        """Test that an equivalent query is not embedded again"""
+        compute = _compute()
+        _cache().get_or_compute("bedrock", "marengo", "red car", compute)
+        table.get_item = MagicMock()
+
+        embedding = _cache().get_or_compute("bedrock", "marengo", "red   car", compute)
+
+        assert embedding == EMBEDDING
+        compute.assert_called_once()
+        table.get_item.assert_not_called()
+
+    def test_other_container_is_served_from_dynamodb(self, table):
+        """Test that the shared tier returns the exact vector without embedding"""
+        _cache().get_or_compute("bedrock", "marengo", "red car", _compute())
+        embedding_cache._memory_cache.clear()
+        compute = _compute()
+
+        embedding = _cache().get_or_compute("bedrock", "marengo", "red car", compute)
+
+        assert embedding == EMBEDDING
+        compute.assert_not_called()
+
+    def test_provider_and_model_are_part_of_the_key(self, table):
+        """Test that another model embeds the same text separately"""
+        compute = _compute()
+        _cache().get_or_compute("bedrock", "marengo-2.7", "red car", compute)
+
+        _cache().get_or_compute("bedrock", "marengo-3.0", "red car", compute)
+
+        assert compute.call_count == 2
+        assert len(table.items) == 2
+
+    def test_expired_dynamodb_item_is_a_miss(self, table):
+        """Test that an item past its ttl is not served before TTL deletion"""
+        _cache().get_or_compute("bedrock", "marengo", "red car", _compute())
+        embedding_cache._memory_cache.clear()
+        for item in table.items.values():
+            item["ttl"] = int(time.time()) - 1
+        compute = _compute()
+
+        _cache().get_or_compute("bedrock", "marengo", "red car", compute)
+
+        compute.assert_called_once()
+
+    def test_dynamodb_errors_fall_back_to_computing(self, table):
+        """Test that a failing shared tier never fails the search"""
+        table.get_item = MagicMock(side_effect=Exception("throttled"))
+        table.put_item = MagicMock(side_effect=Exception("throttled"))
+        compute = _compute()
+
+        embedding = _cache().get_or_compute("bedrock", "marengo", "red car", compute)
+
+        assert embedding == EMBEDDING
+        compute.assert_called_once()
+
+    def test_tier_is_skipped_without_a_table(self, monkeypatch):
+        """Test that an unset EMBEDDING_CACHE_TABLE_NAME disables the shared tier"""
+        embedding_cache._memory_cache.clear()
+        monkeypatch.setattr(embedding_cache, "EMBEDDING_CACHE_TABLE_NAME", "")
+        monkeypatch.setattr(embedding_cache, "_dynamodb_table", None)
+        compute = _compute()
+
+        _cache().get_or_compute("bedrock", "marengo", "red car", compute)
+
+        compute.assert_called_once()
+        assert embedding_cache._dynamodb_table is None
+        embedding_cache._memory_cache.clear()
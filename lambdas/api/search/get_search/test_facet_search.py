@@ -0,0 +1,132 @@
+"""
+Unit tests for facet search.
+
+Tests that GET /search/facets computes aggregations once per query and serves
+repeats from the facet cache, and that page requests sent with facets=false
+skip aggregations entirely.
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("OPENSEARCH_INDEX", "media")
+
+import facet_cache
+import index
+import pytest
+from index import SearchParams, build_search_query, perform_facet_search
+from opensearchpy import RequestError
+
+
+def _facet_response(total=42):
+    return {
+        "hits": {"total": {"value": total}, "hits": []},
+        "aggregations": {
+            "asset_types": {"buckets": [{"key": "Image", "doc_count": total}]}
+        },
+    }
+
+
+@pytest.fixture
+def opensearch():
+    """OpenSearch client returning a fixed facet response."""
+    facet_cache._memory_cache.clear()
+    client = MagicMock()
+    client.search.return_value = _facet_response()
+    with patch.object(
+        index, "get_opensearch_client", return_value=client
+    ), patch.object(index, "fetch_metadata_fields_config", return_value=None):
+        yield client
+    facet_cache._memory_cache.clear()
+
+
+class TestFacetSearch:
+    """Test suite for perform_facet_search"""
+
+    def test_returns_total_and_facets(self, opensearch):
+        """Test that facets and the exact total come back in searchMetadata"""
+        result = perform_facet_search(SearchParams(q="beach"))
+
+        metadata = result["data"]["searchMetadata"]
+        assert result["status"] == "200"
+        assert metadata["totalResults"] == 42
+        assert metadata["searchTerm"] == "beach"
+        assert "asset_types" in metadata["facets"]
+
+    def test_aggregation_query_fetches_no_hits(self, opensearch):
+        """Test that the facet query only counts and aggregates"""
+        perform_facet_search(SearchParams(q="beach", sort="-createdAt"))
+
+        body = opensearch.search.call_args.kwargs["body"]
+        assert body["size"] == 0
+        assert body["track_total_hits"] is True
+        assert "aggs" in body
+        assert not {"from", "sort", "_source"} & body.keys()
+
+    def test_paging_params_share_a_cache_entry(self, opensearch):
+        """Test that other pages, sizes and sorts of the same query hit the cache"""
+        perform_facet_search(SearchParams(q="beach"))
+        perform_facet_search(SearchParams(q="  beach ", page=3, pageSize=100))
+        perform_facet_search(SearchParams(q="beach", sort="-createdAt", facets=False))
+
+        assert opensearch.search.call_count == 1
+
+    def test_filters_get_their_own_cache_entry(self, opensearch):
+        """Test that a different match set is aggregated separately"""
+        perform_facet_search(SearchParams(q="beach"))
+        perform_facet_search(SearchParams(q="beach", type="Image"))
+        perform_facet_search(SearchParams(q="sunset"))
+
+        assert opensearch.search.call_count == 3
+
+    def test_semantic_search_is_rejected(self, opensearch):
+        """Test that facets are only offered for keyword search"""
+        result = perform_facet_search(SearchParams(q="beach", semantic=True))
+
+        assert result["status"] == "400"
+        opensearch.search.assert_not_called()
+
+    def test_opensearch_request_error_returns_empty_facets(self, opensearch):
+        """Test that a rejected query degrades to empty facets and is not cached"""
+        opensearch.search.side_effect = RequestError(400, "search_phase_exception")
+
+        result = perform_facet_search(SearchParams(q="beach"))
+
+        metadata = result["data"]["searchMetadata"]
+        assert metadata["totalResults"] == 0
+        assert metadata["facets"] is None
+        assert not facet_cache._memory_cache
+
+
+class TestFacetsDisabled:
+    """Test suite for page requests sent with facets=false"""
+
+    def test_query_has_no_aggregations(self):
+        """Test that facets=false drops every aggregation from the page query"""
+        query_body, facets_info = build_search_query(
+            SearchParams(q="beach", facets=False), None, [{"name": "unused"}]
+        )
+
+        assert "aggs" not in query_body
+        assert facets_info is None
+
+    def test_query_keeps_aggregations_by_default(self):
+        """Test that page requests without the flag still carry facets"""
+        query_body, _ = build_search_query(SearchParams(q="beach"), None, None)
+
+        assert query_body["aggs"]
+
+    def test_metadata_fields_config_is_not_fetched(self):
+        """Test that facets=false skips the metadata-fields config read"""
+        client = MagicMock()
+        client.search.return_value = {"hits": {"total": {"value": 0}, "hits": []}}
+        with patch.object(
+            index, "get_opensearch_client", return_value=client
+        ), patch.object(index, "fetch_metadata_fields_config") as fetch_config:
+            index.perform_search(SearchParams(q="beach", facets=False))
+
+        fetch_config.assert_not_called()
+        assert "aggs" not in client.search.call_args.kwargs["body"]
@@ -0,0 +1,217 @@
+"""
+Unit tests for the concurrent S3 Vectors clip-query fan-out.
+
+Tests that assets are planned into one query each (or folded into $in
+queries), that queries run concurrently up to the worker limit, and that
+failed, starved and timed-out queries degrade to partial results.
+"""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import pytest
+import s3_vector_embedding_store
+from s3_vector_embedding_store import S3VectorEmbeddingStore
+
+QUERY = {"bucket_name": "vectors", "index_name": "media", "embedding": [0.1, 0.2]}
+ALLOWED_TYPES = ["visual", "audio"]
+
+
+def _inventory_ids(vector_filter):
+    """Inventory IDs a query_vectors filter selects."""
+    id_filter = vector_filter.get("$and", [vector_filter])[0]["inventory_id"]
+    return [id_filter["$eq"]] if "$eq" in id_filter else id_filter["$in"]
+
+
+class FakeS3Vectors:
+    """query_vectors stand-in returning hits_per_asset hits per filtered asset"""
+
+    def __init__(self, delay=0.0, fail=(), slow=(), hits_per_asset=1):
+        self.delay = delay
+        self.fail = set(fail)
+        self.slow = set(slow)
+        self.hits_per_asset = hits_per_asset
+        self.filters = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def query_vectors(self, filter, **kwargs):
+        ids = _inventory_ids(filter)
+        with self._lock:
+            self.filters.append(filter)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(1.0 if self.slow & set(ids) else self.delay)
+            if self.fail & set(ids):
+                raise RuntimeError("query failed")
+            return {
+                "vectors": [
+                    {"key": f"{i}-{n}", "metadata": {"inventory_id": i}}
+                    for i in ids
+                    for n in range(self.hits_per_asset)
+                ]
+            }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _store(client):
+    store = S3VectorEmbeddingStore(MagicMock(), MagicMock())
+    store._s3_vector_client = client
+    return store
+
+
+def _assets(count, kind="Video"):
+    ids = [f"asset-{i}" for i in range(count)]
+    return ids, {i: kind for i in ids}
+
+
+class TestPlanClipQueries:
+    """Test suite for grouping assets into fan-out tasks"""
+
+    def test_one_query_per_asset_by_default(self, monkeypatch):
+        """Test that folding is off unless FANOUT_CLIPS_PER_ASSET is set"""
+        monkeypatch.setattr(s3_vector_embedding_store, "FANOUT_CLIPS_PER_ASSET", 0)
+        ids, types = _assets(3)
+
+        tasks = _store(None)._plan_clip_queries(ids, types, ALLOWED_TYPES)
+
+        assert [task_ids for task_ids, _ in tasks] == [[i] for i in ids]
+        assert tasks[0][1] == {
+            "$and": [
+                {"inventory_id": {"$eq": "asset-0"}},
+                {"embedding_option": {"$in": ALLOWED_TYPES}},
+            ]
+        }
+
+    def test_assets_are_folded_within_the_top_k_budget(self, monkeypatch):
+        """Test that 25 expected clips per asset folds 4 assets per query"""
+        monkeypatch.setattr(s3_vector_embedding_store, "FANOUT_CLIPS_PER_ASSET", 25)
+        ids, types = _assets(10)
+
+        tasks = _store(None)._plan_clip_queries(ids, types, ALLOWED_TYPES)
+
+        assert [len(task_ids) for task_ids, _ in tasks] == [4, 4, 2]
+
+    def test_video_and_other_assets_do_not_share_a_filter(self, monkeypatch):
+        """Test that only video queries carry the embedding_option restriction"""
+        monkeypatch.setattr(s3_vector_embedding_store, "FANOUT_CLIPS_PER_ASSET", 25)
+        types = {"v1": "Video", "i1": "Image", "v2": "Video"}
+
+        tasks = _store(None)._plan_clip_queries(list(types), types, ALLOWED_TYPES)
+
+        assert tasks[0][0] == ["v1", "v2"]
+        assert "$and" in tasks[0][1]
+        assert tasks[1] == (["i1"], {"inventory_id": {"$eq": "i1"}})
+
+
+class TestFanOutClipQueries:
+    """Test suite for running clip queries concurrently"""
+
+    @pytest.fixture(autouse=True)
+    def fanout_limits(self, monkeypatch):
+        monkeypatch.setattr(s3_vector_embedding_store, "FANOUT_CLIPS_PER_ASSET", 0)
+        monkeypatch.setattr(s3_vector_embedding_store, "FANOUT_MAX_WORKERS", 3)
+        monkeypatch.setattr(s3_vector_embedding_store, "FANOUT_TIMEOUT_SECONDS", 5.0)
+
+    def test_queries_run_concurrently_up_to_the_worker_limit(self):
+        """Test that at most FANOUT_MAX_WORKERS queries are in flight"""
+        client = FakeS3Vectors(delay=0.05)
+        ids, types = _assets(9)
+
+        results = _store(client)._fan_out_clip_queries(
+            QUERY, ids, types, ALLOWED_TYPES
+        )
+
+        assert client.peak == 3
+        assert sorted(r["metadata"]["inventory_id"] for r in results) == sorted(ids)
+
+    def test_failed_query_is_skipped(self):
+        """Test that one failing asset does not fail the search"""
+        client = FakeS3Vectors(fail=["asset-1"])
+        ids, types = _assets(3)
+        store = _store(client)
+
+        results = store._fan_out_clip_queries(QUERY, ids, types, ALLOWED_TYPES)
+
+        assert {r["metadata"]["inventory_id"] for r in results} == {
+            "asset-0",
+            "asset-2",
+        }
+        store.metrics.add_metric.assert_any_call(
+            name="S3VectorClipFanOutIncomplete",
+            unit=s3_vector_embedding_store.MetricUnit.Count,
+            value=1,
+        )
+
+    def test_failed_batch_is_retried_per_asset(self, monkeypatch):
+        """Test that a failed $in query is split so the healthy assets return"""
+        monkeypatch.setattr(s3_vector_embedding_store, "FANOUT_CLIPS_PER_ASSET", 25)
+        client = FakeS3Vectors(fail=["asset-1"])
+        ids, types = _assets(3)
+
+        results = _store(client)._fan_out_clip_queries(
+            QUERY, ids, types, ALLOWED_TYPES
+        )
+
+        assert {r["metadata"]["inventory_id"] for r in results} == {
+            "asset-0",
+            "asset-2",
+        }
+        assert len(client.filters) == 1 + 3
+
+    def test_starved_assets_of_a_saturated_batch_are_requeried(self, monkeypatch):
+        """Test that assets crowded out of a topK-full batch get their own query"""
+        monkeypatch.setattr(s3_vector_embedding_store, "FANOUT_CLIPS_PER_ASSET", 50)
+        client = FakeS3Vectors(hits_per_asset=100)
+        ids, types = _assets(2)
+        original = client.query_vectors
+
+        def saturated_by_first_asset(filter, **kwargs):
+            response = original(filter, **kwargs)
+            response["vectors"] = response["vectors"][:100]
+            return response
+
+        client.query_vectors = saturated_by_first_asset
+
+        results = _store(client)._fan_out_clip_queries(
+            QUERY, ids, types, ALLOWED_TYPES
+        )
+
+        assert [_inventory_ids(f) for f in client.filters] == [
+            ["asset-0", "asset-1"],
+            ["asset-1"],
+        ]
+        assert {r["metadata"]["inventory_id"] for r in results} == set(ids)
+
+    def test_deadline_returns_partial_results(self, monkeypatch):
+        """Test that a query still running at the deadline is not awaited"""
+        monkeypatch.setattr(s3_vector_embedding_store, "FANOUT_TIMEOUT_SECONDS", 0.3)
+        client = FakeS3Vectors(slow=["asset-2"])
+        ids, types = _assets(3)
+
+        start = time.time()
+        results = _store(client)._fan_out_clip_queries(
+            QUERY, ids, types, ALLOWED_TYPES
+        )
+
+        assert time.time() - start < 0.9
+        assert {r["metadata"]["inventory_id"] for r in results} == {
+            "asset-0",
+            "asset-1",
+        }
+
+    def test_no_assets_makes_no_queries(self):
+        """Test that an empty asset list returns without querying"""
+        client = FakeS3Vectors()
+
+        assert _store(client)._fan_out_clip_queries(QUERY, [], {}, None) == []
+        assert client.filters == []
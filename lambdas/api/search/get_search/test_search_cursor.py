@@ -0,0 +1,51 @@
+"""
+Unit tests for search pagination cursors.
+
+Tests that cursors round-trip, are bound to the query they were issued for,
+and reject malformed input.
+"""
+
+import pytest
+from search_cursor import (
+    CURSOR_START,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    query_fingerprint,
+)
+
+
+class TestSearchCursor:
+    """Test suite for search cursor encoding"""
+
+    def test_start_sentinel_decodes_to_empty_state(self):
+        """Test that the start sentinel begins a fresh cursor session"""
+        assert decode_cursor(CURSOR_START, "any") == {}
+
+    def test_round_trip(self):
+        """Test that a cursor decodes back to the state it was built from"""
+        fingerprint = query_fingerprint({"q": "beach"})
+        state = {"pit": "abc==", "sa": [1.5, "asset:img:1"], "t": 1200, "p": 3}
+        cursor = encode_cursor(state, fingerprint)
+
+        decoded = decode_cursor(cursor, fingerprint)
+
+        assert {k: decoded[k] for k in state} == state
+        assert "=" not in cursor
+
+    def test_fingerprint_ignores_paging_params(self):
+        """Test that moving through results does not change the fingerprint"""
+        first = query_fingerprint({"q": "beach", "page": 1, "cursor": "*"})
+        later = query_fingerprint({"q": "beach", "page": 7, "pageSize": 100})
+        assert first == later
+
+    def test_cursor_rejected_for_other_query(self):
+        """Test that a cursor cannot be replayed against a different query"""
+        cursor = encode_cursor({"o": 50}, query_fingerprint({"q": "beach"}))
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, query_fingerprint({"q": "mountain"}))
+
+    def test_malformed_cursor_rejected(self):
+        """Test that garbage input raises InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor!", query_fingerprint({"q": "beach"}))
@@ -7,6 +7,7 @@ import time
 from typing import Dict, List
 
 import boto3
+from embedding_cache import EmbeddingCache
 from opensearchpy import (
     OpenSearch,
     RequestsAWSV4SignerAuth,
@@ -120,8 +121,14 @@ class TwelveLabsAPISearchProvider(ProviderPlusStoreSearchProvider):
     def generate_embeddings(self, query_text: str) -> List[float]:
         """
         Generate embeddings using TwelveLabs API.
+        Embeddings are served from the shared query-embedding cache when possible.
         """
-        return self._generate_embedding_via_twelvelabs_api(query_text)
+        return EmbeddingCache(self.logger, self.metrics).get_or_compute(
+            self.config.provider,
+            self.embedding_model,
+            query_text,
+            self._generate_embedding_via_twelvelabs_api,
+        )
 
     def _generate_embedding_via_twelvelabs_api(self, query_text: str) -> List[float]:
         """
@@ -144,7 +151,7 @@ class TwelveLabsAPISearchProvider(ProviderPlusStoreSearchProvider):
 
             # Generate embedding using TwelveLabs API
             embedding_response = client.embed.create(
-                model_name="Marengo-retrieval-2.7",
+                model_name=self.embedding_model,
                 text=query_text,
                 text_truncate="start",
             )
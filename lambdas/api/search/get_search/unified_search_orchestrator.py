@@ -18,6 +18,12 @@ from typing import Any, Dict, List, Optional
 import boto3
 from bedrock_twelvelabs_search_provider import BedrockTwelveLabsSearchProvider
 from coactive_search_provider import CoactiveSearchProvider
+from search_cursor import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    query_fingerprint,
+)
 from search_provider_models import DEFAULT_PAGE_SIZE
 from twelvelabs_api_search_provider import TwelveLabsAPISearchProvider
 from unified_search_models import (
@@ -571,6 +577,29 @@ class UnifiedSearchOrchestrator:
             provider = self._select_provider(search_query)
 
             if provider:
+                # Provider APIs only page by offset, so their cursors wrap one
+                cursor = query_params.get("cursor")
+                fingerprint = None
+                if cursor:
+                    fingerprint = query_fingerprint(
+                        {**query_params, "user_sub": user_sub}
+                    )
+                    try:
+                        cursor_state = decode_cursor(cursor, fingerprint)
+                    except InvalidCursorError as e:
+                        self.logger.warning(f"Rejected search cursor: {str(e)}")
+                        return {
+                            "status": "400",
+                            "message": "Invalid search cursor",
+                            "data": {
+                                "error": "INVALID_CURSOR",
+                                "details": str(e),
+                                "guidance": "Restart pagination with cursor=*",
+                                "results": [],
+                            },
+                        }
+                    search_query.page_offset = cursor_state.get("o", 0)
+
                 # Execute search using selected provider
                 search_result = provider.search(search_query)
 
@@ -583,6 +612,13 @@ class UnifiedSearchOrchestrator:
                 response = self._convert_to_medialake_response(
                     search_result, search_query
                 )
+                if cursor:
+                    next_offset = search_query.page_offset + search_query.page_size
+                    response["data"]["searchMetadata"]["nextCursor"] = (
+                        encode_cursor({"o": next_offset}, fingerprint)
+                        if next_offset < search_result.total_results
+                        else None
+                    )
 
                 total_time = time.time() - start_time
                 self.logger.info(
@@ -788,6 +824,72 @@ class UnifiedSearchOrchestrator:
                 f"Failed to add presigned URLs to search results: {str(e)}"
             )
 
+    @staticmethod
+    def _legacy_search_params(query_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert query params to legacy SearchParams fields, skipping absent ones"""
+        search_params = {}
+
+        # Required parameter
+        search_params["q"] = query_params.get("q", "")
+
+        # Optional parameters with defaults
+        search_params["page"] = int(query_params.get("page", 1))
+        search_params["pageSize"] = int(query_params.get("pageSize", DEFAULT_PAGE_SIZE))
+        search_params["min_score"] = float(query_params.get("min_score", 0.01))
+        search_params["semantic"] = query_params.get("semantic", "false").lower() == "true"
+
+        # Handle optional filter parameters
+        if "filters" in query_params:
+            search_params["filters"] = query_params["filters"]
+        if "search_fields" in query_params:
+            search_params["search_fields"] = query_params["search_fields"]
+        if "fields" in query_params and "search_fields" not in search_params:
+            fields_val = query_params["fields"]
+            if isinstance(fields_val, list):
+                parsed_fields = [
+                    token.strip()
+                    for entry in fields_val
+                    if isinstance(entry, str)
+                    for token in entry.split(",")
+                    if token.strip()
+                ]
+            elif isinstance(fields_val, str):
+                parsed_fields = [f.strip() for f in fields_val.split(",") if f.strip()]
+            else:
+                parsed_fields = []
+            if parsed_fields:
+                search_params["search_fields"] = parsed_fields
+        if "type" in query_params:
+            search_params["type"] = query_params["type"]
+        if "extension" in query_params:
+            search_params["extension"] = query_params["extension"]
+        if "LargerThan" in query_params:
+            search_params["LargerThan"] = query_params["LargerThan"]
+        if "asset_size_lte" in query_params:
+            search_params["asset_size_lte"] = query_params["asset_size_lte"]
+        if "asset_size_gte" in query_params:
+            search_params["asset_size_gte"] = query_params["asset_size_gte"]
+        if "ingested_date_lte" in query_params:
+            search_params["ingested_date_lte"] = query_params["ingested_date_lte"]
+        if "ingested_date_gte" in query_params:
+            search_params["ingested_date_gte"] = query_params["ingested_date_gte"]
+        if "filename" in query_params:
+            search_params["filename"] = query_params["filename"]
+        if "storageIdentifier" in query_params:
+            search_params["storageIdentifier"] = query_params["storageIdentifier"]
+        if "objectPrefix" in query_params:
+            search_params["objectPrefix"] = query_params["objectPrefix"]
+        if "sort" in query_params:
+            search_params["sort"] = query_params["sort"]
+        if "searchModality" in query_params:
+            search_params["searchModality"] = query_params["searchModality"]
+        if "facets" in query_params:
+            search_params["facets"] = query_params["facets"]
+        if "cursor" in query_params:
+            search_params["cursor"] = query_params["cursor"]
+
+        return search_params
+
     def _execute_opensearch_search(
         self, query_params: Dict[str, Any], user_sub: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -803,72 +905,8 @@ class UnifiedSearchOrchestrator:
             # Import the legacy search components
             from index import SearchParams, perform_search
 
-            # Convert query params to legacy SearchParams, handling missing optional fields
-            search_params = {}
-
-            # Required parameter
-            search_params["q"] = query_params.get("q", "")
-
-            # Optional parameters with defaults
-            search_params["page"] = int(query_params.get("page", 1))
-            search_params["pageSize"] = int(
-                query_params.get("pageSize", DEFAULT_PAGE_SIZE)
-            )
-            search_params["min_score"] = float(query_params.get("min_score", 0.01))
-            search_params["semantic"] = (
-                query_params.get("semantic", "false").lower() == "true"
-            )
-
-            # Handle optional filter parameters
-            if "filters" in query_params:
-                search_params["filters"] = query_params["filters"]
-            if "search_fields" in query_params:
-                search_params["search_fields"] = query_params["search_fields"]
-            if "fields" in query_params and "search_fields" not in search_params:
-                fields_val = query_params["fields"]
-                if isinstance(fields_val, list):
-                    parsed_fields = [
-                        token.strip()
-                        for entry in fields_val
-                        if isinstance(entry, str)
-                        for token in entry.split(",")
-                        if token.strip()
-                    ]
-                elif isinstance(fields_val, str):
-                    parsed_fields = [
-                        f.strip() for f in fields_val.split(",") if f.strip()
-                    ]
-                else:
-                    parsed_fields = []
-                if parsed_fields:
-                    search_params["search_fields"] = parsed_fields
-            if "type" in query_params:
-                search_params["type"] = query_params["type"]
-            if "extension" in query_params:
-                search_params["extension"] = query_params["extension"]
-            if "LargerThan" in query_params:
-                search_params["LargerThan"] = query_params["LargerThan"]
-            if "asset_size_lte" in query_params:
-                search_params["asset_size_lte"] = query_params["asset_size_lte"]
-            if "asset_size_gte" in query_params:
-                search_params["asset_size_gte"] = query_params["asset_size_gte"]
-            if "ingested_date_lte" in query_params:
-                search_params["ingested_date_lte"] = query_params["ingested_date_lte"]
-            if "ingested_date_gte" in query_params:
-                search_params["ingested_date_gte"] = query_params["ingested_date_gte"]
-            if "filename" in query_params:
-                search_params["filename"] = query_params["filename"]
-            if "storageIdentifier" in query_params:
-                search_params["storageIdentifier"] = query_params["storageIdentifier"]
-            if "objectPrefix" in query_params:
-                search_params["objectPrefix"] = query_params["objectPrefix"]
-            if "sort" in query_params:
-                search_params["sort"] = query_params["sort"]
-            if "searchModality" in query_params:
-                search_params["searchModality"] = query_params["searchModality"]
-
             # Create SearchParams object
-            params = SearchParams(**search_params)
+            params = SearchParams(**self._legacy_search_params(query_params))
 
             # Execute legacy search
             result = perform_search(params, user_sub)
@@ -897,6 +935,19 @@ class UnifiedSearchOrchestrator:
                 },
             }
 
+    def facets(
+        self, query_params: Dict[str, Any], user_sub: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Compute (or serve cached) facet aggregations for a keyword query"""
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        if current_dir not in sys.path:
+            sys.path.insert(0, current_dir)
+
+        from index import SearchParams, perform_facet_search
+
+        params = SearchParams(**self._legacy_search_params(query_params))
+        return perform_facet_search(params, user_sub)
+
     def get_provider_status(self) -> Dict[str, Any]:
         """Get status of all configured providers"""
         status = {
@@ -14,6 +14,7 @@ It implements AWS best practices including:
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from decimal import Decimal
 from http import HTTPStatus
 from typing import Any, Dict, List
@@ -26,6 +27,7 @@ from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.exceptions import ClientError
 from pydantic import BaseModel, Field
+from s3_copy_engine import copy_object, delete_objects
 
 # Initialize AWS Lambda Powertools
 logger = Logger(service="asset-rename-service")
@@ -37,6 +39,10 @@ dynamodb = boto3.resource("dynamodb")
 s3 = boto3.client("s3")
 table = dynamodb.Table(os.environ["MEDIALAKE_ASSET_TABLE"])
 
+# Representations are copied concurrently; large ones are additionally split
+# into parallel part copies by s3_copy_engine
+RENAME_COPY_CONCURRENCY = int(os.environ.get("RENAME_COPY_CONCURRENCY", "8"))
+
 
 class RenameRequest(BaseModel):
     """Request model for rename operation"""
@@ -192,13 +198,13 @@ def copy_s3_object_with_tags(
             if is_master and master_id:
                 tags.append({"Key": "MasterID", "Value": master_id})
 
-        # Copy object with tags
-        s3.copy_object(
-            Bucket=dest_bucket,
-            CopySource={"Bucket": source_bucket, "Key": source_key},
-            Key=dest_key,
-            TaggingDirective="REPLACE",
-            Tagging=format_tags_for_copy(tags),
+        # Copy object with tags (multipart above the engine's size threshold)
+        size = copy_object(
+            source_bucket,
+            source_key,
+            dest_bucket,
+            dest_key,
+            tagging=format_tags_for_copy(tags),
         )
 
         logger.info(
@@ -208,6 +214,7 @@ def copy_s3_object_with_tags(
                 "source_key": source_key,
                 "dest_bucket": dest_bucket,
                 "dest_key": dest_key,
+                "size_bytes": size,
                 "tags_count": len(tags),
                 "inventory_id": inventory_id,
                 "master_id": master_id if is_master else None,
@@ -273,18 +280,18 @@ def copy_s3_objects(asset: Dict[str, Any], new_name: str) -> List[Dict[str, Any]
             },
         )
 
-        # Copy main representation with both inventory ID and master ID tags
-        copy_s3_object_with_tags(
-            source_bucket,
-            source_path,
-            source_bucket,
-            new_path,
-            inventory_id,
-            master_id,
-            is_master=True,  # This is the master representation
-        )
-
-        successful_copies.append({"bucket": source_bucket, "key": new_path})
+        # Main representation is copied with both inventory ID and master ID tags
+        copy_tasks = [
+            {
+                "source_bucket": source_bucket,
+                "source_key": source_path,
+                "dest_bucket": source_bucket,
+                "dest_key": new_path,
+                "inventory_id": inventory_id,
+                "master_id": master_id,
+                "is_master": True,  # This is the master representation
+            }
+        ]
 
         # Copy derived representations (only with inventory ID)
         for idx, derived in enumerate(
@@ -302,7 +309,7 @@ def copy_s3_objects(asset: Dict[str, Any], new_name: str) -> List[Dict[str, Any]
             derived["Name"] = get_object_name_from_path(new_derived_path)
 
             logger.info(
-                f"Copying derived representation {idx + 1}",
+                f"Queueing derived representation {idx + 1}",
                 extra={
                     "derived_index": idx,
                     "source_bucket": derived_bucket,
@@ -314,19 +321,19 @@ def copy_s3_objects(asset: Dict[str, Any], new_name: str) -> List[Dict[str, Any]
                 },
             )
 
-            # Copy derived representation with only inventory ID tag
-            copy_s3_object_with_tags(
-                derived_bucket,
-                derived_path,
-                derived_bucket,
-                new_derived_path,
-                inventory_id,
-                is_master=False,  # This is not the master representation
+            # Derived representations are copied with only the inventory ID tag
+            copy_tasks.append(
+                {
+                    "source_bucket": derived_bucket,
+                    "source_key": derived_path,
+                    "dest_bucket": derived_bucket,
+                    "dest_key": new_derived_path,
+                    "inventory_id": inventory_id,
+                    "is_master": False,  # This is not the master representation
+                }
             )
 
-            successful_copies.append(
-                {"bucket": derived_bucket, "key": new_derived_path}
-            )
+        run_copy_tasks(copy_tasks, successful_copies)
 
         return successful_copies
 
@@ -347,48 +354,68 @@ def copy_s3_objects(asset: Dict[str, Any], new_name: str) -> List[Dict[str, Any]
         raise AssetRenameError(f"Failed to copy S3 objects: {str(e)}")
 
 
+@tracer.capture_method
+def run_copy_tasks(
+    copy_tasks: List[Dict[str, Any]], successful_copies: List[Dict[str, Any]]
+) -> None:
+    """
+    Runs copy_s3_object_with_tags for every task concurrently.
+
+    Each completed copy is appended to successful_copies so the caller can
+    roll it back. If any copy fails, the first error is raised once all
+    in-flight copies have finished.
+    """
+    first_error = None
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(RENAME_COPY_CONCURRENCY, len(copy_tasks)))
+    ) as executor:
+        futures = {
+            executor.submit(copy_s3_object_with_tags, **task): task
+            for task in copy_tasks
+        }
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                future.result()
+                successful_copies.append(
+                    {"bucket": task["dest_bucket"], "key": task["dest_key"]}
+                )
+            except Exception as e:
+                first_error = first_error or e
+                # Copies that have not started yet would only be rolled back
+                for pending in futures:
+                    pending.cancel()
+
+    if first_error:
+        raise first_error
+
+
 @tracer.capture_method
 def cleanup_copied_objects(copies: List[Dict[str, Any]]) -> None:
     """Deletes any successfully copied objects during rollback."""
-    for copy in copies:
-        try:
-            s3.delete_object(Bucket=copy["bucket"], Key=copy["key"])
-        except ClientError as e:
-            logger.error(f"Failed to cleanup copied object: {str(e)}")
+    try:
+        errors = delete_objects((copy["bucket"], copy["key"]) for copy in copies)
+    except ClientError as e:
+        logger.error(f"Failed to cleanup copied objects: {str(e)}")
+        return
+    for error in errors:
+        logger.error(
+            f"Failed to cleanup copied object {error['bucket']}/{error['key']}: "
+            f"{error['code']} {error['message']}"
+        )
 
 
 @tracer.capture_method
 def delete_original_objects(asset: Dict[str, Any]) -> None:
     """Deletes original objects after successful copy."""
     try:
-        # Delete main representation
         main_storage = asset["DigitalSourceAsset"]["MainRepresentation"]["StorageInfo"][
             "PrimaryLocation"
         ]
-        main_bucket = main_storage["Bucket"]
-        main_key = main_storage["ObjectKey"]["FullPath"]
-
-        logger.info(
-            "Deleting main representation",
-            extra={
-                "bucket": main_bucket,
-                "key": main_key,
-                "operation": "delete_main_representation",
-            },
-        )
-
-        s3.delete_object(Bucket=main_bucket, Key=main_key)
-
-        logger.info(
-            "Successfully deleted main representation",
-            extra={
-                "bucket": main_bucket,
-                "key": main_key,
-                "operation": "delete_main_representation_success",
-            },
-        )
+        objects_to_delete = [
+            (main_storage["Bucket"], main_storage["ObjectKey"]["FullPath"])
+        ]
 
-        # Delete derived representations
         for idx, derived in enumerate(
             asset["DigitalSourceAsset"].get("DerivedRepresentations", [])
         ):
@@ -400,30 +427,41 @@ def delete_original_objects(asset: Dict[str, Any]) -> None:
                 continue
 
             storage = derived["StorageInfo"]["PrimaryLocation"]
-            derived_bucket = storage["Bucket"]
-            derived_key = storage["ObjectKey"]["FullPath"]
-
-            logger.info(
-                f"Deleting derived representation {idx + 1}",
-                extra={
-                    "derived_index": idx,
-                    "bucket": derived_bucket,
-                    "key": derived_key,
-                    "operation": "delete_derived_representation",
-                },
+            objects_to_delete.append(
+                (storage["Bucket"], storage["ObjectKey"]["FullPath"])
             )
 
-            s3.delete_object(Bucket=derived_bucket, Key=derived_key)
+        logger.info(
+            f"Deleting {len(objects_to_delete)} original objects",
+            extra={
+                "object_count": len(objects_to_delete),
+                "operation": "delete_original_objects",
+            },
+        )
 
-            logger.info(
-                f"Successfully deleted derived representation {idx + 1}",
+        # One DeleteObjects request per bucket (per 1000 keys)
+        errors = delete_objects(objects_to_delete)
+        for error in errors:
+            logger.error(
+                "Failed to delete original object",
                 extra={
-                    "derived_index": idx,
-                    "bucket": derived_bucket,
-                    "key": derived_key,
-                    "operation": "delete_derived_representation_success",
+                    "bucket": error["bucket"],
+                    "key": error["key"],
+                    "error_code": error["code"],
+                    "error_message": error["message"],
+                    "operation": "delete_error",
                 },
             )
+        if errors:
+            raise AssetRenameError("Failed to delete original objects after copy")
+
+        logger.info(
+            "Successfully deleted original objects",
+            extra={
+                "object_count": len(objects_to_delete),
+                "operation": "delete_original_objects_success",
+            },
+        )
 
     except ClientError as e:
         logger.error(
@@ -0,0 +1,226 @@
+"""
+Bounded caches for the custom authorizer.
+
+Lambda containers are reused across many invocations, so the authorizer keeps
+verified JWT claims, API-key records and final allow/deny decisions in memory.
+BoundedTTLCache caps those caches by entry count and by an estimated byte size,
+evicts least-recently-used entries first and expires entries lazily on read.
+
+SecretDigestStore is a secondary tier (AUTHORIZER_CACHE_TABLE_NAME) shared
+across containers so that cold starts during scale-out do not all call
+Secrets Manager for the same API keys. It only ever stores a SHA-256 digest of
+the API-key secret, never the secret itself, keyed by the secret ARN and the
+API key record's updatedAt so a rotated secret never matches an old digest.
+"""
+
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+AUTHORIZER_CACHE_TABLE_NAME = os.environ.get("AUTHORIZER_CACHE_TABLE_NAME", "")
+SECRET_DIGEST_TTL_SECONDS = int(os.environ.get("SECRET_DIGEST_TTL_SECONDS", "300"))
+
+
+def estimate_size(value: Any) -> int:
+    """Rough byte size of a cached value, used for the memory cap."""
+    try:
+        return len(json.dumps(value, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+class BoundedTTLCache:
+    """
+    Size-bounded LRU cache with per-entry expiry.
+
+    Entries are evicted least-recently-used first once either max_entries or
+    max_bytes is exceeded. on_evict, if given, is called with the eviction
+    reason ("capacity" or "expired") so callers can publish metrics.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        max_bytes: int,
+        on_evict: Optional[Callable[[str, str], None]] = None,
+        size_of: Callable[[Any], int] = estimate_size,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._on_evict = on_evict
+        self._size_of = size_of
+        # key -> (expires_at, size, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if it is missing or expired."""
+        expired = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                self._remove(key)
+                self.evictions += 1
+                expired = True
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if expired:
+            self._notify("expired")
+        return None if entry is None else entry[2]
+
+    def put(self, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        """Store a value for ttl_seconds, evicting LRU entries if over capacity."""
+        if ttl_seconds <= 0:
+            return
+        size = self._size_of(value)
+        if size > self.max_bytes:
+            return
+        evicted = 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.time() + ttl_seconds, size, value)
+            self._bytes += size
+            while (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                evicted += 1
+            self.evictions += evicted
+        for _ in range(evicted):
+            self._notify("capacity")
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _notify(self, reason: str) -> None:
+        if self._on_evict is None:
+            return
+        try:
+            self._on_evict(self.name, reason)
+        except Exception:
+            pass
+
+
+def secret_digest(secret_value: str) -> str:
+    """SHA-256 hex digest of an API-key secret."""
+    return hashlib.sha256(secret_value.encode("utf-8")).hexdigest()
+
+
+def secret_matches_digest(provided_secret: str, stored_digest: str) -> bool:
+    """Constant-time comparison of a provided secret against a stored digest."""
+    return secrets.compare_digest(secret_digest(provided_secret), stored_digest)
+
+
+class SecretDigestStore:
+    """
+    DynamoDB tier holding SHA-256 digests of API-key secrets.
+
+    Items are keyed by a SHA-256 of the secret ARN and the API key's updatedAt,
+    which changes whenever the key is rotated, and carry a ttl attribute. The
+    tier is disabled when AUTHORIZER_CACHE_TABLE_NAME is unset, and every read
+    or write failure degrades to a miss so Secrets Manager stays the source of
+    truth.
+    """
+
+    def __init__(self, logger, table_name: str = AUTHORIZER_CACHE_TABLE_NAME):
+        self.logger = logger
+        self.table_name = table_name
+        self._table = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.table_name)
+
+    def _get_table(self):
+        if not self.enabled:
+            return None
+        if self._table is None:
+            import boto3
+
+            self._table = boto3.resource("dynamodb").Table(self.table_name)
+        return self._table
+
+    @staticmethod
+    def _item_key(secret_arn: str, version: str) -> str:
+        key_hash = hashlib.sha256(
+            json.dumps([secret_arn, version]).encode("utf-8")
+        ).hexdigest()
+        return f"apikey-secret#{key_hash}"
+
+    def get(self, secret_arn: str, version: str) -> Optional[str]:
+        """Return the stored secret digest for the ARN, or None on a miss."""
+        table = self._get_table()
+        if table is None:
+            return None
+        try:
+            item = table.get_item(
+                Key={"cacheKey": self._item_key(secret_arn, version)}
+            ).get("Item")
+            # DynamoDB TTL deletion is lazy, so expired items can still be returned
+            if not item or int(item.get("ttl", 0)) < time.time():
+                return None
+            return item.get("secretDigest")
+        except Exception as e:
+            self.logger.warning(f"Secret digest cache read failed: {str(e)}")
+            return None
+
+    def put(self, secret_arn: str, version: str, digest: str) -> None:
+        table = self._get_table()
+        if table is None:
+            return
+        try:
+            table.put_item(
+                Item={
+                    "cacheKey": self._item_key(secret_arn, version),
+                    "secretDigest": digest,
+                    "ttl": int(time.time()) + SECRET_DIGEST_TTL_SECONDS,
+                }
+            )
+        except Exception as e:
+            self.logger.warning(f"Secret digest cache write failed: {str(e)}")
@@ -19,6 +19,12 @@ from aws_lambda_powertools import Logger, Metrics, Tracer
 from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from jose import jwt
+from authorizer_cache import (
+    BoundedTTLCache,
+    SecretDigestStore,
+    secret_digest,
+    secret_matches_digest,
+)
 from lambda_middleware import is_lambda_warmer_event
 
 # Initialize observability tools with proper namespace
@@ -73,11 +79,40 @@ if DEBUG_MODE:
 # JWKS cache with TTL - optimized for Lambda reuse
 jwks_cache = {"keys": None, "expiry": 0}
 
-# JWT token verification cache - optimized for Lambda reuse
-token_verification_cache = {}
+# Size-bounded LRU caches, reused across invocations of a warm container
+CACHE_MAX_ENTRIES = int(os.environ.get("AUTHORIZER_CACHE_MAX_ENTRIES", "2048"))
+CACHE_MAX_BYTES = int(
+    os.environ.get("AUTHORIZER_CACHE_MAX_BYTES", str(8 * 1024 * 1024))
+)
+# Kept short: a disabled, deleted or rotated API key is only rejected by warm
+# containers once their cached record expires
+API_KEY_CACHE_TTL_SECONDS = int(os.environ.get("API_KEY_CACHE_TTL_SECONDS", "30"))
+DECISION_CACHE_TTL_SECONDS = int(os.environ.get("DECISION_CACHE_TTL_SECONDS", "60"))
 
-# API key validation cache - optimized for Lambda reuse
-api_key_validation_cache = {}
+
+def _record_cache_eviction(cache_name: str, reason: str) -> None:
+    metrics.add_metric(
+        name=f"cache.{cache_name}.eviction.{reason}", unit=MetricUnit.Count, value=1
+    )
+
+
+# JWT token verification cache: sha256(token) -> verified claims
+token_verification_cache = BoundedTTLCache(
+    "token", CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, on_evict=_record_cache_eviction
+)
+
+# API key validation cache: sha256(api key) -> API key record
+api_key_validation_cache = BoundedTTLCache(
+    "api_key", CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, on_evict=_record_cache_eviction
+)
+
+# Authorization decision cache: (credential hash, method, route) -> decision
+authorization_decision_cache = BoundedTTLCache(
+    "decision", CACHE_MAX_ENTRIES * 4, CACHE_MAX_BYTES, on_evict=_record_cache_eviction
+)
+
+# Cross-container tier for API key secret digests
+secret_digest_store = SecretDigestStore(logger)
 
 
 @tracer.capture_method
@@ -222,10 +257,10 @@ def decode_and_verify_token(token: str, correlation_id: str) -> Dict[str, Any]:
 
     # Check if we have this token in cache
     token_hash = hashlib.sha256(token.encode()).hexdigest()
-    cache_entry = token_verification_cache.get(token_hash)
+    cached_claims = token_verification_cache.get(token_hash)
 
-    # If we have a valid cache entry that hasn't expired
-    if cache_entry and cache_entry["expiry"] > time.time():
+    # Entries expire with the token, so a hit is always still valid
+    if cached_claims is not None:
         metrics.add_metric(
             name="validate.token.cache_hit", unit=MetricUnit.Count, value=1
         )
@@ -233,7 +268,7 @@ def decode_and_verify_token(token: str, correlation_id: str) -> Dict[str, Any]:
             "Using cached token verification result",
             extra={"correlation_id": correlation_id},
         )
-        return cache_entry["claims"]
+        return cached_claims
 
     metrics.add_metric(name="validate.token.cache_miss", unit=MetricUnit.Count, value=1)
     logger.info("Verifying token signature", extra={"correlation_id": correlation_id})
@@ -360,18 +395,7 @@ def decode_and_verify_token(token: str, correlation_id: str) -> Dict[str, Any]:
 
         # Cache the verified token with expiry time
         exp_time = claims.get("exp", int(time.time() + 300))
-        token_verification_cache[token_hash] = {"claims": claims, "expiry": exp_time}
-
-        # Clean up expired cache entries periodically (1% chance per request)
-        if hash(token_hash) % 100 == 0:
-            current_time = time.time()
-            expired_keys = [
-                k
-                for k, v in token_verification_cache.items()
-                if v["expiry"] < current_time
-            ]
-            for k in expired_keys:
-                token_verification_cache.pop(k, None)
+        token_verification_cache.put(token_hash, claims, exp_time - time.time())
 
         # Record validation time
         validation_time = (time.time() - start_time) * 1000
@@ -837,9 +861,9 @@ def validate_api_key(api_key_value: str, correlation_id: str) -> Dict[str, Any]:
 
     # Check cache first
     cache_key = hashlib.sha256(api_key_value.encode()).hexdigest()
-    cache_entry = api_key_validation_cache.get(cache_key)
+    cached_api_key_item = api_key_validation_cache.get(cache_key)
 
-    if cache_entry and cache_entry["expiry"] > time.time():
+    if cached_api_key_item is not None:
         metrics.add_metric(
             name="validate.api_key.cache_hit", unit=MetricUnit.Count, value=1
         )
@@ -847,7 +871,7 @@ def validate_api_key(api_key_value: str, correlation_id: str) -> Dict[str, Any]:
             "Using cached API key validation result",
             extra={"correlation_id": correlation_id},
         )
-        return cache_entry["api_key_item"]
+        return cached_api_key_item
 
     metrics.add_metric(
         name="validate.api_key.cache_miss", unit=MetricUnit.Count, value=1
@@ -953,57 +977,66 @@ def validate_api_key(api_key_value: str, correlation_id: str) -> Dict[str, Any]:
             )
             raise Exception("API key is disabled")
 
-        # Retrieve the actual secret from Secrets Manager with error handling
-        try:
-            secret_response = secretsmanager.get_secret_value(
-                SecretId=api_key_item["secretArn"]
+        # Check the shared secret digest tier before calling Secrets Manager.
+        # Rotation updates updatedAt, so a digest of a rotated-out secret is
+        # never found; a mismatch falls through to Secrets Manager.
+        secret_version = api_key_item["updatedAt"]
+        stored_digest = secret_digest_store.get(
+            api_key_item["secretArn"], secret_version
+        )
+        secret_verified = stored_digest is not None and secret_matches_digest(
+            provided_secret, stored_digest
+        )
+        if secret_verified:
+            metrics.add_metric(
+                name="validate.api_key.secret_digest_hit",
+                unit=MetricUnit.Count,
+                value=1,
             )
+        else:
+            # Retrieve the actual secret from Secrets Manager with error handling
+            try:
+                secret_response = secretsmanager.get_secret_value(
+                    SecretId=api_key_item["secretArn"]
+                )
 
-            if "SecretString" not in secret_response:
-                raise Exception("Secret value not found in Secrets Manager response")
+                if "SecretString" not in secret_response:
+                    raise Exception(
+                        "Secret value not found in Secrets Manager response"
+                    )
 
-            stored_secret = secret_response["SecretString"]
+                stored_secret = secret_response["SecretString"]
 
-            if not stored_secret:
-                raise Exception("Empty secret value retrieved from Secrets Manager")
+                if not stored_secret:
+                    raise Exception("Empty secret value retrieved from Secrets Manager")
 
-        except Exception as secret_err:
-            metrics.add_metric(
-                name="validate.api_key.secrets_manager_error",
-                unit=MetricUnit.Count,
-                value=1,
-            )
-            logger.error(
-                f"Error retrieving secret for API key {api_key_item['id']}: {str(secret_err)}",
-                extra={"correlation_id": correlation_id},
-            )
-            raise Exception(f"Error retrieving API key secret: {str(secret_err)}")
+            except Exception as secret_err:
+                metrics.add_metric(
+                    name="validate.api_key.secrets_manager_error",
+                    unit=MetricUnit.Count,
+                    value=1,
+                )
+                logger.error(
+                    f"Error retrieving secret for API key {api_key_item['id']}: {str(secret_err)}",
+                    extra={"correlation_id": correlation_id},
+                )
+                raise Exception(f"Error retrieving API key secret: {str(secret_err)}")
 
-        # Compare provided secret with stored secret using constant-time comparison
-        if not secrets.compare_digest(provided_secret, stored_secret):
-            metrics.add_metric(
-                name="validate.api_key.invalid_secret",
-                unit=MetricUnit.Count,
-                value=1,
-            )
-            raise Exception("Invalid API key secret")
+            # Compare provided secret with stored secret using constant-time comparison
+            if not secrets.compare_digest(provided_secret, stored_secret):
+                metrics.add_metric(
+                    name="validate.api_key.invalid_secret",
+                    unit=MetricUnit.Count,
+                    value=1,
+                )
+                raise Exception("Invalid API key secret")
 
-        # Cache successful validation (5 minutes TTL)
-        api_key_validation_cache[cache_key] = {
-            "api_key_item": api_key_item,
-            "expiry": time.time() + 300,
-        }
+            secret_digest_store.put(
+                api_key_item["secretArn"], secret_version, secret_digest(stored_secret)
+            )
 
-        # Clean up expired cache entries periodically (1% chance per request)
-        if hash(cache_key) % 100 == 0:
-            current_time = time.time()
-            expired_keys = [
-                k
-                for k, v in api_key_validation_cache.items()
-                if v["expiry"] < current_time
-            ]
-            for k in expired_keys:
-                api_key_validation_cache.pop(k, None)
+        # Cache successful validation
+        api_key_validation_cache.put(cache_key, api_key_item, API_KEY_CACHE_TTL_SECONDS)
 
         # Record validation time
         validation_time = (time.time() - start_time) * 1000
@@ -1174,6 +1207,7 @@ def create_permission_mapping() -> Dict[str, Union[str, List[str], None]]:
         "delete /settings/roles/{id}": "permissions:delete",
         # Search endpoints - accessible to all authenticated users
         "get /search": None,
+        "get /search/facets": None,
         "get /search/fields": None,
         # Connector summaries for the Assets page sidebar and upload
         # destination picker. Gated by search:view (not connectors:view) so
@@ -1253,6 +1287,115 @@ def normalize_resource_path(
     return normalized_path
 
 
+def _is_path_placeholder(segment: str) -> bool:
+    return segment.startswith("{") and segment.endswith("}")
+
+
+class _RouteTrieNode:
+    """One path segment in the compiled permission route table."""
+
+    __slots__ = ("literals", "wildcard", "terminal", "min_index")
+
+    def __init__(self):
+        self.literals: Dict[str, "_RouteTrieNode"] = {}
+        self.wildcard: Optional["_RouteTrieNode"] = None
+        # (mapping insertion index, permission) of the first route ending here
+        self.terminal: Optional[Tuple[int, Union[str, List[str], None]]] = None
+        # Lowest insertion index of any route in this subtree (search pruning)
+        self.min_index: float = float("inf")
+
+
+class PermissionRouteTable:
+    """
+    Compiled form of create_permission_mapping().
+
+    Routes are indexed by exact "method path" key and, per method, in a
+    segment trie where "{param}" segments become a single wildcard edge.
+    Lookups resolve in O(path length) for concrete paths instead of scanning
+    every pattern. Results are identical to the original linear scan: exact
+    key first, otherwise the earliest mapping entry whose segments match,
+    with placeholders on either side matching any segment.
+    """
+
+    def __init__(self, mapping: Dict[str, Union[str, List[str], None]]):
+        self._exact = dict(mapping)
+        self._roots: Dict[str, _RouteTrieNode] = {}
+
+        for index, (pattern, permission) in enumerate(mapping.items()):
+            method, _, path = pattern.partition(" ")
+            node = self._roots.setdefault(method, _RouteTrieNode())
+            node.min_index = min(node.min_index, index)
+            for segment in (s for s in path.split("/") if s):
+                if _is_path_placeholder(segment):
+                    if node.wildcard is None:
+                        node.wildcard = _RouteTrieNode()
+                    node = node.wildcard
+                else:
+                    node = node.literals.setdefault(segment, _RouteTrieNode())
+                node.min_index = min(node.min_index, index)
+            if node.terminal is None:
+                node.terminal = (index, permission)
+
+    def lookup(
+        self, http_method: str, normalized_path: str
+    ) -> Tuple[bool, Union[str, List[str], None]]:
+        """
+        Resolve the permission for a method and normalized path.
+
+        Returns:
+            Tuple of (matched, permission). matched is False when no route applies.
+        """
+        method = http_method.lower()
+        action_key = f"{method} {normalized_path}"
+        if action_key in self._exact:
+            return True, self._exact[action_key]
+
+        root = self._roots.get(method)
+        if root is None:
+            return False, None
+
+        segments = [s for s in normalized_path.split("/") if s]
+        best: Optional[Tuple[int, Union[str, List[str], None]]] = None
+        stack = [(root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if best is not None and node.min_index >= best[0]:
+                continue
+            if depth == len(segments):
+                if node.terminal is not None and (
+                    best is None or node.terminal[0] < best[0]
+                ):
+                    best = node.terminal
+                continue
+
+            segment = segments[depth]
+            if _is_path_placeholder(segment):
+                # A placeholder in the request matches every edge
+                children = list(node.literals.values())
+            else:
+                child = node.literals.get(segment)
+                children = [child] if child is not None else []
+            if node.wildcard is not None:
+                children.append(node.wildcard)
+            stack.extend((child, depth + 1) for child in children)
+
+        if best is None:
+            return False, None
+        return True, best[1]
+
+
+# Compiled once per container on first use
+_permission_route_table: Optional[PermissionRouteTable] = None
+
+
+def get_permission_route_table() -> PermissionRouteTable:
+    """Return the container-wide compiled permission route table."""
+    global _permission_route_table
+    if _permission_route_table is None:
+        _permission_route_table = PermissionRouteTable(create_permission_mapping())
+    return _permission_route_table
+
+
 @tracer.capture_method
 def get_required_permission(
     http_method: str, resource_path: str, path_parameters: Dict[str, str] = None
@@ -1269,34 +1412,21 @@ def get_required_permission(
         Required permission string, a list of acceptable permissions (OR
         semantics), or None if no specific permission is required.
     """
-    permission_mapping = create_permission_mapping()
-
     # Normalize the resource path
     normalized_path = normalize_resource_path(resource_path, path_parameters)
 
-    # Create the action key
-    action_key = f"{http_method.lower()} {normalized_path}"
-
-    # Try exact match first
-    if action_key in permission_mapping:
-        required_permission = permission_mapping[action_key]
+    matched, required_permission = get_permission_route_table().lookup(
+        http_method, normalized_path
+    )
+    if matched:
         logger.debug(
-            f"Found exact permission match: {action_key} -> {required_permission}"
+            f"Found permission match: {http_method.lower()} {normalized_path} -> {required_permission}"
         )
         return required_permission
 
-    # Try pattern matching for common cases
-    # Handle cases where the path might have different parameter names
-    for pattern, permission in permission_mapping.items():
-        if pattern.startswith(f"{http_method.lower()} "):
-            pattern_path = pattern[len(f"{http_method.lower()} ") :]
-            if _paths_match(normalized_path, pattern_path):
-                logger.debug(
-                    f"Found pattern permission match: {pattern} -> {permission}"
-                )
-                return permission
-
-    logger.debug(f"No specific permission found for: {action_key}")
+    logger.debug(
+        f"No specific permission found for: {http_method.lower()} {normalized_path}"
+    )
     return None
 
 
@@ -1768,6 +1898,52 @@ def validate_api_key_permissions(
         return False
 
 
+def cached_authorization_decision(
+    credential_hash: str,
+    http_method: str,
+    resource_path: str,
+    required_permission: Union[str, List[str]],
+    evaluate,
+    ttl_seconds: float,
+) -> Tuple[bool, Optional[str]]:
+    """
+    Return the allow/deny decision for a principal on a route, evaluating it
+    only when it is not already cached.
+
+    Args:
+        credential_hash: SHA-256 of the bearer token or API key
+        http_method: HTTP method of the request
+        resource_path: API Gateway resource path template
+        required_permission: Permission(s) required for the route
+        evaluate: Called on a miss; returns (is_authorized, error_message)
+        ttl_seconds: Upper bound on how long the decision may be reused
+
+    Returns:
+        Tuple of (is_authorized, error_message)
+    """
+    if isinstance(required_permission, list):
+        permission_key = tuple(required_permission)
+    else:
+        permission_key = required_permission
+    cache_key = (credential_hash, http_method, resource_path, permission_key)
+
+    decision = authorization_decision_cache.get(cache_key)
+    if decision is not None:
+        metrics.add_metric(
+            name="authorize.decision.cache_hit", unit=MetricUnit.Count, value=1
+        )
+        return decision
+
+    metrics.add_metric(
+        name="authorize.decision.cache_miss", unit=MetricUnit.Count, value=1
+    )
+    decision = evaluate()
+    authorization_decision_cache.put(
+        cache_key, decision, min(ttl_seconds, DECISION_CACHE_TTL_SECONDS)
+    )
+    return decision
+
+
 @tracer.capture_method
 def generate_api_key_context(api_key_item: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -2045,8 +2221,18 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
 
                     if required_permission:
                         # Validate that the API key has the required permission
-                        is_authorized = validate_api_key_permissions(
-                            api_key_item, required_permission, correlation_id
+                        is_authorized, _ = cached_authorization_decision(
+                            hashlib.sha256(api_key.encode()).hexdigest(),
+                            http_method,
+                            resource_path,
+                            required_permission,
+                            lambda: (
+                                validate_api_key_permissions(
+                                    api_key_item, required_permission, correlation_id
+                                ),
+                                None,
+                            ),
+                            API_KEY_CACHE_TTL_SECONDS,
                         )
 
                         if is_authorized:
@@ -2351,6 +2537,8 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
             # Initialize authorization variables
             is_authorized = False
             auth_response = {}
+            token_hash = hashlib.sha256(bearer_token.encode()).hexdigest()
+            token_ttl = parsed_token.get("exp", time.time() + 300) - time.time()
 
             if required_permission:
                 # Validate JWT custom claims for the required permission
@@ -2361,8 +2549,15 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
 
                 if DEBUG_MODE:
                     # In DEBUG_MODE, still validate but log warnings
-                    has_permission, error_message = validate_jwt_permissions(
-                        parsed_token, required_permission, correlation_id
+                    has_permission, error_message = cached_authorization_decision(
+                        token_hash,
+                        http_method,
+                        resource_path,
+                        required_permission,
+                        lambda: validate_jwt_permissions(
+                            parsed_token, required_permission, correlation_id
+                        ),
+                        token_ttl,
                     )
 
                     if not has_permission:
@@ -2386,8 +2581,15 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
                     }
                 else:
                     # Production mode - enforce permission check
-                    has_permission, error_message = validate_jwt_permissions(
-                        parsed_token, required_permission, correlation_id
+                    has_permission, error_message = cached_authorization_decision(
+                        token_hash,
+                        http_method,
+                        resource_path,
+                        required_permission,
+                        lambda: validate_jwt_permissions(
+                            parsed_token, required_permission, correlation_id
+                        ),
+                        token_ttl,
                     )
 
                     is_authorized = has_permission
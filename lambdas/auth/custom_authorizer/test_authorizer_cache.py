@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded authorizer caches: LRU eviction, TTL expiry, the memory
+cap, hit/miss/eviction accounting and the secret digest tier.
+"""
+
+import os
+import sys
+import time
+
+# Add the current directory to the path so we can import the authorizer cache
+sys.path.insert(0, os.path.dirname(__file__))
+
+from authorizer_cache import (
+    BoundedTTLCache,
+    SecretDigestStore,
+    secret_digest,
+    secret_matches_digest,
+)
+
+
+def test_evicts_least_recently_used_entry():
+    evicted = []
+    cache = BoundedTTLCache(
+        "test", 2, 1024 * 1024, on_evict=lambda name, reason: evicted.append(reason)
+    )
+    cache.put("a", 1, 60)
+    cache.put("b", 2, 60)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3, 60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert evicted == ["capacity"]
+    assert cache.stats() == {
+        "entries": 2,
+        "bytes": cache.size_bytes,
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+    }
+
+
+def test_expired_entries_are_dropped_on_read():
+    evicted = []
+    cache = BoundedTTLCache(
+        "test", 10, 1024, on_evict=lambda name, reason: evicted.append(reason)
+    )
+    cache.put("token", {"sub": "user"}, 0.01)
+    time.sleep(0.02)
+
+    assert cache.get("token") is None
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+    assert evicted == ["expired"]
+
+
+def test_non_positive_ttl_is_not_cached():
+    cache = BoundedTTLCache("test", 10, 1024)
+    cache.put("expired-token", {"sub": "user"}, -5)
+    assert len(cache) == 0
+
+
+def test_memory_cap_evicts_until_under_budget():
+    cache = BoundedTTLCache("test", 100, 10, size_of=lambda value: len(value))
+    cache.put("a", "xxxx", 60)
+    cache.put("b", "yyyy", 60)
+    cache.put("c", "zzzz", 60)
+
+    assert cache.get("a") is None
+    assert cache.size_bytes == 8
+    # Values larger than the whole budget are never stored
+    cache.put("huge", "x" * 11, 60)
+    assert cache.get("huge") is None
+    assert cache.get("b") == "yyyy"
+
+
+def test_overwrite_replaces_size_accounting():
+    cache = BoundedTTLCache("test", 10, 100, size_of=lambda value: len(value))
+    cache.put("a", "xxxx", 60)
+    cache.put("a", "xx", 60)
+    assert cache.size_bytes == 2
+    assert cache.get("a") == "xx"
+
+
+class FakeDigestTable:
+    def __init__(self):
+        self.items = {}
+
+    def get_item(self, Key):
+        item = self.items.get(Key["cacheKey"])
+        return {"Item": item} if item else {}
+
+    def put_item(self, Item):
+        self.items[Item["cacheKey"]] = Item
+
+
+def _digest_store():
+    store = SecretDigestStore(logger=None, table_name="authorizer-cache")
+    store._table = FakeDigestTable()
+    return store
+
+
+def test_secret_digest_matching():
+    digest = secret_digest("s3cr3t")
+    assert secret_matches_digest("s3cr3t", digest)
+    assert not secret_matches_digest("other", digest)
+
+
+def test_secret_digest_store_round_trip():
+    store = _digest_store()
+    arn = "arn:aws:secretsmanager:us-east-1:123:secret:key"
+    store.put(arn, "2026-01-01T00:00:00", secret_digest("s3cr3t"))
+
+    assert store.get(arn, "2026-01-01T00:00:00") == secret_digest("s3cr3t")
+    # Only the digest is stored, never the secret
+    assert "s3cr3t" not in str(store._table.items)
+
+
+def test_secret_digest_store_misses_after_rotation():
+    store = _digest_store()
+    arn = "arn:aws:secretsmanager:us-east-1:123:secret:key"
+    store.put(arn, "2026-01-01T00:00:00", secret_digest("old"))
+
+    assert store.get(arn, "2026-02-01T00:00:00") is None
+
+
+def test_secret_digest_store_ignores_expired_items():
+    store = _digest_store()
+    arn = "arn:aws:secretsmanager:us-east-1:123:secret:key"
+    store.put(arn, "v1", secret_digest("s3cr3t"))
+    for item in store._table.items.values():
+        item["ttl"] = int(time.time()) - 1
+
+    assert store.get(arn, "v1") is None
+
+
+def test_secret_digest_store_disabled_without_table():
+    store = SecretDigestStore(logger=None, table_name="")
+    assert not store.enabled
+    assert store.get("arn:aws:secretsmanager:us-east-1:123:secret:key", "v1") is None
+    store.put("arn:aws:secretsmanager:us-east-1:123:secret:key", "v1", digest="abc")
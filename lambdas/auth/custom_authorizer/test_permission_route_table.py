@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Equivalence and lookup-cost tests for the compiled permission route table.
+
+Every route in create_permission_mapping() is resolved both through the
+compiled PermissionRouteTable and through the original linear pattern scan,
+using placeholder paths, concrete paths and near-miss paths. Lookup cost is
+compared by counting the work each lookup does rather than by timing it.
+"""
+
+import os
+import sys
+
+# Add the current directory to the path so we can import the authorizer
+sys.path.insert(0, os.path.dirname(__file__))
+
+import index
+from index import (
+    PermissionRouteTable,
+    _paths_match,
+    create_permission_mapping,
+    get_required_permission,
+    normalize_resource_path,
+)
+
+_MISSING = object()
+
+
+def linear_scan_permission(mapping, http_method, resource_path, path_parameters):
+    """Reference implementation: the pre-compilation lookup algorithm."""
+    normalized_path = normalize_resource_path(resource_path, path_parameters)
+    action_key = f"{http_method.lower()} {normalized_path}"
+    if action_key in mapping:
+        return mapping[action_key]
+    for pattern, permission in mapping.items():
+        if pattern.startswith(f"{http_method.lower()} "):
+            pattern_path = pattern[len(f"{http_method.lower()} ") :]
+            if _paths_match(normalized_path, pattern_path):
+                return permission
+    return _MISSING
+
+
+def _request_cases(mapping):
+    """Yield (method, resource_path, path_parameters) for every mapped route."""
+    for pattern in mapping:
+        method, _, path = pattern.partition(" ")
+        segments = path.split("/")
+        params = {}
+        concrete = []
+        for position, segment in enumerate(segments):
+            if segment.startswith("{") and segment.endswith("}"):
+                value = f"value{position}"
+                params[segment[1:-1]] = value
+                concrete.append(value)
+            else:
+                concrete.append(segment)
+        concrete_path = "/".join(concrete)
+
+        # As API Gateway sends it: concrete path plus path parameters
+        yield method, concrete_path, params
+        # Already-normalized template path
+        yield method, path, None
+        # Concrete path without path parameters (no normalization possible)
+        yield method, concrete_path, None
+        # Same template under a different placeholder name
+        yield method, path.replace("{", "{other_").replace("}", "_x}"), None
+        # Near misses: extra segment, trailing slash, other method
+        yield method, concrete_path + "/extra", None
+        yield method, concrete_path + "/", None
+        yield "patch" if method != "patch" else "get", concrete_path, params
+
+
+def test_route_table_matches_linear_scan_for_all_routes():
+    mapping = create_permission_mapping()
+    table = PermissionRouteTable(mapping)
+
+    checked = 0
+    for method, path, params in _request_cases(mapping):
+        expected = linear_scan_permission(mapping, method, path, params)
+        matched, actual = table.lookup(method, normalize_resource_path(path, params))
+        if expected is _MISSING:
+            assert not matched, (method, path, params, actual)
+        else:
+            assert matched and actual == expected, (method, path, params, actual)
+        checked += 1
+
+    assert checked == 7 * len(mapping)
+
+
+def test_get_required_permission_uses_compiled_table():
+    assert get_required_permission("get", "/assets/abc", {"id": "abc"}) == (
+        "assets:view"
+    )
+    assert get_required_permission("DELETE", "/assets/abc", {"id": "abc"}) == (
+        "assets:delete"
+    )
+    assert get_required_permission(
+        "post", "/collections/c1/items", {"collectionId": "c1"}
+    ) == ["collections:add_assets", "collections:edit"]
+    assert get_required_permission("get", "/search", None) is None
+    assert get_required_permission("patch", "/nonexistent", None) is None
+
+
+def test_route_table_work_does_not_grow_with_route_count(monkeypatch):
+    """Compare the work per lookup of the compiled table and the linear scan.
+
+    Work is counted, not timed: the compiled table expands one trie node per
+    path segment it examines, while the linear scan compares the path against
+    every pattern of the method until one matches.
+    """
+    mapping = create_permission_mapping()
+    table = PermissionRouteTable(mapping)
+
+    expansions = [0]
+    comparisons = [0]
+    is_placeholder = index._is_path_placeholder
+    paths_match = _paths_match
+
+    def count_expansion(segment):
+        expansions[0] += 1
+        return is_placeholder(segment)
+
+    def count_comparison(path, pattern_path):
+        comparisons[0] += 1
+        return paths_match(path, pattern_path)
+
+    # Patched after compiling, so only lookups are counted
+    monkeypatch.setattr(index, "_is_path_placeholder", count_expansion)
+    monkeypatch.setattr(sys.modules[__name__], "_paths_match", count_comparison)
+
+    compiled_total = 0
+    linear_total = 0
+    for method, path, params in _request_cases(mapping):
+        normalized = normalize_resource_path(path, params)
+        segments = [s for s in normalized.split("/") if s]
+
+        expansions[0] = 0
+        table.lookup(method, normalized)
+        # Bounded by the path length, whatever the number of routes
+        assert expansions[0] <= 2 * (len(segments) + 1), (method, path)
+        compiled_total += expansions[0]
+
+        comparisons[0] = 0
+        linear_scan_permission(mapping, method, path, params)
+        linear_total += comparisons[0]
+
+    assert compiled_total < linear_total
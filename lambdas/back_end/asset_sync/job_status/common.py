@@ -25,6 +25,8 @@ DEFAULT_BATCH_SIZE = 1000
 MAX_THREADS = 32
 MAX_RETRIES = 5
 BACKOFF_BASE = 2  # exponential backoff base
+# Number of counter shard items per job; must match the asset sync processor
+JOB_COUNTER_SHARDS = int(os.environ.get("JOB_COUNTER_SHARDS", "16"))
 
 
 # Enums for better type safety
@@ -398,6 +400,43 @@ class AssetProcessor:
             logger.error(f"Failed to get job details: {str(e)}")
             return {}
 
+    @staticmethod
+    def get_sharded_job_counters(job_id: str) -> Dict[str, int]:
+        """
+        Sum the counter shard items written by the asset sync processor
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Counter totals across all shards, empty if none were written
+        """
+        totals: Dict[str, int] = {}
+        try:
+            table_name = os.environ.get("JOB_TABLE_NAME")
+            keys = [
+                {"jobId": f"{job_id}#stats#{shard:02d}"}
+                for shard in range(JOB_COUNTER_SHARDS)
+            ]
+            dynamodb = boto3.resource("dynamodb")
+
+            # BatchGetItem is limited to 100 keys per request
+            for batch in AssetProcessor.chunk_list(keys, 100):
+                request = {table_name: {"Keys": batch}}
+                while request:
+                    response = dynamodb.batch_get_item(RequestItems=request)
+                    for item in response.get("Responses", {}).get(table_name, []):
+                        for name, value in item.items():
+                            if isinstance(value, Decimal):
+                                totals[name] = totals.get(name, 0) + int(value)
+                    request = response.get("UnprocessedKeys")
+                    if request:
+                        time.sleep(0.1)
+        except Exception as e:
+            logger.error(f"Failed to read job counter shards: {str(e)}")
+
+        return totals
+
     @staticmethod
     def increment_job_counter(
         job_id: str, counter_name: str, increment: int = 1
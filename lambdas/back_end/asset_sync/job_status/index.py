@@ -3,7 +3,7 @@ import os
 
 import boto3
 from boto3.dynamodb.conditions import Key
-from common import AssetProcessor, logger
+from common import AssetProcessor, DecimalEncoder, logger
 
 
 def get_job_errors(job_id, limit=100, last_evaluated_key=None):
@@ -56,6 +56,12 @@ def lambda_handler(event, context):
         if not job_details:
             return {"statusCode": 404, "body": json.dumps({"error": "Job not found"})}
 
+        # The processor writes counters to shard items; fold them into stats
+        stats = dict(job_details.get("stats") or {})
+        for name, value in AssetProcessor.get_sharded_job_counters(job_id).items():
+            stats[name] = int(stats.get(name, 0)) + value
+        job_details["stats"] = stats
+
         # Get job errors if requested
         if include_errors:
             errors = get_job_errors(job_id, error_limit, error_last_key)
@@ -81,7 +87,7 @@ def lambda_handler(event, context):
                 logger.warning(f"Could not get execution status: {str(e)}")
 
         # Return job status
-        return {"statusCode": 200, "body": json.dumps(job_details)}
+        return {"statusCode": 200, "body": json.dumps(job_details, cls=DecimalEncoder)}
     except Exception as e:
         logger.error(f"Error retrieving job status: {str(e)}")
         return {
@@ -16,6 +16,8 @@ logger = Logger()
 # Constants
 MAX_THREADS = 50  # Maximum number of threads for parallel operations
 MAX_RETRY_ATTEMPTS = 5  # Maximum number of retry attempts for operations
+# Number of counter shard items per job; must match the job status reader
+JOB_COUNTER_SHARDS = int(os.environ.get("JOB_COUNTER_SHARDS", "16"))
 
 
 class JobStatus(enum.Enum):
@@ -62,6 +64,11 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(o)
 
 
+def job_counter_shard_key(job_id, shard):
+    """Key of one of a job's counter shard items in the job table"""
+    return f"{job_id}#stats#{shard:02d}"
+
+
 def get_optimized_client(service_name):
     """Get optimized boto3 client with retries and connection pooling"""
     config = Config(
@@ -154,6 +161,49 @@ class AssetProcessor:
             ExpressionAttributeNames=expr_names,
         )
 
+    @staticmethod
+    def add_job_counters(job_id, counters, shard):
+        """
+        Add several counter deltas to one of the job's counter shard items
+
+        Counters are spread over JOB_COUNTER_SHARDS items next to the job
+        item so that large syncs do not throttle on a single hot key. The job
+        status API sums the shards into the job's stats on read.
+        """
+        if not job_id:
+            raise ValueError("job_id is required")
+
+        if "JOB_TABLE_NAME" not in os.environ:
+            raise ValueError("JOB_TABLE_NAME environment variable is not set")
+
+        counters = {name: value for name, value in counters.items() if value}
+        if not counters:
+            return
+
+        dynamodb = boto3.resource("dynamodb")
+        job_table = dynamodb.Table(os.environ["JOB_TABLE_NAME"])
+
+        add_exprs = []
+        expr_names = {}
+        expr_values = {
+            ":job_id": job_id,
+            ":timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        for i, (counter_name, value) in enumerate(counters.items()):
+            add_exprs.append(f"#counter{i} :inc{i}")
+            expr_names[f"#counter{i}"] = counter_name
+            expr_values[f":inc{i}"] = value
+
+        job_table.update_item(
+            Key={"jobId": job_counter_shard_key(job_id, shard)},
+            UpdateExpression=(
+                "ADD " + ", ".join(add_exprs) + " "
+                "SET counterShardOf = :job_id, lastUpdated = :timestamp"
+            ),
+            ExpressionAttributeValues=expr_values,
+            ExpressionAttributeNames=expr_names,
+        )
+
     @staticmethod
     def update_job_metadata(job_id, metadata):
         """Update job metadata in DynamoDB"""
@@ -14,7 +14,12 @@ from aws_lambda_powertools import Logger, Metrics, Tracer
 from aws_lambda_powertools.metrics import MetricUnit
 from botocore.config import Config
 from botocore.exceptions import ClientError
-from common import AssetProcessor, JobStatus, get_optimized_s3_client
+from common import (
+    JOB_COUNTER_SHARDS,
+    AssetProcessor,
+    JobStatus,
+    get_optimized_s3_client,
+)
 
 # Initialize powertools
 logger = Logger()
@@ -210,6 +215,7 @@ def retry_with_backoff(
 
 # Patch AssetProcessor methods with retry
 original_increment_job_counter = AssetProcessor.increment_job_counter
+original_add_job_counters = AssetProcessor.add_job_counters
 original_update_job_status = AssetProcessor.update_job_status
 original_update_job_metadata = AssetProcessor.update_job_metadata
 original_log_error = AssetProcessor.log_error
@@ -225,6 +231,14 @@ def patched_increment_job_counter(
     )
 
 
+@staticmethod
+def patched_add_job_counters(
+    job_id: str, counters: Dict[str, int], shard: int
+) -> bool:
+    """Patched method with retry for DynamoDB throttling"""
+    return retry_with_backoff(original_add_job_counters, job_id, counters, shard)
+
+
 @staticmethod
 def patched_update_job_status(
     job_id: str, status: JobStatus, message: str = None
@@ -247,11 +261,58 @@ def patched_log_error(error_data: Dict[str, Any]) -> bool:
 
 # Apply patches
 AssetProcessor.increment_job_counter = patched_increment_job_counter
+AssetProcessor.add_job_counters = patched_add_job_counters
 AssetProcessor.update_job_status = patched_update_job_status
 AssetProcessor.update_job_metadata = patched_update_job_metadata
 AssetProcessor.log_error = patched_log_error
 
 
+class JobCounterAggregator:
+    """
+    Coalesces job counter increments in memory
+
+    S3 Batch Operations invokes the processor once per task, and every task
+    bumps several job counters. Increments are accumulated here and written
+    with a single ADD update per flush to a randomly chosen counter shard,
+    instead of one update per counter against the job item.
+    """
+
+    def __init__(self, job_id: str, shard_count: int = JOB_COUNTER_SHARDS):
+        self.job_id = job_id
+        self.shard_count = max(1, shard_count)
+        self._pending: Dict[str, int] = {}
+
+    def increment(self, counter_name: str, value: int = 1) -> None:
+        self._pending[counter_name] = self._pending.get(counter_name, 0) + value
+
+    @property
+    def pending(self) -> Dict[str, int]:
+        return dict(self._pending)
+
+    def flush(self) -> bool:
+        """Write pending increments; returns False if the write failed"""
+        if not self._pending:
+            return True
+
+        counters = self._pending
+        self._pending = {}
+        shard = random.randrange(self.shard_count)
+        try:
+            AssetProcessor.add_job_counters(self.job_id, counters, shard)
+        except Exception as e:
+            logger.error(
+                f"Failed to flush job counters for job {self.job_id}: {str(e)}",
+                extra={"counters": counters, "shard": shard},
+            )
+            metrics.add_metric(
+                name="JobCounterFlushFailures", unit=MetricUnit.Count, value=1
+            )
+            return False
+
+        metrics.add_metric(name="JobCounterFlushes", unit=MetricUnit.Count, value=1)
+        return True
+
+
 class AssetSyncProcessor:
     """Processes objects for synchronization with the Asset Management system via S3 batch operations"""
 
@@ -267,6 +328,8 @@ class AssetSyncProcessor:
         self.bucket_name = bucket_name
         # Use cached S3 client instead of creating new one
         self.s3_client = get_cached_s3_client(bucket_name)
+        # Job counters are flushed once per invocation by the handler
+        self.counters = JobCounterAggregator(job_id)
 
     def process_s3_batch_operation(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -317,15 +380,9 @@ class AssetSyncProcessor:
 
             if result.get("status") == "success":
                 # Update job counters
-                AssetProcessor.increment_job_counter(
-                    self.job_id, "totalObjectsScanned", 1
-                )
-                AssetProcessor.increment_job_counter(
-                    self.job_id, "totalObjectsToProcess", 1
-                )
-                AssetProcessor.increment_job_counter(
-                    self.job_id, "totalObjectsProcessed", 1
-                )
+                self.counters.increment("totalObjectsScanned")
+                self.counters.increment("totalObjectsToProcess")
+                self.counters.increment("totalObjectsProcessed")
 
                 return {
                     "resultCode": "Succeeded",
@@ -333,13 +390,9 @@ class AssetSyncProcessor:
                 }
             else:
                 # Update error counters
-                AssetProcessor.increment_job_counter(
-                    self.job_id, "totalObjectsScanned", 1
-                )
-                AssetProcessor.increment_job_counter(
-                    self.job_id, "totalObjectsToProcess", 1
-                )
-                AssetProcessor.increment_job_counter(self.job_id, "errors", 1)
+                self.counters.increment("totalObjectsScanned")
+                self.counters.increment("totalObjectsToProcess")
+                self.counters.increment("errors")
 
                 return {
                     "resultCode": "PermanentFailure",
@@ -352,7 +405,7 @@ class AssetSyncProcessor:
             )
 
             # Update error counters
-            AssetProcessor.increment_job_counter(self.job_id, "errors", 1)
+            self.counters.increment("errors")
 
             return {
                 "resultCode": "PermanentFailure",
@@ -749,47 +802,61 @@ def lambda_handler(event, context):
 
             # Process tasks and collect results
             results = []
-            for task in tasks:
-                try:
-                    task_id = task.get("taskId", "unknown")
-                    logger.info(f"Processing task {task_id}")
-
-                    result = processor.process_s3_batch_operation(task)
+            try:
+                for task in tasks:
+                    try:
+                        task_id = task.get("taskId", "unknown")
+                        logger.info(f"Processing task {task_id}")
+
+                        result = processor.process_s3_batch_operation(task)
+
+                        # Record batch operation processing success/failure
+                        if result.get("resultCode") == "Succeeded":
+                            metrics.add_metric(
+                                name="BatchOperationSuccesses",
+                                unit=MetricUnit.Count,
+                                value=1,
+                            )
+                        else:
+                            metrics.add_metric(
+                                name="BatchOperationErrors",
+                                unit=MetricUnit.Count,
+                                value=1,
+                            )
+
+                        results.append(
+                            {
+                                "taskId": task_id,
+                                "resultCode": result.get(
+                                    "resultCode", "PermanentFailure"
+                                ),
+                                "resultString": result.get(
+                                    "resultString", "Unknown error"
+                                ),
+                            }
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Error processing task: {str(e)}", exc_info=True
+                        )
 
-                    # Record batch operation processing success/failure
-                    if result.get("resultCode") == "Succeeded":
+                        # Record batch operation processing errors
                         metrics.add_metric(
-                            name="BatchOperationSuccesses",
+                            name="BatchOperationErrors",
                             unit=MetricUnit.Count,
                             value=1,
                         )
-                    else:
-                        metrics.add_metric(
-                            name="BatchOperationErrors", unit=MetricUnit.Count, value=1
-                        )
 
-                    results.append(
-                        {
-                            "taskId": task_id,
-                            "resultCode": result.get("resultCode", "PermanentFailure"),
-                            "resultString": result.get("resultString", "Unknown error"),
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Error processing task: {str(e)}", exc_info=True)
-
-                    # Record batch operation processing errors
-                    metrics.add_metric(
-                        name="BatchOperationErrors", unit=MetricUnit.Count, value=1
-                    )
-
-                    results.append(
-                        {
-                            "taskId": task.get("taskId", "unknown"),
-                            "resultCode": "PermanentFailure",
-                            "resultString": f"Exception: {str(e)}",
-                        }
-                    )
+                        results.append(
+                            {
+                                "taskId": task.get("taskId", "unknown"),
+                                "resultCode": "PermanentFailure",
+                                "resultString": f"Exception: {str(e)}",
+                            }
+                        )
+            finally:
+                # One counter write per invocation instead of several per task
+                processor.counters.flush()
 
             # Return the results
             return {
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import boto3
 from aws_lambda_powertools import Logger, Metrics, Tracer
 from boto3.dynamodb.types import TypeDeserializer
+from opensearch_bulk import chunk_bulk_actions
 from opensearchpy import OpenSearch, RequestsHttpConnection
 from opensearchpy.helpers import streaming_bulk
 
@@ -23,10 +24,6 @@ HOST = os.environ["OPENSEARCH_ENDPOINT"].split("://")[-1]
 INDEX = os.environ["OPENSEARCH_INDEX"]
 SQS_URL = os.environ["SQS_URL"]
 
-# Bulk processing configuration
-BULK_BATCH_SIZE = int(os.environ.get("BULK_BATCH_SIZE", "500"))
-MAX_BULK_SIZE_MB = int(os.environ.get("MAX_BULK_SIZE_MB", "5"))
-
 # Circuit breaker configuration
 ERROR_THRESHOLD = float(os.environ.get("ERROR_THRESHOLD", "0.3"))
 CIRCUIT_TIMEOUT = int(os.environ.get("CIRCUIT_TIMEOUT", "60"))
@@ -967,39 +964,6 @@ def estimate_bulk_size(actions: List[dict]) -> int:
     return len(json.dumps(actions, cls=DecimalEncoder).encode("utf-8"))
 
 
-def chunk_bulk_actions(actions: List[dict]) -> List[List[dict]]:
-    """
-    Split bulk actions into chunks based on size and count limits.
-
-    Returns:
-        List of action chunks
-    """
-    chunks = []
-    current_chunk = []
-    current_size = 0
-    max_size_bytes = MAX_BULK_SIZE_MB * 1024 * 1024
-
-    for action in actions:
-        action_size = len(json.dumps(action, cls=DecimalEncoder).encode("utf-8"))
-
-        if (
-            len(current_chunk) >= BULK_BATCH_SIZE
-            or current_size + action_size > max_size_bytes
-        ):
-            if current_chunk:
-                chunks.append(current_chunk)
-                current_chunk = []
-                current_size = 0
-
-        current_chunk.append(action)
-        current_size += action_size
-
-    if current_chunk:
-        chunks.append(current_chunk)
-
-    return chunks
-
-
 # max_retries trimmed 15 -> 8 (2026-07-23): at 15 a sustained 429 storm held
 # a batch slot for ~11.5 minutes of sleep inside one invocation, stalling the
 # stream shard and aging the iterator (observed 6-9.6h lag in prd). At 8 the
@@ -1613,8 +1577,8 @@ def lambda_handler(event, context):
             logger.info("No bulk actions to process")
             return {"statusCode": 200, "body": json.dumps("No actions to process")}
 
-        # Split into chunks if needed
-        action_chunks = chunk_bulk_actions(bulk_actions)
+        # Split into chunks bounded by BULK_BATCH_SIZE and MAX_BULK_SIZE_MB
+        action_chunks = chunk_bulk_actions(bulk_actions, json_encoder=DecimalEncoder)
         logger.info(
             f"Split {len(bulk_actions)} actions into {len(action_chunks)} chunks"
         )
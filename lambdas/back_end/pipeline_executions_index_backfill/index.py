@@ -0,0 +1,129 @@
+"""
+Pipeline Executions Index Backfill
+
+One-off migration that adds the derived GSI keys (start_month,
+object_key_name_lower) to executions recorded before the executions list
+moved to indexed queries. New executions get them from the executions event
+processor; until this has run, older executions are missing from the
+unfiltered listing and object name search (status and pipeline name filters
+already cover them).
+
+Invoke with an empty payload to start a run:
+
+    aws lambda invoke --function-name <backfill function> \\
+        --invocation-type Event --payload '{}' /dev/null
+
+The starter fans out BACKFILL_SEGMENT_COUNT asynchronous workers, one per
+parallel Scan segment. A worker that runs low on time re-invokes itself with
+its ExclusiveStartKey. Re-running is safe: only items without start_month are
+updated.
+"""
+
+import json
+import os
+from decimal import Decimal
+from typing import Any, Dict
+
+import boto3
+from aws_lambda_powertools import Logger, Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+from pipeline_execution_index import index_attributes
+
+logger = Logger(service="pipeline_executions_index_backfill")
+metrics = Metrics(namespace="MediaLake/PipelineExecutions", service="index_backfill")
+
+PIPELINES_EXECUTIONS_TABLE_NAME = os.environ["PIPELINES_EXECUTIONS_TABLE_NAME"]
+SEGMENT_COUNT = int(os.environ.get("BACKFILL_SEGMENT_COUNT", "8"))
+# Hand off to a fresh invocation once less than this much time is left
+HANDOFF_MARGIN_MS = int(os.environ.get("BACKFILL_HANDOFF_MARGIN_MS", "60000"))
+
+lambda_client = boto3.client("lambda")
+table = boto3.resource("dynamodb").Table(PIPELINES_EXECUTIONS_TABLE_NAME)
+
+
+def _json_default(value: Any) -> Any:
+    # start_time in a LastEvaluatedKey comes back from the resource API as Decimal
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _invoke_self(context, payload: Dict[str, Any]) -> None:
+    lambda_client.invoke(
+        FunctionName=context.invoked_function_arn,
+        InvocationType="Event",
+        Payload=json.dumps(payload, default=_json_default).encode("utf-8"),
+    )
+
+
+def start_run(context) -> Dict[str, Any]:
+    """Fan out one worker per Scan segment."""
+    for segment_index in range(SEGMENT_COUNT):
+        _invoke_self(
+            context,
+            {"segmentIndex": segment_index, "segmentCount": SEGMENT_COUNT},
+        )
+    logger.info(
+        "Started executions index backfill", extra={"segments": SEGMENT_COUNT}
+    )
+    return {"segments": SEGMENT_COUNT}
+
+
+def backfill_item(item: Dict[str, Any]) -> None:
+    attributes = index_attributes(item)
+    names = {f"#a{i}": name for i, name in enumerate(attributes)}
+    values = {f":v{i}": value for i, value in enumerate(attributes.values())}
+    table.update_item(
+        Key={"execution_id": item["execution_id"], "start_time": item["start_time"]},
+        UpdateExpression="SET "
+        + ", ".join(f"{name} = {value}" for name, value in zip(names, values)),
+        ExpressionAttributeNames=names,
+        ExpressionAttributeValues=values,
+    )
+
+
+def backfill_segment(event: Dict[str, Any], context) -> Dict[str, Any]:
+    segment_index = int(event["segmentIndex"])
+    params: Dict[str, Any] = {
+        "Segment": segment_index,
+        "TotalSegments": int(event["segmentCount"]),
+        "FilterExpression": "attribute_not_exists(start_month)",
+        "ProjectionExpression": "execution_id, start_time, object_key_name",
+    }
+    if event.get("exclusiveStartKey"):
+        params["ExclusiveStartKey"] = event["exclusiveStartKey"]
+
+    updated = 0
+    while True:
+        response = table.scan(**params)
+        for item in response.get("Items", []):
+            backfill_item(item)
+            updated += 1
+
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            break
+        params["ExclusiveStartKey"] = last_key
+        if context.get_remaining_time_in_millis() < HANDOFF_MARGIN_MS:
+            _invoke_self(context, {**event, "exclusiveStartKey": last_key})
+            metrics.add_metric("ExecutionsBackfilled", MetricUnit.Count, updated)
+            logger.info(
+                "Handing off backfill segment",
+                extra={"segment_index": segment_index, "updated": updated},
+            )
+            return {"segmentIndex": segment_index, "status": "CONTINUED"}
+
+    metrics.add_metric("ExecutionsBackfilled", MetricUnit.Count, updated)
+    logger.info(
+        "Backfill segment complete",
+        extra={"segment_index": segment_index, "updated": updated},
+    )
+    return {"segmentIndex": segment_index, "status": "SEGMENT_COMPLETE"}
+
+
+@logger.inject_lambda_context
+@metrics.log_metrics
+def lambda_handler(event, context):
+    if "segmentIndex" in (event or {}):
+        return backfill_segment(event, context)
+    return start_run(context)
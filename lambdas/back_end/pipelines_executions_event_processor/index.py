@@ -1,5 +1,7 @@
 import json
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, Optional
@@ -8,6 +10,13 @@ import boto3
 from aws_lambda_powertools import Logger, Metrics, Tracer
 from aws_lambda_powertools.utilities.data_classes import EventBridgeEvent
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from pipeline_concurrency import ExecutionSemaphore
+from pipeline_execution_index import (
+    TRACE_ID_INDEX,
+    TRACE_INHERITED_FIELDS,
+    deployed_indexes,
+    index_attributes,
+)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Initialize
@@ -27,6 +36,16 @@ dynamodb_client = boto3.client("dynamodb")
 # last member finishes.
 GROUPS_TABLE_NAME = os.environ.get("PIPELINE_GROUPS_TABLE_NAME", "")
 
+# Pipeline concurrency table (optional). Trigger Lambdas acquire a slot per
+# execution they start; terminal events release it here.
+CONCURRENCY_TABLE_NAME = os.environ.get("PIPELINE_CONCURRENCY_TABLE_NAME", "")
+
+# Recent trace ID -> inherited parent fields. Every status event of a child
+# execution needs the same lookup, so warm containers answer it from memory.
+TRACE_PARENT_CACHE_SIZE = int(os.environ.get("TRACE_PARENT_CACHE_SIZE", "1024"))
+_trace_parent_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_trace_parent_cache_lock = threading.Lock()
+
 # Statuses that end an execution
 TERMINAL_STATUSES = ("SUCCEEDED", "FAILED", "TIMED_OUT", "ABORTED")
 
@@ -208,14 +227,57 @@ def parse_nested_metadata(detail_input_str: str) -> Dict[str, Any]:
 def fetch_parent_by_trace_id(
     trace_id: str, current_execution_id: str
 ) -> Optional[Dict[str, Any]]:
+    """
+    Return the inherited fields of the first execution in trace_id's trace.
+
+    Reads the sparse trace ID index oldest first, so the result is the
+    execution that started the trace rather than an arbitrary sibling.
+    Until the index is deployed (only on tables upgraded in stages), one page
+    of a filtered scan is read instead and may return any of them, or none.
+    Hits are cached per container; misses are not, since the parent may
+    simply not have been recorded yet.
+    """
+    with _trace_parent_cache_lock:
+        cached = _trace_parent_cache.get(trace_id)
+        if cached is not None:
+            _trace_parent_cache.move_to_end(trace_id)
+            return cached
+
     try:
-        response = table.scan(
-            FilterExpression="pipeline_trace_id = :trace_id",
-            ExpressionAttributeValues={":trace_id": trace_id},
-        )
-        for item in response.get("Items", []):
-            if item.get("execution_id") != current_execution_id:
-                return item
+        indexed = TRACE_ID_INDEX in deployed_indexes()
+        if indexed:
+            read = table.query
+            params: Dict[str, Any] = {
+                "IndexName": TRACE_ID_INDEX,
+                "KeyConditionExpression": "pipeline_trace_id = :trace_id",
+                "ExpressionAttributeValues": {":trace_id": trace_id},
+                "ScanIndexForward": True,
+            }
+        else:
+            # The index has not been deployed yet; scan one page in no
+            # particular order rather than the whole table on every miss
+            read = table.scan
+            params = {
+                "FilterExpression": "pipeline_trace_id = :trace_id",
+                "ExpressionAttributeValues": {":trace_id": trace_id},
+            }
+        while True:
+            response = read(**params)
+            for item in response.get("Items", []):
+                if item.get("execution_id") == current_execution_id:
+                    continue
+                parent = {f: item[f] for f in TRACE_INHERITED_FIELDS if f in item}
+                if not parent:
+                    continue
+                with _trace_parent_cache_lock:
+                    _trace_parent_cache[trace_id] = parent
+                    _trace_parent_cache.move_to_end(trace_id)
+                    while len(_trace_parent_cache) > TRACE_PARENT_CACHE_SIZE:
+                        _trace_parent_cache.popitem(last=False)
+                return parent
+            if not indexed or "LastEvaluatedKey" not in response:
+                return None
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
     except Exception as e:
         logger.warning(f"fetch_parent_by_trace_id: {e}")
     return None
@@ -377,6 +439,30 @@ def attempt_group_terminal_transition(group_id: str) -> None:
         )
 
 
+@tracer.capture_method
+def release_concurrency_slot(state_machine_arn: str, execution_id: str) -> None:
+    """
+    Free the admission slot held by a finished execution.
+
+    Release is idempotent: executions that were never admitted through the
+    semaphore and duplicate terminal events find no lease and are skipped.
+    """
+    if not CONCURRENCY_TABLE_NAME:
+        return
+
+    semaphore = ExecutionSemaphore(
+        CONCURRENCY_TABLE_NAME, state_machine_arn, limit=0, client=dynamodb_client
+    )
+    try:
+        if semaphore.release(execution_id):
+            metrics.add_metric(name="ConcurrencySlotsReleased", unit="Count", value=1)
+    except Exception as e:
+        logger.warning(
+            f"Concurrency slot release failed: {e}",
+            extra={"execution_id": execution_id},
+        )
+
+
 @logger.inject_lambda_context(log_event=True)
 @tracer.capture_lambda_handler
 @metrics.log_metrics(capture_cold_start_metric=True)
@@ -469,11 +555,7 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         # ────────────────────────────────────────
         trace_id = base_item.get("pipeline_trace_id")
         if trace_id:
-            missing_fields = [
-                f
-                for f in ["inventory_id", "dsa_type", "object_key_name"]
-                if f not in base_item
-            ]
+            missing_fields = [f for f in TRACE_INHERITED_FIELDS if f not in base_item]
             if missing_fields:
                 parent_item = fetch_parent_by_trace_id(
                     trace_id, base_item["execution_id"]
@@ -502,8 +584,14 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
                 if "cause" in detail:
                     base_item["cause"] = detail["cause"]
 
+        # Keys for the listing/search GSIs used by GET /pipelines/executions
+        base_item.update(index_attributes(base_item))
+
         store_execution_details(base_item)
 
+        if status in TERMINAL_STATUSES:
+            release_concurrency_slot(state_machine_arn, execution_id)
+
         # ── Group fan-in ──
         # When a grouped execution reaches a terminal state, count it against
         # its group and close the group if it was the last member.
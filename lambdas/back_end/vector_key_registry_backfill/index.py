@@ -0,0 +1,230 @@
+"""
+Vector Key Registry Backfill
+
+One-off migration that records every vector already stored in the S3 Vectors
+index in the vector key registry, so asset deletion can stop listing the whole
+index. New vectors are registered by the s3_vector_store node as they are
+written; this job covers everything written before that.
+
+Invoke with an empty payload to start a run:
+
+    aws lambda invoke --function-name <backfill function> \\
+        --invocation-type Event --payload '{}' /dev/null
+
+The starter writes the backfill marker and fans out BACKFILL_SEGMENT_COUNT
+asynchronous workers, one per ListVectors segment. A worker that runs low on
+time re-invokes itself with its continuation token. When the last segment
+completes, the marker gets completedAt and deletion paths stop scanning the
+index alongside the registry.
+
+Re-running is safe: registry writes are idempotent, and a new run replaces
+the marker so stale workers from an older run cannot complete it.
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import boto3
+from aws_lambda_powertools import Logger, Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from vector_key_registry import (
+    BACKFILL_PK,
+    MAX_VECTORS_PER_REQUEST,
+    VectorKeyRegistry,
+    backfill_marker_key,
+)
+
+logger = Logger(service="vector_key_registry_backfill")
+metrics = Metrics(namespace="MediaLake/VectorKeyRegistry", service="backfill")
+
+VECTOR_BUCKET_NAME = os.environ["VECTOR_BUCKET_NAME"]
+VECTOR_INDEX_NAME = os.environ.get("VECTOR_INDEX_NAME", "media-vectors")
+REGISTRY_TABLE_NAME = os.environ["VECTOR_KEY_REGISTRY_TABLE_NAME"]
+# ListVectors accepts at most 16 segments
+SEGMENT_COUNT = min(int(os.environ.get("BACKFILL_SEGMENT_COUNT", "8")), 16)
+# Hand off to a fresh invocation once less than this much time is left
+HANDOFF_MARGIN_MS = int(os.environ.get("BACKFILL_HANDOFF_MARGIN_MS", "60000"))
+
+s3vectors = boto3.client(
+    "s3vectors",
+    config=Config(retries={"max_attempts": 10, "mode": "adaptive"}),
+)
+lambda_client = boto3.client("lambda")
+dynamodb = boto3.resource("dynamodb")
+registry = VectorKeyRegistry(
+    VECTOR_BUCKET_NAME, VECTOR_INDEX_NAME, table_name=REGISTRY_TABLE_NAME
+)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _marker_key() -> Dict[str, str]:
+    return {
+        "PK": BACKFILL_PK,
+        "SK": backfill_marker_key(VECTOR_BUCKET_NAME, VECTOR_INDEX_NAME),
+    }
+
+
+def _invoke_self(context, payload: Dict[str, Any]) -> None:
+    lambda_client.invoke(
+        FunctionName=context.invoked_function_arn,
+        InvocationType="Event",
+        Payload=json.dumps(payload).encode("utf-8"),
+    )
+
+
+def start_run(context) -> Dict[str, Any]:
+    """Reset the marker and fan out one worker per ListVectors segment."""
+    run_id = str(uuid.uuid4())
+    dynamodb.Table(REGISTRY_TABLE_NAME).put_item(
+        Item={
+            **_marker_key(),
+            "runId": run_id,
+            "segmentCount": SEGMENT_COUNT,
+            "startedAt": _now(),
+        }
+    )
+    for segment_index in range(SEGMENT_COUNT):
+        _invoke_self(
+            context,
+            {
+                "runId": run_id,
+                "segmentIndex": segment_index,
+                "segmentCount": SEGMENT_COUNT,
+            },
+        )
+    logger.info(
+        "Started vector key registry backfill",
+        extra={"run_id": run_id, "segments": SEGMENT_COUNT},
+    )
+    return {"runId": run_id, "segments": SEGMENT_COUNT}
+
+
+def register_page(vectors: List[Dict[str, Any]]) -> int:
+    keys_by_inventory_id: Dict[str, List[str]] = {}
+    for vector in vectors:
+        metadata = vector.get("metadata")
+        inventory_id = (
+            metadata.get("inventory_id") if isinstance(metadata, dict) else None
+        )
+        if inventory_id:
+            keys_by_inventory_id.setdefault(inventory_id, []).append(vector["key"])
+    return registry.register_many(keys_by_inventory_id)
+
+
+def complete_segment(run_id: str, segment_index: int, segment_count: int) -> bool:
+    """
+    Record a finished segment; sets completedAt once every segment is done.
+
+    Returns:
+        True if this call completed the whole run
+    """
+    table = dynamodb.Table(REGISTRY_TABLE_NAME)
+    try:
+        response = table.update_item(
+            Key=_marker_key(),
+            UpdateExpression="ADD completedSegments :segment",
+            ConditionExpression="runId = :run_id",
+            ExpressionAttributeValues={
+                ":segment": {segment_index},
+                ":run_id": run_id,
+            },
+            ReturnValues="ALL_NEW",
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            logger.warning(
+                "Backfill run was superseded, not recording segment",
+                extra={"run_id": run_id, "segment_index": segment_index},
+            )
+            return False
+        raise
+
+    if len(response["Attributes"].get("completedSegments", ())) < segment_count:
+        return False
+
+    try:
+        table.update_item(
+            Key=_marker_key(),
+            UpdateExpression="SET completedAt = :now",
+            ConditionExpression=(
+                "runId = :run_id AND attribute_not_exists(completedAt)"
+            ),
+            ExpressionAttributeValues={":now": _now(), ":run_id": run_id},
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            return False
+        raise
+    return True
+
+
+def backfill_segment(event: Dict[str, Any], context) -> Dict[str, Any]:
+    run_id = event["runId"]
+    segment_index = int(event["segmentIndex"])
+    segment_count = int(event["segmentCount"])
+    params: Dict[str, Any] = {
+        "vectorBucketName": VECTOR_BUCKET_NAME,
+        "indexName": VECTOR_INDEX_NAME,
+        "returnMetadata": True,
+        "maxResults": MAX_VECTORS_PER_REQUEST,
+        "segmentCount": segment_count,
+        "segmentIndex": segment_index,
+    }
+    if event.get("nextToken"):
+        params["nextToken"] = event["nextToken"]
+
+    scanned = 0
+    registered = 0
+    while True:
+        response = s3vectors.list_vectors(**params)
+        vectors = response.get("vectors", [])
+        scanned += len(vectors)
+        registered += register_page(vectors)
+
+        next_token = response.get("nextToken")
+        if not next_token:
+            break
+        params["nextToken"] = next_token
+        if context.get_remaining_time_in_millis() < HANDOFF_MARGIN_MS:
+            _invoke_self(context, {**event, "nextToken": next_token})
+            metrics.add_metric("VectorsScanned", MetricUnit.Count, scanned)
+            metrics.add_metric("VectorKeysRegistered", MetricUnit.Count, registered)
+            logger.info(
+                "Handing off backfill segment",
+                extra={"segment_index": segment_index, "scanned": scanned},
+            )
+            return {"segmentIndex": segment_index, "status": "CONTINUED"}
+
+    metrics.add_metric("VectorsScanned", MetricUnit.Count, scanned)
+    metrics.add_metric("VectorKeysRegistered", MetricUnit.Count, registered)
+    finished = complete_segment(run_id, segment_index, segment_count)
+    logger.info(
+        "Backfill segment complete",
+        extra={
+            "run_id": run_id,
+            "segment_index": segment_index,
+            "scanned": scanned,
+            "registered": registered,
+            "run_complete": finished,
+        },
+    )
+    return {
+        "segmentIndex": segment_index,
+        "status": "RUN_COMPLETE" if finished else "SEGMENT_COMPLETE",
+    }
+
+
+@logger.inject_lambda_context
+@metrics.log_metrics
+def lambda_handler(event, context):
+    if "segmentIndex" in (event or {}):
+        return backfill_segment(event, context)
+    return start_run(context)
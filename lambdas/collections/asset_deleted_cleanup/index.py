@@ -1,167 +1,362 @@
 """
 Collections Asset Deletion Cleanup
 ==================================
-Event-driven consumer that removes a deleted asset from every collection that
-referenced it.
-
-Triggered by ``AssetDeleted`` events (source ``medialake.assets``) delivered via
-the internal application-service-events EventBridge bus. The asset deletion
+Event-driven consumer that removes deleted assets from every collection that
+referenced them.
+
+Triggered by ``AssetDeleted`` events (source ``medialake.assets``) on the
+internal application-service-events EventBridge bus. The events are buffered in
+an SQS queue, so bulk deletes reach this Lambda as batches of up to a hundred
+assets that are resolved and deleted together. A raw EventBridge event (direct
+invocation) is still accepted and handled as a batch of one. The asset deletion
 service itself does not touch collections, so without this consumer the asset's
 collection-item rows would be orphaned (still counted, still listed, pointing at
 an asset that no longer exists).
 
-Backwards compatibility
-------------------------
-This consumer works against the EXISTING collections table as-is. It does not
-require any change to the table's keys, GSIs, or index configuration, and it
-does not assume a particular ``GSI2_PK`` format.
-
-Collection items are stored with these shapes (all already present in the live
-table)::
+Collection items are stored with these shapes::
 
     new asset format : SK = ASSET#{asset_id}#FULL or ASSET#{asset_id}#CLIP#...
                        assetId = {asset_id}
     legacy item format: SK = ITEM#{item_id}
                        itemId  = {item_id}
 
-An asset may appear several times in one collection (full file plus clips). The
-canonical link to the asset is the ``assetId`` attribute (``itemId`` for legacy
-rows), which is identical for full file and every clip. We therefore locate all
-matching rows with a filtered table scan on those attributes (with an ``SK``
-prefix as a defensive fallback) and delete each row by its real PK/SK.
-
-A scan is used deliberately: there is no index keyed on the bare asset id, and
-adding one is explicitly out of scope. Asset deletion is an infrequent,
-asynchronous operation, so scanning the (comparatively small) collections table
-is an acceptable tradeoff.
+An asset may appear several times in one collection (full file plus clips).
+Every item write path also sets ``GSI7_PK = ASSET#{asset_id}``, so the keys-only
+``AssetMembershipGSI`` maps an asset to all of its rows in one Query, whatever
+their SK shape.
+
+Rows written before the index existed are covered by the membership backfill
+(``{"action": "backfillMembershipIndex"}``), which the stack starts on deploy
+through a custom resource. Only until the backfill writes its completion
+marker do assets with no indexed rows fall back to one filtered table scan (on
+``assetId``/``itemId``) per batch, so nothing is orphaned while it runs; once
+the marker is seen, the fallback is never taken again.
 """
 
 from __future__ import annotations
 
+import json
 import os
-from typing import Any, Dict, List, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Tuple
 
 import boto3
 from aws_lambda_powertools import Logger, Metrics, Tracer
 from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
-from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from collections_utils import (
+    ASSET_MEMBERSHIP_GSI,
+    ASSET_SK_PREFIX,
+    ITEM_SK_PREFIX,
+    SYSTEM_PK,
+    asset_membership_keys,
+)
 
 logger = Logger(service="collections-asset-cleanup")
 tracer = Tracer(service="collections-asset-cleanup")
 metrics = Metrics(namespace="medialake", service="collections-asset-cleanup")
 
 TABLE_NAME = os.environ["COLLECTIONS_TABLE_NAME"]
+# Concurrent membership queries and batch_writer flushes per invocation
+MAX_WORKERS = int(os.environ.get("CLEANUP_MAX_WORKERS", "8"))
+# Rows per parallel delete chunk (each chunk flushes as 25-item batch writes)
+DELETE_CHUNK_SIZE = 100
+# Hand a running backfill off to a fresh invocation below this much time
+BACKFILL_HANDOFF_MARGIN_MS = 60_000
 
-# SK prefixes used by collection-item rows.
-ASSET_SK_PREFIX = "ASSET#"
-ITEM_SK_PREFIX = "ITEM#"
+BACKFILL_ACTION = "backfillMembershipIndex"
+BACKFILL_MARKER_KEY = {"PK": SYSTEM_PK, "SK": f"BACKFILL#{ASSET_MEMBERSHIP_GSI}"}
 
 dynamodb = boto3.resource("dynamodb")
 table = dynamodb.Table(TABLE_NAME)
+lambda_client = boto3.client("lambda")
 
+# boto3 resources are not thread-safe; each worker thread gets its own.
+_thread_local = threading.local()
 
-@tracer.capture_method
-def _find_collection_rows(inventory_id: str) -> List[Tuple[str, str]]:
-    """Find all collection-item rows referencing the asset.
 
-    Matches across both storage formats without depending on the GSI:
-      * ``assetId`` equals the inventory id (new ASSET# rows, full + clips)
-      * ``itemId`` equals the inventory id (legacy ITEM# rows)
-      * ``SK`` begins with ``ASSET#{id}#`` (defensive fallback for rows missing
-        the ``assetId`` attribute)
+def _thread_table():
+    if not hasattr(_thread_local, "table"):
+        _thread_local.table = (
+            boto3.session.Session().resource("dynamodb").Table(TABLE_NAME)
+        )
+    return _thread_local.table
 
-    Returns a list of ``(PK, SK)`` tuples.
-    """
-    asset_sk_prefix = f"{ASSET_SK_PREFIX}{inventory_id}#"
 
-    filter_expression = (
-        Attr("assetId").eq(inventory_id)
-        | Attr("itemId").eq(inventory_id)
-        | Attr("SK").begins_with(asset_sk_prefix)
-    )
+def _is_item_row(sk: str) -> bool:
+    return sk.startswith(ASSET_SK_PREFIX) or sk.startswith(ITEM_SK_PREFIX)
+
+
+# Set once the backfill marker is seen; it is never cleared.
+_backfill_complete = False
+
+
+def _membership_backfilled() -> bool:
+    global _backfill_complete
+    if not _backfill_complete:
+        item = table.get_item(Key=BACKFILL_MARKER_KEY, ConsistentRead=True).get(
+            "Item"
+        )
+        _backfill_complete = bool(item and item.get("completedAt"))
+    return _backfill_complete
 
+
+def _query_memberships(inventory_id: str) -> List[Tuple[str, str]]:
+    """Collection-item rows for one asset, from the membership index."""
     rows: List[Tuple[str, str]] = []
-    scan_kwargs: Dict[str, Any] = {
-        "FilterExpression": filter_expression,
-        "ProjectionExpression": "PK, SK",
+    query_kwargs: Dict[str, Any] = {
+        "IndexName": ASSET_MEMBERSHIP_GSI,
+        "KeyConditionExpression": Key("GSI7_PK").eq(f"{ASSET_SK_PREFIX}{inventory_id}"),
     }
-    last_evaluated_key = None
-
     while True:
-        if last_evaluated_key:
-            scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
+        response = _thread_table().query(**query_kwargs)
+        rows.extend(
+            (item["PK"], item["SK"])
+            for item in response.get("Items", [])
+            if _is_item_row(item["SK"])
+        )
+        last_evaluated_key = response.get("LastEvaluatedKey")
+        if not last_evaluated_key:
+            return rows
+        query_kwargs["ExclusiveStartKey"] = last_evaluated_key
 
-        response = table.scan(**scan_kwargs)
 
-        for item in response.get("Items", []):
-            pk = item.get("PK")
-            sk = item.get("SK")
-            # Guard against matching the collection metadata row or any
-            # non-item rows that could theoretically carry the attribute.
-            if (
-                pk
-                and sk
-                and (sk.startswith(ASSET_SK_PREFIX) or sk.startswith(ITEM_SK_PREFIX))
-            ):
-                rows.append((pk, sk))
+@tracer.capture_method
+def _scan_memberships(inventory_ids: Iterable[str]) -> Dict[str, List[Tuple[str, str]]]:
+    """Find item rows for several assets in one filtered table scan.
 
+    Legacy path for rows written before the membership index existed; matches
+    on ``assetId`` (new rows) and ``itemId`` (legacy ITEM# rows). A batch holds
+    at most 100 assets, the limit for a single IN operand list.
+    """
+    ids = list(inventory_ids)
+    rows: Dict[str, List[Tuple[str, str]]] = {inventory_id: [] for inventory_id in ids}
+    scan_kwargs: Dict[str, Any] = {
+        "FilterExpression": Attr("assetId").is_in(ids) | Attr("itemId").is_in(ids),
+        "ProjectionExpression": "PK, SK, assetId, itemId",
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            pk, sk = item.get("PK"), item.get("SK")
+            inventory_id = item.get("assetId") or item.get("itemId")
+            # Guard against the collection metadata row or any non-item rows
+            # that could theoretically carry the attribute.
+            if pk and sk and _is_item_row(sk) and inventory_id in rows:
+                rows[inventory_id].append((pk, sk))
         last_evaluated_key = response.get("LastEvaluatedKey")
         if not last_evaluated_key:
-            break
+            return rows
+        scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
 
+@tracer.capture_method
+def _find_collection_rows(inventory_ids: List[str]) -> Dict[str, List[Tuple[str, str]]]:
+    """Resolve the collection-item rows for every asset in the batch.
+
+    Returns ``{inventory_id: [(PK, SK), ...]}``.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        rows = dict(zip(inventory_ids, executor.map(_query_memberships, inventory_ids)))
+
+    unindexed = [inventory_id for inventory_id, found in rows.items() if not found]
+    if unindexed and not _membership_backfilled():
+        metrics.add_metric(
+            name="MembershipScanFallbacks", unit=MetricUnit.Count, value=1
+        )
+        rows.update(_scan_memberships(unindexed))
     return rows
 
 
-@tracer.capture_method
-def _delete_rows(rows: List[Tuple[str, str]]) -> int:
-    """Batch-delete collection-item rows. Returns the number deleted."""
-    deleted = 0
-    with table.batch_writer() as batch:
+def _delete_chunk(rows: List[Tuple[str, str]]) -> int:
+    with _thread_table().batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
         for pk, sk in rows:
             batch.delete_item(Key={"PK": pk, "SK": sk})
-            deleted += 1
-    return deleted
+    return len(rows)
 
 
-@logger.inject_lambda_context
-@tracer.capture_lambda_handler
-@metrics.log_metrics
-def lambda_handler(event: Dict[str, Any], _context: LambdaContext) -> Dict[str, Any]:
-    """Remove a deleted asset from every collection that referenced it."""
-    detail = event.get("detail", {}) or {}
-    inventory_id = detail.get("inventoryId") or detail.get("inventory_id")
+@tracer.capture_method
+def _delete_rows(rows: List[Tuple[str, str]]) -> int:
+    """Batch-delete collection-item rows in parallel chunks. Returns the count."""
+    chunks = [
+        rows[i : i + DELETE_CHUNK_SIZE] for i in range(0, len(rows), DELETE_CHUNK_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return sum(executor.map(_delete_chunk, chunks))
 
-    if not inventory_id:
-        logger.warning(
-            "AssetDeleted event missing inventoryId; skipping", extra={"event": event}
-        )
-        return {"removed": 0, "inventoryId": None}
 
-    logger.info(f"Cleaning up collections for deleted asset: {inventory_id}")
+def _inventory_id(event: Dict[str, Any]) -> str | None:
+    detail = event.get("detail", {}) or {}
+    return detail.get("inventoryId") or detail.get("inventory_id")
+
 
-    rows = _find_collection_rows(inventory_id)
+@tracer.capture_method
+def cleanup_assets(inventory_ids: List[str]) -> Dict[str, Any]:
+    """Remove the given deleted assets from every collection."""
+    rows_by_asset = _find_collection_rows(inventory_ids)
+    rows = [row for found in rows_by_asset.values() for row in found]
 
     if not rows:
-        logger.info(f"No collection items found for asset {inventory_id}")
+        logger.info(f"No collection items found for {len(inventory_ids)} asset(s)")
         metrics.add_metric(
             name="OrphanedCollectionItemsRemoved", unit=MetricUnit.Count, value=0
         )
-        return {"removed": 0, "inventoryId": inventory_id}
+        return {"removed": 0, "assets": len(inventory_ids), "collectionsAffected": 0}
 
     affected_collections = {pk for pk, _ in rows}
     removed = _delete_rows(rows)
 
     logger.info(
-        f"Removed asset {inventory_id} from {len(affected_collections)} collection(s)",
+        f"Removed {len(inventory_ids)} asset(s) from "
+        f"{len(affected_collections)} collection(s)",
         extra={"rows_removed": removed, "collections": len(affected_collections)},
     )
     metrics.add_metric(
         name="OrphanedCollectionItemsRemoved", unit=MetricUnit.Count, value=removed
     )
-
     return {
         "removed": removed,
-        "inventoryId": inventory_id,
+        "assets": len(inventory_ids),
         "collectionsAffected": len(affected_collections),
     }
+
+
+def _handle_sqs_batch(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Clean up every asset in an SQS batch of AssetDeleted events."""
+    message_ids_by_asset: Dict[str, List[str]] = {}
+    for record in records:
+        try:
+            inventory_id = _inventory_id(json.loads(record["body"]))
+        except (KeyError, TypeError, ValueError):
+            inventory_id = None
+        if not inventory_id:
+            logger.warning(
+                "AssetDeleted message missing inventoryId; skipping",
+                extra={"message_id": record.get("messageId")},
+            )
+            continue
+        message_ids_by_asset.setdefault(inventory_id, []).append(record["messageId"])
+
+    if not message_ids_by_asset:
+        return {"batchItemFailures": []}
+
+    try:
+        result = cleanup_assets(list(message_ids_by_asset))
+    except Exception:
+        # Deletes are idempotent, so the whole batch can safely be retried
+        logger.exception("Collection cleanup failed for batch")
+        return {
+            "batchItemFailures": [
+                {"itemIdentifier": message_id}
+                for message_ids in message_ids_by_asset.values()
+                for message_id in message_ids
+            ]
+        }
+
+    logger.info("Collection cleanup batch complete", extra=result)
+    return {"batchItemFailures": []}
+
+
+@tracer.capture_method
+def backfill_membership_index(event: Dict[str, Any], context: LambdaContext) -> Dict:
+    """Set GSI7 keys on item rows written before the membership index existed.
+
+    Marks the run complete on the SYSTEM backfill marker when the scan
+    finishes; hands off to a fresh invocation when time runs low.
+    """
+    scan_kwargs: Dict[str, Any] = {
+        "FilterExpression": (
+            Attr("SK").begins_with(ASSET_SK_PREFIX)
+            | Attr("SK").begins_with(ITEM_SK_PREFIX)
+        )
+        & Attr("GSI7_PK").not_exists(),
+        "ProjectionExpression": "PK, SK, assetId, itemId",
+    }
+    if event.get("exclusiveStartKey"):
+        scan_kwargs["ExclusiveStartKey"] = event["exclusiveStartKey"]
+
+    updated = 0
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            asset_id = item.get("assetId") or item.get("itemId")
+            if not asset_id:
+                continue
+            collection_id = item["PK"].split("#", 1)[-1]
+            membership_keys = asset_membership_keys(asset_id, collection_id)
+            try:
+                table.update_item(
+                    Key={"PK": item["PK"], "SK": item["SK"]},
+                    UpdateExpression="SET GSI7_PK = :pk, GSI7_SK = :sk",
+                    # Don't resurrect a row deleted since the scan read it
+                    ConditionExpression="attribute_exists(PK)",
+                    ExpressionAttributeValues={
+                        ":pk": membership_keys["GSI7_PK"],
+                        ":sk": membership_keys["GSI7_SK"],
+                    },
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                continue
+            updated += 1
+
+        last_evaluated_key = response.get("LastEvaluatedKey")
+        if not last_evaluated_key:
+            break
+        scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
+        if context.get_remaining_time_in_millis() < BACKFILL_HANDOFF_MARGIN_MS:
+            lambda_client.invoke(
+                FunctionName=context.invoked_function_arn,
+                InvocationType="Event",
+                Payload=json.dumps(
+                    {"action": BACKFILL_ACTION, "exclusiveStartKey": last_evaluated_key}
+                ).encode("utf-8"),
+            )
+            metrics.add_metric(
+                name="MembershipRowsBackfilled", unit=MetricUnit.Count, value=updated
+            )
+            return {"status": "CONTINUED", "updated": updated}
+
+    table.put_item(
+        Item={
+            **BACKFILL_MARKER_KEY,
+            "completedAt": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+    metrics.add_metric(
+        name="MembershipRowsBackfilled", unit=MetricUnit.Count, value=updated
+    )
+    logger.info("Asset membership backfill complete", extra={"updated": updated})
+    return {"status": "COMPLETE", "updated": updated}
+
+
+@logger.inject_lambda_context
+@tracer.capture_lambda_handler
+@metrics.log_metrics
+def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+    """Remove deleted assets from every collection that referenced them."""
+    if event.get("action") == BACKFILL_ACTION:
+        return backfill_membership_index(event, context)
+
+    if "Records" in event:
+        return _handle_sqs_batch(event["Records"])
+
+    inventory_id = _inventory_id(event)
+    if not inventory_id:
+        logger.warning(
+            "AssetDeleted event missing inventoryId; skipping", extra={"event": event}
+        )
+        return {"removed": 0, "inventoryId": None}
+
+    logger.info(f"Cleaning up collections for deleted asset: {inventory_id}")
+    result = cleanup_assets([inventory_id])
+    return {
+        "removed": result["removed"],
+        "inventoryId": inventory_id,
+        "collectionsAffected": result["collectionsAffected"],
+    }
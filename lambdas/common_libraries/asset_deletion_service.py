@@ -19,9 +19,11 @@ import http.client
 import json
 import os
 import re
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import boto3
@@ -32,6 +34,8 @@ from botocore.awsrequest import AWSRequest
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from external_service_manager import MediaLakeExternalServiceManager
+from s3_copy_engine import delete_objects
+from vector_key_registry import VectorKeyRegistry, delete_vector_keys, find_vector_keys
 
 logger = Logger(service="asset-deletion-service", child=True)
 tracer = Tracer(service="asset-deletion-service")
@@ -56,10 +60,28 @@ DYNAMODB_TABLE_NAME = os.getenv("MEDIALAKE_ASSET_TABLE", "")
 # to preserve backward compatibility in environments without the variable.
 EVENT_BUS_NAME = os.getenv("ASSET_EVENT_BUS_NAME", "")
 
+# Batch deletion (delete_assets) tuning
+DELETION_CONCURRENCY = int(os.getenv("ASSET_DELETION_CONCURRENCY", "16"))
+# Each asset adds two match_phrase clauses to the media-index query, so this
+# stays well inside OpenSearch's default 1024 clause limit
+OPENSEARCH_DELETE_BATCH_SIZE = int(os.getenv("OPENSEARCH_DELETE_BATCH_SIZE", "256"))
+DYNAMODB_BATCH_GET_SIZE = 100
+EVENTBRIDGE_BATCH_SIZE = 10
+
+# boto3 resources are not thread-safe, so worker threads get their own
+_thread_state = threading.local()
+
 _session = boto3.Session()
 _credentials = _session.get_credentials()
 
 
+def _thread_dynamodb():
+    """DynamoDB resource private to the calling thread."""
+    if not hasattr(_thread_state, "dynamodb"):
+        _thread_state.dynamodb = boto3.session.Session().resource("dynamodb")
+    return _thread_state.dynamodb
+
+
 @dataclass
 class DeletionResult:
     """Result of asset deletion operation"""
@@ -79,6 +101,23 @@ class DeletionResult:
             self.external_services_deleted = []
 
 
+@dataclass
+class BatchDeletionResult:
+    """Result of deleting a batch of assets with delete_assets"""
+
+    results: List[DeletionResult] = field(default_factory=list)
+    # delete_by_query only reports totals, so document counts are per batch
+    opensearch_docs_deleted: int = 0
+
+    @property
+    def succeeded(self) -> List[DeletionResult]:
+        return [result for result in self.results if result.success]
+
+    @property
+    def failed(self) -> List[DeletionResult]:
+        return [result for result in self.results if not result.success]
+
+
 class AssetDeletionError(Exception):
     """Custom exception for asset deletion errors"""
 
@@ -153,7 +192,9 @@ class AssetDeletionService:
             result.s3_objects_deleted = self._delete_s3_objects(asset_data)
 
             # 3. Delete OpenSearch documents
-            result.opensearch_docs_deleted = self._delete_opensearch_docs(inventory_id)
+            result.opensearch_docs_deleted = self._delete_opensearch_docs(
+                [inventory_id]
+            )
 
             # 4. Delete S3 vectors
             result.vectors_deleted = self._delete_s3_vectors(inventory_id)
@@ -196,6 +237,199 @@ class AssetDeletionService:
             self.metrics.add_metric("AssetDeletionFailure", MetricUnit.Count, 1)
             raise AssetDeletionError(f"Failed to delete asset: {str(e)}", inventory_id)
 
+    @tracer.capture_method
+    def delete_assets(
+        self, inventory_ids: List[str], publish_event: bool = True
+    ) -> BatchDeletionResult:
+        """
+        Delete a batch of assets in one pass.
+
+        S3 keys of all assets are grouped per bucket into DeleteObjects
+        requests, OpenSearch documents go in one delete_by_query per index and
+        DynamoDB records through a batch writer. As in delete_asset, S3 goes
+        first: OpenSearch, vectors and external services (concurrently) and
+        then the DynamoDB record are only deleted for assets whose S3 objects
+        are gone, so an asset whose S3 deletion fails is left intact and can
+        simply be deleted again.
+
+        Unlike delete_asset this never raises for a single asset: failures are
+        reported on that asset's DeletionResult.
+
+        Args:
+            inventory_ids: The assets' inventory IDs
+            publish_event: Whether to publish deletion events to EventBridge
+
+        Returns:
+            BatchDeletionResult with one DeletionResult per inventory ID
+        """
+        results = {
+            inventory_id: DeletionResult(success=False, inventory_id=inventory_id)
+            for inventory_id in dict.fromkeys(inventory_ids)
+        }
+        batch = BatchDeletionResult(results=list(results.values()))
+        self.logger.info(f"Starting batch deletion of {len(results)} assets")
+
+        assets = self._fetch_assets(list(results))
+        for inventory_id, result in results.items():
+            if inventory_id not in assets:
+                result.error = f"Asset {inventory_id} not found in DynamoDB"
+        found = [inventory_id for inventory_id in results if inventory_id in assets]
+        if not found:
+            self._record_batch_metrics(batch)
+            return batch
+
+        vector_client = self._vector_client() if VECTOR_BUCKET_NAME else None
+
+        with ThreadPoolExecutor(max_workers=DELETION_CONCURRENCY) as executor:
+            # Planning lists numbered thumbnails, so it runs in parallel too
+            plan_futures = {
+                inventory_id: executor.submit(self._plan_s3_keys, assets[inventory_id])
+                for inventory_id in found
+            }
+            s3_deleted = self._delete_s3_objects_for(plan_futures, results)
+            for inventory_id, count in s3_deleted.items():
+                results[inventory_id].s3_objects_deleted = count
+
+            deletable = [
+                inventory_id
+                for inventory_id in found
+                if not results[inventory_id].error
+            ]
+            if deletable:
+                opensearch_future = executor.submit(
+                    self._delete_opensearch_docs, deletable
+                )
+                vector_futures = {
+                    inventory_id: executor.submit(
+                        self._delete_s3_vectors, inventory_id, vector_client
+                    )
+                    for inventory_id in deletable
+                }
+                # The external service manager is not shared across threads
+                external_future = executor.submit(
+                    lambda: {
+                        inventory_id: self._delete_external_services(
+                            assets[inventory_id], inventory_id
+                        )
+                        for inventory_id in deletable
+                    }
+                )
+
+                for inventory_id, future in vector_futures.items():
+                    results[inventory_id].vectors_deleted = future.result()
+                for inventory_id, services in external_future.result().items():
+                    results[inventory_id].external_services_deleted = services
+                batch.opensearch_docs_deleted = opensearch_future.result()
+                if len(deletable) == 1:
+                    results[deletable[0]].opensearch_docs_deleted = (
+                        batch.opensearch_docs_deleted
+                    )
+
+                self._delete_dynamodb_records(deletable, results)
+
+        deleted = [
+            inventory_id
+            for inventory_id in found
+            if results[inventory_id].dynamodb_deleted
+        ]
+        if publish_event and deleted:
+            for inventory_id in self._publish_deletion_events(deleted):
+                results[inventory_id].event_published = True
+        for inventory_id in deleted:
+            results[inventory_id].success = True
+
+        self._record_batch_metrics(batch)
+        self.logger.info(
+            f"Batch deletion finished: {len(batch.succeeded)} deleted, "
+            f"{len(batch.failed)} failed",
+            extra={
+                "s3_objects": sum(r.s3_objects_deleted for r in batch.results),
+                "opensearch_docs": batch.opensearch_docs_deleted,
+                "vectors": sum(r.vectors_deleted for r in batch.results),
+            },
+        )
+        return batch
+
+    def _delete_s3_objects_for(
+        self, plan_futures: Dict[str, Any], results: Dict[str, DeletionResult]
+    ) -> Dict[str, int]:
+        """Delete the planned S3 keys of a batch, recording failures on results.
+
+        Returns:
+            Number of objects deleted per inventory ID
+        """
+        owners: Dict[Tuple[str, str], str] = {}
+        planned: Dict[str, int] = {}
+        for inventory_id, future in plan_futures.items():
+            try:
+                keys = future.result()
+            except Exception as e:
+                self.logger.error(f"Failed to plan S3 deletion for {inventory_id}: {e}")
+                results[inventory_id].error = f"Failed to delete S3 objects: {e}"
+                continue
+            for key in keys:
+                owners.setdefault(key, inventory_id)
+            planned[inventory_id] = len(set(keys))
+
+        try:
+            deleted_count, errors = self._delete_s3_keys(list(owners))
+        except Exception as e:
+            self.logger.error(f"S3 deletion error: {e}")
+            for inventory_id in planned:
+                results[inventory_id].error = f"Failed to delete S3 objects: {e}"
+            return {}
+
+        errors_by_asset: Dict[str, List[Dict[str, str]]] = {}
+        for error in errors:
+            inventory_id = owners[(error["bucket"], error["key"])]
+            errors_by_asset.setdefault(inventory_id, []).append(error)
+        for inventory_id, asset_errors in errors_by_asset.items():
+            self.logger.error(f"S3 deletion errors for {inventory_id}: {asset_errors}")
+            results[inventory_id].error = (
+                f"Failed to delete S3 objects: {self._format_s3_errors(asset_errors)}"
+            )
+
+        self.metrics.add_metric("S3ObjectsDeleted", MetricUnit.Count, deleted_count)
+        return {
+            inventory_id: count - len(errors_by_asset.get(inventory_id, []))
+            for inventory_id, count in planned.items()
+        }
+
+    def _record_batch_metrics(self, batch: BatchDeletionResult) -> None:
+        if batch.succeeded:
+            self.metrics.add_metric(
+                "AssetDeletionSuccess", MetricUnit.Count, len(batch.succeeded)
+            )
+        if batch.failed:
+            self.metrics.add_metric(
+                "AssetDeletionFailure", MetricUnit.Count, len(batch.failed)
+            )
+
+    @tracer.capture_method
+    def _fetch_assets(self, inventory_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch several assets with BatchGetItem; missing assets are omitted"""
+        assets: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(inventory_ids), DYNAMODB_BATCH_GET_SIZE):
+            request = {
+                self.table_name: {
+                    "Keys": [
+                        {"InventoryID": inventory_id}
+                        for inventory_id in inventory_ids[
+                            start : start + DYNAMODB_BATCH_GET_SIZE
+                        ]
+                    ]
+                }
+            }
+            while request:
+                response = dynamodb.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    # Convert Decimal to standard types
+                    assets[item["InventoryID"]] = json.loads(
+                        json.dumps(item, cls=DecimalEncoder)
+                    )
+                request = response.get("UnprocessedKeys") or None
+        return assets
+
     @tracer.capture_method
     def _fetch_asset(self, inventory_id: str) -> Dict[str, Any]:
         """Fetch asset data from DynamoDB"""
@@ -212,135 +446,121 @@ class AssetDeletionService:
             self.logger.error(f"DynamoDB error fetching asset: {e}")
             raise AssetDeletionError(f"Failed to fetch asset: {e}", inventory_id)
 
-    def _safe_delete_object(self, bucket: str, key: str, description: str) -> bool:
-        """Delete a single S3 object, tolerating a missing bucket/key.
-
-        ``DeleteObject`` is normally idempotent when the *key* is already
-        gone, but a *bucket* that no longer exists (e.g. its S3 connector
-        was torn down out-of-band) returns a ``NoSuchBucket`` ``ClientError``
-        instead of a quiet success. Since the desired end-state — "the
-        object is gone" — already holds in these cases, we log a warning and
-        treat it as a no-op rather than failing the entire asset deletion.
-        Any other ``ClientError`` (e.g. ``AccessDenied``) indicates a real
-        problem and is re-raised so the caller still fails loudly.
-
-        Returns:
-            True if S3 confirmed the delete, False if the bucket/key was
-            already missing (so nothing was actually deleted here).
-        """
-        try:
-            s3.delete_object(Bucket=bucket, Key=key)
-            return True
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code in ("NoSuchBucket", "NoSuchKey", "404", "NotFound"):
-                self.logger.warning(
-                    f"Skipping delete of {description} — already missing "
-                    f"(bucket/key not found): s3://{bucket}/{key} "
-                    f"(code={error_code})"
-                )
-                return False
-            raise
-
     @tracer.capture_method
     def _delete_s3_objects(self, asset: Dict[str, Any]) -> int:
         """Delete all S3 objects associated with the asset"""
-        deleted_count = 0
-
         try:
-            # Delete main representation
-            main = asset["DigitalSourceAsset"]["MainRepresentation"]["StorageInfo"][
-                "PrimaryLocation"
-            ]
-            bucket = main["Bucket"]
-            key = main["ObjectKey"]["FullPath"]
-
-            if self._safe_delete_object(bucket, key, "main representation"):
-                deleted_count += 1
-                self.logger.info(f"Deleted main representation: s3://{bucket}/{key}")
+            keys = self._plan_s3_keys(asset)
+            deleted_count, errors = self._delete_s3_keys(keys)
+        except ClientError as e:
+            self.logger.error(f"S3 deletion error: {e}")
+            raise AssetDeletionError(f"Failed to delete S3 objects: {e}")
 
-            # Log all derived representations for debugging
-            derived_reps = asset.get("DerivedRepresentations", [])
-            self.logger.info(
-                f"Processing {len(derived_reps)} derived representations",
-                extra={"derived_reps_count": len(derived_reps)},
+        if errors:
+            self.logger.error(f"S3 deletion errors: {errors}")
+            raise AssetDeletionError(
+                f"Failed to delete S3 objects: {self._format_s3_errors(errors)}"
             )
 
-            # Delete derived representations
-            for idx, rep in enumerate(derived_reps):
-                rep_purpose = rep.get("Purpose", "unknown")
-                rep_type = rep.get("Type", "unknown")
-                self.logger.info(
-                    f"Processing derived rep [{idx}]: Purpose={rep_purpose}, Type={rep_type}",
-                    extra={"rep_index": idx, "purpose": rep_purpose, "type": rep_type},
+        self.metrics.add_metric("S3ObjectsDeleted", MetricUnit.Count, deleted_count)
+        return deleted_count
+
+    def _plan_s3_keys(self, asset: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """(bucket, key) of every S3 object that belongs to the asset"""
+        main = asset["DigitalSourceAsset"]["MainRepresentation"]["StorageInfo"][
+            "PrimaryLocation"
+        ]
+        keys = [(main["Bucket"], main["ObjectKey"]["FullPath"])]
+
+        for idx, rep in enumerate(asset.get("DerivedRepresentations", [])):
+            pl = rep.get("StorageInfo", {}).get("PrimaryLocation")
+            if not pl:
+                self.logger.warning(f"Derived rep [{idx}] has no PrimaryLocation")
+                continue
+
+            rep_bucket = pl["Bucket"]
+            rep_key = pl["ObjectKey"]["FullPath"]
+            keys.append((rep_bucket, rep_key))
+
+            # For video thumbnails, MediaConvert generates multiple numbered files
+            # e.g., video_thumbnail.0000000.jpg, video_thumbnail.0000001.jpg, etc.
+            # Only one is tracked in DerivedRepresentations, so delete all matching the pattern
+            if rep.get("Purpose") == "thumbnail" and "_thumbnail." in rep_key:
+                keys.extend(
+                    (rep_bucket, thumbnail_key)
+                    for thumbnail_key in self._numbered_thumbnail_keys(
+                        rep_bucket, rep_key
+                    )
                 )
 
-                pl = rep.get("StorageInfo", {}).get("PrimaryLocation")
-                if pl:
-                    rep_bucket = pl["Bucket"]
-                    rep_key = pl["ObjectKey"]["FullPath"]
+        # Transcript files
+        if transcript_uri := asset.get("TranscriptionS3Uri"):
+            transcript_bucket, transcript_key = self._parse_s3_uri(transcript_uri)
+            if transcript_bucket and transcript_key:
+                keys.append((transcript_bucket, transcript_key))
 
-                    self.logger.info(
-                        f"Derived rep [{idx}] location: bucket={rep_bucket}, key={rep_key}",
-                        extra={"bucket": rep_bucket, "key": rep_key},
-                    )
+        return keys
 
-                    if self._safe_delete_object(
-                        rep_bucket, rep_key, f"derived representation [{idx}]"
-                    ):
-                        deleted_count += 1
-                        self.logger.info(
-                            f"Deleted derived representation: s3://{rep_bucket}/{rep_key}"
-                        )
+    def _delete_s3_keys(
+        self, keys: List[Tuple[str, str]]
+    ) -> Tuple[int, List[Dict[str, str]]]:
+        """Delete (bucket, key) pairs with one DeleteObjects request per bucket
+        (per 1000 keys).
 
-                    # For video thumbnails, MediaConvert generates multiple numbered files
-                    # e.g., video_thumbnail.0000000.jpg, video_thumbnail.0000001.jpg, etc.
-                    # Only one is tracked in DerivedRepresentations, so delete all matching the pattern
-                    is_thumbnail = rep_purpose == "thumbnail"
-                    has_thumbnail_pattern = "_thumbnail." in rep_key
-                    self.logger.info(
-                        f"Checking thumbnail cleanup: is_thumbnail={is_thumbnail}, has_pattern={has_thumbnail_pattern}",
-                        extra={
-                            "is_thumbnail": is_thumbnail,
-                            "has_thumbnail_pattern": has_thumbnail_pattern,
-                        },
-                    )
+        ``DeleteObjects`` already treats keys that are gone as deleted, but a
+        *bucket* that no longer exists (e.g. its S3 connector was torn down
+        out-of-band) fails the request with ``NoSuchBucket``. Since the
+        desired end-state — "the object is gone" — already holds, we log a
+        warning and skip that bucket rather than failing the deletion. Any
+        other error (e.g. ``AccessDenied``) is reported for every key of the
+        bucket so the caller still fails loudly.
 
-                    if is_thumbnail and has_thumbnail_pattern:
-                        self.logger.info(
-                            f"Triggering additional thumbnail cleanup for: {rep_key}"
-                        )
-                        additional_deleted = self._delete_all_numbered_thumbnails(
-                            rep_bucket, rep_key
-                        )
-                        deleted_count += additional_deleted
-                        self.logger.info(
-                            f"Additional thumbnails deleted: {additional_deleted}"
-                        )
-                else:
-                    self.logger.warning(f"Derived rep [{idx}] has no PrimaryLocation")
+        Returns:
+            (number of keys S3 confirmed deleted, one error dict per key S3
+            failed to delete)
+        """
+        keys_by_bucket: Dict[str, Dict[str, None]] = {}
+        for bucket, key in keys:
+            keys_by_bucket.setdefault(bucket, {})[key] = None
 
-            # Delete transcript files
-            if transcript_uri := asset.get("TranscriptionS3Uri"):
-                transcript_bucket, transcript_key = self._parse_s3_uri(transcript_uri)
-                if transcript_bucket and transcript_key:
-                    if self._safe_delete_object(
-                        transcript_bucket, transcript_key, "transcript"
-                    ):
-                        deleted_count += 1
-                        self.logger.info(f"Deleted transcript: {transcript_uri}")
+        deleted_count = 0
+        errors: List[Dict[str, str]] = []
+        for bucket, bucket_keys in keys_by_bucket.items():
+            try:
+                bucket_errors = delete_objects((bucket, key) for key in bucket_keys)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                if error_code in ("NoSuchBucket", "404", "NotFound"):
+                    self.logger.warning(
+                        f"Skipping delete of {len(bucket_keys)} objects — bucket "
+                        f"s3://{bucket} no longer exists (code={error_code})"
+                    )
+                    continue
+                bucket_errors = [
+                    {
+                        "bucket": bucket,
+                        "key": key,
+                        "code": error_code or "Unknown",
+                        "message": str(e),
+                    }
+                    for key in bucket_keys
+                ]
+            deleted_count += len(bucket_keys) - len(bucket_errors)
+            errors.extend(bucket_errors)
 
-            self.metrics.add_metric("S3ObjectsDeleted", MetricUnit.Count, deleted_count)
-            return deleted_count
+        return deleted_count, errors
 
-        except ClientError as e:
-            self.logger.error(f"S3 deletion error: {e}")
-            raise AssetDeletionError(f"Failed to delete S3 objects: {e}")
+    @staticmethod
+    def _format_s3_errors(errors: List[Dict[str, str]]) -> str:
+        first = errors[0]
+        return (
+            f"{len(errors)} object(s) not deleted, first "
+            f"s3://{first['bucket']}/{first['key']}: {first['code']} {first['message']}"
+        )
 
-    @tracer.capture_method
-    def _delete_all_numbered_thumbnails(self, bucket: str, thumbnail_key: str) -> int:
+    def _numbered_thumbnail_keys(self, bucket: str, thumbnail_key: str) -> List[str]:
         """
-        Delete all numbered thumbnail files generated by MediaConvert.
+        Keys of the additional numbered thumbnail files generated by MediaConvert.
 
         MediaConvert generates multiple thumbnails with pattern:
         {base}_thumbnail.XXXXXXX.jpg where X is a digit (7 digits, zero-padded)
@@ -354,97 +574,53 @@ class AssetDeletionService:
             thumbnail_key: Key of the tracked thumbnail (e.g., path/video_thumbnail.0000000.jpg)
 
         Returns:
-            Number of additional thumbnails deleted (not counting the one already deleted)
+            The other numbered thumbnail keys (not including thumbnail_key)
         """
-        deleted_count = 0
-
-        self.logger.info(
-            f"_delete_all_numbered_thumbnails called with bucket={bucket}, thumbnail_key={thumbnail_key}"
-        )
+        # Extract the base prefix before the numbered part
+        # e.g., "path/video-mp4_thumbnail.0000000.jpg" -> "path/video-mp4_thumbnail."
+        match = re.match(r"(.+_thumbnail\.)\d{7}\.jpg$", thumbnail_key)
+        if not match:
+            self.logger.warning(
+                f"Thumbnail key doesn't match expected pattern (.*_thumbnail.XXXXXXX.jpg): {thumbnail_key}"
+            )
+            return []
+        prefix = match.group(1)
 
         try:
-            # Extract the base prefix before the numbered part
-            # Pattern: {base}_thumbnail.XXXXXXX.jpg
-            # e.g., "path/video-mp4_thumbnail.0000000.jpg" -> "path/video-mp4_thumbnail."
-            match = re.match(r"(.+_thumbnail\.)\d{7}\.jpg$", thumbnail_key)
-            if not match:
-                self.logger.warning(
-                    f"Thumbnail key doesn't match expected pattern (.*_thumbnail.XXXXXXX.jpg): {thumbnail_key}"
-                )
-                return 0
-
-            prefix = match.group(1)
-            self.logger.info(f"Extracted prefix for S3 listing: {prefix}")
-
-            # List all objects with this prefix
-            self.logger.info(f"Listing objects in bucket={bucket} with prefix={prefix}")
             response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
-
-            contents = response.get("Contents", [])
-            self.logger.info(f"Found {len(contents)} objects with prefix {prefix}")
-
-            if not contents:
-                self.logger.info("No objects found with this prefix")
-                return 0
-
-            for obj in contents:
-                obj_key = obj["Key"]
-                self.logger.info(f"Checking object: {obj_key}")
-
-                # Skip the thumbnail that was already deleted
-                if obj_key == thumbnail_key:
-                    self.logger.info(f"Skipping already-deleted thumbnail: {obj_key}")
-                    continue
-
-                # Match pattern: {prefix}XXXXXXX.jpg where X is a digit
-                # e.g., video_thumbnail.0000001.jpg, video_thumbnail.0000002.jpg
-                if obj_key.startswith(prefix) and obj_key.endswith(".jpg"):
-                    # Extract the number part between prefix and .jpg
-                    number_part = obj_key[len(prefix) : -4]  # Remove prefix and .jpg
-                    self.logger.info(
-                        f"Extracted number part: '{number_part}' from {obj_key}"
-                    )
-
-                    if number_part.isdigit() and len(number_part) == 7:
-                        self.logger.info(
-                            f"Deleting additional thumbnail: s3://{bucket}/{obj_key}"
-                        )
-                        if self._safe_delete_object(
-                            bucket, obj_key, "additional numbered thumbnail"
-                        ):
-                            deleted_count += 1
-                            self.logger.info(
-                                f"Deleted additional thumbnail: s3://{bucket}/{obj_key}"
-                            )
-                    else:
-                        self.logger.info(
-                            f"Number part '{number_part}' doesn't match expected format (7 digits)"
-                        )
-                else:
-                    self.logger.info(
-                        f"Object {obj_key} doesn't match thumbnail pattern"
-                    )
-
-            self.logger.info(
-                f"Finished thumbnail cleanup. Deleted {deleted_count} additional thumbnails with prefix: {prefix}"
-            )
-
         except ClientError as e:
             self.logger.error(
-                f"Error deleting additional thumbnails for {thumbnail_key}: {e}",
+                f"Error listing additional thumbnails for {thumbnail_key}: {e}",
                 exc_info=True,
             )
             # Don't fail the entire deletion for this
+            return []
 
-        return deleted_count
+        keys = []
+        for obj in response.get("Contents", []):
+            obj_key = obj["Key"]
+            if obj_key == thumbnail_key or not obj_key.endswith(".jpg"):
+                continue
+            # Extract the number part between prefix and .jpg
+            number_part = obj_key[len(prefix) : -4]
+            if number_part.isdigit() and len(number_part) == 7:
+                keys.append(obj_key)
+
+        self.logger.info(
+            f"Found {len(keys)} additional thumbnails with prefix: {prefix}"
+        )
+        return keys
 
     @tracer.capture_method
-    def _delete_opensearch_docs(self, inventory_id: str) -> int:
-        """Delete OpenSearch documents for the asset from both indexes.
+    def _delete_opensearch_docs(self, inventory_ids: List[str]) -> int:
+        """Delete OpenSearch documents for the assets from both indexes.
 
         Deletes from:
         1. 'media' index: Master documents (InventoryID) and any legacy Marengo 2.7/3.0 docs
         2. 'asset-embeddings' index: Marengo 3.0 embedding documents (inventory_id)
+
+        Runs one delete_by_query per index for every OPENSEARCH_DELETE_BATCH_SIZE
+        assets rather than one per asset.
         """
         if not OPENSEARCH_ENDPOINT:
             self.logger.info(
@@ -452,41 +628,47 @@ class AssetDeletionService:
             )
             return 0
 
-        total_deleted = 0
+        media_deleted = 0
+        embeddings_deleted = 0
         host = OPENSEARCH_ENDPOINT.lstrip("https://").lstrip("http://")
 
-        # Delete from 'media' index - master documents and any embeddings stored there
-        media_deleted = self._delete_from_opensearch_index(
-            host=host,
-            index_name=INDEX_NAME,
-            inventory_id=inventory_id,
-            query={
-                "query": {
-                    "bool": {
-                        "should": [
-                            {"match_phrase": {"InventoryID": inventory_id}},
-                            {"match_phrase": {"inventory_id": inventory_id}},
-                        ],
-                        "minimum_should_match": 1,
-                    }
-                }
-            },
-        )
-        total_deleted += media_deleted
+        for start in range(0, len(inventory_ids), OPENSEARCH_DELETE_BATCH_SIZE):
+            batch = inventory_ids[start : start + OPENSEARCH_DELETE_BATCH_SIZE]
+            label = batch[0] if len(batch) == 1 else f"{len(batch)} assets"
 
-        # Delete from 'asset-embeddings' index - Marengo 3.0 embedding documents
-        if ASSET_EMBEDDINGS_INDEX:
-            embeddings_deleted = self._delete_from_opensearch_index(
+            # 'media' index - master documents and any embeddings stored there
+            media_deleted += self._delete_from_opensearch_index(
                 host=host,
-                index_name=ASSET_EMBEDDINGS_INDEX,
-                inventory_id=inventory_id,
-                query={"query": {"term": {"inventory_id": inventory_id}}},
+                index_name=INDEX_NAME,
+                inventory_id=label,
+                query={
+                    "query": {
+                        "bool": {
+                            "should": [
+                                {"match_phrase": {field: inventory_id}}
+                                for inventory_id in batch
+                                for field in ("InventoryID", "inventory_id")
+                            ],
+                            "minimum_should_match": 1,
+                        }
+                    }
+                },
             )
-            total_deleted += embeddings_deleted
 
+            # 'asset-embeddings' index - Marengo 3.0 embedding documents
+            if ASSET_EMBEDDINGS_INDEX:
+                embeddings_deleted += self._delete_from_opensearch_index(
+                    host=host,
+                    index_name=ASSET_EMBEDDINGS_INDEX,
+                    inventory_id=label,
+                    query={"query": {"terms": {"inventory_id": batch}}},
+                )
+
+        total_deleted = media_deleted + embeddings_deleted
         self.logger.info(
-            f"[INDEX DELETION] Total deleted {total_deleted} OpenSearch documents for {inventory_id} "
-            f"(media: {media_deleted}, asset-embeddings: {embeddings_deleted if ASSET_EMBEDDINGS_INDEX else 0})"
+            f"[INDEX DELETION] Total deleted {total_deleted} OpenSearch documents for "
+            f"{len(inventory_ids)} asset(s) "
+            f"(media: {media_deleted}, asset-embeddings: {embeddings_deleted})"
         )
         self.metrics.add_metric(
             "OpenSearchDocsDeleted", MetricUnit.Count, total_deleted
@@ -555,63 +737,53 @@ class AssetDeletionService:
             # Don't fail the entire deletion for OpenSearch errors
             return 0
 
+    @staticmethod
+    def _vector_client():
+        # Configure retry strategy for transient errors
+        retry_config = Config(
+            retries={
+                "max_attempts": 10,
+                "mode": "adaptive",
+            },
+            connect_timeout=5,
+            read_timeout=60,
+            max_pool_connections=DELETION_CONCURRENCY,
+        )
+        return boto3.client("s3vectors", region_name=AWS_REGION, config=retry_config)
+
     @tracer.capture_method
-    def _delete_s3_vectors(self, inventory_id: str) -> int:
-        """Delete S3 vectors associated with the asset"""
+    def _delete_s3_vectors(self, inventory_id: str, client=None) -> int:
+        """Delete S3 vectors associated with the asset
+
+        Args:
+            inventory_id: The asset's inventory ID
+            client: Optional s3vectors client shared across a batch (clients
+                are thread-safe)
+        """
         if not VECTOR_BUCKET_NAME:
             self.logger.info("VECTOR_BUCKET_NAME not set, skipping vector deletion")
             return 0
 
         try:
-            # Configure retry strategy for transient errors
-            retry_config = Config(
-                retries={
-                    "max_attempts": 10,
-                    "mode": "adaptive",
-                },
-                connect_timeout=5,
-                read_timeout=60,
-            )
+            client = client or self._vector_client()
 
-            client = boto3.client(
-                "s3vectors", region_name=AWS_REGION, config=retry_config
+            registry = VectorKeyRegistry(
+                VECTOR_BUCKET_NAME, VECTOR_INDEX_NAME, dynamodb=_thread_dynamodb()
+            )
+            vectors_to_delete = find_vector_keys(
+                registry,
+                client,
+                inventory_id,
+                on_scan=lambda: self.metrics.add_metric(
+                    "VectorIndexScans", MetricUnit.Count, 1
+                ),
             )
-
-            # Find vectors by metadata
-            vectors_to_delete = []
-            next_token = None
-
-            while True:
-                params = {
-                    "vectorBucketName": VECTOR_BUCKET_NAME,
-                    "indexName": VECTOR_INDEX_NAME,
-                    "returnMetadata": True,
-                    "maxResults": 500,
-                }
-
-                if next_token:
-                    params["nextToken"] = next_token
-
-                response = client.list_vectors(**params)
-
-                for vector in response.get("vectors", []):
-                    metadata = vector.get("metadata", {})
-                    if (
-                        isinstance(metadata, dict)
-                        and metadata.get("inventory_id") == inventory_id
-                    ):
-                        vectors_to_delete.append(vector["key"])
-
-                next_token = response.get("nextToken")
-                if not next_token:
-                    break
 
             if vectors_to_delete:
-                client.delete_vectors(
-                    vectorBucketName=VECTOR_BUCKET_NAME,
-                    indexName=VECTOR_INDEX_NAME,
-                    keys=vectors_to_delete,
+                delete_vector_keys(
+                    client, VECTOR_BUCKET_NAME, VECTOR_INDEX_NAME, vectors_to_delete
                 )
+                registry.forget(inventory_id, vectors_to_delete)
                 self.logger.info(
                     f"Deleted {len(vectors_to_delete)} vectors for {inventory_id}"
                 )
@@ -656,6 +828,77 @@ class AssetDeletionService:
                 f"Failed to delete DynamoDB record: {e}", inventory_id
             )
 
+    @tracer.capture_method
+    def _delete_dynamodb_records(
+        self, inventory_ids: List[str], results: Dict[str, DeletionResult]
+    ) -> None:
+        """Delete several asset records through a batch writer"""
+        if not inventory_ids:
+            return
+        try:
+            with self.table.batch_writer() as batch:
+                for inventory_id in inventory_ids:
+                    batch.delete_item(Key={"InventoryID": inventory_id})
+        except ClientError as e:
+            self.logger.error(f"DynamoDB batch deletion error: {e}")
+            for inventory_id in inventory_ids:
+                results[inventory_id].error = f"Failed to delete DynamoDB record: {e}"
+            return
+
+        for inventory_id in inventory_ids:
+            results[inventory_id].dynamodb_deleted = True
+        self.logger.info(f"Deleted {len(inventory_ids)} DynamoDB records")
+        self.metrics.add_metric(
+            "DynamoDBRecordsDeleted", MetricUnit.Count, len(inventory_ids)
+        )
+
+    @tracer.capture_method
+    def _publish_deletion_events(self, inventory_ids: List[str]) -> List[str]:
+        """Publish deletion events in PutEvents batches.
+
+        Returns:
+            The inventory IDs whose events were accepted
+        """
+        published = []
+        for start in range(0, len(inventory_ids), EVENTBRIDGE_BATCH_SIZE):
+            batch = inventory_ids[start : start + EVENTBRIDGE_BATCH_SIZE]
+            try:
+                response = eventbridge.put_events(
+                    Entries=[self._deletion_event_entry(i) for i in batch]
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to publish deletion events: {e}")
+                # Don't fail the entire deletion for event publishing errors
+                continue
+            for inventory_id, entry in zip(batch, response.get("Entries", [])):
+                if entry.get("ErrorCode"):
+                    self.logger.error(
+                        f"Failed to publish deletion event for {inventory_id}: "
+                        f"{entry.get('ErrorCode')} {entry.get('ErrorMessage')}"
+                    )
+                else:
+                    published.append(inventory_id)
+        self.logger.info(
+            f"Published {len(published)} deletion events",
+            extra={"event_bus": EVENT_BUS_NAME or "default"},
+        )
+        return published
+
+    def _deletion_event_entry(self, inventory_id: str) -> Dict[str, Any]:
+        entry = {
+            "Source": "medialake.assets",
+            "DetailType": "AssetDeleted",
+            "Detail": json.dumps(
+                {
+                    "inventoryId": inventory_id,
+                    "timestamp": self._get_timestamp(),
+                }
+            ),
+        }
+        if EVENT_BUS_NAME:
+            entry["EventBusName"] = EVENT_BUS_NAME
+        return entry
+
     @tracer.capture_method
     def _publish_deletion_event(self, inventory_id: str) -> None:
         """Publish asset deletion event to EventBridge.
@@ -665,20 +908,7 @@ class AssetDeletionService:
         rules. Falls back to the default bus when the variable is unset.
         """
         try:
-            entry = {
-                "Source": "medialake.assets",
-                "DetailType": "AssetDeleted",
-                "Detail": json.dumps(
-                    {
-                        "inventoryId": inventory_id,
-                        "timestamp": self._get_timestamp(),
-                    }
-                ),
-            }
-            if EVENT_BUS_NAME:
-                entry["EventBusName"] = EVENT_BUS_NAME
-
-            eventbridge.put_events(Entries=[entry])
+            eventbridge.put_events(Entries=[self._deletion_event_entry(inventory_id)])
             self.logger.info(
                 f"Published deletion event for {inventory_id}",
                 extra={"event_bus": EVENT_BUS_NAME or "default"},
@@ -37,6 +37,20 @@ ASSET_SK_PREFIX = "ASSET#"
 RULE_SK_PREFIX = "RULE#"
 PERM_SK_PREFIX = "PERM#"
 
+# GSI7 (AssetMembershipGSI) - asset -> every collection item row for it,
+# across full-file, clip and legacy ITEM# rows. Keys-only; used by the
+# asset-deleted cleanup consumer.
+ASSET_MEMBERSHIP_GSI = "AssetMembershipGSI"
+
+
+def asset_membership_keys(asset_id: str, collection_id: str) -> Dict[str, str]:
+    """GSI7 key attributes for a collection item row referencing asset_id."""
+    return {
+        "GSI7_PK": f"{ASSET_SK_PREFIX}{asset_id}",
+        "GSI7_SK": f"{COLLECTION_PK_PREFIX}{collection_id}",
+    }
+
+
 # Valid collection statuses
 VALID_COLLECTION_STATUSES = ["ACTIVE", "ARCHIVED", "DELETED"]
 ACTIVE_STATUS = "ACTIVE"
@@ -0,0 +1,192 @@
+"""
+Content fingerprints for duplicate and replacement detection.
+
+The fingerprint of an object is the MD5 of its content, stored as FileHash and
+used as the duplicate-detection key everywhere. Hashing means reading all of
+the object, so it is avoided where HeadObject (with ChecksumMode=ENABLED)
+already settles the value:
+
+    ETag        of a single-part upload without SSE-KMS/SSE-C is the MD5 of
+                the content
+    checksum    a full-object SHA256, SHA1 or CRC64NVME checksum (stored as
+                FileChecksum) equal to the one recorded for the same object
+                means its content is unchanged, so the recorded MD5 is reused
+
+Otherwise the object is hashed. S3 checksums are never compared across
+objects: they differ by upload type, and a CRC is not collision-resistant
+enough to deduplicate on.
+"""
+
+import base64
+import hashlib
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, NamedTuple, Optional
+
+from aws_lambda_powertools import Logger
+
+logger = Logger(service="content-fingerprint", child=True)
+
+SOURCE_ETAG = "etag"
+SOURCE_CHECKSUM = "checksum"
+SOURCE_HASH = "hash"
+
+# Full-object checksums in order of preference, with their HeadObject field
+_CHECKSUM_FIELDS = (
+    ("sha256", "ChecksumSHA256"),
+    ("sha1", "ChecksumSHA1"),
+    ("crc64nvme", "ChecksumCRC64NVME"),
+)
+
+# Hashing reads HASH_PART_SIZE_BYTES ranges, up to HASH_CONCURRENCY of them in
+# flight; at 1 the object is streamed with a single GetObject
+HASH_PART_SIZE_BYTES = int(
+    os.environ.get("FINGERPRINT_HASH_PART_SIZE_BYTES", str(16 * 1024 * 1024))
+)
+HASH_CONCURRENCY = int(os.environ.get("FINGERPRINT_HASH_CONCURRENCY", "1"))
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+_KMS_ENCRYPTION = ("aws:kms", "aws:kms:dsse")
+
+
+class Fingerprint(NamedTuple):
+    md5: str
+    checksum: Optional[str]
+    source: str
+
+
+def fingerprint_object(
+    s3_client,
+    bucket: str,
+    key: str,
+    head: Dict[str, Any],
+    known: Optional[Dict[str, Any]] = None,
+) -> Fingerprint:
+    """
+    MD5 fingerprint of an object, reading its content only when needed.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket: Bucket name
+        key: Object key
+        head: HeadObject response for the object, requested with
+            ChecksumMode="ENABLED" so checksums are included
+        known: Asset record previously stored for this same object; its
+            FileHash is reused when its FileChecksum still matches
+
+    Returns:
+        Fingerprint(md5, checksum, source); checksum is None when S3 has no
+        full-object checksum for the object
+    """
+    checksum = content_checksum(head)
+    if (
+        known
+        and checksum
+        and known.get("FileHash")
+        and known.get("FileChecksum") == checksum
+    ):
+        return Fingerprint(known["FileHash"], checksum, SOURCE_CHECKSUM)
+
+    md5 = _etag_md5(head)
+    if md5:
+        return Fingerprint(md5, checksum, SOURCE_ETAG)
+    return Fingerprint(
+        _hash_object(s3_client, bucket, key, head), checksum, SOURCE_HASH
+    )
+
+
+def content_checksum(head: Dict[str, Any]) -> Optional[str]:
+    """Full-object checksum from a HeadObject response, prefixed with its type.
+
+    Composite checksums of multipart uploads depend on the part layout rather
+    than the content and are not used; CRC64NVME also carries the size.
+    """
+    if head.get("ChecksumType", "FULL_OBJECT") != "FULL_OBJECT":
+        return None
+    for name, field in _CHECKSUM_FIELDS:
+        checksum = head.get(field)
+        if not checksum or "-" in checksum:
+            continue
+        digest = base64.b64decode(checksum).hex()
+        if name == "crc64nvme":
+            return f"{name}:{head.get('ContentLength', 0)}:{digest}"
+        return f"{name}:{digest}"
+    return None
+
+
+def _etag_md5(head: Dict[str, Any]) -> Optional[str]:
+    """Content MD5 from the ETag, when the ETag is one."""
+    etag = head.get("ETag", "").strip('"')
+    if (
+        len(etag) != 32
+        or "-" in etag
+        or head.get("ServerSideEncryption") in _KMS_ENCRYPTION
+        or head.get("SSECustomerAlgorithm")
+    ):
+        return None
+    return etag.lower()
+
+
+def _hash_object(s3_client, bucket: str, key: str, head: Dict[str, Any]) -> str:
+    digest = hashlib.md5(usedforsecurity=False)
+    size = head.get("ContentLength", 0)
+    # A body that changes while it is read fails the read instead of
+    # producing a hash of neither version
+    etag = head.get("ETag")
+
+    if HASH_CONCURRENCY <= 1 or size <= HASH_PART_SIZE_BYTES:
+        params = {"Bucket": bucket, "Key": key}
+        if etag:
+            params["IfMatch"] = etag
+        body = s3_client.get_object(**params)["Body"]
+        for chunk in body.iter_chunks(STREAM_CHUNK_BYTES):
+            digest.update(chunk)
+    else:
+        _hash_ranges(s3_client, bucket, key, size, etag, digest)
+
+    logger.info(
+        "Hashed object for fingerprint",
+        extra={"object": f"s3://{bucket}/{key}", "size_bytes": size},
+    )
+    return digest.hexdigest()
+
+
+def _hash_ranges(
+    s3_client, bucket: str, key: str, size: int, etag: Optional[str], digest
+) -> None:
+    """
+    Feed an object to digest with parallel ranged reads.
+
+    Digests consume bytes in order, so ranges are fetched ahead by a bounded
+    window and applied as they come up; memory use is about
+    HASH_CONCURRENCY * HASH_PART_SIZE_BYTES.
+    """
+
+    def read(start: int, end: int) -> bytes:
+        params = {"Bucket": bucket, "Key": key, "Range": f"bytes={start}-{end}"}
+        if etag:
+            params["IfMatch"] = etag
+        return s3_client.get_object(**params)["Body"].read()
+
+    ranges = iter(
+        (start, min(start + HASH_PART_SIZE_BYTES, size) - 1)
+        for start in range(0, size, HASH_PART_SIZE_BYTES)
+    )
+    with ThreadPoolExecutor(max_workers=HASH_CONCURRENCY) as executor:
+        pending = deque(
+            executor.submit(read, start, end)
+            for start, end in itertools.islice(ranges, HASH_CONCURRENCY)
+        )
+        try:
+            while pending:
+                data = pending.popleft().result()
+                next_range = next(ranges, None)
+                if next_range:
+                    pending.append(executor.submit(read, *next_range))
+                digest.update(data)
+        except Exception:
+            for future in pending:
+                future.cancel()
+            raise
@@ -0,0 +1,170 @@
+"""
+Shared HTTP session for outbound integration calls.
+
+Bare requests.get/post open a new TCP + TLS connection to the partner API on
+every call. get_http_session returns one requests.Session per container whose
+connections to each host stay open between requests and invocations, with
+one timeout and retry policy for every integration:
+
+- requests without a timeout get a connect timeout, but no read timeout
+  unless HTTP_READ_TIMEOUT_SECONDS is set for the function, since partner
+  operations can legitimately take minutes to answer;
+- connect failures are retried for any method, since nothing was sent;
+- 429/500/502/503/504 responses and read errors are retried for idempotent
+  methods, and 429 also for POST because a throttled request was not
+  processed;
+- Retry-After is honoured (capped at HTTP_MAX_RETRY_AFTER_SECONDS),
+  exponential backoff otherwise;
+- once retries run out the last response is returned, so callers keep
+  handling error statuses themselves.
+
+Every request emits an HttpRequestLatency metric with Host and
+ConnectionReused dimensions, so the handshake cost saved shows up as the
+latency gap between the two. This module needs `requests` in the function's
+own requirements; the layer itself has no third-party dependencies.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import requests
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import MetricUnit, single_metric
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+logger = Logger(service="http-client", child=True)
+
+METRICS_NAMESPACE = os.environ.get("HTTP_CLIENT_METRICS_NAMESPACE", "MediaLake/Http")
+
+# Host pools kept per container, and connections kept per host
+POOL_HOSTS = int(os.environ.get("HTTP_POOL_HOSTS", "10"))
+POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "16"))
+
+CONNECT_TIMEOUT_SECONDS = float(os.environ.get("HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+# Unset means no read timeout; integration nodes set it per node from
+# read_timeout_seconds in their YAML
+READ_TIMEOUT_SECONDS = (
+    float(os.environ["HTTP_READ_TIMEOUT_SECONDS"])
+    if os.environ.get("HTTP_READ_TIMEOUT_SECONDS")
+    else None
+)
+
+MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", "3"))
+BACKOFF_FACTOR = float(os.environ.get("HTTP_BACKOFF_FACTOR", "0.5"))
+MAX_RETRY_AFTER_SECONDS = float(os.environ.get("HTTP_MAX_RETRY_AFTER_SECONDS", "30"))
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Connections opened by the current thread's request; urllib3 opens them on
+# the thread that sends the request
+_local = threading.local()
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+class _IntegrationRetry(Retry):
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method.upper() == "POST" and status_code == 429:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def sleep_for_retry(self, response=None) -> bool:
+        retry_after = self.get_retry_after(response) if response else None
+        if retry_after:
+            time.sleep(min(retry_after, MAX_RETRY_AFTER_SECONDS))
+            return True
+        return False
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _local.new_connections = getattr(_local, "new_connections", 0) + 1
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _local.new_connections = getattr(_local, "new_connections", 0) + 1
+        return super()._new_conn()
+
+
+class _PooledAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+class _InstrumentedSession(requests.Session):
+    """Session that applies the default timeouts and records each request.
+
+    A caller's own timeout always wins, so nodes that know how long their
+    partner takes pass it explicitly.
+    """
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = (CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS)
+        _local.new_connections = 0
+        started = time.perf_counter()
+        try:
+            return super().request(method, url, *args, **kwargs)
+        finally:
+            _record_request(
+                urlparse(url).hostname or "unknown",
+                (time.perf_counter() - started) * 1000,
+                _local.new_connections == 0,
+            )
+
+
+def _record_request(host: str, latency_ms: float, reused: bool) -> None:
+    try:
+        with single_metric(
+            name="HttpRequestLatency",
+            unit=MetricUnit.Milliseconds,
+            value=latency_ms,
+            namespace=METRICS_NAMESPACE,
+        ) as metric:
+            metric.add_dimension(name="Host", value=host)
+            metric.add_dimension(name="ConnectionReused", value=str(reused).lower())
+    except Exception as e:
+        # Metrics must never fail the call they describe
+        logger.debug(f"Failed to record HTTP metrics: {e}")
+
+
+def _build_session() -> requests.Session:
+    retry = _IntegrationRetry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=MAX_RETRIES,
+        status=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = _PooledAdapter(
+        pool_connections=POOL_HOSTS, pool_maxsize=POOL_MAXSIZE, max_retries=retry
+    )
+    session = _InstrumentedSession()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """The container-wide pooled session; safe to share between threads."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
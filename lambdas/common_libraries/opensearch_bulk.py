@@ -0,0 +1,64 @@
+"""Size-bounded batching of OpenSearch ``_bulk`` actions.
+
+OpenSearch rejects ``_bulk`` bodies larger than the domain's HTTP request
+limit, and very long requests hold a write thread for their whole duration.
+``chunk_bulk_actions`` splits a list of ``streaming_bulk`` actions into
+groups bounded both by action count (BULK_BATCH_SIZE) and by serialized size
+(MAX_BULK_SIZE_MB), keeping the actions in their original order.
+"""
+
+import json
+import os
+from typing import List, Optional, Type
+
+BULK_BATCH_SIZE = int(os.environ.get("BULK_BATCH_SIZE", "500"))
+MAX_BULK_SIZE_MB = int(os.environ.get("MAX_BULK_SIZE_MB", "5"))
+
+
+def chunk_bulk_actions(
+    actions: List[dict],
+    max_actions: Optional[int] = None,
+    max_size_mb: Optional[int] = None,
+    json_encoder: Optional[Type[json.JSONEncoder]] = None,
+) -> List[List[dict]]:
+    """
+    Split bulk actions into chunks based on size and count limits.
+
+    An action larger than the size limit on its own becomes a chunk of one,
+    so OpenSearch reports it as a per-item failure instead of it being lost.
+
+    Args:
+        actions: streaming_bulk actions, in the order they should be sent
+        max_actions: Actions per chunk (default: BULK_BATCH_SIZE)
+        max_size_mb: Serialized megabytes per chunk (default: MAX_BULK_SIZE_MB)
+        json_encoder: JSON encoder for action bodies, e.g. for Decimal values
+
+    Returns:
+        List of action chunks
+    """
+    max_actions = max_actions or BULK_BATCH_SIZE
+    max_size_bytes = (max_size_mb or MAX_BULK_SIZE_MB) * 1024 * 1024
+
+    chunks = []
+    current_chunk = []
+    current_size = 0
+
+    for action in actions:
+        action_size = len(json.dumps(action, cls=json_encoder).encode("utf-8"))
+
+        if (
+            len(current_chunk) >= max_actions
+            or current_size + action_size > max_size_bytes
+        ):
+            if current_chunk:
+                chunks.append(current_chunk)
+                current_chunk = []
+                current_size = 0
+
+        current_chunk.append(action)
+        current_size += action_size
+
+    if current_chunk:
+        chunks.append(current_chunk)
+
+    return chunks
@@ -0,0 +1,211 @@
+"""
+Distributed admission control for pipeline executions.
+
+Every pipeline state machine gets a counting semaphore in the pipeline
+concurrency table, shared by all of its trigger Lambda containers:
+
+    PK=SEM#{stateMachineArn} SK=COUNT               — inFlight counter
+    PK=SEM#{stateMachineArn} SK=LEASE#{executionId} — one item per admitted
+                                                      execution
+
+The trigger acquires a slot (counter increment + lease, in one transaction
+conditional on the counter being below the limit) before starting an
+execution under a pre-generated name. The executions event processor releases
+the slot when that execution reaches a terminal status. Deleting the lease in
+the same transaction as the decrement makes release idempotent, so duplicate
+terminal events and executions that were never admitted (manual retries,
+redrives) leave the counter untouched.
+
+Leases older than the lease timeout are reclaimed when a semaphore is full, so
+a lost terminal event cannot leak a slot forever.
+"""
+
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+import boto3
+from aws_lambda_powertools import Logger
+
+logger = Logger(child=True)
+
+COUNT_SK = "COUNT"
+LEASE_PREFIX = "LEASE#"
+DEFAULT_LEASE_TIMEOUT_SECONDS = 24 * 60 * 60
+
+
+def semaphore_key(state_machine_arn: str) -> str:
+    return f"SEM#{state_machine_arn}"
+
+
+def new_execution_name() -> str:
+    """Execution name chosen before admission so the lease can be keyed by it."""
+    return str(uuid.uuid4())
+
+
+class ExecutionSemaphore:
+    """
+    DynamoDB-backed counting semaphore for one state machine.
+
+    Uses a plain low-level client: transactions need raw attribute values,
+    which the resource layer would re-serialize.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        state_machine_arn: str,
+        limit: int,
+        lease_timeout_seconds: int = DEFAULT_LEASE_TIMEOUT_SECONDS,
+        client=None,
+    ):
+        self.table_name = table_name
+        self.state_machine_arn = state_machine_arn
+        self.limit = limit
+        self.lease_timeout_seconds = lease_timeout_seconds
+        self._client = client or boto3.client("dynamodb")
+        self._pk = semaphore_key(state_machine_arn)
+
+    def try_acquire(self, execution_name: str) -> bool:
+        """
+        Take a slot for execution_name.
+
+        Returns:
+            True if a slot was taken, False if the semaphore is full
+        """
+        now = int(time.time())
+        try:
+            self._client.transact_write_items(
+                TransactItems=[
+                    {
+                        "Update": {
+                            "TableName": self.table_name,
+                            "Key": {
+                                "PK": {"S": self._pk},
+                                "SK": {"S": COUNT_SK},
+                            },
+                            "UpdateExpression": (
+                                "ADD inFlight :one "
+                                "SET maxConcurrency = :limit, updatedAt = :now"
+                            ),
+                            "ConditionExpression": (
+                                "attribute_not_exists(inFlight) OR inFlight < :limit"
+                            ),
+                            "ExpressionAttributeValues": {
+                                ":one": {"N": "1"},
+                                ":limit": {"N": str(self.limit)},
+                                ":now": {"N": str(now)},
+                            },
+                        }
+                    },
+                    {
+                        "Put": {
+                            "TableName": self.table_name,
+                            "Item": {
+                                "PK": {"S": self._pk},
+                                "SK": {"S": f"{LEASE_PREFIX}{execution_name}"},
+                                "acquiredAt": {"N": str(now)},
+                                "expiresAt": {
+                                    "N": str(now + self.lease_timeout_seconds)
+                                },
+                            },
+                            "ConditionExpression": "attribute_not_exists(SK)",
+                        }
+                    },
+                ]
+            )
+            return True
+        except self._client.exceptions.TransactionCanceledException as e:
+            reasons = [
+                r.get("Code") for r in e.response.get("CancellationReasons", [])
+            ]
+            if reasons and reasons[0] == "ConditionalCheckFailed":
+                return False
+            raise
+
+    def release(self, execution_name: str) -> bool:
+        """
+        Give back the slot held by execution_name.
+
+        Returns:
+            True if a slot was released, False if the execution held none
+        """
+        try:
+            self._client.transact_write_items(
+                TransactItems=[
+                    {
+                        "Delete": {
+                            "TableName": self.table_name,
+                            "Key": {
+                                "PK": {"S": self._pk},
+                                "SK": {"S": f"{LEASE_PREFIX}{execution_name}"},
+                            },
+                            "ConditionExpression": "attribute_exists(SK)",
+                        }
+                    },
+                    {
+                        "Update": {
+                            "TableName": self.table_name,
+                            "Key": {
+                                "PK": {"S": self._pk},
+                                "SK": {"S": COUNT_SK},
+                            },
+                            "UpdateExpression": (
+                                "ADD inFlight :minus_one SET updatedAt = :now"
+                            ),
+                            "ConditionExpression": "inFlight > :zero",
+                            "ExpressionAttributeValues": {
+                                ":minus_one": {"N": "-1"},
+                                ":zero": {"N": "0"},
+                                ":now": {"N": str(int(time.time()))},
+                            },
+                        }
+                    },
+                ]
+            )
+            return True
+        except self._client.exceptions.TransactionCanceledException:
+            return False
+
+    def in_flight(self) -> Optional[int]:
+        """Current number of admitted executions (eventually consistent)."""
+        item = self._client.get_item(
+            TableName=self.table_name,
+            Key={"PK": {"S": self._pk}, "SK": {"S": COUNT_SK}},
+            ProjectionExpression="inFlight",
+        ).get("Item")
+        if not item or "inFlight" not in item:
+            return None
+        return int(item["inFlight"]["N"])
+
+    def reclaim_expired(self) -> int:
+        """Release leases past their timeout; returns how many were reclaimed."""
+        now = str(int(time.time()))
+        reclaimed = 0
+        params: Dict[str, Any] = {
+            "TableName": self.table_name,
+            "KeyConditionExpression": "PK = :pk AND begins_with(SK, :lease)",
+            "FilterExpression": "expiresAt < :now",
+            "ProjectionExpression": "SK",
+            "ExpressionAttributeValues": {
+                ":pk": {"S": self._pk},
+                ":lease": {"S": LEASE_PREFIX},
+                ":now": {"N": now},
+            },
+        }
+        while True:
+            response = self._client.query(**params)
+            for item in response.get("Items", []):
+                execution_name = item["SK"]["S"][len(LEASE_PREFIX) :]
+                if self.release(execution_name):
+                    reclaimed += 1
+                    logger.warning(
+                        "Reclaimed expired execution lease",
+                        extra={
+                            "state_machine_arn": self.state_machine_arn,
+                            "execution_name": execution_name,
+                        },
+                    )
+            if "LastEvaluatedKey" not in response:
+                return reclaimed
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
@@ -0,0 +1,96 @@
+"""
+Secondary index layout of the pipeline executions table.
+
+The executions list is served from GSIs instead of table scans, so every page
+is a bounded Query no matter how many executions the table holds:
+
+    startMonth-startTime-index     start_month / start_time — newest first
+                                   listing, one partition per UTC month
+    status-startTime-index         status / start_time
+    pipelineName-startTime-index   pipeline_name / start_time
+    startMonth-objectKey-index     start_month / object_key_name_lower —
+                                   object name prefix search (sparse)
+    traceId-startTime-index        pipeline_trace_id / start_time — parent
+                                   lookup in the event processor (sparse,
+                                   projects TRACE_INHERITED_FIELDS only)
+
+start_month and object_key_name_lower are derived attributes written by the
+executions event processor alongside every item (see index_attributes).
+Executions recorded before they existed are picked up by the
+pipeline_executions_index_backfill Lambda.
+"""
+
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, FrozenSet, List
+
+START_MONTH_INDEX = "startMonth-startTime-index"
+STATUS_INDEX = "status-startTime-index"
+PIPELINE_NAME_INDEX = "pipelineName-startTime-index"
+OBJECT_KEY_INDEX = "startMonth-objectKey-index"
+TRACE_ID_INDEX = "traceId-startTime-index"
+
+# Order in which an existing table gains the indexes: CloudFormation creates
+# one GSI per table update, so the stack adds them over several deploys
+EXECUTIONS_TABLE_INDEXES = (
+    TRACE_ID_INDEX,
+    START_MONTH_INDEX,
+    STATUS_INDEX,
+    PIPELINE_NAME_INDEX,
+    OBJECT_KEY_INDEX,
+)
+
+START_MONTH_ATTRIBUTE = "start_month"
+OBJECT_KEY_LOWER_ATTRIBUTE = "object_key_name_lower"
+
+# Asset fields a child execution inherits from the first execution of its trace
+TRACE_INHERITED_FIELDS = ("inventory_id", "dsa_type", "object_key_name")
+
+# Step Functions execution statuses, in the order used when sorting by status
+EXECUTION_STATUSES = (
+    "ABORTED",
+    "FAILED",
+    "PENDING_REDRIVE",
+    "RUNNING",
+    "SUCCEEDED",
+    "TIMED_OUT",
+)
+
+
+def start_month(start_time: int) -> str:
+    """UTC month bucket ("YYYY-MM") for a unix start time."""
+    return datetime.fromtimestamp(int(start_time), tz=timezone.utc).strftime("%Y-%m")
+
+
+def recent_months(count: int, now: datetime = None) -> List[str]:
+    """The last count month buckets, newest first, including the current one."""
+    now = now or datetime.now(timezone.utc)
+    year, month = now.year, now.month
+    months = []
+    for _ in range(count):
+        months.append(f"{year:04d}-{month:02d}")
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    return months
+
+
+def deployed_indexes() -> FrozenSet[str]:
+    """
+    The GSIs the stack has created so far, from EXECUTIONS_TABLE_INDEXES.
+
+    Readers fall back to table scans for the ones still missing.
+    """
+    value = os.environ.get("EXECUTIONS_TABLE_INDEXES")
+    if value is None:
+        return frozenset(EXECUTIONS_TABLE_INDEXES)
+    return frozenset(name for name in value.split(",") if name)
+
+
+def index_attributes(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Derived GSI key attributes for an executions table item."""
+    attributes = {START_MONTH_ATTRIBUTE: start_month(item["start_time"])}
+    object_key_name = item.get("object_key_name")
+    if object_key_name:
+        attributes[OBJECT_KEY_LOWER_ATTRIBUTE] = str(object_key_name).lower()
+    return attributes
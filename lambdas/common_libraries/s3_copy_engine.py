@@ -0,0 +1,286 @@
+"""
+Server-side S3 copy and batched delete helpers.
+
+CopyObject is a single request that is capped at 5 GB and copies at the speed
+of one stream, so large masters are copied with a multipart upload whose parts
+are filled by parallel UploadPartCopy requests. Every part is pinned to the
+source ETag (CopySourceIfMatch) so a source overwritten mid-copy fails the
+copy instead of producing a mixed object, and a failed copy aborts its
+multipart upload so no orphaned parts are left behind.
+
+Objects below S3_MULTIPART_COPY_THRESHOLD_BYTES keep using CopyObject, which
+is one request and carries metadata over on its own.
+
+Deletes go through DeleteObjects, 1000 keys per request per bucket.
+"""
+
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import boto3
+from aws_lambda_powertools import Logger
+from botocore.config import Config
+
+logger = Logger(service="s3-copy-engine", child=True)
+
+MULTIPART_THRESHOLD_BYTES = int(
+    os.environ.get("S3_MULTIPART_COPY_THRESHOLD_BYTES", str(256 * 1024 * 1024))
+)
+PART_SIZE_BYTES = int(
+    os.environ.get("S3_MULTIPART_COPY_PART_SIZE_BYTES", str(128 * 1024 * 1024))
+)
+PART_CONCURRENCY = int(os.environ.get("S3_MULTIPART_COPY_CONCURRENCY", "16"))
+
+# S3 multipart limits
+MIN_PART_SIZE_BYTES = 5 * 1024 * 1024
+MAX_PARTS = 10000
+DELETE_BATCH_SIZE = 1000
+
+# Progress is logged each time another PROGRESS_STEP_PERCENT of a multipart
+# copy completes
+PROGRESS_STEP_PERCENT = 10
+
+# Headers CopyObject carries over from the source that CreateMultipartUpload
+# has to be given explicitly
+_CARRIED_HEADERS = (
+    "ContentType",
+    "ContentDisposition",
+    "ContentEncoding",
+    "ContentLanguage",
+    "CacheControl",
+    "Expires",
+    "Metadata",
+)
+
+# Clients are thread-safe; the pool is sized for the part workers of a couple
+# of concurrent multipart copies
+s3 = boto3.client(
+    "s3",
+    config=Config(
+        max_pool_connections=max(10, PART_CONCURRENCY * 2),
+        retries={"max_attempts": 10, "mode": "adaptive"},
+    ),
+)
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def part_ranges(size: int, part_size: int = None) -> List[Tuple[int, int]]:
+    """
+    Inclusive byte ranges covering an object of the given size.
+
+    The part size is raised when needed to stay within the 10,000 part limit.
+    """
+    part_size = max(part_size or PART_SIZE_BYTES, MIN_PART_SIZE_BYTES)
+    part_size = max(part_size, math.ceil(size / MAX_PARTS))
+    return [
+        (start, min(start + part_size, size) - 1) for start in range(0, size, part_size)
+    ]
+
+
+def copy_object(
+    source_bucket: str,
+    source_key: str,
+    dest_bucket: str,
+    dest_key: str,
+    tagging: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    """
+    Server-side copy of one object, multipart for large objects.
+
+    Args:
+        source_bucket: Source bucket name
+        source_key: Source object key
+        dest_bucket: Destination bucket name
+        dest_key: Destination object key
+        tagging: URL-encoded tag set for the copy; source tags are kept if None
+        progress: Called with (bytes_copied, total_bytes) as parts complete
+
+    Returns:
+        Size of the copied object in bytes
+
+    Raises:
+        ClientError: If any S3 request fails
+    """
+    head = s3.head_object(Bucket=source_bucket, Key=source_key)
+    size = head["ContentLength"]
+
+    if size < MULTIPART_THRESHOLD_BYTES:
+        params: Dict[str, Any] = {
+            "Bucket": dest_bucket,
+            "Key": dest_key,
+            "CopySource": {"Bucket": source_bucket, "Key": source_key},
+            "CopySourceIfMatch": head["ETag"],
+        }
+        if tagging is not None:
+            params["TaggingDirective"] = "REPLACE"
+            params["Tagging"] = tagging
+        s3.copy_object(**params)
+        if progress:
+            progress(size, size)
+        return size
+
+    _multipart_copy(
+        source_bucket, source_key, dest_bucket, dest_key, head, tagging, progress
+    )
+    return size
+
+
+def _multipart_copy(
+    source_bucket: str,
+    source_key: str,
+    dest_bucket: str,
+    dest_key: str,
+    head: Dict[str, Any],
+    tagging: Optional[str],
+    progress: Optional[ProgressCallback],
+) -> None:
+    size = head["ContentLength"]
+    create_params = {
+        header: head[header] for header in _CARRIED_HEADERS if head.get(header)
+    }
+    if tagging is None:
+        tagging = _source_tagging(source_bucket, source_key)
+    if tagging:
+        create_params["Tagging"] = tagging
+
+    upload_id = s3.create_multipart_upload(
+        Bucket=dest_bucket, Key=dest_key, **create_params
+    )["UploadId"]
+
+    ranges = part_ranges(size)
+    tracker = _ProgressTracker(f"s3://{dest_bucket}/{dest_key}", size, progress)
+    logger.info(
+        "Starting multipart copy",
+        extra={
+            "source": f"s3://{source_bucket}/{source_key}",
+            "destination": f"s3://{dest_bucket}/{dest_key}",
+            "size_bytes": size,
+            "part_count": len(ranges),
+        },
+    )
+
+    def copy_part(part_number: int, start: int, end: int) -> Dict[str, Any]:
+        response = s3.upload_part_copy(
+            Bucket=dest_bucket,
+            Key=dest_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            CopySource={"Bucket": source_bucket, "Key": source_key},
+            CopySourceRange=f"bytes={start}-{end}",
+            CopySourceIfMatch=head["ETag"],
+        )
+        tracker.add(end - start + 1)
+        return {"PartNumber": part_number, "ETag": response["CopyPartResult"]["ETag"]}
+
+    workers = min(PART_CONCURRENCY, len(ranges))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(copy_part, part_number, start, end)
+                for part_number, (start, end) in enumerate(ranges, start=1)
+            ]
+            try:
+                parts = [future.result() for future in as_completed(futures)]
+            except Exception:
+                # Don't start parts that are still queued once one has failed
+                for future in futures:
+                    future.cancel()
+                raise
+
+        parts.sort(key=lambda part: part["PartNumber"])
+        s3.complete_multipart_upload(
+            Bucket=dest_bucket,
+            Key=dest_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except Exception:
+        try:
+            s3.abort_multipart_upload(
+                Bucket=dest_bucket, Key=dest_key, UploadId=upload_id
+            )
+        except Exception as abort_error:
+            logger.warning(
+                f"Failed to abort multipart upload {upload_id}: {abort_error}"
+            )
+        raise
+
+
+def _source_tagging(bucket: str, key: str) -> str:
+    """Tag set of an object in the URL-encoded form copy requests take."""
+    tag_set = s3.get_object_tagging(Bucket=bucket, Key=key).get("TagSet", [])
+    return urlencode([(tag["Key"], tag["Value"]) for tag in tag_set])
+
+
+class _ProgressTracker:
+    """Thread-safe byte counter that logs every PROGRESS_STEP_PERCENT."""
+
+    def __init__(self, label: str, total: int, callback: Optional[ProgressCallback]):
+        self.label = label
+        self.total = total
+        self.callback = callback
+        self.copied = 0
+        self.next_percent = PROGRESS_STEP_PERCENT
+        self.lock = threading.Lock()
+
+    def add(self, byte_count: int) -> None:
+        with self.lock:
+            self.copied += byte_count
+            copied = self.copied
+            percent = copied * 100 // self.total
+            if percent >= self.next_percent:
+                logger.info(
+                    f"Multipart copy {percent}% complete",
+                    extra={
+                        "destination": self.label,
+                        "bytes_copied": copied,
+                        "size_bytes": self.total,
+                    },
+                )
+                self.next_percent = (
+                    percent // PROGRESS_STEP_PERCENT + 1
+                ) * PROGRESS_STEP_PERCENT
+        if self.callback:
+            self.callback(copied, self.total)
+
+
+def delete_objects(objects: Iterable[Tuple[str, str]]) -> List[Dict[str, str]]:
+    """
+    Delete (bucket, key) pairs with batched DeleteObjects requests.
+
+    Keys that do not exist count as deleted, as with DeleteObject.
+
+    Returns:
+        One {"bucket", "key", "code", "message"} entry per key S3 failed to
+        delete; empty when every key was deleted
+    """
+    # dicts keep the first-seen order while dropping duplicate keys
+    keys_by_bucket: Dict[str, Dict[str, None]] = {}
+    for bucket, key in objects:
+        keys_by_bucket.setdefault(bucket, {})[key] = None
+
+    errors = []
+    for bucket, unique_keys in keys_by_bucket.items():
+        keys = list(unique_keys)
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[start : start + DELETE_BATCH_SIZE]
+            response = s3.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            for error in response.get("Errors", []):
+                errors.append(
+                    {
+                        "bucket": bucket,
+                        "key": error.get("Key", ""),
+                        "code": error.get("Code", "Unknown"),
+                        "message": error.get("Message", ""),
+                    }
+                )
+    return errors
@@ -0,0 +1,223 @@
+"""
+Per-asset registry of S3 Vectors keys.
+
+S3 Vectors can only list an index in key order, so finding the vectors that
+belong to one asset by metadata means paging through the whole index. The
+s3_vector_store node records every key it writes in this registry instead:
+
+    PK=inventoryId SK={vectorBucket}/{indexName}#{vectorKey} — one item per vector
+    PK=#BACKFILL   SK={vectorBucket}/{indexName} — backfill progress marker
+
+Deletion then becomes a Query on the asset's partition followed by
+DeleteVectors calls on known keys.
+
+Vectors written before the registry existed are picked up by the
+vector_key_registry_backfill Lambda. Until it has completed for an index,
+find_vector_keys also scans the index for every asset, so legacy vectors of
+an asset that already has newer vectors registered are not leaked.
+"""
+
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import boto3
+
+VECTOR_KEY_REGISTRY_TABLE_NAME = os.getenv("VECTOR_KEY_REGISTRY_TABLE_NAME", "")
+
+BACKFILL_PK = "#BACKFILL"
+# Hard limit on keys per DeleteVectors and vectors per PutVectors/ListVectors page
+MAX_VECTORS_PER_REQUEST = 500
+
+
+def registry_sort_key(vector_bucket_name: str, index_name: str, vector_key: str) -> str:
+    return f"{vector_bucket_name}/{index_name}#{vector_key}"
+
+
+def backfill_marker_key(vector_bucket_name: str, index_name: str) -> str:
+    return f"{vector_bucket_name}/{index_name}"
+
+
+class VectorKeyRegistry:
+    """
+    DynamoDB-backed map from inventory ID to the vector keys stored for it.
+
+    The registry is disabled when no table name is configured; every method is
+    then a no-op so callers can keep their existing behaviour.
+    """
+
+    def __init__(
+        self,
+        vector_bucket_name: str,
+        index_name: str,
+        table_name: str = VECTOR_KEY_REGISTRY_TABLE_NAME,
+        dynamodb=None,
+    ):
+        self.vector_bucket_name = vector_bucket_name
+        self.index_name = index_name
+        self.table_name = table_name
+        self._dynamodb = dynamodb
+        self._table = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.table_name)
+
+    def _get_table(self):
+        if self._table is None:
+            self._table = (self._dynamodb or boto3.resource("dynamodb")).Table(
+                self.table_name
+            )
+        return self._table
+
+    def _sort_key(self, vector_key: str) -> str:
+        return registry_sort_key(self.vector_bucket_name, self.index_name, vector_key)
+
+    def register(self, inventory_id: str, vector_keys: Iterable[str]) -> int:
+        """Record vector keys stored for inventory_id; returns how many."""
+        return self.register_many({inventory_id: vector_keys})
+
+    def register_many(self, keys_by_inventory_id: Dict[str, Iterable[str]]) -> int:
+        """Record keys for several assets in one stream of batch writes."""
+        if not self.enabled:
+            return 0
+        count = 0
+        now = int(time.time())
+        table = self._get_table()
+        with table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+            for inventory_id, vector_keys in keys_by_inventory_id.items():
+                for vector_key in vector_keys:
+                    batch.put_item(
+                        Item={
+                            "PK": inventory_id,
+                            "SK": self._sort_key(vector_key),
+                            "vectorKey": vector_key,
+                            "vectorBucketName": self.vector_bucket_name,
+                            "indexName": self.index_name,
+                            "registeredAt": now,
+                        }
+                    )
+                    count += 1
+        return count
+
+    def keys_for(self, inventory_id: str) -> List[str]:
+        """Return every vector key registered for inventory_id in this index."""
+        if not self.enabled:
+            return []
+        keys = []
+        params: Dict[str, Any] = {
+            "KeyConditionExpression": "PK = :pk AND begins_with(SK, :prefix)",
+            "ExpressionAttributeValues": {
+                ":pk": inventory_id,
+                ":prefix": self._sort_key(""),
+            },
+            "ProjectionExpression": "vectorKey",
+        }
+        table = self._get_table()
+        while True:
+            response = table.query(**params)
+            keys.extend(item["vectorKey"] for item in response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                return keys
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def forget(self, inventory_id: str, vector_keys: Iterable[str]) -> None:
+        """Remove registry entries once their vectors have been deleted."""
+        if not self.enabled:
+            return
+        table = self._get_table()
+        with table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+            for vector_key in vector_keys:
+                batch.delete_item(
+                    Key={
+                        "PK": inventory_id,
+                        "SK": self._sort_key(vector_key),
+                    }
+                )
+
+    def is_backfilled(self) -> bool:
+        """True once every pre-existing vector in the index has been registered."""
+        if not self.enabled:
+            return False
+        marker_key = backfill_marker_key(self.vector_bucket_name, self.index_name)
+        item = (
+            self._get_table()
+            .get_item(Key={"PK": BACKFILL_PK, "SK": marker_key})
+            .get("Item")
+        )
+        return bool(item and item.get("completedAt"))
+
+
+def scan_vector_keys(
+    client, vector_bucket_name: str, index_name: str, inventory_id: str
+) -> List[str]:
+    """
+    Find an asset's vectors by listing the whole index.
+
+    Legacy path, only used for assets the registry does not know about yet.
+    """
+    vector_keys = []
+    params: Dict[str, Any] = {
+        "vectorBucketName": vector_bucket_name,
+        "indexName": index_name,
+        "returnMetadata": True,
+        "maxResults": MAX_VECTORS_PER_REQUEST,
+    }
+    while True:
+        response = client.list_vectors(**params)
+        for vector in response.get("vectors", []):
+            metadata = vector.get("metadata", {})
+            if (
+                isinstance(metadata, dict)
+                and metadata.get("inventory_id") == inventory_id
+            ):
+                vector_keys.append(vector["key"])
+        next_token = response.get("nextToken")
+        if not next_token:
+            return vector_keys
+        params["nextToken"] = next_token
+
+
+def find_vector_keys(
+    registry: VectorKeyRegistry,
+    client,
+    inventory_id: str,
+    on_scan: Optional[Callable[[], None]] = None,
+) -> List[str]:
+    """
+    Resolve the vector keys stored for inventory_id.
+
+    Once the index has been fully backfilled the registry is authoritative.
+    Until then an asset can have legacy vectors that were never registered
+    alongside newer registered ones, so the index is scanned as well and both
+    answers are merged; on_scan is called first so callers can count how often
+    that still happens.
+    """
+    keys: List[str] = []
+    if registry.enabled:
+        keys = registry.keys_for(inventory_id)
+        if registry.is_backfilled():
+            return keys
+    if on_scan is not None:
+        on_scan()
+    registered = set(keys)
+    return keys + [
+        key
+        for key in scan_vector_keys(
+            client, registry.vector_bucket_name, registry.index_name, inventory_id
+        )
+        if key not in registered
+    ]
+
+
+def delete_vector_keys(
+    client, vector_bucket_name: str, index_name: str, vector_keys: List[str]
+) -> int:
+    """Delete known vector keys in DeleteVectors-sized batches."""
+    for i in range(0, len(vector_keys), MAX_VECTORS_PER_REQUEST):
+        client.delete_vectors(
+            vectorBucketName=vector_bucket_name,
+            indexName=index_name,
+            keys=vector_keys[i : i + MAX_VECTORS_PER_REQUEST],
+        )
+    return len(vector_keys)
@@ -1,6 +1,5 @@
 import concurrent.futures
 import functools
-import hashlib
 import http.client
 import json
 import os
@@ -21,13 +20,16 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from collection_activity import record_collection_activity
 
 # Import shared helpers from common_libraries layer for collection association
-from collections_utils import get_user_collection_role
+from collections_utils import asset_membership_keys, get_user_collection_role
+from content_fingerprint import SOURCE_HASH, Fingerprint, fingerprint_object
 
 # Import centralized file extension constants from common_libraries layer
 from file_extensions import SUPPORTED_EXTENSIONS
+from vector_key_registry import VectorKeyRegistry, delete_vector_keys, find_vector_keys
 
 
 def utc_now_z() -> str:
@@ -101,6 +103,11 @@ ASSET_SK_FULL_SUFFIX = "#FULL"
 # inline collection-ids metadata exceeds the S3 user-metadata budget (§6.5).
 UPLOAD_DIRECTIVES_TABLE_NAME = os.environ.get("UPLOAD_DIRECTIVES_TABLE_NAME", "")
 
+# Asset table GSIs used for duplicate detection. FileHashIndex is only read
+# when FileHashPathIndex is unavailable (see _check_existing_file).
+FILE_HASH_PATH_INDEX = "FileHashPathIndex"
+FILE_HASH_INDEX = "FileHashIndex"
+
 
 def _find_portal_user_metadata(obj) -> Dict[str, str]:
     """Locate the S3 user-metadata dict carrying the portal directives.
@@ -241,6 +248,8 @@ def _put_membership(collection_id: str, inventory_id: str, added_by: str) -> Non
             "addedBy": added_by,
             "GSI2_PK": asset_sk,
             "GSI2_SK": f"{COLLECTION_PK_PREFIX}{collection_id}",
+            # GSI7 asset membership lookup, used by asset deletion cleanup
+            **asset_membership_keys(inventory_id, collection_id),
         }
     )
 
@@ -897,6 +906,7 @@ class FileHash(TypedDict):
     Algorithm: str
     Value: str
     MD5Hash: str
+    Checksum: Optional[str]
 
 
 class FileInfo(TypedDict):
@@ -963,6 +973,7 @@ class AssetRecord(TypedDict):
     DerivedRepresentations: Optional[List[AssetRepresentation]]
     Metadata: Optional[AssetMetadata]
     FileHash: str
+    FileChecksum: Optional[str]
     StoragePath: str
 
 
@@ -1132,43 +1143,23 @@ class AssetProcessor:
     def delete_s3_vectors(self, inventory_id: str) -> int:
         """
         Delete S3 vectors associated with inventory_id.
-        Uses metadata filtering to find all vectors for the asset.
+        Looks the keys up in the vector key registry, falling back to a
+        metadata scan of the index for assets registered before it existed.
         """
         if not VECTOR_BUCKET_NAME or not s3_vector_client:
             logger.info("S3 Vector Store not configured – skipping vector deletion")
             return 0
 
         try:
-            # List all vectors with metadata to filter by inventory_id
-            vectors_to_delete = []
-            next_token = None
-
-            while True:
-                list_params = {
-                    "vectorBucketName": VECTOR_BUCKET_NAME,
-                    "indexName": VECTOR_INDEX_NAME,
-                    "returnMetadata": True,
-                    "maxResults": 500,  # Process in batches
-                }
-
-                if next_token:
-                    list_params["nextToken"] = next_token
-
-                response = s3_vector_client.list_vectors(**list_params)
-                vectors = response.get("vectors", [])
-
-                # Filter vectors by inventory_id in metadata
-                for vector in vectors:
-                    metadata = vector.get("metadata", {})
-                    if (
-                        isinstance(metadata, dict)
-                        and metadata.get("inventory_id") == inventory_id
-                    ):
-                        vectors_to_delete.append(vector["key"])
-
-                next_token = response.get("nextToken")
-                if not next_token:
-                    break
+            registry = VectorKeyRegistry(VECTOR_BUCKET_NAME, VECTOR_INDEX_NAME)
+            vectors_to_delete = find_vector_keys(
+                registry,
+                s3_vector_client,
+                inventory_id,
+                on_scan=lambda: metrics.add_metric(
+                    name="VectorIndexScans", unit=MetricUnit.Count, value=1
+                ),
+            )
 
             if not vectors_to_delete:
                 logger.info(f"No vectors found for inventory_id: {inventory_id}")
@@ -1181,12 +1172,13 @@ class AssetProcessor:
                 },  # Log first 10 keys for debugging
             )
 
-            # Batch delete vectors
-            s3_vector_client.delete_vectors(
-                vectorBucketName=VECTOR_BUCKET_NAME,
-                indexName=VECTOR_INDEX_NAME,
-                keys=vectors_to_delete,
+            delete_vector_keys(
+                s3_vector_client,
+                VECTOR_BUCKET_NAME,
+                VECTOR_INDEX_NAME,
+                vectors_to_delete,
             )
+            registry.forget(inventory_id, vectors_to_delete)
 
             logger.info(
                 f"Successfully deleted {len(vectors_to_delete)} vectors for {inventory_id}"
@@ -1258,111 +1250,150 @@ class AssetProcessor:
         return key.split(".")[-1].lower() if "." in key else ""
 
     @tracer.capture_method
-    def _calculate_md5(self, bucket: str, key: str, chunk_size: int = 8192) -> str:
-        """Calculate MD5 hash with optimal chunk size for memory efficiency"""
+    def _fingerprint(
+        self,
+        bucket: str,
+        key: str,
+        head: Dict,
+        known: Optional[Dict] = None,
+    ) -> Fingerprint:
+        """
+        MD5 of the object, from its ETag or from the record already stored for
+        it (known) when its S3 checksum is unchanged, and hashing it otherwise
+        (see content_fingerprint).
+        """
         try:
-            response = self.s3.get_object(Bucket=bucket, Key=key)
-            md5_hash = hashlib.md5(usedforsecurity=False)
-
-            # Use larger chunk size for better performance
-            bytes_processed = 0
-            for chunk in response["Body"].iter_chunks(chunk_size):
-                md5_hash.update(chunk)
-                bytes_processed += len(chunk)
-
-            return md5_hash.hexdigest()
+            fingerprint = fingerprint_object(self.s3, bucket, key, head, known=known)
         except Exception as e:
-            logger.exception(
-                f"Error calculating MD5 hash for {bucket}/{key}, error: {e}"
-            )
+            logger.exception(f"Error fingerprinting {bucket}/{key}, error: {e}")
             raise
 
+        metrics.add_metric(
+            name=(
+                "FingerprintsHashed"
+                if fingerprint.source == SOURCE_HASH
+                else "FingerprintsFromS3Metadata"
+            ),
+            unit=MetricUnit.Count,
+            value=1,
+        )
+        logger.info(f"Fingerprinted {bucket}/{key}: MD5 from {fingerprint.source}")
+        return fingerprint
+
     @tracer.capture_method
     def _check_existing_file(
         self, md5_hash: str, bucket: str = None, key: str = None
     ) -> Tuple[Optional[Dict], bool]:
         """
-        Check if file with same MD5 hash exists with pagination support.
+        Check if a file with the same MD5 hash already exists.
         Returns: (existing_file, is_exact_match)
-        - existing_file: First file with matching hash (or None if no matches)
-        - is_exact_match: True if the file has same hash AND same storage path/key
+        - existing_file: InventoryID and DigitalSourceAsset.ID of a file with
+          the same hash, preferring the one at bucket/key (None if no matches)
+        - is_exact_match: True if that file has the same hash AND storage path
+
+        Both questions are answered from FileHashPathIndex (FileHash /
+        StoragePath, keys only): the exact match is a fully keyed Query and
+        any other duplicate a Limit=1 Query, so the cost no longer grows with
+        the number of copies of popular content.
         """
+        storage_path = f"{bucket}:{key}" if bucket and key else None
         try:
-            all_items = []
-            last_evaluated_key = None
-            page_count = 0
-
-            # Paginate through all results
-            while True:
-                query_params = {
-                    "IndexName": "FileHashIndex",
-                    "KeyConditionExpression": "FileHash = :hash",
-                    "ExpressionAttributeValues": {":hash": md5_hash},
-                }
-
-                if last_evaluated_key:
-                    query_params["ExclusiveStartKey"] = last_evaluated_key
-
-                response = self.dynamodb.query(**query_params)
-                page_count += 1
-                all_items.extend(response["Items"])
-
-                # Log pagination progress for large result sets
-                if page_count > 1:
-                    logger.info(
-                        f"Retrieved page {page_count} with {len(response['Items'])} items for hash {md5_hash}"
-                    )
-
-                # Check if there are more pages
-                last_evaluated_key = response.get("LastEvaluatedKey")
-                if not last_evaluated_key:
-                    break
-
-            logger.info(
-                f"Found {len(all_items)} total items with hash {md5_hash} across {page_count} page(s)"
-            )
-
-            if not all_items:
-                return None, False
-
-            # If bucket and key provided, check if any item is an exact match
-            is_exact_match = False
-            if bucket and key:
-                storage_path = f"{bucket}:{key}"
-                logger.info(
-                    f"Checking for exact match with storage path: {storage_path}"
+            match = self._query_file_hash_path_index(md5_hash, storage_path)
+        except ClientError as e:
+            # Connectors created before the index existed have no grant on it,
+            # and the index can't be read while it is backfilling
+            if e.response["Error"]["Code"] not in (
+                "AccessDeniedException",
+                "ValidationException",
+            ):
+                logger.exception(
+                    f"Error querying DynamoDB for hash {md5_hash}, error {e}"
                 )
+                raise
+            logger.warning(
+                f"{FILE_HASH_PATH_INDEX} unavailable ({e.response['Error']['Code']}),"
+                f" falling back to {FILE_HASH_INDEX}"
+            )
+            match = self._query_file_hash_index(md5_hash, storage_path)
 
-                for item in all_items:
-                    item_storage_path = item.get("StoragePath")
-                    item_object_key = (
-                        item.get("DigitalSourceAsset", {})
-                        .get("MainRepresentation", {})
-                        .get("StorageInfo", {})
-                        .get("PrimaryLocation", {})
-                        .get("ObjectKey", {})
-                        .get("FullPath")
-                    )
+        if match is None:
+            logger.info(f"No existing file with hash {md5_hash}")
+            return None, False
 
-                    # Check if both storage path AND object key match
-                    if item_storage_path == storage_path and item_object_key == key:
-                        logger.info(
-                            f"Found exact match: StoragePath={item_storage_path}, ObjectKey={item_object_key}"
-                        )
-                        is_exact_match = True
-                        break
+        inventory_id, is_exact_match = match
+        logger.info(
+            f"Found existing file {inventory_id} with hash {md5_hash}"
+            f" (exact match: {is_exact_match})"
+        )
+        existing_file = self.dynamodb.get_item(
+            Key={"InventoryID": inventory_id},
+            ProjectionExpression="InventoryID, DigitalSourceAsset.ID",
+        ).get("Item")
+        if not existing_file:
+            # Deleted between the index read and now
+            return None, False
+        return existing_file, is_exact_match
+
+    def _query_file_hash_path_index(
+        self, md5_hash: str, storage_path: Optional[str]
+    ) -> Optional[Tuple[str, bool]]:
+        """(InventoryID, is_exact_match) of a file with this hash, if any."""
+        if storage_path:
+            response = self.dynamodb.query(
+                IndexName=FILE_HASH_PATH_INDEX,
+                KeyConditionExpression="FileHash = :hash AND StoragePath = :path",
+                ExpressionAttributeValues={":hash": md5_hash, ":path": storage_path},
+                Limit=1,
+            )
+            if response["Items"]:
+                return response["Items"][0]["InventoryID"], True
 
-                if not is_exact_match:
-                    logger.info(
-                        f"No exact match found for storage path {storage_path} - but returning first duplicate for hash match"
-                    )
+        response = self.dynamodb.query(
+            IndexName=FILE_HASH_PATH_INDEX,
+            KeyConditionExpression="FileHash = :hash",
+            ExpressionAttributeValues={":hash": md5_hash},
+            Limit=1,
+        )
+        if response["Items"]:
+            return response["Items"][0]["InventoryID"], False
+        return None
 
-            # Always return first item with matching hash for duplicate detection
-            return all_items[0], is_exact_match
+    def _query_file_hash_index(
+        self, md5_hash: str, storage_path: Optional[str]
+    ) -> Optional[Tuple[str, bool]]:
+        """
+        FileHashIndex version of _query_file_hash_path_index.
 
-        except Exception as e:
-            logger.exception(f"Error querying DynamoDB for hash {md5_hash}, error {e}")
-            raise
+        The index has no sort key, so finding the exact match means paging
+        through every file with the hash; only the two compared attributes
+        are read and paging stops at the exact match.
+        """
+        query_params = {
+            "IndexName": FILE_HASH_INDEX,
+            "KeyConditionExpression": "FileHash = :hash",
+            "ExpressionAttributeValues": {":hash": md5_hash},
+            "ProjectionExpression": "InventoryID, StoragePath",
+        }
+        if not storage_path:
+            query_params["Limit"] = 1
+
+        first_inventory_id = None
+        while True:
+            response = self.dynamodb.query(**query_params)
+            for item in response["Items"]:
+                if item.get("StoragePath") == storage_path:
+                    return item["InventoryID"], True
+                if first_inventory_id is None:
+                    first_inventory_id = item["InventoryID"]
+
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not storage_path or not last_evaluated_key:
+                break
+            query_params["ExclusiveStartKey"] = last_evaluated_key
+
+        if first_inventory_id is None:
+            return None
+        return first_inventory_id, False
 
     @tracer.capture_method
     def process_asset(
@@ -1391,8 +1422,13 @@ class AssetProcessor:
 
             # Get S3 object metadata and tags in parallel
             with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                # ChecksumMode adds the object's checksums, which usually
+                # spare reading the whole object to fingerprint it
                 head_future = executor.submit(
-                    self.s3.head_object, Bucket=bucket, Key=key
+                    self.s3.head_object,
+                    Bucket=bucket,
+                    Key=key,
+                    ChecksumMode="ENABLED",
                 )
                 tag_future = executor.submit(
                     self.s3.get_object_tagging, Bucket=bucket, Key=key
@@ -1491,9 +1527,6 @@ class AssetProcessor:
                         f"Found tagged asset: {tags['AssetID']} - verifying hash to detect replacements"
                     )
 
-                    # CRITICAL: Calculate hash to detect if file content changed
-                    current_md5_hash = self._calculate_md5(bucket, key)
-
                     # Add logging to check if the record exists in DynamoDB
                     try:
                         existing_record = self.dynamodb.get_item(
@@ -1502,12 +1535,18 @@ class AssetProcessor:
                         if "Item" in existing_record:
                             stored_hash = existing_record["Item"].get("FileHash")
 
+                            # CRITICAL: Calculate hash to detect if file content
+                            # changed (skipped when the S3 checksum is unchanged)
+                            current_hash = self._fingerprint(
+                                bucket, key, response, known=existing_record["Item"]
+                            ).md5
+
                             # Check if hash has changed - this indicates file replacement
-                            if stored_hash and stored_hash != current_md5_hash:
+                            if stored_hash and stored_hash != current_hash:
                                 logger.warning(
                                     f"FILE REPLACEMENT DETECTED (tagged asset): "
                                     f"StoragePath={bucket}:{key}, "
-                                    f"Old hash={stored_hash}, New hash={current_md5_hash}, "
+                                    f"Old hash={stored_hash}, New hash={current_hash}, "
                                     f"Old InventoryID={tags['InventoryID']}. "
                                     f"Deleting old asset and creating new one."
                                 )
@@ -1581,7 +1620,7 @@ class AssetProcessor:
                             else:
                                 # Hash matches - this is the same file, just update timestamp
                                 self._log_with_asset_context(
-                                    f"Hash matches ({current_md5_hash}) - same file, updating lastModifiedDate only"
+                                    f"Hash matches ({current_hash}) - same file, updating lastModifiedDate only"
                                 )
 
                                 # Update only the lastModifiedDate
@@ -1613,12 +1652,11 @@ class AssetProcessor:
                                 f"Recreating DynamoDB record for tagged asset: {key}"
                             )
 
-                            # Calculate MD5 hash for the file
-                            md5_hash = self._calculate_md5(bucket, key)
+                            fingerprint = self._fingerprint(bucket, key, response)
 
                             # Create metadata structure
                             metadata = self._create_asset_metadata(
-                                response, bucket, key, md5_hash
+                                response, bucket, key, fingerprint
                             )
 
                             # Create DynamoDB entry using existing InventoryID and AssetID
@@ -1657,7 +1695,7 @@ class AssetProcessor:
                             # Create the item structure
                             item = {
                                 "InventoryID": inventory_id,
-                                "FileHash": md5_hash,
+                                "FileHash": fingerprint.md5,
                                 "StoragePath": f"{bucket}:{key}",
                                 "DigitalSourceAsset": {
                                     "ID": asset_id,
@@ -1681,6 +1719,8 @@ class AssetProcessor:
                                 "DerivedRepresentations": [],
                                 "Metadata": metadata.get("Metadata"),
                             }
+                            if fingerprint.checksum:
+                                item["FileChecksum"] = fingerprint.checksum
 
                             # Use batch writer for better DynamoDB performance
                             try:
@@ -1736,9 +1776,6 @@ class AssetProcessor:
 
                     return None
 
-            # Calculate MD5 hash for duplicate checking
-            md5_hash = self._calculate_md5(bucket, key)
-
             # CRITICAL: First check if there's already a record at this StoragePath
             # This handles the file replacement scenario (same path, different hash)
             storage_path = f"{bucket}:{key}"
@@ -1769,14 +1806,21 @@ class AssetProcessor:
             except Exception as e:
                 logger.warning(f"Error checking StoragePath index: {str(e)}")
 
+            # Calculate MD5 hash for duplicate checking; the record already at
+            # this path spares the read when the S3 checksum is unchanged
+            fingerprint = self._fingerprint(
+                bucket, key, response, known=existing_at_path
+            )
+            file_hash = fingerprint.md5
+
             # If there's a file at this path with a DIFFERENT hash, it's a replacement
-            if existing_at_path and existing_at_path.get("FileHash") != md5_hash:
+            if existing_at_path and existing_at_path.get("FileHash") != file_hash:
                 old_inventory_id = existing_at_path["InventoryID"]
                 old_hash = existing_at_path.get("FileHash")
 
                 logger.warning(
                     f"FILE REPLACEMENT DETECTED at {storage_path}: "
-                    f"Old hash={old_hash}, New hash={md5_hash}. "
+                    f"Old hash={old_hash}, New hash={file_hash}. "
                     f"Deleting old record {old_inventory_id} and creating new asset."
                 )
 
@@ -1828,9 +1872,9 @@ class AssetProcessor:
                 existing_at_path = None
 
             # If there's a file at this path with the SAME hash, it's already processed
-            elif existing_at_path and existing_at_path.get("FileHash") == md5_hash:
+            elif existing_at_path and existing_at_path.get("FileHash") == file_hash:
                 logger.info(
-                    f"File at {storage_path} already exists with same hash {md5_hash} - updating lastModifiedDate only"
+                    f"File at {storage_path} already exists with same hash {file_hash} - updating lastModifiedDate only"
                 )
                 # Update lastModifiedDate
                 self.dynamodb.update_item(
@@ -1845,24 +1889,24 @@ class AssetProcessor:
             # Now check if file with same hash exists at DIFFERENT locations
             # Pass bucket and key to check for both hash matches and exact matches
             existing_file, is_exact_match = self._check_existing_file(
-                md5_hash, bucket, key
+                file_hash, bucket, key
             )
 
             if existing_file:
                 if is_exact_match:
                     logger.info(
-                        f"Found existing file with hash {md5_hash} - EXACT MATCH (same storage path/key)"
+                        f"Found existing file with hash {file_hash} - EXACT MATCH (same storage path/key)"
                     )
                 else:
                     logger.info(
-                        f"Found existing file with hash {md5_hash} - DIFFERENT path/key (duplicate hash)"
+                        f"Found existing file with hash {file_hash} - DIFFERENT path/key (duplicate hash)"
                     )
                 metrics.add_metric(
                     name="DuplicateCheckPerformed", unit=MetricUnit.Count, value=1
                 )
             else:
                 logger.info(
-                    f"No existing file found with hash {md5_hash} - this is a unique file"
+                    f"No existing file found with hash {file_hash} - this is a unique file"
                 )
                 metrics.add_metric(
                     name="DuplicateCheckPerformed", unit=MetricUnit.Count, value=1
@@ -1870,7 +1914,7 @@ class AssetProcessor:
 
             # Handle duplicate logic based on DO_NOT_INGEST_DUPLICATES setting
             if existing_file:
-                logger.info(f"Duplicate file found with hash {md5_hash}")
+                logger.info(f"Duplicate file found with hash {file_hash}")
 
                 # Check if it's the exact same file (same hash + same storage path + same key)
                 if is_exact_match:
@@ -1891,7 +1935,7 @@ class AssetProcessor:
                                     "Key": "AssetID",
                                     "Value": existing_file["DigitalSourceAsset"]["ID"],
                                 },
-                                {"Key": "FileHash", "Value": md5_hash},
+                                {"Key": "FileHash", "Value": file_hash},
                             ]
                         },
                     )
@@ -1941,7 +1985,7 @@ class AssetProcessor:
                                     "Key": "AssetID",
                                     "Value": existing_file["DigitalSourceAsset"]["ID"],
                                 },
-                                {"Key": "FileHash", "Value": md5_hash},
+                                {"Key": "FileHash", "Value": file_hash},
                                 {"Key": "DuplicateHash", "Value": "true"},
                             ]
                         },
@@ -1967,7 +2011,7 @@ class AssetProcessor:
                     # Fall through to process as new asset since DO_NOT_INGEST_DUPLICATES is False
 
             # Process new unique file...
-            metadata = self._create_asset_metadata(response, bucket, key, md5_hash)
+            metadata = self._create_asset_metadata(response, bucket, key, fingerprint)
 
             # If we have InventoryID tag but no AssetID tag, use existing inventory
             if "InventoryID" in tags and "AssetID" not in tags:
@@ -1994,7 +2038,7 @@ class AssetProcessor:
                             "Key": "AssetID",
                             "Value": dynamo_entry["DigitalSourceAsset"]["ID"],
                         },
-                        {"Key": "FileHash", "Value": md5_hash},
+                        {"Key": "FileHash", "Value": file_hash},
                     ]
                 },
             )
@@ -2028,7 +2072,7 @@ class AssetProcessor:
             raise
 
     def _create_asset_metadata(
-        self, s3_response: Dict, bucket: str, key: str, md5_hash: str
+        self, s3_response: Dict, bucket: str, key: str, fingerprint: Fingerprint
     ) -> StorageInfo:
         """Create asset metadata structure with optimized field extraction"""
         # Get file extension from key
@@ -2064,7 +2108,8 @@ class AssetProcessor:
                         "Hash": {
                             "Algorithm": "SHA256",
                             "Value": etag,
-                            "MD5Hash": md5_hash,
+                            "MD5Hash": fingerprint.md5,
+                            "Checksum": fingerprint.checksum,
                         },
                         "CreateDate": last_modified,
                     },
@@ -2117,6 +2162,7 @@ class AssetProcessor:
             # Extract bucket and key from metadata for StoragePath
             bucket = metadata["StorageInfo"]["PrimaryLocation"]["Bucket"]
             key = metadata["StorageInfo"]["PrimaryLocation"]["ObjectKey"]["FullPath"]
+            file_hash = metadata["StorageInfo"]["PrimaryLocation"]["FileInfo"]["Hash"]
 
             # Extract content type and file extension for type determination
             content_type = (
@@ -2142,9 +2188,7 @@ class AssetProcessor:
 
             item: AssetRecord = {
                 "InventoryID": inventory_id,
-                "FileHash": metadata["StorageInfo"]["PrimaryLocation"]["FileInfo"][
-                    "Hash"
-                ]["MD5Hash"],
+                "FileHash": file_hash["MD5Hash"],
                 "StoragePath": f"{bucket}:{key}",
                 "DigitalSourceAsset": {
                     "ID": f"asset:{type_abbrev}:{asset_id}",
@@ -2165,6 +2209,10 @@ class AssetProcessor:
                 "DerivedRepresentations": [],
                 "Metadata": metadata.get("Metadata"),
             }
+            # S3 checksum the FileHash was taken for, so a re-sync of the
+            # unchanged object can reuse it instead of re-hashing
+            if file_hash.get("Checksum"):
+                item["FileChecksum"] = file_hash["Checksum"]
 
             # Add detailed logging before DynamoDB operation
             logger.info(
@@ -2268,6 +2316,9 @@ class AssetProcessor:
                     "FullPath"
                 ]
                 file_ext = self._extract_file_extension(object_key)
+                file_hash = metadata["StorageInfo"]["PrimaryLocation"]["FileInfo"][
+                    "Hash"
+                ]
 
                 # Use more accurate asset type detection
                 asset_type = determine_asset_type(content_type, file_ext)
@@ -2286,9 +2337,7 @@ class AssetProcessor:
                 # Construct event detail
                 event_detail = {
                     "InventoryID": inventory_id,
-                    "FileHash": metadata["StorageInfo"]["PrimaryLocation"]["FileInfo"][
-                        "Hash"
-                    ]["MD5Hash"],
+                    "FileHash": file_hash["MD5Hash"],
                     "DigitalSourceAsset": {
                         "ID": asset_id,
                         "Type": asset_type,
@@ -0,0 +1,117 @@
+"""
+Unit tests for ingest content fingerprints.
+
+Tests that the MD5 duplicate key comes from the ETag when it is the content
+MD5, is reused from the stored record only while the object's S3 checksum is
+unchanged, and is hashed from the object otherwise.
+"""
+
+import base64
+import hashlib
+from unittest.mock import MagicMock
+
+import content_fingerprint
+from content_fingerprint import (
+    SOURCE_CHECKSUM,
+    SOURCE_ETAG,
+    SOURCE_HASH,
+    content_checksum,
+    fingerprint_object,
+)
+
+BODY = b"media bytes"
+BODY_MD5 = hashlib.md5(BODY).hexdigest()
+SHA256 = base64.b64encode(hashlib.sha256(BODY).digest()).decode()
+
+
+def _s3_client():
+    client = MagicMock()
+    client.get_object.return_value = {
+        "Body": MagicMock(iter_chunks=lambda size: iter([BODY]))
+    }
+    return client
+
+
+def _head(**fields):
+    return {"ContentLength": len(BODY), "ETag": f'"{BODY_MD5}"', **fields}
+
+
+class TestFingerprintObject:
+    """Test suite for fingerprint_object"""
+
+    def test_single_part_etag_is_the_md5(self):
+        """Test that a plain single-part ETag is used without reading the object"""
+        client = _s3_client()
+
+        fingerprint = fingerprint_object(client, "b", "k", _head())
+
+        assert (fingerprint.md5, fingerprint.source) == (BODY_MD5, SOURCE_ETAG)
+        client.get_object.assert_not_called()
+
+    def test_multipart_and_kms_etags_are_hashed(self):
+        """Test that ETags that are not the content MD5 fall back to hashing"""
+        for head in (
+            _head(ETag='"0123456789abcdef0123456789abcdef-3"'),
+            _head(ServerSideEncryption="aws:kms"),
+        ):
+            client = _s3_client()
+
+            fingerprint = fingerprint_object(client, "b", "k", head)
+
+            assert (fingerprint.md5, fingerprint.source) == (BODY_MD5, SOURCE_HASH)
+            assert client.get_object.call_args.kwargs["IfMatch"] == head["ETag"]
+
+    def test_unchanged_checksum_reuses_the_stored_md5(self):
+        """Test that a matching FileChecksum spares hashing a multipart object"""
+        head = _head(ETag='"abc-2"', ChecksumSHA256=SHA256)
+        known = {"FileHash": "stored-md5", "FileChecksum": content_checksum(head)}
+        client = _s3_client()
+
+        fingerprint = fingerprint_object(client, "b", "k", head, known=known)
+
+        assert (fingerprint.md5, fingerprint.source) == ("stored-md5", SOURCE_CHECKSUM)
+        client.get_object.assert_not_called()
+
+    def test_changed_checksum_is_hashed_again(self):
+        """Test that a different checksum never reuses the stored MD5"""
+        head = _head(ETag='"abc-2"', ChecksumSHA256=SHA256)
+        known = {"FileHash": "stored-md5", "FileChecksum": "sha256:other"}
+
+        fingerprint = fingerprint_object(_s3_client(), "b", "k", head, known=known)
+
+        assert (fingerprint.md5, fingerprint.source) == (BODY_MD5, SOURCE_HASH)
+        assert fingerprint.checksum == content_checksum(head)
+
+    def test_parallel_ranges_hash_in_order(self, monkeypatch):
+        """Test that ranged reads are fed to the digest in object order"""
+        monkeypatch.setattr(content_fingerprint, "HASH_CONCURRENCY", 3)
+        monkeypatch.setattr(content_fingerprint, "HASH_PART_SIZE_BYTES", 4)
+        client = MagicMock()
+
+        def get_object(Range, **kwargs):
+            start, end = map(int, Range.split("=")[1].split("-"))
+            return {"Body": MagicMock(read=lambda: BODY[start : end + 1])}
+
+        client.get_object.side_effect = get_object
+
+        fingerprint = fingerprint_object(client, "b", "k", _head(ETag='"abc-2"'))
+
+        assert fingerprint.md5 == BODY_MD5
+
+
+class TestContentChecksum:
+    """Test suite for content_checksum"""
+
+    def test_crc64nvme_carries_the_size(self):
+        """Test that a CRC64NVME checksum is qualified by the object size"""
+        checksum = content_checksum(_head(ChecksumCRC64NVME="AAAAAAAAAAE="))
+
+        assert checksum == f"crc64nvme:{len(BODY)}:0000000000000001"
+
+    def test_composite_checksums_are_ignored(self):
+        """Test that part-layout dependent checksums are not used"""
+        assert content_checksum(_head(ChecksumSHA256=f"{SHA256}-2")) is None
+        assert (
+            content_checksum(_head(ChecksumSHA256=SHA256, ChecksumType="COMPOSITE"))
+            is None
+        )
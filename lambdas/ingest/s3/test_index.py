@@ -13,6 +13,7 @@ sys.modules.setdefault("file_extensions", _file_ext_mod)
 sys.modules.setdefault("asset_deletion_service", MagicMock())
 sys.modules.setdefault("collections_utils", MagicMock())
 sys.modules.setdefault("collection_activity", MagicMock())
+sys.modules.setdefault("vector_key_registry", MagicMock())
 
 with patch.dict(
     "os.environ",
@@ -1,17 +1,21 @@
 import ast
+import functools
 import importlib.util
 import json
 import os
 import sys
 import time
-from typing import Any, Dict, Optional
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple
 from urllib.parse import urljoin
 
 import boto3
 import requests
 from aws_lambda_powertools import Logger, Metrics, Tracer
+from aws_lambda_powertools.metrics import MetricUnit
 from botocore.exceptions import ClientError
-from jinja2 import Environment, FileSystemLoader
+from http_client import get_http_session
+from jinja2 import Environment, FileSystemLoader, Template
 
 # Import the lambda_middleware from the local module
 from lambda_middleware import lambda_middleware
@@ -25,6 +29,19 @@ logger = Logger()
 tracer = Tracer(disabled=True)
 metrics = Metrics(namespace="ApiStandardLambda")
 
+# Templates and mapping modules are compiled once per container and reused
+# until their ETag changes; after TEMPLATE_CACHE_TTL_SECONDS a cached entry is
+# revalidated with a conditional GET (If-None-Match) before it is used again
+TEMPLATE_CACHE_TTL_SECONDS = int(os.environ.get("TEMPLATE_CACHE_TTL_SECONDS", "300"))
+
+jinja_env = Environment(
+    loader=FileSystemLoader("/tmp/")
+)  # nosec B701 - Controlled template rendering with trusted input
+jinja_env.filters["jsonify"] = json.dumps
+
+# (bucket, key) -> {"etag", "value", "fetched_at"}
+_compiled_objects: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
 ################################################################################
 # THE EXISTING LAMBDA FUNCTION CODE
 ################################################################################
@@ -49,6 +66,9 @@ def make_api_call(
         logger.info(f"Region: {region}")
         logger.info(f"Service: {service}")
 
+        # Pooled keep-alive session shared by every call in this container
+        http = get_http_session()
+
         if api_auth_type == "AWSSigV4":
             session = boto3.Session()
             credentials = session.get_credentials()
@@ -69,17 +89,17 @@ def make_api_call(
             logger.info("Created AWS4Auth object")
 
             if method.lower() == "get":
-                response = requests.get(url, auth=auth, headers=headers, params=params)
+                response = http.get(url, auth=auth, headers=headers, params=params)
             elif method.lower() == "post":
-                response = requests.post(url, auth=auth, headers=headers, data=data)
+                response = http.post(url, auth=auth, headers=headers, data=data)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
         else:
             if method.lower() == "get":
                 response = (
-                    requests.get(url, headers=headers, params=params)
+                    http.get(url, headers=headers, params=params)
                     if params
-                    else requests.get(url, headers=headers)
+                    else http.get(url, headers=headers)
                 )
             elif method.lower() == "post":
                 if data:
@@ -91,12 +111,12 @@ def make_api_call(
                         and isinstance(data[0], tuple)
                     ):
                         # TwelveLabs format: use files parameter for multipart form data
-                        response = requests.post(url, headers=headers, files=data)
+                        response = http.post(url, headers=headers, files=data)
                     else:
                         # Standard JSON format: use json parameter
-                        response = requests.post(url, headers=headers, json=data)
+                        response = http.post(url, headers=headers, json=data)
                 else:
-                    response = requests.post(url, headers=headers)
+                    response = http.post(url, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -163,24 +183,76 @@ def retrieve_api_key(api_key_secret_arn: str) -> Dict[str, str]:
         raise
 
 
+def get_compiled_s3_object(
+    bucket: str, key: str, compile_source: Callable[[str], Any]
+) -> Any:
+    """
+    Compiled form of an S3 object, cached per container by key and ETag.
+
+    compile_source turns the object's text into the cached value (a Jinja
+    template, an executed module). It only runs when the object is first seen
+    or its ETag has changed.
+    """
+    cache_key = (bucket, key)
+    entry = _compiled_objects.get(cache_key)
+    now = time.monotonic()
+    if entry and now - entry["fetched_at"] < TEMPLATE_CACHE_TTL_SECONDS:
+        metrics.add_metric(name="TemplateCacheHit", unit=MetricUnit.Count, value=1)
+        return entry["value"]
+
+    params = {"Bucket": bucket, "Key": key}
+    if entry:
+        params["IfNoneMatch"] = entry["etag"]
+    try:
+        response = s3_client.get_object(**params)
+    except ClientError as e:
+        if entry and e.response["Error"]["Code"] in ("304", "NotModified"):
+            entry["fetched_at"] = now
+            metrics.add_metric(
+                name="TemplateCacheHit", unit=MetricUnit.Count, value=1
+            )
+            return entry["value"]
+        raise
+
+    source = response["Body"].read().decode("utf-8")
+    logger.info(f"Compiling s3://{bucket}/{key} ({len(source)} characters)")
+    value = compile_source(source)
+    _compiled_objects[cache_key] = {
+        "etag": response["ETag"],
+        "value": value,
+        "fetched_at": now,
+    }
+    metrics.add_metric(name="TemplateCacheMiss", unit=MetricUnit.Count, value=1)
+    return value
+
+
+def load_template(bucket: str, key: str) -> Template:
+    return get_compiled_s3_object(bucket, key, jinja_env.from_string)
+
+
+def exec_module_source(module_name: str, source: str) -> ModuleType:
+    spec = importlib.util.spec_from_loader(module_name, loader=None)
+    module = importlib.util.module_from_spec(spec)
+    exec(
+        source, module.__dict__
+    )  # nosec B102 - Controlled execution of trusted S3 templates
+    return module
+
+
+def load_module(bucket: str, key: str, module_name: str) -> ModuleType:
+    return get_compiled_s3_object(
+        bucket, key, functools.partial(exec_module_source, module_name)
+    )
+
+
 def load_and_execute_function_from_s3(
     bucket: str, key: str, function_name: str, event: dict
 ):
-    s3_client = boto3.client("s3")
     try:
         logger.info(
             f"Loading function from S3: bucket={bucket}, key=api_templates/{key}, function={function_name}"
         )
-        response = s3_client.get_object(Bucket=bucket, Key=f"api_templates/{key}")
-        file_content = response["Body"].read().decode("utf-8")
-        logger.info(f"File content loaded: {len(file_content)} characters")
-        logger.info(f"File content preview: {file_content[:200]}...")
-
-        spec = importlib.util.spec_from_loader("dynamic_module", loader=None)
-        module = importlib.util.module_from_spec(spec)
-        exec(
-            file_content, module.__dict__
-        )  # nosec B102 - Controlled execution of trusted S3 templates
+        module = load_module(bucket, f"api_templates/{key}", "dynamic_module")
         if not hasattr(module, function_name):
             available_functions = [
                 name
@@ -217,15 +289,6 @@ def load_and_execute_function_from_s3(
         raise
 
 
-def download_s3_object(bucket: str, key: str) -> str:
-    try:
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        return response["Body"].read().decode("utf-8")
-    except ClientError as e:
-        print(f"Error downloading S3 object: {e}")
-        raise
-
-
 def create_authentication(api_auth_type: str, api_key_secret_arn: str):
     if api_auth_type == "api_key":
         api_key = retrieve_api_key(api_key_secret_arn)
@@ -318,15 +381,10 @@ def create_request_body(s3_templates, api_template_bucket, event):
     request_template_path = f"api_templates/{s3_templates['request_template']}"
     mapping_path = s3_templates["mapping_file"]
     logger.info(api_template_bucket + " " + request_template_path)
-    request_template = download_s3_object(api_template_bucket, request_template_path)
+    query_template = load_template(api_template_bucket, request_template_path)
     mapping = load_and_execute_function_from_s3(
         api_template_bucket, mapping_path, function_name, event
     )
-    env = Environment(
-        loader=FileSystemLoader("/tmp/")
-    )  # nosec B701 - Controlled template rendering with trusted input
-    env.filters["jsonify"] = json.dumps
-    query_template = env.from_string(request_template)
     request_body = query_template.render(variables=mapping)
     request_body = ast.literal_eval(request_body)
     return request_body
@@ -345,10 +403,10 @@ def create_custom_url(s3_templates, api_template_bucket, event):
     logger.info(f"Looking for URL mapping at: api_templates/{url_mapping_path}")
 
     try:
-        request_template = download_s3_object(api_template_bucket, url_template_path)
-        logger.info(f"Successfully downloaded URL template: {url_template_path}")
+        query_template = load_template(api_template_bucket, url_template_path)
+        logger.info(f"Successfully loaded URL template: {url_template_path}")
     except Exception as e:
-        logger.error(f"Failed to download URL template {url_template_path}: {str(e)}")
+        logger.error(f"Failed to load URL template {url_template_path}: {str(e)}")
         raise
 
     try:
@@ -361,9 +419,6 @@ def create_custom_url(s3_templates, api_template_bucket, event):
         logger.error(f"Failed to execute URL mapping {url_mapping_path}: {str(e)}")
         raise
 
-    env = Environment(loader=FileSystemLoader("/tmp/"))  # nosec B701
-    env.filters["jsonify"] = json.dumps
-    query_template = env.from_string(request_template)
     custom_url = query_template.render(variables=mapping)
     logger.info(f"Generated custom URL: {custom_url}")
     return custom_url
@@ -384,8 +439,7 @@ def create_response_output(s3_templates, api_template_bucket, response_body, eve
         f"Event keys: {list(event.keys()) if isinstance(event, dict) else 'Not a dict'}"
     )
 
-    response_template = download_s3_object(api_template_bucket, response_template_path)
-    logger.info(f"Response template loaded: {len(response_template)} characters")
+    query_template = load_template(api_template_bucket, response_template_path)
 
     # Create the combined parameter as expected by the response mapping function
     response_body_and_event = {"response_body": response_body, "event": event}
@@ -428,17 +482,13 @@ def create_response_output(s3_templates, api_template_bucket, response_body, eve
         logger.error(f"Response mapping file: {response_mapping_path}")
         raise
 
-    env = Environment(loader=FileSystemLoader("/tmp/"))  # nosec B701
-    env.filters["jsonify"] = json.dumps
-    query_template = env.from_string(response_template)
-
     logger.info(f"Rendering template with variables: {response_mapping}")
     try:
         response_output = query_template.render(variables=response_mapping)
         logger.info(f"Template rendered successfully: {response_output}")
     except Exception as e:
         logger.error(f"Error rendering template: {str(e)}")
-        logger.error(f"Template: {response_template}")
+        logger.error(f"Template: {response_template_path}")
         logger.error(f"Variables: {response_mapping}")
         raise
 
@@ -453,6 +503,28 @@ def create_response_output(s3_templates, api_template_bucket, response_body, eve
         raise
 
 
+def log_parent_directory(api_template_bucket: str, module_path: str):
+    """List the objects next to a missing module, for debugging"""
+    try:
+        parent_path = "/".join(module_path.split("/")[:-1]) + "/"
+        logger.info(f"Listing objects in parent directory: {parent_path}")
+        list_response = s3_client.list_objects_v2(
+            Bucket=api_template_bucket, Prefix=parent_path, MaxKeys=20
+        )
+        if "Contents" in list_response:
+            logger.info(
+                f"Found {len(list_response['Contents'])} objects in {parent_path}:"
+            )
+            for obj in list_response["Contents"]:
+                logger.info(
+                    f"  - {obj['Key']} (size: {obj['Size']}, modified: {obj['LastModified']})"
+                )
+        else:
+            logger.info(f"No objects found in {parent_path}")
+    except Exception as list_error:
+        logger.error(f"Error listing parent directory: {list_error}")
+
+
 def load_custom_modules(api_template_bucket: str, custom_code_paths: list):
     """
     Load custom code modules from S3 and make them available for import
@@ -467,52 +539,17 @@ def load_custom_modules(api_template_bucket: str, custom_code_paths: list):
             logger.info(f"Loading custom code module from: {module_path}")
             logger.info(f"Full S3 path: s3://{api_template_bucket}/{module_path}")
 
-            # Check if the object exists first
-            try:
-                s3_client.head_object(Bucket=api_template_bucket, Key=module_path)
-                logger.info(f"✓ S3 object exists: {module_path}")
-            except ClientError as head_error:
-                logger.error(f"✗ S3 object does not exist: {module_path}")
-                logger.error(f"Head object error: {head_error}")
-
-                # List objects in the parent directory for debugging
-                try:
-                    parent_path = "/".join(module_path.split("/")[:-1]) + "/"
-                    logger.info(f"Listing objects in parent directory: {parent_path}")
-                    list_response = s3_client.list_objects_v2(
-                        Bucket=api_template_bucket, Prefix=parent_path, MaxKeys=20
-                    )
-                    if "Contents" in list_response:
-                        logger.info(
-                            f"Found {len(list_response['Contents'])} objects in {parent_path}:"
-                        )
-                        for obj in list_response["Contents"]:
-                            logger.info(
-                                f"  - {obj['Key']} (size: {obj['Size']}, modified: {obj['LastModified']})"
-                            )
-                    else:
-                        logger.info(f"No objects found in {parent_path}")
-                except Exception as list_error:
-                    logger.error(f"Error listing parent directory: {list_error}")
-
-                raise head_error
-
-            response = s3_client.get_object(Bucket=api_template_bucket, Key=module_path)
-            file_content = response["Body"].read().decode("utf-8")
-            logger.info(
-                f"✓ Successfully downloaded file: {len(file_content)} characters"
-            )
-            logger.info(
-                f"File content preview (first 200 chars): {file_content[:200]}..."
-            )
-
             # Extract module name from path (e.g., "coactive/shared/coactive_auth.py" -> "coactive_auth")
             module_name = module_path.split("/")[-1].replace(".py", "")
             logger.info(f"Module name extracted: {module_name}")
 
-            spec = importlib.util.spec_from_loader(module_name, loader=None)
-            module = importlib.util.module_from_spec(spec)
-            exec(file_content, module.__dict__)
+            try:
+                module = load_module(api_template_bucket, module_path, module_name)
+            except ClientError as load_error:
+                if load_error.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                    logger.error(f"✗ S3 object does not exist: {module_path}")
+                    log_parent_directory(api_template_bucket, module_path)
+                raise
 
             # Make module available in sys.modules for import
             sys.modules[module_name] = module
@@ -709,13 +746,9 @@ def load_and_execute_custom_code(
 
         # Fallback to individual custom code file if no shared modules
         if "custom_code_file" in s3templates:
-            response = s3_client.get_object(
-                Bucket=api_template_bucket, Key=s3templates["custom_code_file"]
+            module = load_module(
+                api_template_bucket, s3templates["custom_code_file"], "custom_module"
             )
-            file_content = response["Body"].read().decode("utf-8")
-            spec = importlib.util.spec_from_loader("custom_module", loader=None)
-            module = importlib.util.module_from_spec(spec)
-            exec(file_content, module.__dict__)
 
             if not hasattr(module, "process_api_response"):
                 raise AttributeError(
@@ -741,6 +774,7 @@ def load_and_execute_custom_code(
 @lambda_middleware(
     event_bus_name=os.environ.get("EVENT_BUS_NAME", "default-event-bus"),
 )
+@metrics.log_metrics
 @tracer.capture_lambda_handler
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     time.time()
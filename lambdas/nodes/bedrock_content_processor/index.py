@@ -1,8 +1,12 @@
+import hashlib
 import json
 import os
 import random
 import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import Any, Callable, Dict, Optional, Union
 from urllib.parse import urlparse
@@ -19,6 +23,8 @@ logger = Logger()
 tracer = Tracer()
 
 s3 = boto3.resource("s3")
+# Clients are thread-safe; used from the chunk summary workers
+s3_client = boto3.client("s3")
 bedrock_rt = boto3.client("bedrock-runtime")
 dynamodb = boto3.resource("dynamodb")
 table = dynamodb.Table(os.environ["MEDIALAKE_ASSET_TABLE"])
@@ -29,6 +35,16 @@ table = dynamodb.Table(os.environ["MEDIALAKE_ASSET_TABLE"])
 
 ImagePayload = Dict[str, str]
 
+# Chunk summaries requested from Bedrock at the same time
+MAX_CONCURRENT_INVOCATIONS = int(os.getenv("BEDROCK_MAX_CONCURRENCY", "4"))
+
+# Text results are cached by (content hash, prompt, model id), in memory and
+# under this prefix of the media assets bucket, which expires them
+RESULT_CACHE_ENABLED = os.getenv("BEDROCK_RESULT_CACHE_ENABLED", "true") == "true"
+RESULT_CACHE_PREFIX = os.getenv("BEDROCK_RESULT_CACHE_PREFIX", "bedrock-cache")
+# Results kept in memory per container, least recently used evicted first
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("BEDROCK_RESULT_CACHE_MAX_ENTRIES", "256"))
+
 # Default prompts
 DEFAULT_PROMPTS = {
     "summary_100": (
@@ -498,10 +514,64 @@ def validate_input_size(text: str, model_id: str, max_tokens: int = 100000):
     return estimated_tokens
 
 
+# Boundaries chunks are split at, in order of preference: line ends (transcript
+# segments, paragraphs), then sentence ends
+_LINE_BOUNDARY = re.compile(r"\n+")
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?…])\s+")
+
+
+def _split_after(text: str, boundary: re.Pattern) -> list:
+    """Split text after each boundary match, keeping the separators."""
+    pieces = []
+    start = 0
+    for match in boundary.finditer(text):
+        pieces.append(text[start : match.end()])
+        start = match.end()
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
+
+
+def _text_segments(text: str, max_chars: int):
+    """Yield pieces of text no longer than max_chars, split at boundaries."""
+    for line in _split_after(text, _LINE_BOUNDARY):
+        if len(line) <= max_chars:
+            yield line
+            continue
+        for sentence in _split_after(line, _SENTENCE_BOUNDARY):
+            if len(sentence) <= max_chars:
+                yield sentence
+                continue
+            # A single sentence longer than a chunk has to be cut
+            for i in range(0, len(sentence), max_chars):
+                yield sentence[i : i + max_chars]
+
+
+def _pack(pieces, max_chars: int, separator: str = "") -> list:
+    """Greedily join consecutive pieces into groups of at most max_chars."""
+    groups = []
+    current = []
+    size = 0
+    for piece in pieces:
+        if current and size + len(separator) + len(piece) > max_chars:
+            groups.append(current)
+            current = []
+            size = 0
+        size += len(piece) + (len(separator) if current else 0)
+        current.append(piece)
+    if current:
+        groups.append(current)
+    return groups
+
+
 def chunk_text(text: str, max_tokens: int = 50000) -> list:
     """
     Split text into chunks that fit within token limits.
 
+    Chunks end at transcript segment (line) boundaries where possible, then at
+    sentence boundaries, so no chunk starts or ends mid-sentence unless a
+    single sentence is longer than a chunk.
+
     Args:
         text: The text to chunk
         max_tokens: Maximum tokens per chunk (default: 50K to leave room for prompt)
@@ -510,21 +580,126 @@ def chunk_text(text: str, max_tokens: int = 50000) -> list:
         List of text chunks
     """
     max_chars = max_tokens * 4
-    chunks = []
-
-    for i in range(0, len(text), max_chars):
-        chunk = text[i : i + max_chars]
-        chunks.append(chunk)
+    segments = _text_segments(text, max_chars)
+    chunks = ["".join(group) for group in _pack(segments, max_chars)]
 
     logger.info(f"Split text into {len(chunks)} chunks")
     return chunks
 
 
+class BedrockResultCache:
+    """
+    Text results keyed by (content hash, prompt, model id).
+
+    The most recently used max_entries results are kept in memory for the
+    life of the container and, when a bucket is given, every result is stored
+    as a small JSON object under RESULT_CACHE_PREFIX so that re-running a
+    pipeline on unchanged content makes no model calls on any container.
+    Cache errors are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        bucket: Optional[str],
+        prefix: str,
+        enabled: bool = True,
+        max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+    ):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key: str, result: str) -> None:
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    @staticmethod
+    def key(model_id: str, instr: str, content: str) -> str:
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return hashlib.sha256(
+            json.dumps([content_hash, instr, model_id]).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+        if not self.bucket:
+            return None
+        try:
+            body = s3_client.get_object(
+                Bucket=self.bucket, Key=f"{self.prefix}/{key}.json"
+            )["Body"].read()
+            result = json.loads(body)["result"]
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchKey":
+                logger.warning(f"Bedrock result cache read failed: {e}")
+            return None
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable Bedrock cache entry {key}: {e}")
+            return None
+        self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: str, model_id: str) -> None:
+        if not self.enabled:
+            return
+        self._remember(key, result)
+        if not self.bucket:
+            return
+        try:
+            s3_client.put_object(
+                Bucket=self.bucket,
+                Key=f"{self.prefix}/{key}.json",
+                Body=json.dumps({"result": result, "model_id": model_id}),
+                ContentType="application/json",
+            )
+        except ClientError as e:
+            logger.warning(f"Bedrock result cache write failed: {e}")
+
+
+result_cache = BedrockResultCache(
+    os.getenv("MEDIA_ASSETS_BUCKET_NAME"), RESULT_CACHE_PREFIX, RESULT_CACHE_ENABLED
+)
+
+
+def _extract_text_result(model_id: str, data: Dict[str, Any]) -> str:
+    if "anthropic" in model_id.lower():
+        return data["content"][0]["text"]
+    elif "nova" in model_id.lower():
+        return data["output"]["message"]["content"][0]["text"]
+    elif "titan" in model_id.lower():
+        return data["results"][0]["outputText"]
+    else:
+        return str(data)
+
+
 def summarize_chunks(
-    chunks: list, model_id: str, instr: str, bedrock_client, profile_id: str
+    chunks: list,
+    model_id: str,
+    instr: str,
+    bedrock_client,
+    profile_id: str,
+    max_workers: int = MAX_CONCURRENT_INVOCATIONS,
+    cache: Optional[BedrockResultCache] = None,
+    max_tokens: int = 50000,
 ) -> str:
     """
-    Summarize each chunk and combine results.
+    Summarize each chunk and combine results (map-reduce).
+
+    Chunk summaries run concurrently, at most max_workers in flight, sharing
+    one throttling backoff. When the summaries together are too long for one
+    request they are combined in groups first, until one combine call fits.
+    Every call is looked up in the cache before Bedrock is invoked.
 
     Args:
         chunks: List of text chunks to summarize
@@ -532,54 +707,60 @@ def summarize_chunks(
         instr: The instruction/prompt
         bedrock_client: Bedrock runtime client
         profile_id: Inference profile ID
+        max_workers: Maximum concurrent Bedrock invocations
+        cache: Result cache; results are not cached if None
+        max_tokens: Maximum tokens per combine request
 
     Returns:
         Combined summary of all chunks
     """
-    summaries = []
-
-    for i, chunk in enumerate(chunks):
-        logger.info(f"Processing chunk {i+1}/{len(chunks)}")
-        body_json = build_bedrock_body(model_id, instr, chunk).encode("utf-8")
+    throttle = BedrockThrottle()
+    max_chars = max_tokens * 4
 
+    def invoke(prompt: str, content: str) -> str:
+        key = BedrockResultCache.key(model_id, prompt, content) if cache else None
+        if cache:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        body_json = build_bedrock_body(model_id, prompt, content).encode("utf-8")
         resp = invoke_bedrock_with_retry(
-            bedrock_client, profile_id, body_json, "application/json"
+            bedrock_client, profile_id, body_json, "application/json", throttle=throttle
         )
-        data = json.loads(resp["body"].read())
-
-        if "anthropic" in model_id.lower():
-            summary = data["content"][0]["text"]
-        elif "nova" in model_id.lower():
-            summary = data["output"]["message"]["content"][0]["text"]
-        elif "titan" in model_id.lower():
-            summary = data["results"][0]["outputText"]
-        else:
-            summary = str(data)
+        result = _extract_text_result(model_id, json.loads(resp["body"].read()))
+        if cache:
+            cache.put(key, result, model_id)
+        return result
 
-        summaries.append(summary)
+    def summarize(indexed_chunk) -> str:
+        i, chunk = indexed_chunk
+        logger.info(f"Processing chunk {i+1}/{len(chunks)}")
+        return invoke(instr, chunk)
 
-    if len(summaries) > 1:
-        combined = "\n\n".join(summaries)
+    def combine(summaries: list) -> str:
         final_instr = (
             "Combine these summaries into a single coherent summary. "
-            "Maintain the key points and overall structure:\n\n" + combined
+            "Maintain the key points and overall structure:\n\n"
+            + "\n\n".join(summaries)
         )
+        return invoke(final_instr, "")
 
-        logger.info("Creating final combined summary")
-        body_json = build_bedrock_body(model_id, final_instr, "").encode("utf-8")
-        resp = invoke_bedrock_with_retry(
-            bedrock_client, profile_id, body_json, "application/json"
-        )
-        data = json.loads(resp["body"].read())
-
-        if "anthropic" in model_id.lower():
-            return data["content"][0]["text"]
-        elif "nova" in model_id.lower():
-            return data["output"]["message"]["content"][0]["text"]
-        elif "titan" in model_id.lower():
-            return data["results"][0]["outputText"]
-        else:
-            return str(data)
+    def run(fn, items: list) -> list:
+        workers = min(max_workers, len(items))
+        if workers <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items))
+
+    summaries = run(summarize, list(enumerate(chunks)))
+
+    while len(summaries) > 1:
+        groups = _pack(summaries, max_chars, separator="\n\n")
+        if len(groups) == 1 or len(groups) == len(summaries):
+            logger.info("Creating final combined summary")
+            return combine(summaries)
+        logger.info(f"Combining {len(summaries)} summaries in {len(groups)} groups")
+        summaries = run(combine, groups)
 
     return summaries[0]
 
@@ -650,6 +831,30 @@ def create_response_output(tpl_paths, bucket, result, event, mapping):
 # ────────────────────────────────────────────────────────────
 
 
+class BedrockThrottle:
+    """
+    Throttling backoff shared by concurrent invocations.
+
+    A throttled call pushes back the next attempt of every worker, so
+    concurrent chunk summaries back off together instead of each one
+    retrying into the same exhausted quota.
+    """
+
+    def __init__(self):
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def backoff(self, delay: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+
 def invoke_bedrock_with_retry(
     bedrock_client,
     model_id: str,
@@ -658,6 +863,7 @@ def invoke_bedrock_with_retry(
     max_retries: int = 50,
     base_delay: float = 1.0,
     max_delay: float = 60.0,
+    throttle: Optional[BedrockThrottle] = None,
 ):
     """
     Invoke Bedrock model with exponential backoff retry for throttling exceptions.
@@ -670,6 +876,7 @@ def invoke_bedrock_with_retry(
         max_retries: Maximum number of retry attempts (default: 50)
         base_delay: Base delay in seconds for exponential backoff
         max_delay: Maximum delay in seconds between retries
+        throttle: Backoff shared with other concurrent invocations, if any
 
     Returns:
         The response from Bedrock invoke_model
@@ -678,6 +885,8 @@ def invoke_bedrock_with_retry(
         ClientError: If all retries are exhausted or for non-throttling errors
     """
     for attempt in range(max_retries + 1):
+        if throttle:
+            throttle.wait()
         try:
             logger.info(f"Bedrock invoke attempt {attempt + 1}/{max_retries + 1}")
             response = bedrock_client.invoke_model(
@@ -705,7 +914,11 @@ def invoke_bedrock_with_retry(
                         f"Bedrock throttling on attempt {attempt + 1}: {error_code}. "
                         f"Retrying in {total_delay:.2f} seconds..."
                     )
-                    time.sleep(total_delay)
+                    if throttle:
+                        # Slept in throttle.wait() with the other workers
+                        throttle.backoff(total_delay)
+                    else:
+                        time.sleep(total_delay)
                     continue
                 else:
                     logger.error(
@@ -1174,23 +1387,34 @@ def lambda_handler(event, context):
         else:
             raise ValueError(f"Unsupported content_source: {content_src!r}")
 
-        try:
-            profile_id = get_inference_profile_for_model(
-                model_id, region_name=os.getenv("AWS_REGION")
-            )
-        except (PermissionError, ValueError) as e:
-            logger.error("Bedrock setup error", exc_info=e)
-            raise
+        # Same transcript, prompt and model as an earlier run: reuse its result
+        cache_key = None
+        cached_result = None
+        if content_src == "transcript":
+            cache_key = BedrockResultCache.key(model_id, instr, text)
+            cached_result = result_cache.get(cache_key)
+
+        if cached_result is None:
+            try:
+                profile_id = get_inference_profile_for_model(
+                    model_id, region_name=os.getenv("AWS_REGION")
+                )
+            except (PermissionError, ValueError) as e:
+                logger.error("Bedrock setup error", exc_info=e)
+                raise
 
         # ── Invoke Bedrock ────────────────────────────────────────────────
         logger.info(f"Invoking {model_id} with payload from {fetched_uri}")
 
         try:
-            if use_chunking:
+            if cached_result is not None:
+                logger.info("Using cached result for unchanged transcript")
+                result = cached_result
+            elif use_chunking:
                 logger.info("Using chunking strategy for large content")
                 chunks = chunk_text(text, max_tokens=50000)
                 result = summarize_chunks(
-                    chunks, model_id, instr, bedrock_rt, profile_id
+                    chunks, model_id, instr, bedrock_rt, profile_id, cache=result_cache
                 )
                 logger.info(
                     f"Chunked processing complete. Final result length: {len(result)}"
@@ -1211,9 +1435,15 @@ def lambda_handler(event, context):
                         logger.warning(
                             "Token limit exceeded despite validation. Falling back to chunking."
                         )
+                        use_chunking = True
                         chunks = chunk_text(text, max_tokens=50000)
                         result = summarize_chunks(
-                            chunks, model_id, instr, bedrock_rt, profile_id
+                            chunks,
+                            model_id,
+                            instr,
+                            bedrock_rt,
+                            profile_id,
+                            cache=result_cache,
                         )
                         logger.info(
                             f"Fallback chunking complete. Final result length: {len(result)}"
@@ -1317,6 +1547,9 @@ def lambda_handler(event, context):
                         raise
             raise  # always re-raise
 
+        if cache_key and cached_result is None and isinstance(result, str) and result:
+            result_cache.put(cache_key, result, model_id)
+
         # ── Persist back to DynamoDB ──────────────────────────────────────
         from datetime import datetime
 
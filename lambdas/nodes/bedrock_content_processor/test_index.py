@@ -0,0 +1,217 @@
+"""
+Unit tests for chunked Bedrock summaries.
+
+Tests that long text is chunked on line and sentence boundaries, that chunk
+summaries are combined in groups until one combine call fits while keeping
+chunk order, and that cached results are returned without calling Bedrock.
+"""
+
+import io
+import json
+import os
+import re
+import time
+from unittest.mock import MagicMock
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("EXTERNAL_PAYLOAD_BUCKET", "payloads")
+os.environ.setdefault("MEDIALAKE_ASSET_TABLE", "assets")
+
+import index
+import pytest
+from index import BedrockResultCache, _pack, chunk_text, summarize_chunks
+
+MODEL_ID = "anthropic.claude-3-haiku"
+CHUNK_ID = re.compile(r"chunk-\d+")
+
+
+class StubBedrock:
+    """
+    invoke_model stand-in summarizing a request as the chunk ids it contains.
+
+    A chunk summary of "chunk-3 ..." is "<chunk-3>" and a combine request
+    over "<chunk-0>" and "<chunk-1>" is "<chunk-0 chunk-1>", so the final
+    summary shows which chunks were combined and in what order. Earlier
+    chunks answer more slowly so concurrent workers finish out of order.
+    """
+
+    def __init__(self, chunks=0):
+        self.chunks = chunks
+        self.calls = 0
+
+    def invoke_model(self, modelId, body, contentType):
+        self.calls += 1
+        ids = CHUNK_ID.findall(body.decode("utf-8"))
+        if len(ids) == 1:
+            time.sleep(0.005 * (self.chunks - int(ids[0].split("-")[1])))
+        text = f"<{' '.join(ids)}>"
+        payload = json.dumps({"content": [{"text": text}]}).encode("utf-8")
+        return {"body": io.BytesIO(payload)}
+
+
+class TestPack:
+    """Test suite for greedy packing of pieces into groups"""
+
+    def test_separator_counts_towards_the_limit(self):
+        """Test that joining separators are included in a group's size"""
+        pieces = ["aaaa", "bbbb", "cc"]
+
+        assert _pack(pieces, 10) == [["aaaa", "bbbb", "cc"]]
+        assert _pack(pieces, 10, separator="\n\n") == [["aaaa", "bbbb"], ["cc"]]
+
+    def test_oversize_piece_is_its_own_group(self):
+        """Test that a piece longer than the limit is kept whole and alone"""
+        assert _pack(["a" * 15, "b", "c"], 10) == [["a" * 15], ["b", "c"]]
+
+    def test_no_pieces_is_no_groups(self):
+        """Test that packing nothing returns no groups"""
+        assert _pack([], 10) == []
+
+
+class TestChunkText:
+    """Test suite for splitting text into chunks (4 characters per token)"""
+
+    def test_chunks_end_on_line_boundaries(self):
+        """Test that whole lines are packed and never split"""
+        text = "aaaaaaaa\n" * 3
+
+        chunks = chunk_text(text, max_tokens=5)
+
+        assert chunks == ["aaaaaaaa\naaaaaaaa\n", "aaaaaaaa\n"]
+
+    def test_long_line_is_split_on_sentences(self):
+        """Test that a line longer than a chunk is split after sentence ends"""
+        text = "One two three. Four five six. Seven.\n"
+
+        chunks = chunk_text(text, max_tokens=5)
+
+        assert chunks == ["One two three. ", "Four five six. ", "Seven.\n"]
+
+    def test_over_long_sentence_is_cut(self):
+        """Test that a single sentence longer than a chunk is cut to size"""
+        text = "x" * 45
+
+        chunks = chunk_text(text, max_tokens=5)
+
+        assert chunks == ["x" * 20, "x" * 20, "x" * 5]
+
+    def test_chunks_reassemble_the_text(self):
+        """Test that no characters are lost or duplicated across chunks"""
+        text = "Short line.\n" + "A much longer sentence here. And another! " * 3
+
+        chunks = chunk_text(text, max_tokens=5)
+
+        assert "".join(chunks) == text
+        assert all(len(chunk) <= 20 for chunk in chunks)
+
+
+class TestSummarizeChunks:
+    """Test suite for the map-reduce summary over Bedrock"""
+
+    def test_single_chunk_is_summarized_once(self):
+        """Test that one chunk needs no combine call"""
+        client = StubBedrock(chunks=1)
+
+        summary = summarize_chunks(["chunk-0 text"], MODEL_ID, "Summarize", client, "p")
+
+        assert summary == "<chunk-0>"
+        assert client.calls == 1
+
+    def test_summaries_are_combined_in_groups_in_order(self):
+        """Test that combine rounds keep chunk order until one call fits"""
+        chunks = [f"chunk-{i} text" for i in range(6)]
+        client = StubBedrock(chunks=6)
+
+        summary = summarize_chunks(
+            chunks, MODEL_ID, "Summarize", client, "p", max_workers=6, max_tokens=5
+        )
+
+        # 6 summaries of 9 characters pack in pairs within 20 characters, and
+        # the 3 pair summaries no longer fit together, so they are combined once
+        assert summary == "<chunk-0 chunk-1 chunk-2 chunk-3 chunk-4 chunk-5>"
+        assert client.calls == 6 + 3 + 1
+
+    def test_summaries_that_fit_are_combined_once(self):
+        """Test that summaries fitting one request skip the grouping rounds"""
+        chunks = [f"chunk-{i} text" for i in range(4)]
+        client = StubBedrock(chunks=4)
+
+        summary = summarize_chunks(chunks, MODEL_ID, "Summarize", client, "p")
+
+        assert summary == "<chunk-0 chunk-1 chunk-2 chunk-3>"
+        assert client.calls == 4 + 1
+
+    def test_cached_chunk_skips_bedrock(self):
+        """Test that a cache hit returns the stored result without a call"""
+        cache = BedrockResultCache(None, "bedrock-cache")
+        key = BedrockResultCache.key(MODEL_ID, "Summarize", "chunk-0 text")
+        cache.put(key, "cached summary", MODEL_ID)
+        client = StubBedrock(chunks=1)
+
+        summary = summarize_chunks(
+            ["chunk-0 text"], MODEL_ID, "Summarize", client, "p", cache=cache
+        )
+
+        assert summary == "cached summary"
+        assert client.calls == 0
+
+    def test_results_are_cached_for_the_next_run(self):
+        """Test that a second run over unchanged chunks makes no calls"""
+        cache = BedrockResultCache(None, "bedrock-cache")
+        chunks = [f"chunk-{i} text" for i in range(3)]
+        first = summarize_chunks(
+            chunks, MODEL_ID, "Summarize", StubBedrock(chunks=3), "p", cache=cache
+        )
+        client = StubBedrock(chunks=3)
+
+        second = summarize_chunks(
+            chunks, MODEL_ID, "Summarize", client, "p", cache=cache
+        )
+
+        assert second == first
+        assert client.calls == 0
+
+
+class TestBedrockResultCache:
+    """Test suite for the in-memory and S3 result tiers"""
+
+    @pytest.fixture
+    def s3_client(self, monkeypatch):
+        client = MagicMock()
+        monkeypatch.setattr(index, "s3_client", client)
+        return client
+
+    def test_s3_hit_is_kept_in_memory(self, s3_client):
+        """Test that a result written by another container is read once"""
+        body = json.dumps({"result": "from s3", "model_id": MODEL_ID}).encode()
+        s3_client.get_object.return_value = {"Body": io.BytesIO(body)}
+        cache = BedrockResultCache("media", "bedrock-cache/")
+
+        assert cache.get("k") == "from s3"
+        assert cache.get("k") == "from s3"
+
+        s3_client.get_object.assert_called_once_with(
+            Bucket="media", Key="bedrock-cache/k.json"
+        )
+
+    def test_memory_tier_evicts_least_recently_used(self, s3_client):
+        """Test that the memory tier is bounded and keeps recently read keys"""
+        cache = BedrockResultCache(None, "bedrock-cache", max_entries=2)
+        cache.put("a", "A", MODEL_ID)
+        cache.put("b", "B", MODEL_ID)
+        cache.get("a")
+
+        cache.put("c", "C", MODEL_ID)
+
+        assert list(cache._results) == ["a", "c"]
+        assert cache.get("b") is None
+
+    def test_disabled_cache_stores_nothing(self, s3_client):
+        """Test that a disabled cache never reads or writes"""
+        cache = BedrockResultCache("media", "bedrock-cache", enabled=False)
+        cache.put("k", "result", MODEL_ID)
+
+        assert cache.get("k") is None
+        s3_client.put_object.assert_not_called()
+        s3_client.get_object.assert_not_called()
@@ -24,6 +24,7 @@ from typing import Any, Dict, List
 
 import boto3
 from aws_lambda_powertools import Logger, Tracer
+from collections_utils import asset_membership_keys
 from lambda_middleware import lambda_middleware
 
 logger = Logger(service="collection-manager-node")
@@ -446,6 +447,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     # GSI2 reverse lookup (asset -> collections), mirrors the API.
                     "GSI2_PK": sk,
                     "GSI2_SK": f"{COLLECTION_PK_PREFIX}{collection_id}",
+                    # GSI7 asset membership lookup, used by asset deletion cleanup.
+                    **asset_membership_keys(asset_id, collection_id),
                 }
             )
             added.append(asset_id)
@@ -7,6 +7,7 @@ Store embedding vectors in OpenSearch.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import random
@@ -21,7 +22,9 @@ from distributed_map_utils import download_s3_external_payload, is_s3_reference
 from lambda_middleware import lambda_middleware
 from lambda_utils import _truncate_floats
 from nodes_utils import seconds_to_smpte
+from opensearch_bulk import MAX_BULK_SIZE_MB, chunk_bulk_actions
 from opensearchpy import AWSV4SignerAuth, OpenSearch, RequestsHttpConnection, exceptions
+from opensearchpy.helpers import streaming_bulk
 
 # S3 client for downloading external payloads
 s3_client = boto3.client("s3")
@@ -46,6 +49,11 @@ MODEL_VERSION = os.getenv("MODEL_VERSION", "")
 
 IS_AUDIO_CONTENT = CONTENT_TYPE == "audio"
 
+# Retries of failed items in batched clip embedding bulk requests
+BULK_MAX_RETRIES = int(os.getenv("BULK_MAX_RETRIES", "3"))
+# Per-item bulk statuses worth retrying in-process (throttling / transient)
+RETRYABLE_BULK_STATUSES = {429, 500, 502, 503, 504}
+
 # OpenSearch client
 _session = boto3.Session()
 _credentials = _session.get_credentials()
@@ -793,10 +801,10 @@ def _create_separate_embedding_document(
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-def process_single_embedding(
-    payload: Dict[str, Any], embedding_data: Dict[str, Any], client, inventory_id: str
-) -> Dict[str, Any]:
-    """Process a single embedding object."""
+def _build_clip_document(
+    payload: Dict[str, Any], embedding_data: Dict[str, Any], inventory_id: str
+) -> Tuple[Dict[str, Any], int, int]:
+    """Build the OpenSearch document for a single clip/audio embedding object."""
     # Check if this is a lightweight reference that needs to be downloaded
     if is_s3_reference(embedding_data):
         logger.info("Detected lightweight reference, downloading from S3")
@@ -841,8 +849,65 @@ def process_single_embedding(
     if embedding_option is not None:
         document["embedding_option"] = embedding_option
 
+    return document, start_sec, end_sec
+
+
+def _clip_document_id(inventory_id: str, document: Dict[str, Any]) -> str:
+    """
+    Deterministic document ID for a clip embedding.
+
+    Re-delivering the same clip (Step Functions retry of a failed invocation,
+    single or batched) overwrites the earlier document instead of creating a
+    duplicate.
+    """
+    key = "|".join(
+        [
+            inventory_id,
+            str(document.get("embedding_scope")),
+            str(document.get("embedding_option")),
+            str(document.get("start_timecode")),
+            str(document.get("end_timecode")),
+        ]
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _embedding_document_id(document: Dict[str, Any]) -> str:
+    """
+    Deterministic document ID for a Marengo 3.0 asset-embeddings document.
+
+    One document per asset, model version, granularity, representation and
+    time range, so a retried invocation overwrites rather than duplicates.
+    """
+    key = "|".join(
+        str(document.get(field))
+        for field in (
+            "inventory_id",
+            "model_version",
+            "embedding_granularity",
+            "embedding_representation",
+            "embedding_dimension",
+            "start_seconds",
+            "end_seconds",
+        )
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def process_single_embedding(
+    payload: Dict[str, Any], embedding_data: Dict[str, Any], client, inventory_id: str
+) -> Dict[str, Any]:
+    """Process a single embedding object."""
+    document, start_sec, end_sec = _build_clip_document(
+        payload, embedding_data, inventory_id
+    )
+
     try:
-        res = client.index(index=INDEX_NAME, body=document)
+        res = client.index(
+            index=INDEX_NAME,
+            body=document,
+            id=_clip_document_id(inventory_id, document),
+        )
         check_opensearch_response(res, "index")
 
         return {
@@ -860,6 +925,220 @@ def process_single_embedding(
         ) from e
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Bulk clip indexing (batch payloads)
+def bulk_index_clip_documents(
+    client: OpenSearch, actions: List[dict]
+) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """
+    Index clip documents with size-bounded _bulk requests.
+
+    Only items that fail with a retryable status (429/5xx), or whose chunk
+    request failed without a status (connection error, timeout), are re-sent,
+    with exponential backoff, up to BULK_MAX_RETRIES times. Items that were
+    indexed are never sent again. Everything else is reported back to the
+    caller.
+
+    Returns:
+        Tuple of (indexed document IDs, failed document ID -> error details)
+    """
+    indexed: List[str] = []
+    failures: Dict[str, Dict[str, Any]] = {}
+    pending = actions
+
+    for attempt in range(BULK_MAX_RETRIES + 1):
+        if attempt > 0:
+            time.sleep(exponential_backoff_with_jitter(attempt, base_delay=0.5))
+            logger.info(
+                f"Retrying {len(pending)} failed clip documents (attempt {attempt})"
+            )
+
+        actions_by_id = {a["_id"]: a for a in pending}
+        retry: List[dict] = []
+        for chunk in chunk_bulk_actions(pending):
+            chunk_start = time.time()
+            for ok, item in streaming_bulk(
+                client,
+                chunk,
+                chunk_size=len(chunk),
+                max_chunk_bytes=MAX_BULK_SIZE_MB * 1024 * 1024,
+                raise_on_error=False,
+                raise_on_exception=False,
+                max_retries=0,
+                yield_ok=True,
+            ):
+                info = item.get("index", {})
+                doc_id = info.get("_id", "unknown")
+                if ok:
+                    indexed.append(doc_id)
+                    failures.pop(doc_id, None)
+                    continue
+
+                status = info.get("status", 0)
+                failures[doc_id] = {"status": status, "error": info.get("error")}
+                # A failed chunk request reports every item in it with the
+                # transport status, which is "N/A" when there was no response
+                retryable = (
+                    status in RETRYABLE_BULK_STATUSES or not isinstance(status, int)
+                )
+                if retryable and doc_id in actions_by_id:
+                    retry.append(actions_by_id[doc_id])
+
+            logger.info(
+                f"Bulk indexed chunk of {len(chunk)} clip documents in {time.time() - chunk_start:.3f}s",
+                extra={"index": INDEX_NAME, "attempt": attempt},
+            )
+
+        if not retry:
+            break
+        pending = retry
+
+    return indexed, failures
+
+
+def _find_master_doc_id(client: OpenSearch, inventory_id: str) -> str:
+    """
+    Resolve the master document ID for an asset, refreshing the index and
+    retrying for up to two minutes while ingest is still catching up.
+    """
+    search_query = {
+        "query": {
+            "bool": {
+                "filter": [
+                    {"match_phrase": {"InventoryID": inventory_id}},
+                    {
+                        "nested": {
+                            "path": "DerivedRepresentations",
+                            "query": {"exists": {"field": "DerivedRepresentations.ID"}},
+                        }
+                    },
+                ]
+            }
+        }
+    }
+
+    logger.info(
+        "Searching for master document",
+        extra={"index": INDEX_NAME, "inventory_id": inventory_id},
+    )
+    start_time = time.time()
+    try:
+        search_resp = client.search(index=INDEX_NAME, body=search_query, size=1)
+        check_opensearch_response(search_resp, "search")
+    except Exception as e:
+        logger.error(
+            "Failed to search for master document",
+            extra={"inventory_id": inventory_id, "error": str(e), "index": INDEX_NAME},
+        )
+        raise RuntimeError(
+            f"Failed to search for master document for asset {inventory_id}: {str(e)}"
+        ) from e
+
+    while search_resp["hits"]["total"]["value"] == 0 and time.time() - start_time < 120:
+        logger.info("Master doc not found – refreshing index & retrying …")
+        try:
+            client.indices.refresh(index=INDEX_NAME)
+            time.sleep(5)
+            search_resp = client.search(index=INDEX_NAME, body=search_query, size=1)
+            check_opensearch_response(search_resp, "search")
+        except Exception as e:
+            logger.error(
+                "Failed to refresh index and retry master document search",
+                extra={
+                    "inventory_id": inventory_id,
+                    "error": str(e),
+                    "index": INDEX_NAME,
+                },
+            )
+            raise RuntimeError(
+                f"Failed to refresh index and retry search for asset {inventory_id}: {str(e)}"
+            ) from e
+
+    if search_resp["hits"]["total"]["value"] == 0:
+        raise RuntimeError(
+            f"No master doc with InventoryID={inventory_id} in '{INDEX_NAME}'"
+        )
+
+    return search_resp["hits"]["hits"][0]["_id"]
+
+
+def _update_master_with_video_embedding(
+    client: OpenSearch,
+    existing_id: str,
+    inventory_id: str,
+    embedding_vector: List[float],
+    scope: str,
+    embedding_option: Optional[str],
+) -> None:
+    """Write a whole-video embedding onto the master document (optimistic concurrency)."""
+    try:
+        meta = client.get(index=INDEX_NAME, id=existing_id)
+        check_opensearch_response(meta, "get")
+        seq_no = meta["_seq_no"]
+        p_term = meta["_primary_term"]
+    except Exception as e:
+        logger.error(
+            "Failed to get master document metadata",
+            extra={
+                "inventory_id": inventory_id,
+                "document_id": existing_id,
+                "error": str(e),
+                "index": INDEX_NAME,
+            },
+        )
+        raise RuntimeError(
+            f"Failed to get metadata for document {existing_id} (asset {inventory_id}): {str(e)}"
+        ) from e
+
+    update_body = {
+        "doc": {
+            "type": CONTENT_TYPE,
+            "embedding": embedding_vector,
+            "embedding_scope": scope,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    }
+    if embedding_option == "audio":
+        update_body["doc"]["audio_embedding"] = embedding_vector
+    else:
+        update_body["doc"]["embedding"] = embedding_vector
+    if embedding_option is not None:
+        update_body["doc"]["embedding_option"] = embedding_option
+
+    for attempt in range(50):
+        try:
+            res = client.update(
+                index=INDEX_NAME,
+                id=existing_id,
+                body=update_body,
+                if_seq_no=seq_no,
+                if_primary_term=p_term,
+            )
+            check_opensearch_response(res, "update")
+            return
+        except exceptions.ConflictError:
+            try:
+                meta = client.get(index=INDEX_NAME, id=existing_id)
+                seq_no = meta["_seq_no"]
+                p_term = meta["_primary_term"]
+                time.sleep(1)
+            except Exception as e:
+                logger.error(
+                    "Failed to resolve conflict during master document update",
+                    extra={
+                        "inventory_id": inventory_id,
+                        "document_id": existing_id,
+                        "error": str(e),
+                        "attempt": attempt + 1,
+                    },
+                )
+                raise RuntimeError(
+                    f"Failed to resolve conflict for document {existing_id} (asset {inventory_id}): {str(e)}"
+                ) from e
+
+    raise RuntimeError("Failed to update master document after 50 retries")
+
+
 @lambda_middleware(event_bus_name=EVENT_BUS_NAME)
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
@@ -895,6 +1174,8 @@ def lambda_handler(event: Dict[str, Any], _context: LambdaContext):
             logger.info(f"Processing batch of {len(payload['data'])} embeddings")
             results = []
             video_scope_embeddings = []
+            clip_actions = []
+            clip_positions: Dict[str, int] = {}
 
             # Separate video scope embeddings from clip embeddings
             for i, embedding_data in enumerate(payload["data"]):
@@ -912,31 +1193,64 @@ def lambda_handler(event: Dict[str, Any], _context: LambdaContext):
 
                 if scope == "video" and not IS_AUDIO_CONTENT:
                     video_scope_embeddings.append((i, embedding_data, scope))
-                else:
-                    # Process clip/audio embeddings
-                    try:
-                        result = process_single_embedding(
-                            payload, embedding_data, client, inventory_id
-                        )
-                        results.append(result)
-                        logger.info(
-                            f"Processed clip embedding {i+1}/{len(payload['data'])}",
-                            extra={
-                                "document_id": result["document_id"],
-                                "start_sec": result["start_sec"],
-                                "end_sec": result["end_sec"],
-                            },
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to process clip embedding {i+1}",
-                            extra={"error": str(e)},
-                        )
-                        raise RuntimeError(
-                            f"Failed to process clip embedding {i+1}: {str(e)}"
-                        ) from e
+                    continue
+
+                # Accumulate clip/audio documents for bulk indexing
+                try:
+                    document, _, _ = _build_clip_document(
+                        payload, embedding_data, inventory_id
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to process clip embedding {i+1}",
+                        extra={"error": str(e)},
+                    )
+                    raise RuntimeError(
+                        f"Failed to process clip embedding {i+1}: {str(e)}"
+                    ) from e
+
+                doc_id = _clip_document_id(inventory_id, document)
+                clip_positions[doc_id] = i + 1
+                clip_actions.append(
+                    {
+                        "_op_type": "index",
+                        "_index": INDEX_NAME,
+                        "_id": doc_id,
+                        "_source": document,
+                    }
+                )
+
+            if clip_actions:
+                bulk_start = time.time()
+                indexed, failures = bulk_index_clip_documents(client, clip_actions)
+                logger.info(
+                    f"Bulk indexed {len(indexed)}/{len(clip_actions)} clip embeddings in {time.time() - bulk_start:.3f}s",
+                    extra={"index": INDEX_NAME, "inventory_id": inventory_id},
+                )
+                results.extend(
+                    {"document_id": doc_id, "type": "clip"} for doc_id in indexed
+                )
+
+                if failures:
+                    failed_items = sorted(
+                        clip_positions.get(doc_id, 0) for doc_id in failures
+                    )
+                    logger.error(
+                        f"Failed to index {len(failures)} clip embeddings",
+                        extra={
+                            "inventory_id": inventory_id,
+                            "failed_items": failed_items,
+                            "errors": list(failures.values())[:10],
+                        },
+                    )
+                    # Clip IDs are deterministic, so a Step Functions retry of
+                    # this batch overwrites the clips that already succeeded.
+                    raise RuntimeError(
+                        f"Failed to index clip embeddings {failed_items} for asset {inventory_id}"
+                    )
 
             # Process video scope embeddings (update master documents)
+            existing_id = None
             for i, embedding_data, scope in video_scope_embeddings:
                 try:
                     embedding_vector = embedding_data.get("float")
@@ -956,152 +1270,18 @@ def lambda_handler(event: Dict[str, Any], _context: LambdaContext):
                         "embedding_option"
                     ) or extract_embedding_option(temp_payload)
 
-                    # Update master document (similar to non-batch logic)
-                    search_query = {
-                        "query": {
-                            "bool": {
-                                "filter": [
-                                    {"match_phrase": {"InventoryID": inventory_id}},
-                                    {
-                                        "nested": {
-                                            "path": "DerivedRepresentations",
-                                            "query": {
-                                                "exists": {
-                                                    "field": "DerivedRepresentations.ID"
-                                                }
-                                            },
-                                        }
-                                    },
-                                ]
-                            }
-                        }
-                    }
-
-                    logger.info(
-                        f"Searching for master document for video embedding {i+1}",
-                        extra={"index": INDEX_NAME, "inventory_id": inventory_id},
+                    # The master document is resolved once per inventory ID
+                    if existing_id is None:
+                        existing_id = _find_master_doc_id(client, inventory_id)
+
+                    _update_master_with_video_embedding(
+                        client,
+                        existing_id,
+                        inventory_id,
+                        embedding_vector,
+                        scope,
+                        embedding_option,
                     )
-                    start_time = time.time()
-                    try:
-                        search_resp = client.search(
-                            index=INDEX_NAME, body=search_query, size=1
-                        )
-                        check_opensearch_response(search_resp, "search")
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to search for master document in batch video embedding {i+1}",
-                            extra={
-                                "inventory_id": inventory_id,
-                                "error": str(e),
-                                "index": INDEX_NAME,
-                            },
-                        )
-                        raise RuntimeError(
-                            f"Failed to search for master document in batch video embedding {i+1} for asset {inventory_id}: {str(e)}"
-                        ) from e
-
-                    while (
-                        search_resp["hits"]["total"]["value"] == 0
-                        and time.time() - start_time < 120
-                    ):
-                        logger.info(
-                            "Master doc not found – refreshing index & retrying …"
-                        )
-                        try:
-                            client.indices.refresh(index=INDEX_NAME)
-                            time.sleep(5)
-                            search_resp = client.search(
-                                index=INDEX_NAME, body=search_query, size=1
-                            )
-                            check_opensearch_response(search_resp, "search")
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to refresh index and retry search in batch video embedding {i+1}",
-                                extra={
-                                    "inventory_id": inventory_id,
-                                    "error": str(e),
-                                    "index": INDEX_NAME,
-                                },
-                            )
-                            raise RuntimeError(
-                                f"Failed to refresh index and retry search in batch video embedding {i+1} for asset {inventory_id}: {str(e)}"
-                            ) from e
-
-                    if search_resp["hits"]["total"]["value"] == 0:
-                        raise RuntimeError(
-                            f"No master doc with InventoryID={inventory_id} in '{INDEX_NAME}'"
-                        )
-
-                    existing_id = search_resp["hits"]["hits"][0]["_id"]
-                    try:
-                        meta = client.get(index=INDEX_NAME, id=existing_id)
-                        check_opensearch_response(meta, "get")
-                        seq_no = meta["_seq_no"]
-                        p_term = meta["_primary_term"]
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to get document metadata in batch video embedding {i+1}",
-                            extra={
-                                "inventory_id": inventory_id,
-                                "document_id": existing_id,
-                                "error": str(e),
-                                "index": INDEX_NAME,
-                            },
-                        )
-                        raise RuntimeError(
-                            f"Failed to get metadata for document {existing_id} in batch video embedding {i+1} (asset {inventory_id}): {str(e)}"
-                        ) from e
-
-                    update_body = {
-                        "doc": {
-                            "type": CONTENT_TYPE,
-                            "embedding": embedding_vector,
-                            "embedding_scope": scope,
-                            "timestamp": datetime.utcnow().isoformat(),
-                        }
-                    }
-                    if embedding_option == "audio":
-                        update_body["doc"]["audio_embedding"] = embedding_vector
-                    else:
-                        update_body["doc"]["embedding"] = embedding_vector
-                    if embedding_option is not None:
-                        update_body["doc"]["embedding_option"] = embedding_option
-
-                    for attempt in range(50):
-                        try:
-                            res = client.update(
-                                index=INDEX_NAME,
-                                id=existing_id,
-                                body=update_body,
-                                if_seq_no=seq_no,
-                                if_primary_term=p_term,
-                            )
-                            check_opensearch_response(res, "update")
-                            break
-                        except exceptions.ConflictError:
-                            try:
-                                meta = client.get(index=INDEX_NAME, id=existing_id)
-                                seq_no = meta["_seq_no"]
-                                p_term = meta["_primary_term"]
-                                time.sleep(1)
-                            except Exception as e:
-                                logger.error(
-                                    "Failed to resolve conflict during batch video embedding update",
-                                    extra={
-                                        "inventory_id": inventory_id,
-                                        "document_id": existing_id,
-                                        "error": str(e),
-                                        "attempt": attempt + 1,
-                                        "embedding_index": i + 1,
-                                    },
-                                )
-                                raise RuntimeError(
-                                    f"Failed to resolve conflict for batch video embedding {i+1} document {existing_id} (asset {inventory_id}): {str(e)}"
-                                ) from e
-                    else:
-                        raise RuntimeError(
-                            "Failed to update master document after 50 retries"
-                        )
 
                     results.append(
                         {
@@ -1301,7 +1481,11 @@ def lambda_handler(event: Dict[str, Any], _context: LambdaContext):
                 )
 
                 try:
-                    res = client.index(index=target_index, body=document)
+                    res = client.index(
+                        index=target_index,
+                        body=document,
+                        id=_embedding_document_id(document),
+                    )
                     check_opensearch_response(res, "index")
 
                     return {
@@ -1371,7 +1555,11 @@ def lambda_handler(event: Dict[str, Any], _context: LambdaContext):
                     },
                 )
                 try:
-                    res = client.index(index=INDEX_NAME, body=document)
+                    res = client.index(
+                        index=INDEX_NAME,
+                        body=document,
+                        id=_clip_document_id(inventory_id, document),
+                    )
                     check_opensearch_response(res, "index")
                 except Exception as e:
                     logger.error(
@@ -1505,7 +1693,11 @@ def lambda_handler(event: Dict[str, Any], _context: LambdaContext):
             )
 
             try:
-                res = client.index(index=target_index, body=document)
+                res = client.index(
+                    index=target_index,
+                    body=document,
+                    id=_embedding_document_id(document),
+                )
                 check_opensearch_response(res, "index")
 
                 return {
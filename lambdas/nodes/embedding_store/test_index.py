@@ -0,0 +1,156 @@
+"""
+Unit tests for embedding_store OpenSearch writes.
+
+Tests that batched clip documents are re-sent only when their own bulk item
+failed with a transient error, and that single documents are written with
+deterministic IDs so a retried invocation overwrites instead of duplicating.
+"""
+
+import os
+from unittest.mock import MagicMock
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("EXTERNAL_PAYLOAD_BUCKET", "payloads")
+
+import index
+import pytest
+from index import (
+    _clip_document_id,
+    _embedding_document_id,
+    bulk_index_clip_documents,
+    process_single_embedding,
+)
+
+
+def _actions(count):
+    return [
+        {"_op_type": "index", "_index": "media", "_id": f"clip-{i}", "_source": {}}
+        for i in range(count)
+    ]
+
+
+class FakeBulk:
+    """streaming_bulk stand-in failing the given ids with a status per attempt"""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.sent = []
+
+    def __call__(self, client, actions, **kwargs):
+        attempt = len(self.sent)
+        self.sent.append([action["_id"] for action in actions])
+        statuses = self.failures[attempt] if attempt < len(self.failures) else {}
+        for action in actions:
+            status = statuses.get(action["_id"])
+            if status is None:
+                yield True, {"index": {"_id": action["_id"], "status": 201}}
+            else:
+                yield False, {
+                    "index": {"_id": action["_id"], "status": status, "error": "x"}
+                }
+
+
+@pytest.fixture
+def bulk(monkeypatch):
+    monkeypatch.setattr(index.time, "sleep", lambda seconds: None)
+
+    def install(*failures):
+        fake = FakeBulk(list(failures))
+        monkeypatch.setattr(index, "streaming_bulk", fake)
+        return fake
+
+    return install
+
+
+class TestBulkIndexClipDocuments:
+    """Test suite for bulk clip indexing with per-item retries"""
+
+    def test_only_failed_items_are_retried(self, bulk):
+        """Test that a retry re-sends the throttled clips and nothing else"""
+        fake = bulk({"clip-1": 429, "clip-3": 503})
+
+        indexed, failures = bulk_index_clip_documents(MagicMock(), _actions(4))
+
+        assert fake.sent == [
+            ["clip-0", "clip-1", "clip-2", "clip-3"],
+            ["clip-1", "clip-3"],
+        ]
+        assert sorted(indexed) == ["clip-0", "clip-1", "clip-2", "clip-3"]
+        assert failures == {}
+
+    def test_failed_request_retries_its_items(self, bulk):
+        """Test that items of a chunk request with no response are retried"""
+        fake = bulk({"clip-0": "N/A", "clip-1": "N/A"})
+
+        indexed, failures = bulk_index_clip_documents(MagicMock(), _actions(2))
+
+        assert fake.sent == [["clip-0", "clip-1"], ["clip-0", "clip-1"]]
+        assert failures == {}
+
+    def test_permanent_failures_are_reported_not_retried(self, bulk):
+        """Test that a mapping error is returned to the caller without a retry"""
+        fake = bulk({"clip-0": 400, "clip-1": 429})
+
+        indexed, failures = bulk_index_clip_documents(MagicMock(), _actions(2))
+
+        assert fake.sent == [["clip-0", "clip-1"], ["clip-1"]]
+        assert indexed == ["clip-1"]
+        assert failures["clip-0"]["status"] == 400
+
+    def test_retries_stop_after_bulk_max_retries(self, bulk, monkeypatch):
+        """Test that an item still throttled after every retry is reported"""
+        monkeypatch.setattr(index, "BULK_MAX_RETRIES", 2)
+        fake = bulk(*[{"clip-0": 429}] * 3)
+
+        indexed, failures = bulk_index_clip_documents(MagicMock(), _actions(2))
+
+        assert fake.sent == [["clip-0", "clip-1"], ["clip-0"], ["clip-0"]]
+        assert indexed == ["clip-1"]
+        assert failures == {"clip-0": {"status": 429, "error": "x"}}
+
+
+class TestDeterministicDocumentIds:
+    """Test suite for idempotent single-document writes"""
+
+    def test_single_clip_uses_the_batch_clip_id(self):
+        """Test that a redelivered single clip overwrites its document"""
+        client = MagicMock()
+        client.index.return_value = {"_id": "id", "result": "created"}
+        payload = {"data": {}}
+        embedding = {
+            "float": [0.1, 0.2],
+            "embedding_scope": "clip",
+            "embedding_option": "visual-text",
+            "start_offset_sec": 0,
+            "end_offset_sec": 6,
+        }
+
+        process_single_embedding(payload, embedding, client, "asset-1")
+        process_single_embedding(payload, embedding, client, "asset-1")
+
+        first, second = client.index.call_args_list
+        document = first.kwargs["body"]
+        assert first.kwargs["id"] == second.kwargs["id"]
+        assert first.kwargs["id"] == _clip_document_id("asset-1", document)
+
+    def test_embedding_document_id_ignores_the_write_time(self):
+        """Test that documents differing only in created_at share an ID"""
+        document = {
+            "inventory_id": "asset-1",
+            "model_version": "3.0",
+            "embedding_granularity": "segment",
+            "embedding_representation": "visual",
+            "embedding_dimension": 512,
+            "start_seconds": 0,
+            "end_seconds": 6,
+            "created_at": "2026-01-01T00:00:00",
+        }
+
+        retried = {**document, "created_at": "2026-01-01T00:05:00"}
+        next_clip = {**document, "start_seconds": 6, "end_seconds": 12}
+
+        assert _embedding_document_id(retried) == _embedding_document_id(document)
+        assert _embedding_document_id(next_clip) != _embedding_document_id(document)
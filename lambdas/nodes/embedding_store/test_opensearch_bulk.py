@@ -0,0 +1,73 @@
+"""
+Unit tests for size-bounded bulk action batching.
+
+Tests that bulk actions are split by count and by serialized size, keep their
+order, and that an action too large for any chunk is sent on its own.
+"""
+
+import json
+from decimal import Decimal
+
+import pytest
+from opensearch_bulk import chunk_bulk_actions
+
+
+def _action(i, padding=0):
+    return {"_op_type": "index", "_id": f"doc-{i}", "_source": {"pad": "x" * padding}}
+
+
+def _size(action):
+    return len(json.dumps(action).encode("utf-8"))
+
+
+class TestChunkBulkActions:
+    """Test suite for chunk_bulk_actions"""
+
+    def test_count_limit_splits_chunks_in_order(self):
+        """Test that no chunk holds more than max_actions actions"""
+        actions = [_action(i) for i in range(7)]
+
+        chunks = chunk_bulk_actions(actions, max_actions=3)
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert [a for chunk in chunks for a in chunk] == actions
+
+    def test_size_limit_splits_chunks(self):
+        """Test that a chunk closes before its serialized size passes the limit"""
+        actions = [_action(i, padding=400 * 1024) for i in range(5)]
+        assert 2 * _size(actions[0]) < 1024 * 1024 < 3 * _size(actions[0])
+
+        chunks = chunk_bulk_actions(actions, max_actions=100, max_size_mb=1)
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+    def test_oversize_action_is_its_own_chunk(self):
+        """Test that an action above the size limit is still sent, alone"""
+        actions = [_action(0), _action(1, padding=2 * 1024 * 1024), _action(2)]
+
+        chunks = chunk_bulk_actions(actions, max_actions=100, max_size_mb=1)
+
+        assert [[a["_id"] for a in chunk] for chunk in chunks] == [
+            ["doc-0"],
+            ["doc-1"],
+            ["doc-2"],
+        ]
+
+    def test_no_actions_is_no_chunks(self):
+        """Test that an empty action list produces no requests"""
+        assert chunk_bulk_actions([]) == []
+
+    def test_json_encoder_is_used_for_sizing(self):
+        """Test that DynamoDB Decimals are sized with the caller's encoder"""
+
+        class DecimalEncoder(json.JSONEncoder):
+            def default(self, obj):
+                if isinstance(obj, Decimal):
+                    return float(obj)
+                return super().default(obj)
+
+        actions = [{"_id": "doc-0", "_source": {"size": Decimal("1.5")}}]
+
+        with pytest.raises(TypeError):
+            chunk_bulk_actions(actions)
+        assert chunk_bulk_actions(actions, json_encoder=DecimalEncoder) == [actions]
@@ -10,6 +10,7 @@ from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 import requests
 import xmltodict
+from http_client import get_http_session
 
 # Support both pytest imports (package-qualified) and Lambda runtime (absolute)
 try:
@@ -227,7 +228,7 @@ class GenericRestAdapter(MetadataAdapter):
                 if auth_query_params and isinstance(auth_query_params, dict):
                     url = self._append_query_params(url, auth_query_params)
 
-        response = requests.get(url, headers=headers, timeout=self.timeout)
+        response = get_http_session().get(url, headers=headers, timeout=self.timeout)
         return self._process_response(response, correlation_id)
 
     def _fetch_with_post(
@@ -248,7 +249,7 @@ class GenericRestAdapter(MetadataAdapter):
         # Build request body with correlation ID
         body: dict[str, str] = {self.correlation_id_param: correlation_id}
 
-        response = requests.post(
+        response = get_http_session().post(
             self.config.metadata_endpoint,
             headers=headers,
             json=body,
@@ -7,6 +7,7 @@ authentication where the client authenticates with client_id and client_secret.
 from typing import Any, Final, override
 
 import requests
+from http_client import get_http_session
 
 # Support both pytest imports (package-qualified) and Lambda runtime (absolute)
 try:
@@ -125,7 +126,7 @@ class OAuth2ClientCredentialsStrategy(AuthStrategy):
             if credential_headers and isinstance(credential_headers, dict):
                 headers.update(credential_headers)
 
-            response = requests.post(
+            response = get_http_session().post(
                 self.config.auth_endpoint_url,
                 data=data,
                 timeout=self.timeout,
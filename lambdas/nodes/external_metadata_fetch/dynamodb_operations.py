@@ -10,6 +10,7 @@ This module provides functions to update asset records in DynamoDB with:
 from __future__ import annotations
 
 import os
+import threading
 from datetime import datetime, timezone
 from typing import Any
 
@@ -22,13 +23,15 @@ logger = Logger()
 # Maximum length for error messages stored in DynamoDB
 MAX_ERROR_MESSAGE_LENGTH = 500
 
-# DynamoDB resource and table (lazy initialization)
-_dynamodb_resource: Any = None
-_asset_table: Any = None
+# DynamoDB table per thread (lazy initialization); boto3 resources are not
+# thread-safe and assets of a batch are enriched concurrently. The enrichment
+# workers live as long as the container (index._get_executor), so each thread
+# sets up its session and table once, not once per batch.
+_local = threading.local()
 
 
 def _get_asset_table() -> Any:
-    """Get the DynamoDB asset table.
+    """Get the DynamoDB asset table for the calling thread.
 
     Returns:
         DynamoDB Table resource
@@ -36,17 +39,16 @@ def _get_asset_table() -> Any:
     Raises:
         ValueError: If MEDIALAKE_ASSET_TABLE environment variable is not set
     """
-    global _dynamodb_resource, _asset_table
-
-    if _asset_table is None:
+    table = getattr(_local, "asset_table", None)
+    if table is None:
         table_name = os.environ.get("MEDIALAKE_ASSET_TABLE")
         if not table_name:
             raise ValueError("MEDIALAKE_ASSET_TABLE environment variable not set")
 
-        _dynamodb_resource = boto3.resource("dynamodb")
-        _asset_table = _dynamodb_resource.Table(table_name)
+        table = boto3.session.Session().resource("dynamodb").Table(table_name)
+        _local.asset_table = table
 
-    return _asset_table
+    return table
 
 
 def _get_current_timestamp() -> str:
@@ -7,13 +7,19 @@ This Lambda function orchestrates the external metadata enrichment process:
 3. Fetches metadata from external API
 4. Normalizes metadata
 5. Stores metadata in DynamoDB asset record
+
+Multi-asset batches are enriched concurrently (max_concurrency workers),
+optionally rate limited per partner host (rate_limit_per_second). Credentials
+and tokens are cached per Lambda container, so a batch makes one token
+request rather than one per asset.
 """
 
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
@@ -33,8 +39,16 @@ except ImportError:
 
 # Support both pytest imports (package-qualified) and Lambda runtime (absolute)
 try:
-    from nodes.external_metadata_fetch.adapters import AdapterConfig, create_adapter
-    from nodes.external_metadata_fetch.auth import AuthConfig, create_auth_strategy
+    from nodes.external_metadata_fetch.adapters import (
+        AdapterConfig,
+        MetadataAdapter,
+        create_adapter,
+    )
+    from nodes.external_metadata_fetch.auth import (
+        AuthConfig,
+        AuthStrategy,
+        create_auth_strategy,
+    )
     from nodes.external_metadata_fetch.correlation_id import (
         CorrelationIdError,
         resolve_correlation_id,
@@ -47,6 +61,10 @@ try:
     )
     from nodes.external_metadata_fetch.normalizer import MetadataNormalizer
     from nodes.external_metadata_fetch.normalizers import resolve_normalizer_config
+    from nodes.external_metadata_fetch.rate_limiter import (
+        RateLimiter,
+        get_rate_limiter,
+    )
     from nodes.external_metadata_fetch.retry import RetryConfig, execute_with_retry
     from nodes.external_metadata_fetch.secrets_retriever import (
         AuthenticationError,
@@ -54,8 +72,8 @@ try:
         SecretsRetriever,
     )
 except ImportError:
-    from adapters import AdapterConfig, create_adapter
-    from auth import AuthConfig, create_auth_strategy
+    from adapters import AdapterConfig, MetadataAdapter, create_adapter
+    from auth import AuthConfig, AuthStrategy, create_auth_strategy
     from correlation_id import CorrelationIdError, resolve_correlation_id
     from dynamodb_operations import (
         update_asset_external_asset_id,
@@ -65,6 +83,7 @@ except ImportError:
     )
     from normalizer import MetadataNormalizer
     from normalizers import resolve_normalizer_config
+    from rate_limiter import RateLimiter, get_rate_limiter
     from retry import RetryConfig, execute_with_retry
     from secrets_retriever import (
         AuthenticationError,
@@ -75,6 +94,43 @@ except ImportError:
 logger = Logger(service="external-metadata-fetch")
 tracer = Tracer()
 
+# Credential and token cache shared by every invocation of this container
+_secrets_retriever: SecretsRetriever | None = None
+
+
+def _get_secrets_retriever() -> SecretsRetriever:
+    global _secrets_retriever
+    if _secrets_retriever is None:
+        _secrets_retriever = SecretsRetriever()
+    return _secrets_retriever
+
+
+# Enrichment worker pools by size. They live as long as the container, so the
+# per-thread DynamoDB tables their workers create are reused by every warm
+# invocation instead of being set up again for each batch.
+_executors: dict[int, ThreadPoolExecutor] = {}
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    executor = _executors.get(max_workers)
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="enrich"
+        )
+        _executors[max_workers] = executor
+    return executor
+
+
+def _enrich_assets(
+    enrich: Callable[[dict[str, Any]], EnrichmentResult],
+    assets: list[dict[str, Any]],
+    max_concurrency: int,
+) -> list[EnrichmentResult]:
+    """Enrich assets with up to max_concurrency workers; results keep input order."""
+    if min(max_concurrency, len(assets)) > 1:
+        return list(_get_executor(max_concurrency).map(enrich, assets))
+    return [enrich(asset) for asset in assets]
+
 
 @dataclass
 class NodeConfig:
@@ -88,6 +144,9 @@ class NodeConfig:
         metadata_endpoint: Metadata API endpoint URL
         max_retries: Maximum retry attempts for transient errors
         initial_backoff_seconds: Initial backoff delay for retries
+        max_concurrency: Assets of a batch enriched in parallel
+        rate_limit_per_second: Metadata requests per second to the partner
+            host across all workers (0 disables the limit)
         auth_config: Auth strategy-specific configuration
         adapter_config: Adapter-specific configuration
         normalizer_config: Normalizer configuration section containing:
@@ -103,6 +162,8 @@ class NodeConfig:
     metadata_endpoint: str
     max_retries: int = 3
     initial_backoff_seconds: float = 1.0
+    max_concurrency: int = 4
+    rate_limit_per_second: float = 0.0
     auth_config: dict[str, Any] | None = None
     adapter_config: dict[str, Any] | None = None
     normalizer_config: dict[str, Any] | None = None
@@ -138,6 +199,8 @@ class NodeConfig:
             metadata_endpoint=config["metadata_endpoint"],
             max_retries=config.get("max_retries", 3),
             initial_backoff_seconds=config.get("initial_backoff_seconds", 1.0),
+            max_concurrency=max(1, int(config.get("max_concurrency", 4))),
+            rate_limit_per_second=float(config.get("rate_limit_per_second", 0.0)),
             auth_config=config.get("auth_config"),
             adapter_config=config.get("adapter_config"),
             normalizer_config=config.get("normalizer_config"),
@@ -182,6 +245,53 @@ class EnrichmentResult:
     attempt_count: int = 0
 
 
+@dataclass
+class PartnerClient:
+    """Auth strategy, adapter and rate limiter shared by every asset of a batch.
+
+    Attributes:
+        auth_strategy: Strategy used to authenticate with the external system
+        adapter: Metadata adapter bound to auth_strategy
+        rate_limiter: Limiter for requests to the metadata host (None if unlimited)
+    """
+
+    auth_strategy: AuthStrategy
+    adapter: MetadataAdapter
+    rate_limiter: RateLimiter | None = None
+
+
+def _create_partner_client(node_config: NodeConfig) -> PartnerClient:
+    """Build the auth strategy, adapter and rate limiter for a batch.
+
+    Args:
+        node_config: Node configuration
+
+    Returns:
+        PartnerClient for the configured external system
+    """
+    auth_config = AuthConfig(
+        auth_endpoint_url=node_config.auth_endpoint,
+        additional_config=node_config.auth_config or {},
+    )
+    auth_strategy = create_auth_strategy(node_config.auth_type, auth_config)
+    adapter_config = AdapterConfig(
+        metadata_endpoint=node_config.metadata_endpoint,
+        additional_config=node_config.adapter_config or {},
+    )
+    adapter = create_adapter(
+        adapter_type=node_config.adapter_type,
+        config=adapter_config,
+        auth_strategy=auth_strategy,
+    )
+    return PartnerClient(
+        auth_strategy=auth_strategy,
+        adapter=adapter,
+        rate_limiter=get_rate_limiter(
+            node_config.metadata_endpoint, node_config.rate_limit_per_second
+        ),
+    )
+
+
 def _sanitize_config_strings(config: dict[str, Any]) -> dict[str, Any]:
     """Strip leading/trailing whitespace from all string values in a config dict.
 
@@ -298,6 +408,10 @@ def _get_node_config(event: dict[str, Any]) -> NodeConfig:
         or int(os.environ.get("MAX_RETRIES", "3")),
         "initial_backoff_seconds": node_config.get("initial_backoff_seconds")
         or float(os.environ.get("INITIAL_BACKOFF_SECONDS", "1.0")),
+        "max_concurrency": node_config.get("max_concurrency")
+        or int(os.environ.get("ENRICHMENT_CONCURRENCY", "4")),
+        "rate_limit_per_second": node_config.get("rate_limit_per_second")
+        or float(os.environ.get("RATE_LIMIT_PER_SECOND", "0")),
         "auth_config": auth_config if auth_config else None,
         "adapter_config": adapter_config if adapter_config else None,
         "normalizer_config": normalizer_config if normalizer_config else None,
@@ -502,6 +616,7 @@ def process_asset(
     correlation_id_override: str | None,
     secrets_retriever: SecretsRetriever,
     normalizer: MetadataNormalizer,
+    partner: PartnerClient,
 ) -> EnrichmentResult:
     """Process a single asset for metadata enrichment.
 
@@ -519,6 +634,7 @@ def process_asset(
         correlation_id_override: Optional correlation ID override from params
         secrets_retriever: SecretsRetriever instance for credential management
         normalizer: MetadataNormalizer instance
+        partner: Auth strategy, adapter and rate limiter for the external system
 
     Returns:
         EnrichmentResult with success/failure status and metadata
@@ -552,18 +668,16 @@ def process_asset(
         update_asset_external_asset_id(inventory_id, correlation_id)
         update_asset_status_pending(inventory_id)
 
-        # Step 3: Create auth strategy and authenticate
-        auth_config = AuthConfig(
-            auth_endpoint_url=node_config.auth_endpoint,
-            additional_config=node_config.auth_config or {},
-        )
-        auth_strategy = create_auth_strategy(node_config.auth_type, auth_config)
-
+        # Step 3: Authenticate (cached token unless it is about to expire)
+        auth_strategy = partner.auth_strategy
         credentials = secrets_retriever.get_credentials(node_config.secret_arn)
+        auth_cache_key = SecretsRetriever.auth_cache_key(
+            auth_strategy, credentials, node_config.secret_arn
+        )
         auth_result = secrets_retriever.get_auth(
             auth_strategy=auth_strategy,
             credentials=credentials,
-            cache_key=node_config.secret_arn,
+            cache_key=auth_cache_key,
         )
 
         # Extract additional headers from credentials (if present)
@@ -581,26 +695,43 @@ def process_asset(
             },
         )
 
-        # Step 4: Create adapter and fetch metadata with retry
-        adapter_config = AdapterConfig(
-            metadata_endpoint=node_config.metadata_endpoint,
-            additional_config=node_config.adapter_config or {},
-        )
-        adapter = create_adapter(
-            adapter_type=node_config.adapter_type,
-            config=adapter_config,
-            auth_strategy=auth_strategy,
-        )
-
+        # Step 4: Fetch metadata with retry
+        adapter = partner.adapter
         retry_config = RetryConfig(
             max_retries=node_config.max_retries,
             initial_backoff_seconds=node_config.initial_backoff_seconds,
         )
 
         def fetch_operation():
-            return adapter.fetch_metadata(
+            nonlocal auth_result
+            if partner.rate_limiter:
+                partner.rate_limiter.acquire()
+            result = adapter.fetch_metadata(
                 correlation_id, auth_result, credential_headers
             )
+            # A cached token the partner has revoked: authenticate again once
+            if (
+                not result.success
+                and result.http_status_code is not None
+                and auth_strategy.supports_refresh()
+                and auth_strategy.is_token_expired_error(result.http_status_code)
+            ):
+                logger.info(
+                    "Token rejected, re-authenticating",
+                    extra={"inventory_id": inventory_id},
+                )
+                secrets_retriever.invalidate_auth(auth_cache_key, rejected=auth_result)
+                auth_result = secrets_retriever.get_auth(
+                    auth_strategy=auth_strategy,
+                    credentials=credentials,
+                    cache_key=auth_cache_key,
+                )
+                if partner.rate_limiter:
+                    partner.rate_limiter.acquire()
+                result = adapter.fetch_metadata(
+                    correlation_id, auth_result, credential_headers
+                )
+            return result
 
         retry_result = execute_with_retry(
             operation=fetch_operation,
@@ -753,10 +884,13 @@ def lambda_handler(event: dict[str, Any], context: LambdaContext) -> dict[str, A
     1. Extracts correlation_id (from params or filename)
     2. Creates the appropriate AuthStrategy based on auth_type config
     3. Creates the appropriate MetadataAdapter with the auth strategy
-    4. Authenticates using the auth strategy
+    4. Authenticates using the auth strategy (token reused while valid)
     5. Fetches metadata using the adapter
     6. Normalizes and stores the metadata
 
+    Assets of a multi-asset batch are processed by up to max_concurrency
+    workers; results keep the input order.
+
     Args:
         event: Standardized Lambda event from middleware
         context: Lambda context
@@ -781,7 +915,8 @@ def lambda_handler(event: dict[str, Any], context: LambdaContext) -> dict[str, A
             raise ValueError("No assets provided in event payload")
 
         # Initialize shared components
-        secrets_retriever = SecretsRetriever()
+        secrets_retriever = _get_secrets_retriever()
+        partner = _create_partner_client(node_config)
 
         # Create normalizer with configuration (if provided)
         normalizer_config = node_config.normalizer_config
@@ -796,22 +931,26 @@ def lambda_handler(event: dict[str, Any], context: LambdaContext) -> dict[str, A
             # Use placeholder normalizer for backward compatibility
             normalizer = MetadataNormalizer()
 
-        # Process each asset
-        results: list[dict[str, Any]] = []
-        success_count = 0
-        failure_count = 0
-        # Track the last enrichment_status for single-asset case
-        last_enrichment_status = EnrichmentStatus.ERROR
-
-        for asset in assets:
-            result = process_asset(
+        def enrich(asset: dict[str, Any]) -> EnrichmentResult:
+            return process_asset(
                 asset=asset,
                 node_config=node_config,
                 correlation_id_override=correlation_id_override,
                 secrets_retriever=secrets_retriever,
                 normalizer=normalizer,
+                partner=partner,
             )
 
+        # Process each asset
+        enrichment_results = _enrich_assets(enrich, assets, node_config.max_concurrency)
+
+        results: list[dict[str, Any]] = []
+        success_count = 0
+        failure_count = 0
+        # Track the last enrichment_status for single-asset case
+        last_enrichment_status = EnrichmentStatus.ERROR
+
+        for asset, result in zip(assets, enrichment_results):
             if result.success:
                 success_count += 1
             else:
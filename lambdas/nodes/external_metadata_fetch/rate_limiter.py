@@ -0,0 +1,84 @@
+"""Per-partner request rate limiting for external metadata fetch operations.
+
+Batches are enriched concurrently, so without a limit a large batch would
+send as many requests at once as there are workers. A RateLimiter is a token
+bucket shared by every worker calling the same partner host; limiters live
+for the life of the container so warm invocations share the budget too.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from urllib.parse import urlparse
+
+_limiters: dict[tuple[str, float], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    Allows requests_per_second on average, with bursts of up to burst
+    requests after an idle period.
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_second=5)
+        >>> limiter.acquire()  # blocks until a request may be sent
+    """
+
+    def __init__(self, requests_per_second: float, burst: int | None = None):
+        """Initialize the rate limiter.
+
+        Args:
+            requests_per_second: Sustained request rate, must be positive
+            burst: Bucket size (default: one second of requests, at least 1)
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.rate: float = requests_per_second
+        self.capacity: float = float(burst or max(1, int(requests_per_second)))
+        self._tokens: float = self.capacity
+        self._updated_at: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Wait until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            # Take the token now, possibly going negative; the deficit is
+            # the wait, which keeps callers in arrival order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+def get_rate_limiter(url: str, requests_per_second: float) -> RateLimiter | None:
+    """Container-wide rate limiter for the host of a URL.
+
+    Args:
+        url: Any URL on the partner API (the host is the limiter key)
+        requests_per_second: Allowed rate; 0 or less disables limiting
+
+    Returns:
+        Shared RateLimiter, or None when limiting is disabled
+    """
+    if requests_per_second <= 0:
+        return None
+    key = (urlparse(url).netloc or url, float(requests_per_second))
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_second)
+            _limiters[key] = limiter
+        return limiter
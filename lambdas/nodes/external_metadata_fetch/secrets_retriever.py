@@ -6,10 +6,14 @@ This module provides the SecretsRetriever class which handles:
 - Cache invalidation for token refresh scenarios
 
 The SecretsRetriever coordinates with AuthStrategy implementations to manage
-the full authentication lifecycle for external API access.
+the full authentication lifecycle for external API access. The handler keeps
+one instance per Lambda container, so a token is requested once and reused
+by every asset and warm invocation until it is about to expire.
 """
 
+import hashlib
 import json
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any
@@ -65,11 +69,15 @@ class SecretsRetriever:
         >>> credentials = retriever.get_credentials("arn:aws:secretsmanager:...")
         >>> auth_result = retriever.get_auth(strategy, credentials, "cache-key")
         >>> # Later, if token is rejected:
-        >>> retriever.invalidate_auth("cache-key")
+        >>> retriever.invalidate_auth("cache-key", rejected=auth_result)
     """
 
-    # Buffer time (seconds) before token expiry to trigger refresh
+    # Buffer time (seconds) before token expiry to trigger refresh. Tokens
+    # that live less than ten buffers are refreshed after 90% of their lifetime
     EXPIRY_BUFFER_SECONDS: int = 60
+    # How long credentials are reused before Secrets Manager is read again,
+    # so rotated secrets are picked up by warm containers
+    CREDENTIALS_TTL_SECONDS: int = 300
 
     def __init__(self, secrets_client: Any | None = None):
         """Initialize the SecretsRetriever.
@@ -80,13 +88,16 @@ class SecretsRetriever:
         """
         self._secrets_client = secrets_client or boto3.client("secretsmanager")
         self._credentials_cache: dict[str, dict[str, Any]] = {}
+        self._credentials_cached_at: dict[str, float] = {}
         self._auth_cache: dict[str, CachedAuth] = {}
+        # Concurrent workers share one token request instead of each making one
+        self._auth_lock = threading.Lock()
 
     def get_credentials(self, secret_arn: str) -> dict[str, Any]:
         """Retrieve credentials from AWS Secrets Manager.
 
-        Credentials are cached after first retrieval to avoid repeated
-        Secrets Manager API calls within the same Lambda invocation.
+        Credentials are cached for CREDENTIALS_TTL_SECONDS after retrieval to
+        avoid repeated Secrets Manager API calls.
 
         Args:
             secret_arn: ARN of the secret containing credentials
@@ -101,7 +112,7 @@ class SecretsRetriever:
             CredentialRetrievalError: If secret retrieval fails
         """
         # Check cache first
-        if secret_arn in self._credentials_cache:
+        if self.is_credentials_cached(secret_arn):
             return self._credentials_cache[secret_arn]
 
         try:
@@ -117,6 +128,7 @@ class SecretsRetriever:
 
             # Cache the credentials
             self._credentials_cache[secret_arn] = credentials
+            self._credentials_cached_at[secret_arn] = time.time()
 
             return credentials
 
@@ -147,7 +159,7 @@ class SecretsRetriever:
         Args:
             auth_strategy: The auth strategy to use for authentication
             credentials: Credentials dictionary from get_credentials()
-            cache_key: Key for auth caching (typically the secret_arn)
+            cache_key: Key for auth caching (see auth_cache_key)
 
         Returns:
             Valid AuthResult with access token
@@ -160,6 +172,19 @@ class SecretsRetriever:
         if cached and not self._is_auth_expired(cached):
             return cached.auth_result
 
+        with self._auth_lock:
+            # Another worker may have authenticated while this one waited
+            cached = self._auth_cache.get(cache_key)
+            if cached and not self._is_auth_expired(cached):
+                return cached.auth_result
+            return self._authenticate(auth_strategy, credentials, cache_key)
+
+    def _authenticate(
+        self,
+        auth_strategy: AuthStrategy,
+        credentials: dict[str, Any],
+        cache_key: str,
+    ) -> AuthResult:
         # Authenticate using the strategy
         auth_result = auth_strategy.authenticate(credentials)
 
@@ -183,16 +208,32 @@ class SecretsRetriever:
 
         return auth_result
 
-    def invalidate_auth(self, cache_key: str) -> None:
+    def invalidate_auth(
+        self, cache_key: str, rejected: AuthResult | None = None
+    ) -> None:
         """Invalidate cached authentication for a given key.
 
         Call this method when a token is rejected (e.g., 401 response)
         to force re-authentication on the next get_auth() call.
 
+        When several workers see the same token rejected, only the first one
+        invalidates it: the others find a newer token cached and keep it, so
+        the batch makes one token request instead of one per worker.
+
         Args:
             cache_key: The cache key to invalidate
+            rejected: The auth result whose token was rejected; the cache is
+                left alone if it already holds a different token
         """
-        _ = self._auth_cache.pop(cache_key, None)
+        with self._auth_lock:
+            cached = self._auth_cache.get(cache_key)
+            if (
+                cached
+                and rejected is not None
+                and cached.auth_result.access_token != rejected.access_token
+            ):
+                return
+            _ = self._auth_cache.pop(cache_key, None)
 
     def invalidate_credentials(self, secret_arn: str) -> None:
         """Invalidate cached credentials for a given secret ARN.
@@ -204,6 +245,7 @@ class SecretsRetriever:
             secret_arn: The secret ARN to invalidate
         """
         _ = self._credentials_cache.pop(secret_arn, None)
+        _ = self._credentials_cached_at.pop(secret_arn, None)
 
     def clear_all_caches(self) -> None:
         """Clear all cached credentials and authentication results.
@@ -211,6 +253,7 @@ class SecretsRetriever:
         Useful for testing or when a full cache reset is needed.
         """
         self._credentials_cache.clear()
+        self._credentials_cached_at.clear()
         self._auth_cache.clear()
 
     def _is_auth_expired(self, cached: CachedAuth) -> bool:
@@ -230,7 +273,9 @@ class SecretsRetriever:
             return False
 
         # Check if current time is past (expiry - buffer)
-        return time.time() >= (cached.expires_at - self.EXPIRY_BUFFER_SECONDS)
+        lifetime = cached.expires_at - cached.cached_at
+        buffer = min(self.EXPIRY_BUFFER_SECONDS, lifetime / 10)
+        return time.time() >= (cached.expires_at - buffer)
 
     def is_auth_cached(self, cache_key: str) -> bool:
         """Check if valid authentication is cached for a key.
@@ -253,6 +298,45 @@ class SecretsRetriever:
             secret_arn: The secret ARN to check
 
         Returns:
-            True if credentials are cached
+            True if credentials are cached and within CREDENTIALS_TTL_SECONDS
         """
-        return secret_arn in self._credentials_cache
+        cached_at = self._credentials_cached_at.get(secret_arn)
+        if cached_at is None:
+            return False
+        return time.time() - cached_at < self.CREDENTIALS_TTL_SECONDS
+
+    @staticmethod
+    def auth_cache_key(
+        auth_strategy: AuthStrategy, credentials: dict[str, Any], secret_arn: str
+    ) -> str:
+        """Auth cache key shared by every node requesting the same token.
+
+        Tokens are keyed by (auth endpoint, client id), so nodes that use the
+        same OAuth2 client share a token. Strategies without a client id are
+        keyed by their secret. Either way the key ends with a hash of the
+        strategy's other token-request parameters (scope, extra headers), so
+        a node never reuses a token issued for a different scope.
+
+        Args:
+            auth_strategy: The auth strategy that will request the token
+            credentials: Credentials dictionary from get_credentials()
+            secret_arn: ARN of the secret the credentials came from
+
+        Returns:
+            Cache key for get_auth()
+        """
+        config = auth_strategy.config
+        request_parameters = json.dumps(
+            [
+                auth_strategy.get_strategy_name(),
+                config.additional_config,
+                credentials.get("additional_headers"),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha256(request_parameters.encode()).hexdigest()[:16]
+        client_id = credentials.get("client_id")
+        if config.auth_endpoint_url and client_id:
+            return f"{config.auth_endpoint_url}|{client_id}|{digest}"
+        return f"{secret_arn}|{digest}"
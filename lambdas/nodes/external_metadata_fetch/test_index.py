@@ -0,0 +1,83 @@
+"""
+Unit tests for concurrent batch enrichment.
+
+Tests that assets of a batch are enriched concurrently on workers that
+outlive the invocation, and that results keep the input order however the
+workers finish.
+"""
+
+import os
+import threading
+import time
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("EXTERNAL_PAYLOAD_BUCKET", "payloads")
+
+from nodes.external_metadata_fetch import index
+from nodes.external_metadata_fetch.index import _enrich_assets
+
+
+def _assets(count):
+    return [{"InventoryID": f"asset-{i}"} for i in range(count)]
+
+
+class TestEnrichAssets:
+    """Test suite for enriching a batch of assets"""
+
+    def test_results_keep_input_order(self):
+        """Test that later assets finishing first do not reorder results"""
+        assets = _assets(6)
+
+        def enrich(asset):
+            # Earlier assets take longer, so workers finish in reverse order
+            time.sleep(0.01 * (6 - int(asset["InventoryID"].split("-")[1])))
+            return asset["InventoryID"]
+
+        results = _enrich_assets(enrich, assets, max_concurrency=6)
+
+        assert results == [asset["InventoryID"] for asset in assets]
+
+    def test_assets_are_enriched_concurrently(self):
+        """Test that up to max_concurrency assets are in flight at once"""
+        in_flight, peak = [0], [0]
+        lock = threading.Lock()
+
+        def enrich(asset):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return asset
+
+        _enrich_assets(enrich, _assets(8), max_concurrency=3)
+
+        assert peak[0] == 3
+
+    def test_single_asset_runs_inline(self):
+        """Test that a one-asset batch is enriched on the calling thread"""
+        threads = []
+
+        _enrich_assets(
+            lambda asset: threads.append(threading.current_thread()),
+            _assets(1),
+            max_concurrency=4,
+        )
+
+        assert threads == [threading.current_thread()]
+
+    def test_workers_are_reused_across_invocations(self):
+        """Test that the pool outlives a batch so worker threads are reused"""
+        names = set()
+
+        def enrich(asset):
+            names.add(threading.current_thread().name)
+            return asset
+
+        _enrich_assets(enrich, _assets(4), max_concurrency=2)
+        _enrich_assets(enrich, _assets(4), max_concurrency=2)
+
+        assert len(names) <= 2
+        assert index._get_executor(2) is index._get_executor(2)
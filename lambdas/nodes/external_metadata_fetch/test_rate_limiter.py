@@ -0,0 +1,74 @@
+"""
+Unit tests for per-partner rate limiting.
+
+Tests that the token bucket lets a burst through, then paces callers at the
+configured rate in arrival order, and that limiters are shared per host.
+"""
+
+import pytest
+from nodes.external_metadata_fetch import rate_limiter
+from nodes.external_metadata_fetch.rate_limiter import RateLimiter, get_rate_limiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock that only moves when a caller sleeps."""
+    now = [100.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(
+        rate_limiter.time, "sleep", lambda seconds: now.__setitem__(0, now[0] + seconds)
+    )
+    return now
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter.acquire"""
+
+    def test_burst_then_paced(self, clock):
+        """Test that a full bucket admits a burst, then one request per interval"""
+        limiter = RateLimiter(requests_per_second=2)
+
+        waits = [limiter.acquire() for _ in range(5)]
+
+        assert waits == [0.0, 0.0, 0.5, 0.5, 0.5]
+        assert clock[0] == pytest.approx(101.5)
+
+    def test_waiters_queue_in_arrival_order(self, monkeypatch):
+        """Test that callers arriving together wait successively longer"""
+        monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: 100.0)
+        monkeypatch.setattr(rate_limiter.time, "sleep", lambda seconds: None)
+        limiter = RateLimiter(requests_per_second=4, burst=1)
+
+        waits = [limiter.acquire() for _ in range(4)]
+
+        assert waits == [0.0, 0.25, 0.5, 0.75]
+
+    def test_idle_time_refills_up_to_the_burst(self, clock):
+        """Test that an idle limiter never banks more than its burst"""
+        limiter = RateLimiter(requests_per_second=2)
+        limiter.acquire()
+        clock[0] += 60
+
+        waits = [limiter.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.5]
+
+    def test_rate_must_be_positive(self):
+        """Test that a zero rate is rejected"""
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_second=0)
+
+
+class TestGetRateLimiter:
+    """Test suite for the container-wide limiter registry"""
+
+    def test_limiter_is_shared_per_host(self):
+        """Test that URLs on one host share a bucket and other hosts do not"""
+        first = get_rate_limiter("https://api.example.com/v1/assets", 5)
+
+        assert get_rate_limiter("https://api.example.com/v2/other", 5) is first
+        assert get_rate_limiter("https://other.example.com/v1/assets", 5) is not first
+
+    def test_zero_rate_disables_limiting(self):
+        """Test that a rate of 0 returns no limiter"""
+        assert get_rate_limiter("https://api.example.com", 0) is None
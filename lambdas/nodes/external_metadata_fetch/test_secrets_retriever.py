@@ -0,0 +1,191 @@
+"""
+Unit tests for partner token caching.
+
+Tests that concurrent workers share one token request, that a rejected token
+is only invalidated while it is still the cached one, that short-lived tokens
+are refreshed before they expire, and that tokens are keyed by everything
+that goes into the token request.
+"""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import pytest
+from nodes.external_metadata_fetch import secrets_retriever
+from nodes.external_metadata_fetch.auth.base import AuthConfig, AuthResult
+from nodes.external_metadata_fetch.auth.oauth2_client_credentials import (
+    OAuth2ClientCredentialsStrategy,
+)
+from nodes.external_metadata_fetch.secrets_retriever import SecretsRetriever
+
+CREDENTIALS = {"client_id": "client", "client_secret": "secret"}
+
+
+class CountingStrategy:
+    """Auth strategy stand-in issuing token-1, token-2, ... slowly"""
+
+    def __init__(self, expires_in=3600, delay=0.0):
+        self.calls = 0
+        self.expires_in = expires_in
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def authenticate(self, credentials):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            token = f"token-{self.calls}"
+        return AuthResult(success=True, access_token=token, expires_in=self.expires_in)
+
+    def get_strategy_name(self):
+        return "counting"
+
+
+@pytest.fixture
+def retriever():
+    return SecretsRetriever(secrets_client=MagicMock())
+
+
+class TestGetAuth:
+    """Test suite for single-flight token requests"""
+
+    def test_concurrent_workers_make_one_token_request(self, retriever):
+        """Test that workers missing the cache together share one authenticate"""
+        strategy = CountingStrategy(delay=0.05)
+        start = threading.Barrier(8)
+        tokens = []
+
+        def worker():
+            start.wait()
+            tokens.append(retriever.get_auth(strategy, CREDENTIALS, "key").access_token)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert strategy.calls == 1
+        assert tokens == ["token-1"] * 8
+
+    def test_failed_authentication_is_not_cached(self, retriever):
+        """Test that a failed token request raises and is retried next time"""
+        strategy = MagicMock()
+        strategy.authenticate.side_effect = [
+            AuthResult(success=False, error_message="denied"),
+            AuthResult(success=True, access_token="token"),
+        ]
+
+        with pytest.raises(secrets_retriever.AuthenticationError):
+            retriever.get_auth(strategy, CREDENTIALS, "key")
+
+        assert retriever.get_auth(strategy, CREDENTIALS, "key").access_token == "token"
+
+
+class TestInvalidateAuth:
+    """Test suite for invalidating a rejected token"""
+
+    def test_rejected_token_is_replaced(self, retriever):
+        """Test that invalidating the cached token forces a new request"""
+        strategy = CountingStrategy()
+        rejected = retriever.get_auth(strategy, CREDENTIALS, "key")
+
+        retriever.invalidate_auth("key", rejected=rejected)
+
+        assert retriever.get_auth(strategy, CREDENTIALS, "key").access_token == (
+            "token-2"
+        )
+
+    def test_newer_token_is_kept(self, retriever):
+        """Test that a late 401 for an old token keeps the refreshed one"""
+        strategy = CountingStrategy()
+        rejected = retriever.get_auth(strategy, CREDENTIALS, "key")
+        retriever.invalidate_auth("key", rejected=rejected)
+        refreshed = retriever.get_auth(strategy, CREDENTIALS, "key")
+
+        retriever.invalidate_auth("key", rejected=rejected)
+
+        assert retriever.get_auth(strategy, CREDENTIALS, "key") is refreshed
+        assert strategy.calls == 2
+
+    def test_without_rejected_token_always_invalidates(self, retriever):
+        """Test that the unconditional form still drops the cached token"""
+        retriever.get_auth(CountingStrategy(), CREDENTIALS, "key")
+
+        retriever.invalidate_auth("key")
+
+        assert not retriever.is_auth_cached("key")
+
+
+class TestExpiryBuffer:
+    """Test suite for refreshing tokens before they expire"""
+
+    @pytest.mark.parametrize(
+        "expires_in, still_valid_at, refreshed_at",
+        [
+            # Long-lived tokens are refreshed EXPIRY_BUFFER_SECONDS early
+            (3600, 3600 - 61, 3600 - 60),
+            # Short-lived tokens are refreshed a tenth of their lifetime early
+            (30, 26.9, 27),
+        ],
+    )
+    def test_token_is_refreshed_before_it_expires(
+        self, retriever, monkeypatch, expires_in, still_valid_at, refreshed_at
+    ):
+        """Test that the buffer never consumes a short token's whole lifetime"""
+        now = [1000.0]
+        monkeypatch.setattr(secrets_retriever.time, "time", lambda: now[0])
+        strategy = CountingStrategy(expires_in=expires_in)
+        retriever.get_auth(strategy, CREDENTIALS, "key")
+
+        now[0] = 1000.0 + still_valid_at
+        assert retriever.get_auth(strategy, CREDENTIALS, "key").access_token == (
+            "token-1"
+        )
+
+        now[0] = 1000.0 + refreshed_at
+        assert retriever.get_auth(strategy, CREDENTIALS, "key").access_token == (
+            "token-2"
+        )
+
+
+def _oauth2(scope=None, endpoint="https://auth.example.com/token"):
+    additional = {"scope": scope} if scope else {}
+    return OAuth2ClientCredentialsStrategy(AuthConfig(endpoint, additional))
+
+
+class TestAuthCacheKey:
+    """Test suite for keying cached tokens"""
+
+    def test_same_client_and_scope_share_a_key(self):
+        """Test that nodes requesting an identical token share it"""
+        assert SecretsRetriever.auth_cache_key(
+            _oauth2("read"), CREDENTIALS, "arn:a"
+        ) == SecretsRetriever.auth_cache_key(_oauth2("read"), CREDENTIALS, "arn:b")
+
+    def test_different_scopes_do_not_share_a_key(self):
+        """Test that a token issued for one scope is never reused for another"""
+        assert SecretsRetriever.auth_cache_key(
+            _oauth2("read"), CREDENTIALS, "arn:a"
+        ) != SecretsRetriever.auth_cache_key(_oauth2("write"), CREDENTIALS, "arn:a")
+
+    def test_credential_headers_are_part_of_the_key(self):
+        """Test that secret-held token request headers separate tokens"""
+        with_headers = {**CREDENTIALS, "additional_headers": {"X-Tenant": "a"}}
+
+        assert SecretsRetriever.auth_cache_key(
+            _oauth2(), CREDENTIALS, "arn:a"
+        ) != SecretsRetriever.auth_cache_key(_oauth2(), with_headers, "arn:a")
+
+    def test_strategies_without_a_client_are_keyed_by_secret(self):
+        """Test that API key style credentials are keyed by their secret"""
+        strategy = _oauth2(endpoint="")
+
+        key = SecretsRetriever.auth_cache_key(strategy, {"api_key": "k"}, "arn:a")
+
+        assert key.startswith("arn:a|")
@@ -52,6 +52,9 @@ async def read_string(arg, options):
     """
     if is_base64_url(arg):
         return await call_reader_class(arg, options, "base64")
+    elif arg.startswith("s3://"):
+        # Ranged reads: only the bytes the file parsers touch are fetched
+        return await call_reader_class(arg, options, "s3")
     elif "://" in arg:
         # URL
         return await call_reader(arg, options, "url", fetch_url_as_bytes)
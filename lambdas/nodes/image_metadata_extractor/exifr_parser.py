@@ -5,12 +5,19 @@ This module provides functions for extracting and organizing image metadata
 using the exifr-py library, maintaining compatibility with the Node.js version.
 """
 
-from typing import Any, Dict
+import os
+from typing import Any, Dict, Union
 
-from exifr import parse
+from exifr import Exifr
 
+# Ranged S3 reads: size of the first fetch and of each on-demand extension,
+# and how many ranged GETs to issue before loading the rest of the object
+FIRST_CHUNK_SIZE = int(os.environ.get("METADATA_FIRST_CHUNK_SIZE", str(64 * 1024)))
+CHUNK_SIZE = int(os.environ.get("METADATA_CHUNK_SIZE", str(64 * 1024)))
+CHUNK_LIMIT = int(os.environ.get("METADATA_CHUNK_LIMIT", "16"))
 
-async def extract_organized_metadata(buffer: bytes) -> Dict[str, Any]:
+
+async def extract_organized_metadata(buffer: Union[bytes, str]) -> Dict[str, Any]:
     """
     Extract and organize metadata using exifr-py.
 
@@ -18,7 +25,8 @@ async def extract_organized_metadata(buffer: bytes) -> Dict[str, Any]:
     organizes the output by segment (tiff, exif, gps, xmp, etc.).
 
     Args:
-        buffer: Image file bytes
+        buffer: Image file bytes, or an s3://bucket/key URL to read the
+            metadata with ranged GETs instead of downloading the object
 
     Returns:
         dict: Organized metadata by segment
@@ -51,11 +59,19 @@ async def extract_organized_metadata(buffer: bytes) -> Dict[str, Any]:
         "translateValues": True,
         "multiSegment": True,
         "silentErrors": True,  # Collect errors but don't throw
+        "firstChunkSize": FIRST_CHUNK_SIZE,
+        "chunkSize": CHUNK_SIZE,
+        "chunkLimit": CHUNK_LIMIT,
     }
 
+    # Read outside the try block so S3 errors reach the caller instead of
+    # looking like an image without metadata
+    exr = Exifr(options)
+    await exr.read(buffer)
+
     try:
         # Parse metadata using exifr-py
-        raw_metadata = await parse(buffer, options)
+        raw_metadata = await exr.parse()
 
         if not raw_metadata:
             return {}
@@ -112,7 +112,8 @@ async def process_image_file(bucket: str, key: str) -> Dict[str, Any]:
     Determines the file type from the extension and routes to:
     - Unsupported formats (.webp, .exr): Return error message
     - SVG files (.svg): Route to XML parser
-    - Supported formats: Route to exifr-py parser
+    - Supported formats: Route to exifr-py parser, reading only the byte
+      ranges that hold metadata
 
     Args:
         bucket: S3 bucket name
@@ -173,8 +174,8 @@ async def process_image_file(bucket: str, key: str) -> Dict[str, Any]:
         from exifr_parser import extract_organized_metadata
 
         try:
-            file_buffer = await _download_file_from_s3(bucket, key)
-            metadata = await extract_organized_metadata(file_buffer)
+            # exifr fetches only the byte ranges its file parsers touch
+            metadata = await extract_organized_metadata(f"s3://{bucket}/{key}")
             return metadata
         except Exception as e:
             logger.error(f"Error processing image file {key}: {e}", exc_info=True)
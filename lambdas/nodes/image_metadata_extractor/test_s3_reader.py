@@ -0,0 +1,175 @@
+"""
+Unit tests for ranged-GET image metadata reads.
+
+Tests that metadata read through s3://bucket/key URLs matches the in-memory
+path while fetching only the header pages, that missing pages are merged
+into as few ranged GETs as possible, and that S3 errors are not mistaken for
+an image without metadata.
+"""
+
+import asyncio
+import io
+import struct
+from types import SimpleNamespace
+
+import boto3
+import exifr_parser
+import pytest
+from botocore.exceptions import ClientError
+from exifr.file_readers import S3Reader
+
+KB = 1024
+
+
+def _jpeg(padding):
+    """JPEG with an EXIF IFD0 (Make, Model) followed by padding bytes"""
+    make, model = b"Acme\0", b"Camera 9000\0"
+    data_offset = 8 + 2 + 2 * 12 + 4
+    tiff = b"MM\0*" + struct.pack(">IH", 8, 2)
+    tiff += struct.pack(">HHII", 0x010F, 2, len(make), data_offset)
+    tiff += struct.pack(">HHII", 0x0110, 2, len(model), data_offset + len(make))
+    tiff += struct.pack(">I", 0) + make + model
+    app1 = b"Exif\0\0" + tiff
+    return (
+        b"\xff\xd8\xff\xe1"
+        + struct.pack(">H", len(app1) + 2)
+        + app1
+        + b"\xff\xda"
+        + b"\0" * padding
+        + b"\xff\xd9"
+    )
+
+
+class FakeS3:
+    """get_object stand-in serving ranges of one in-memory object"""
+
+    def __init__(self, data):
+        self.data = data
+        self.ranges = []
+
+    def get_object(self, Bucket, Key, Range):
+        if not self.data:
+            raise ClientError(
+                {"Error": {"Code": "InvalidRange", "Message": "empty"}}, "GetObject"
+            )
+        start, end = (int(part) for part in Range[len("bytes=") :].split("-"))
+        self.ranges.append((start, end))
+        body = self.data[start : end + 1]
+        return {
+            "ContentRange": f"bytes {start}-{start + len(body) - 1}/{len(self.data)}",
+            "Body": io.BytesIO(body),
+        }
+
+
+def _reader(data, chunk_size=4 * KB, first_chunk_size=4 * KB, chunk_limit=None):
+    options = SimpleNamespace(
+        chunkSize=chunk_size, firstChunkSize=first_chunk_size, chunkLimit=chunk_limit
+    )
+    client = FakeS3(data)
+    reader = S3Reader("s3://bucket/image.jpg", options, client=client)
+    asyncio.run(reader.read())
+    return reader, client
+
+
+class TestS3Reader:
+    """Test suite for the paged ranged-GET file reader"""
+
+    def test_read_fetches_only_the_first_chunk(self):
+        """Test that opening an object costs one GET of firstChunkSize bytes"""
+        reader, client = _reader(bytes(range(256)) * 1024, first_chunk_size=6 * KB)
+
+        assert client.ranges == [(0, 8 * KB - 1)]
+        assert reader.byte_length == 256 * KB
+        assert reader.bytes_fetched == 8 * KB
+
+    def test_reads_outside_loaded_pages_fetch_on_demand(self):
+        """Test that bytes past the first chunk are fetched and returned intact"""
+        data = bytes(range(256)) * 1024
+        reader, client = _reader(data)
+
+        assert reader.get_bytes(100 * KB - 2, 4) == data[100 * KB - 2 : 100 * KB + 2]
+        assert reader.get_uint16(200 * KB) == struct.unpack(
+            ">H", data[200 * KB : 200 * KB + 2]
+        )[0]
+        assert client.ranges[1:] == [
+            (96 * KB, 104 * KB - 1),
+            (200 * KB, 204 * KB - 1),
+        ]
+
+    def test_contiguous_missing_pages_are_one_request(self):
+        """Test that ensure_chunk merges adjacent missing pages into one GET"""
+        reader, client = _reader(b"x" * 64 * KB)
+        reader.get_uint8(20 * KB)
+
+        asyncio.run(reader.ensure_chunk(8 * KB, 24 * KB))
+
+        assert client.ranges[1:] == [
+            (20 * KB, 24 * KB - 1),
+            (8 * KB, 20 * KB - 1),
+            (24 * KB, 32 * KB - 1),
+        ]
+        assert reader.available(8 * KB, 24 * KB)
+
+    def test_chunk_limit_loads_the_rest_in_one_request(self):
+        """Test that after chunkLimit GETs the remaining object is fetched once"""
+        reader, client = _reader(b"x" * 64 * KB, chunk_limit=2)
+        reader.get_uint8(16 * KB)
+
+        reader.get_uint8(40 * KB)
+        reader.get_uint8(60 * KB)
+
+        assert client.ranges[2:] == [(40 * KB, 64 * KB - 1)]
+        assert reader.range_requests == 3
+
+    def test_empty_object_has_no_bytes(self):
+        """Test that the InvalidRange error of an empty object is an empty read"""
+        reader, _ = _reader(b"")
+
+        assert reader.byte_length == 0
+
+    def test_invalid_url_is_rejected(self):
+        """Test that an S3 URL without a key raises ValueError"""
+        with pytest.raises(ValueError):
+            S3Reader("s3://bucket", SimpleNamespace())
+
+
+class TestExtractOrganizedMetadata:
+    """Test suite for metadata extraction from s3:// URLs"""
+
+    @pytest.fixture
+    def s3(self, monkeypatch):
+        def install(data):
+            client = FakeS3(data)
+            monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: client)
+            return client
+
+        return install
+
+    def test_large_image_metadata_is_one_ranged_get(self, s3):
+        """Test that a 5 MB JPEG is parsed from its first 64 KB only"""
+        data = _jpeg(5 * KB * KB)
+        client = s3(data)
+
+        from_s3 = asyncio.run(
+            exifr_parser.extract_organized_metadata("s3://bucket/image.jpg")
+        )
+
+        assert from_s3 == asyncio.run(exifr_parser.extract_organized_metadata(data))
+        assert from_s3["ifd0"] == {"Make": "Acme", "Model": "Camera 9000"}
+        assert client.ranges == [(0, exifr_parser.FIRST_CHUNK_SIZE - 1)]
+
+    def test_s3_errors_reach_the_caller(self, s3, monkeypatch):
+        """Test that a failed GET raises instead of returning empty metadata"""
+        client = s3(_jpeg(0))
+
+        def denied(**kwargs):
+            raise ClientError(
+                {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "GetObject"
+            )
+
+        monkeypatch.setattr(client, "get_object", denied)
+
+        with pytest.raises(ClientError):
+            asyncio.run(
+                exifr_parser.extract_organized_metadata("s3://bucket/image.jpg")
+            )
@@ -7,20 +7,26 @@ using the new S3 Vector Store service with the custom unreleased boto3 SDK.
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
 import os
+import random
 import time
+from collections import deque
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools.metrics import MetricUnit, single_metric
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from distributed_map_utils import download_s3_external_payload, is_s3_reference
 from lambda_middleware import lambda_middleware
 from lambda_utils import _truncate_floats
 from nodes_utils import seconds_to_smpte
+from vector_key_registry import VectorKeyRegistry
 
 # S3 client for downloading external payloads
 s3_client = boto3.client("s3")
@@ -50,10 +56,33 @@ VECTOR_BATCH_SIZE = int(os.getenv("VECTOR_BATCH_SIZE", "500"))
 MAX_VECTOR_BATCH_SIZE = 500  # AWS service hard limit - DO NOT EXCEED
 
 # Request throttling configuration
-# Add delays between operations to avoid overwhelming the S3 Vectors service
-# Helps prevent ServiceUnavailableException during high-concurrency scenarios
+# Add delays between control-plane operations (bucket/index checks) to avoid
+# overwhelming the S3 Vectors service. PutVectors batches are paced by the
+# adaptive writer below instead of a fixed sleep.
 REQUEST_THROTTLE_MS = int(os.getenv("S3_VECTORS_THROTTLE_MS", "100"))  # 100ms default
 
+# Adaptive PutVectors writer (AIMD concurrency control)
+# The in-flight window starts at VECTOR_WRITE_INITIAL_CONCURRENCY, grows by
+# roughly one batch per round of successful writes, and is halved whenever
+# the service throttles. At 500 vectors/batch, 5 in-flight batches already
+# saturate the 2,500 vectors/sec per-index limit.
+VECTOR_WRITE_INITIAL_CONCURRENCY = int(
+    os.getenv("VECTOR_WRITE_INITIAL_CONCURRENCY", "2")
+)
+VECTOR_WRITE_MAX_CONCURRENCY = int(os.getenv("VECTOR_WRITE_MAX_CONCURRENCY", "5"))
+VECTOR_WRITE_MAX_RETRIES = int(os.getenv("VECTOR_WRITE_MAX_RETRIES", "8"))
+VECTOR_WRITE_BASE_BACKOFF_MS = int(os.getenv("VECTOR_WRITE_BASE_BACKOFF_MS", "200"))
+VECTOR_WRITE_MAX_BACKOFF_MS = int(os.getenv("VECTOR_WRITE_MAX_BACKOFF_MS", "10000"))
+
+# Error codes that mean "slow down" rather than "this batch is bad"
+THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+    "SlowDown",
+    "RequestLimitExceeded",
+}
+
 # Graceful degradation configuration
 # Allow pipeline to continue even if vector storage fails (non-critical operation)
 ALLOW_VECTOR_STORAGE_FAILURE = (
@@ -515,6 +544,32 @@ def get_s3_vector_client():
         raise
 
 
+_put_vectors_client = None
+
+
+def get_put_vectors_client():
+    """
+    S3 Vector client used by the adaptive writer.
+
+    botocore's own retries are kept short so throttling surfaces to the AIMD
+    controller instead of being absorbed (and serialized) inside one call.
+    The connection pool is sized for the maximum in-flight window.
+    """
+    global _put_vectors_client
+    if _put_vectors_client is None:
+        _put_vectors_client = boto3.Session().client(
+            "s3vectors",
+            region_name=AWS_REGION,
+            config=Config(
+                retries={"max_attempts": 2, "mode": "standard"},
+                connect_timeout=5,
+                read_timeout=60,
+                max_pool_connections=max(10, VECTOR_WRITE_MAX_CONCURRENCY),
+            ),
+        )
+    return _put_vectors_client
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Early-exit helpers
 def _bad_request(msg: str):
@@ -660,8 +715,254 @@ def ensure_index_exists(
         raise RuntimeError(f"Cannot access index {index_name}: {e}") from e
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Adaptive PutVectors writer
+def _is_throttling_error(error: Exception) -> bool:
+    if isinstance(error, ClientError):
+        code = error.response.get("Error", {}).get("Code", "")
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return code in THROTTLING_ERROR_CODES or status in (429, 503)
+    return False
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Throttling and server-side (5xx) failures are worth retrying."""
+    if _is_throttling_error(error):
+        return True
+    if isinstance(error, ClientError):
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return isinstance(status, int) and status >= 500
+    return False
+
+
+def _emit_metric(
+    name: str, unit: MetricUnit, value: float, bucket_name: str, index_name: str
+) -> None:
+    """Emit a single metric dimensioned by vector bucket and index."""
+    try:
+        with single_metric(
+            name=name, unit=unit, value=value, namespace="MediaLake"
+        ) as metric:
+            metric.add_dimension(name="VectorBucket", value=bucket_name)
+            metric.add_dimension(name="VectorIndex", value=index_name)
+    except Exception as e:
+        logger.debug(f"Failed to emit metric {name}: {e}")
+
+
+class AdaptiveVectorWriter:
+    """
+    Writes PutVectors batches with several requests in flight.
+
+    Concurrency follows AIMD: each successful batch grows the window by
+    1/window (about one extra slot per round trip), each throttled batch
+    halves it. Only the failed batch is retried, after jittered exponential
+    backoff; the rest of the pipeline keeps flowing. Client errors other
+    than throttling (validation, access denied, ...) fail immediately.
+    """
+
+    def __init__(self, client, bucket_name: str, index_name: str):
+        self.client = client
+        self.bucket_name = bucket_name
+        self.index_name = index_name
+        self.max_concurrency = max(1, VECTOR_WRITE_MAX_CONCURRENCY)
+        self.window = float(
+            min(max(1, VECTOR_WRITE_INITIAL_CONCURRENCY), self.max_concurrency)
+        )
+        self.throttle_count = 0
+        self.request_count = 0
+
+    def _put_batch(self, batch: List[Dict[str, Any]]) -> None:
+        self.client.put_vectors(
+            vectorBucketName=self.bucket_name,
+            indexName=self.index_name,
+            vectors=batch,
+        )
+
+    @staticmethod
+    def _backoff_seconds(attempt: int) -> float:
+        capped = min(
+            VECTOR_WRITE_BASE_BACKOFF_MS * (2 ** (attempt - 1)),
+            VECTOR_WRITE_MAX_BACKOFF_MS,
+        )
+        return random.uniform(capped / 2, capped) / 1000.0
+
+    def write(self, batches: List[List[Dict[str, Any]]]) -> List[str]:
+        """
+        Store all batches and return the stored keys in input order.
+
+        Raises:
+            RuntimeError: If a batch fails with a non-retryable error or still
+                fails after VECTOR_WRITE_MAX_RETRIES
+        """
+        total_batches = len(batches)
+        start = time.time()
+        # (batch index, attempt, not-before timestamp)
+        queue = deque((i, 0, 0.0) for i in range(total_batches))
+        stored: Dict[int, List[str]] = {}
+        peak_window = self.window
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrency
+        ) as executor:
+            in_flight: Dict[concurrent.futures.Future, Tuple[int, int]] = {}
+
+            while queue or in_flight:
+                now = time.time()
+                # Fill the window with batches whose backoff has elapsed
+                deferred = []
+                while queue and len(in_flight) < int(self.window):
+                    batch_index, attempt, not_before = queue.popleft()
+                    if not_before > now:
+                        deferred.append((batch_index, attempt, not_before))
+                        continue
+                    future = executor.submit(self._put_batch, batches[batch_index])
+                    in_flight[future] = (batch_index, attempt)
+                    self.request_count += 1
+                queue.extendleft(reversed(deferred))
+
+                if not in_flight:
+                    # Everything left is backing off
+                    time.sleep(max(0.0, min(q[2] for q in queue) - time.time()))
+                    continue
+
+                next_ready = min((q[2] for q in queue), default=None)
+                timeout = (
+                    max(0.0, next_ready - time.time())
+                    if next_ready is not None and len(in_flight) < int(self.window)
+                    else None
+                )
+                done, _ = concurrent.futures.wait(
+                    in_flight,
+                    timeout=timeout,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+
+                for future in done:
+                    batch_index, attempt = in_flight.pop(future)
+                    batch = batches[batch_index]
+                    error = future.exception()
+
+                    if error is None:
+                        stored[batch_index] = [v["key"] for v in batch]
+                        self.window = min(
+                            self.max_concurrency, self.window + 1.0 / self.window
+                        )
+                        peak_window = max(peak_window, self.window)
+                        logger.info(
+                            f"[VECTOR_STORAGE] Stored batch {batch_index + 1}/{total_batches}: "
+                            f"{len(batch)} vectors to bucket='{self.bucket_name}', "
+                            f"index='{self.index_name}' (window={self.window:.2f})"
+                        )
+                        continue
+
+                    throttled = _is_throttling_error(error)
+                    if throttled:
+                        self.throttle_count += 1
+                        self.window = max(1.0, self.window / 2)
+
+                    retryable = _is_retryable_error(error)
+                    if not retryable or attempt + 1 > VECTOR_WRITE_MAX_RETRIES:
+                        logger.error(
+                            f"Failed to store batch {batch_index + 1}/{total_batches}",
+                            extra={
+                                "batch_number": batch_index + 1,
+                                "total_batches": total_batches,
+                                "batch_size": len(batch),
+                                "attempts": attempt + 1,
+                                "error": str(error),
+                            },
+                        )
+                        self._emit_summary(sum(map(len, stored.values())), start)
+                        raise RuntimeError(
+                            f"Failed to store vector batch {batch_index + 1}/{total_batches}: {error}"
+                        ) from error
+
+                    delay = self._backoff_seconds(attempt + 1)
+                    logger.warning(
+                        f"Batch {batch_index + 1}/{total_batches} "
+                        f"{'throttled' if throttled else 'failed'}, retrying in {delay:.2f}s",
+                        extra={
+                            "attempt": attempt + 1,
+                            "window": self.window,
+                            "error": str(error),
+                        },
+                    )
+                    queue.append((batch_index, attempt + 1, time.time() + delay))
+
+        stored_keys = [key for i in range(total_batches) for key in stored[i]]
+        self._emit_summary(len(stored_keys), start, peak_window)
+        return stored_keys
+
+    def _emit_summary(
+        self, vectors_written: int, start: float, peak_window: float = 0.0
+    ) -> None:
+        elapsed = max(time.time() - start, 1e-6)
+        throttle_rate = (
+            100.0 * self.throttle_count / self.request_count
+            if self.request_count
+            else 0.0
+        )
+        logger.info(
+            "[VECTOR_STORAGE] Adaptive write summary",
+            extra={
+                "vectors_written": vectors_written,
+                "elapsed_seconds": round(elapsed, 3),
+                "vectors_per_second": round(vectors_written / elapsed, 1),
+                "put_requests": self.request_count,
+                "throttled_requests": self.throttle_count,
+                "throttle_rate_percent": round(throttle_rate, 2),
+                "peak_concurrency": peak_window,
+                "final_concurrency": self.window,
+            },
+        )
+        _emit_metric(
+            "VectorsWritten",
+            MetricUnit.Count,
+            vectors_written,
+            self.bucket_name,
+            self.index_name,
+        )
+        _emit_metric(
+            "VectorWriteThroughput",
+            MetricUnit.CountPerSecond,
+            vectors_written / elapsed,
+            self.bucket_name,
+            self.index_name,
+        )
+        _emit_metric(
+            "VectorWriteThrottleRate",
+            MetricUnit.Percent,
+            throttle_rate,
+            self.bucket_name,
+            self.index_name,
+        )
+
+
+def register_vector_keys(
+    bucket_name: str, index_name: str, vectors: List[Dict[str, Any]]
+) -> None:
+    """Record each vector key against its asset in the vector key registry."""
+    registry = VectorKeyRegistry(bucket_name, index_name)
+    if not registry.enabled:
+        return
+
+    keys_by_inventory_id: Dict[str, List[str]] = {}
+    for v in vectors:
+        keys_by_inventory_id.setdefault(v["metadata"]["inventory_id"], []).append(
+            v["key"]
+        )
+    try:
+        registered = registry.register_many(keys_by_inventory_id)
+    except ClientError as e:
+        raise RuntimeError(f"Failed to register vector keys: {e}") from e
+    logger.info(
+        f"[VECTOR_STORAGE] Registered {registered} vector keys for "
+        f"{len(keys_by_inventory_id)} asset(s)"
+    )
+
+
 def store_vectors(
-    client, bucket_name: str, index_name: str, vectors_data: List[Dict[str, Any]]
+    bucket_name: str, index_name: str, vectors_data: List[Dict[str, Any]]
 ) -> Dict[str, Any]:
     """Store vectors in S3 Vector Store with strict validation."""
     if not bucket_name:
@@ -760,43 +1061,15 @@ def store_vectors(
             f"[VECTOR_STORAGE] Processing {len(vectors)} vectors in batches of {batch_size}"
         )
 
-        stored_keys = []
-        for i in range(0, len(vectors), batch_size):
-            batch = vectors[i : i + batch_size]
-            batch_number = i // batch_size + 1
-            total_batches = (len(vectors) + batch_size - 1) // batch_size
+        # Register keys before writing so a partially failed write can never
+        # leave stored vectors the deletion path does not know about
+        register_vector_keys(bucket_name, index_name, vectors)
 
-            try:
-                # Add throttling delay before PUT operation (except first batch)
-                if i > 0 and REQUEST_THROTTLE_MS > 0:
-                    time.sleep(REQUEST_THROTTLE_MS / 1000.0)
-
-                client.put_vectors(
-                    vectorBucketName=bucket_name,
-                    indexName=index_name,
-                    vectors=batch,
-                )
-                batch_keys = [v["key"] for v in batch]
-                stored_keys.extend(batch_keys)
-                logger.info(
-                    f"[VECTOR_STORAGE] Stored batch {batch_number}/{total_batches}: "
-                    f"{len(batch)} vectors to bucket='{bucket_name}', index='{index_name}'. "
-                    f"Keys: {batch_keys[:5]}{'...' if len(batch_keys) > 5 else ''}"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"Failed to store batch {batch_number}/{total_batches}",
-                    extra={
-                        "batch_number": batch_number,
-                        "total_batches": total_batches,
-                        "batch_size": len(batch),
-                        "error": str(e),
-                    },
-                )
-                raise RuntimeError(
-                    f"Failed to store vector batch {batch_number}/{total_batches}: {e}"
-                ) from e
+        batches = [
+            vectors[i : i + batch_size] for i in range(0, len(vectors), batch_size)
+        ]
+        writer = AdaptiveVectorWriter(get_put_vectors_client(), bucket_name, index_name)
+        stored_keys = writer.write(batches)
 
         return {"stored_keys": stored_keys}
     except Exception as e:
@@ -877,7 +1150,7 @@ def process_single_embedding(
     ensure_vector_bucket_exists(client, VECTOR_BUCKET_NAME)
     dim = len(embedding_vector)
     ensure_index_exists(client, VECTOR_BUCKET_NAME, INDEX_NAME, dim)
-    store_result = store_vectors(client, VECTOR_BUCKET_NAME, INDEX_NAME, vectors_data)
+    store_result = store_vectors(VECTOR_BUCKET_NAME, INDEX_NAME, vectors_data)
 
     return {
         "document_id": f"{inventory_id}_{int(datetime.utcnow().timestamp())}",
@@ -1008,7 +1281,7 @@ def process_store_action(payload: Dict[str, Any]) -> Dict[str, Any]:
             ensure_vector_bucket_exists(client, bucket)
             dim = len(vector)
             ensure_index_exists(client, bucket, index, dim)
-            store_vectors(client, bucket, index, vectors_data)
+            store_vectors(bucket, index, vectors_data)
 
             results.append(
                 {
@@ -1238,7 +1511,7 @@ def process_store_action(payload: Dict[str, Any]) -> Dict[str, Any]:
     ensure_vector_bucket_exists(client, VECTOR_BUCKET_NAME)
     dim = len(embedding_vector)
     ensure_index_exists(client, VECTOR_BUCKET_NAME, INDEX_NAME, dim)
-    store_vectors(client, VECTOR_BUCKET_NAME, INDEX_NAME, vectors_data)
+    store_vectors(VECTOR_BUCKET_NAME, INDEX_NAME, vectors_data)
 
     return {
         "statusCode": 200,
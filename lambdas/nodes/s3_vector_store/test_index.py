@@ -0,0 +1,176 @@
+"""
+Unit tests for the adaptive PutVectors writer.
+
+Tests that batches are written concurrently within an AIMD window that grows
+on success and halves on throttling, that only throttled and 5xx batches are
+retried, and that stored keys come back in input order.
+"""
+
+import os
+import threading
+import time
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("EXTERNAL_PAYLOAD_BUCKET", "payloads")
+
+import index
+import pytest
+from botocore.exceptions import ClientError
+from index import AdaptiveVectorWriter
+
+
+def _error(code, status):
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": code},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        },
+        "PutVectors",
+    )
+
+
+def _throttled():
+    return _error("ThrottlingException", 429)
+
+
+def _batches(count, size=2):
+    return [[{"key": f"b{i}-v{n}"} for n in range(size)] for i in range(count)]
+
+
+class FakeS3Vectors:
+    """put_vectors stand-in raising queued errors per batch, keyed by first key"""
+
+    def __init__(self, errors=None, delay=0.0):
+        self.errors = {key: list(queue) for key, queue in (errors or {}).items()}
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def put_vectors(self, vectorBucketName, indexName, vectors):
+        first_key = vectors[0]["key"]
+        with self._lock:
+            self.calls.append(first_key)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            queue = self.errors.get(first_key)
+            error = queue.pop(0) if queue else None
+        try:
+            time.sleep(self.delay)
+            if error is not None:
+                raise error
+            return {}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def writer_limits(monkeypatch):
+    monkeypatch.setattr(index, "VECTOR_WRITE_INITIAL_CONCURRENCY", 2)
+    monkeypatch.setattr(index, "VECTOR_WRITE_MAX_CONCURRENCY", 4)
+    monkeypatch.setattr(index, "VECTOR_WRITE_MAX_RETRIES", 3)
+    monkeypatch.setattr(index, "VECTOR_WRITE_BASE_BACKOFF_MS", 1)
+    monkeypatch.setattr(index, "VECTOR_WRITE_MAX_BACKOFF_MS", 5)
+    monkeypatch.setattr(index, "_emit_metric", lambda *args, **kwargs: None)
+
+
+def _writer(client):
+    return AdaptiveVectorWriter(client, "vectors", "media")
+
+
+class TestAdaptiveVectorWriter:
+    """Test suite for AIMD-controlled PutVectors batches"""
+
+    def test_keys_are_returned_in_input_order(self):
+        """Test that concurrent completion does not reorder stored keys"""
+        batches = _batches(6)
+        client = FakeS3Vectors(delay=0.01)
+
+        keys = _writer(client).write(batches)
+
+        assert keys == [vector["key"] for batch in batches for vector in batch]
+        assert sorted(client.calls) == sorted(batch[0]["key"] for batch in batches)
+
+    def test_window_grows_on_success_up_to_the_limit(self):
+        """Test that successful batches widen the window to max concurrency"""
+        client = FakeS3Vectors(delay=0.01)
+        writer = _writer(client)
+
+        writer.write(_batches(20))
+
+        assert writer.window == 4
+        assert 2 <= client.peak <= 4
+
+    def test_throttling_halves_the_window_and_retries_the_batch(self):
+        """Test that a throttled batch is retried alone and the window halves"""
+        client = FakeS3Vectors(errors={"b0-v0": [_throttled()]})
+        writer = _writer(client)
+
+        keys = writer.write(_batches(1))
+
+        assert client.calls == ["b0-v0", "b0-v0"]
+        assert keys == ["b0-v0", "b0-v1"]
+        assert writer.throttle_count == 1
+        assert writer.request_count == 2
+        # Halved from 2 to 1, then grown by 1/1 on the successful retry
+        assert writer.window == 2.0
+
+    def test_server_errors_are_retried_without_shrinking_the_window(self):
+        """Test that a 5xx failure is retried but is not counted as throttling"""
+        client = FakeS3Vectors(errors={"b0-v0": [_error("InternalError", 500)]})
+        writer = _writer(client)
+
+        writer.write(_batches(1))
+
+        assert client.calls == ["b0-v0", "b0-v0"]
+        assert writer.throttle_count == 0
+        assert writer.window > 2
+
+    def test_only_the_failed_batch_is_resent(self):
+        """Test that healthy batches are written once while one is throttled"""
+        client = FakeS3Vectors(errors={"b1-v0": [_throttled(), _throttled()]})
+
+        _writer(client).write(_batches(4))
+
+        assert sorted(client.calls) == [
+            "b0-v0",
+            "b1-v0",
+            "b1-v0",
+            "b1-v0",
+            "b2-v0",
+            "b3-v0",
+        ]
+
+    def test_client_error_fails_immediately(self):
+        """Test that a validation error is raised without a retry"""
+        client = FakeS3Vectors(errors={"b0-v0": [_error("ValidationException", 400)]})
+
+        with pytest.raises(RuntimeError, match="batch 1/1"):
+            _writer(client).write(_batches(1))
+
+        assert client.calls == ["b0-v0"]
+
+    def test_retries_stop_after_max_retries(self):
+        """Test that a batch still throttled after every retry is raised"""
+        client = FakeS3Vectors(errors={"b0-v0": [_throttled()] * 10})
+        writer = _writer(client)
+
+        with pytest.raises(RuntimeError):
+            writer.write(_batches(1))
+
+        assert len(client.calls) == 1 + 3
+        assert writer.window == 1.0
+
+    def test_backoff_is_capped(self, monkeypatch):
+        """Test that jittered backoff never exceeds VECTOR_WRITE_MAX_BACKOFF_MS"""
+        monkeypatch.setattr(index, "VECTOR_WRITE_BASE_BACKOFF_MS", 200)
+        monkeypatch.setattr(index, "VECTOR_WRITE_MAX_BACKOFF_MS", 1000)
+
+        first = AdaptiveVectorWriter._backoff_seconds(1)
+        late = AdaptiveVectorWriter._backoff_seconds(10)
+
+        assert 0.1 <= first <= 0.2
+        assert 0.5 <= late <= 1.0
@@ -0,0 +1,147 @@
+"""
+Unit tests for the per-asset vector key registry.
+
+Tests that registry entries are scoped to one vector bucket and index, and
+that deletion lookups keep scanning the index until the backfill marker is
+complete so legacy vectors are found alongside registered ones.
+"""
+
+from unittest.mock import MagicMock
+
+from vector_key_registry import (
+    BACKFILL_PK,
+    VectorKeyRegistry,
+    backfill_marker_key,
+    find_vector_keys,
+)
+
+
+class FakeTable:
+    """Dict-backed stand-in for the registry table"""
+
+    def __init__(self):
+        self.items = {}
+
+    def batch_writer(self, overwrite_by_pkeys=None):
+        table = self
+
+        class Batch:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def put_item(self, Item):
+                table.items[(Item["PK"], Item["SK"])] = Item
+
+            def delete_item(self, Key):
+                table.items.pop((Key["PK"], Key["SK"]), None)
+
+        return Batch()
+
+    def query(self, ExpressionAttributeValues, **kwargs):
+        pk = ExpressionAttributeValues[":pk"]
+        prefix = ExpressionAttributeValues[":prefix"]
+        items = [
+            item
+            for (item_pk, sk), item in sorted(self.items.items())
+            if item_pk == pk and sk.startswith(prefix)
+        ]
+        return {"Items": items}
+
+    def get_item(self, Key):
+        item = self.items.get((Key["PK"], Key["SK"]))
+        return {"Item": item} if item else {}
+
+
+def _registry(table, bucket="vectors-a", index="media-vectors"):
+    registry = VectorKeyRegistry(bucket, index, table_name="registry")
+    registry._table = table
+    return registry
+
+
+def _complete_backfill(table, bucket="vectors-a", index="media-vectors"):
+    table.items[(BACKFILL_PK, backfill_marker_key(bucket, index))] = {
+        "completedAt": "2026-01-01T00:00:00+00:00"
+    }
+
+
+def _s3vectors(*vectors):
+    client = MagicMock()
+    client.list_vectors.return_value = {
+        "vectors": [
+            {"key": key, "metadata": {"inventory_id": inventory_id}}
+            for key, inventory_id in vectors
+        ]
+    }
+    return client
+
+
+class TestVectorKeyRegistry:
+    """Test suite for registering and looking up vector keys"""
+
+    def test_keys_are_scoped_to_the_vector_bucket(self):
+        """Test that the same index name in another bucket is a separate registry"""
+        table = FakeTable()
+        _registry(table, bucket="vectors-a").register("asset-1", ["a1"])
+        _registry(table, bucket="vectors-b").register("asset-1", ["b1"])
+
+        assert _registry(table, bucket="vectors-a").keys_for("asset-1") == ["a1"]
+        assert _registry(table, bucket="vectors-b").keys_for("asset-1") == ["b1"]
+
+    def test_forget_only_removes_this_buckets_entries(self):
+        """Test that forgetting keys leaves another bucket's entries alone"""
+        table = FakeTable()
+        _registry(table, bucket="vectors-a").register("asset-1", ["k1"])
+        _registry(table, bucket="vectors-b").register("asset-1", ["k1"])
+
+        _registry(table, bucket="vectors-a").forget("asset-1", ["k1"])
+
+        assert _registry(table, bucket="vectors-a").keys_for("asset-1") == []
+        assert _registry(table, bucket="vectors-b").keys_for("asset-1") == ["k1"]
+
+
+class TestFindVectorKeys:
+    """Test suite for resolving an asset's vectors before deletion"""
+
+    def test_legacy_vectors_are_found_until_backfill_completes(self):
+        """Test that registered and unregistered vectors are both returned"""
+        table = FakeTable()
+        registry = _registry(table)
+        registry.register("asset-1", ["new"])
+        client = _s3vectors(("legacy", "asset-1"), ("new", "asset-1"), ("x", "other"))
+        on_scan = MagicMock()
+
+        keys = find_vector_keys(registry, client, "asset-1", on_scan=on_scan)
+
+        assert keys == ["new", "legacy"]
+        on_scan.assert_called_once()
+
+    def test_registry_is_authoritative_after_backfill(self):
+        """Test that a completed backfill skips the index scan"""
+        table = FakeTable()
+        registry = _registry(table)
+        registry.register("asset-1", ["new"])
+        _complete_backfill(table)
+        client = _s3vectors(("legacy", "asset-1"))
+
+        assert find_vector_keys(registry, client, "asset-1") == ["new"]
+        client.list_vectors.assert_not_called()
+
+    def test_backfill_marker_is_per_bucket(self):
+        """Test that another bucket's completed backfill does not stop the scan"""
+        table = FakeTable()
+        _complete_backfill(table, bucket="vectors-b")
+        client = _s3vectors(("legacy", "asset-1"))
+
+        keys = find_vector_keys(_registry(table), client, "asset-1")
+
+        assert keys == ["legacy"]
+
+    def test_disabled_registry_scans_the_index(self):
+        """Test that without a table every lookup scans the index"""
+        registry = VectorKeyRegistry("vectors-a", "media-vectors", table_name="")
+        client = _s3vectors(("legacy", "asset-1"))
+
+        assert find_vector_keys(registry, client, "asset-1") == ["legacy"]
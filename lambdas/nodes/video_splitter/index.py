@@ -5,23 +5,39 @@ Video Splitter Lambda – stream‑copy edition (no‑reencode, no ffprobe)
 • Uses your original get_video_duration() (regex‑parsing ffmpeg stderr).
 • Uploads each chunk to S3 and returns their metadata.
 
+SPLIT_MODE=keyframe (default) reads the source's packet headers once (ffmpeg
+framecrc, stream copy), plans every cut on a video keyframe so that both the
+duration and the size limit hold on the first cut, writes all chunks in one
+ffmpeg segment‑muxer pass (parallel cuts when chunks overlap) and uploads each
+chunk as soon as it is complete. SPLIT_MODE=legacy cuts and re‑cuts each
+chunk until it fits, then uploads; it is also the fallback when the source
+has no indexable video keyframes.
+
 ENV
 ───
 MAX_CHUNK_SIZE_MB           default 50.0
 CHUNK_DURATION              default 7200 s
 OVERLAP_DURATION            default 0 s
 MEDIA_ASSETS_BUCKET_NAME    default source bucket
+SPLIT_MODE                  keyframe | legacy, default keyframe
+SPLIT_CONCURRENCY           parallel cuts for overlapping chunks, default 4
+UPLOAD_CONCURRENCY          chunk uploads in flight, default 4
 EVENT_BUS_NAME              optional (for @lambda_middleware)
 """
 
 from __future__ import annotations
 
+import csv
 import json
 import os
 import re
 import subprocess
 import tempfile
-from typing import Any, Dict, List, Tuple
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import boto3
 import requests
@@ -39,6 +55,18 @@ MAX_CHUNK_SIZE_BYTES = int(MAX_CHUNK_SIZE_MB * 1024 * 1024)
 SAFE_MARGIN = 0.97  # 3 % head‑room
 FFMPEG = "/opt/bin/ffmpeg"
 
+SPLIT_MODE = os.getenv("SPLIT_MODE", "keyframe")
+SPLIT_CONCURRENCY = int(os.getenv("SPLIT_CONCURRENCY", "4"))
+UPLOAD_CONCURRENCY = int(os.getenv("UPLOAD_CONCURRENCY", "4"))
+# Planned cuts sit exactly on keyframe timestamps; this tolerance keeps
+# rounding of the printed times from moving a cut to the next keyframe
+CUT_TIME_DELTA = 0.001
+NOPTS_VALUE = -(2**63)
+
+_DURATION_RE = re.compile(r"Duration:\s+(\d+):(\d+):(\d+\.\d+)")
+_TIME_BASE_RE = re.compile(r"#tb (\d+): (\d+)/(\d+)")
+_MEDIA_TYPE_RE = re.compile(r"#media_type (\d+): (\w+)")
+
 
 def _run(cmd: List[str]) -> subprocess.CompletedProcess:
     """Run subprocess, raise on error, return CompletedProcess."""
@@ -49,7 +77,11 @@ def _run(cmd: List[str]) -> subprocess.CompletedProcess:
 def get_video_duration(path: str) -> float:
     """Return duration of file (seconds) via ffmpeg probe."""
     proc = subprocess.run([FFMPEG, "-i", path], capture_output=True, text=True)
-    match = re.search(r"Duration:\s+(\d+):(\d+):(\d+\.\d+)", proc.stderr or "")
+    return _parse_duration(proc.stderr or "")
+
+
+def _parse_duration(ffmpeg_stderr: str) -> float:
+    match = _DURATION_RE.search(ffmpeg_stderr)
     if not match:
         logger.error("Could not parse duration from ffmpeg output")
         return 0.0
@@ -67,6 +99,34 @@ def get_media_info(path: str) -> Tuple[float, int]:
     return get_video_duration(path), os.path.getsize(path)
 
 
+def cut_segment(src: str, dst: str, start: str, duration: str) -> None:
+    """Stream‑copy `duration` seconds from `start` into `dst`; raise on error."""
+    _run(
+        [
+            FFMPEG,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-ss",
+            start,
+            "-t",
+            duration,
+            "-i",
+            src,
+            "-c",
+            "copy",
+            "-map",
+            "0",
+            "-movflags",
+            "+faststart",
+            "-avoid_negative_ts",
+            "make_zero",
+            "-y",
+            dst,
+        ]
+    )
+
+
 def split_segment_copy(
     src: str, dst: str, start: float, target_dur: float
 ) -> Tuple[bool, float]:
@@ -74,30 +134,8 @@ def split_segment_copy(
     Stream‑copy a slice of `target_dur` seconds into `dst`.
     Returns (success, actual_duration).
     """
-    cmd = [
-        FFMPEG,
-        "-hide_banner",
-        "-loglevel",
-        "error",
-        "-ss",
-        f"{start:.3f}",
-        "-t",
-        f"{target_dur:.3f}",
-        "-i",
-        src,
-        "-c",
-        "copy",
-        "-map",
-        "0",
-        "-movflags",
-        "+faststart",
-        "-avoid_negative_ts",
-        "make_zero",
-        "-y",
-        dst,
-    ]
     try:
-        _run(cmd)
+        cut_segment(src, dst, f"{start:.3f}", f"{target_dur:.3f}")
         dur, _ = get_media_info(dst)
         return True, dur
     except subprocess.CalledProcessError as e:
@@ -106,13 +144,18 @@ def split_segment_copy(
 
 
 def create_size_constrained_segment_copy(
-    src: str, dst: str, start: float, max_dur: float
+    src: str,
+    dst: str,
+    start: float,
+    max_dur: float,
+    source_info: Optional[Tuple[float, int]] = None,
 ) -> Tuple[bool, float]:
     """
     Shorten duration until the segment size ≤ limit (no re‑encode).
+    `source_info` is get_media_info(src), probed here when not given.
     Returns (success, actual_duration).
     """
-    total_dur, total_size = get_media_info(src)
+    total_dur, total_size = source_info or get_media_info(src)
     avg_bps = (total_size * 8) / max(total_dur, 0.1)
 
     dur = min(max_dur, (MAX_CHUNK_SIZE_BYTES * SAFE_MARGIN * 8) / avg_bps)
@@ -173,6 +216,344 @@ def _compute_chunk_bounds(
     return actual_start, actual_max_dur
 
 
+# ─────────────────────────────────────────────── keyframe planning ──
+class PacketIndex(NamedTuple):
+    """Video keyframe times (plus end of file) and the bytes before each."""
+
+    points: List[float]
+    cum_bytes: List[int]
+
+
+def build_packet_index(path: str) -> PacketIndex:
+    """
+    Index `path` from one pass over its packet headers (no decode, no ffprobe).
+
+    ffmpeg's framecrc muxer prints one line per packet with its stream,
+    timestamps, size and, for non‑keyframes, flags, so the bytes of every
+    stream can be attributed to the GOP they fall in.
+    Raises ValueError if the source has no video keyframes to cut on.
+    """
+    time_bases: Dict[int, float] = {}
+    video_stream: Optional[int] = None
+    times = array("d")
+    sizes = array("q")
+    keyframes: List[float] = []
+
+    cmd = [FFMPEG, "-hide_banner", "-i", path, "-map", "0", "-c", "copy"]
+    cmd += ["-f", "framecrc", "-"]
+    with tempfile.TemporaryFile(mode="w+") as stderr:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr, text=True)
+        for line in proc.stdout:
+            if line.startswith("#"):
+                match = _TIME_BASE_RE.match(line)
+                if match:
+                    time_bases[int(match[1])] = int(match[2]) / int(match[3])
+                match = _MEDIA_TYPE_RE.match(line)
+                if match and match[2] == "video" and video_stream is None:
+                    video_stream = int(match[1])
+                continue
+            # stream, dts, pts, duration, size, crc[, F=flags][, side data]
+            fields = [field.strip() for field in line.split(",")]
+            if len(fields) < 6 or int(fields[0]) not in time_bases:
+                continue
+            stream = int(fields[0])
+            pts = int(fields[2])
+            if pts == NOPTS_VALUE:
+                pts = int(fields[1])
+            t = pts * time_bases[stream]
+            times.append(t)
+            sizes.append(int(fields[4]))
+            if stream == video_stream:
+                flags = next((f for f in fields[6:] if f.startswith("F=")), None)
+                if flags is None or int(flags[2:], 16) & 1:
+                    keyframes.append(t)
+        stderr.seek(0)
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(
+                proc.returncode, cmd, stderr=stderr.read()[-2000:]
+            )
+        duration = _parse_duration(stderr.read())
+
+    if not keyframes:
+        raise ValueError("Source has no video keyframes to cut on")
+    duration = max(duration, max(times))
+
+    # Chunk 1 always starts at 0; the last point is the end of the file
+    points = [0.0] + sorted({k for k in keyframes if 0.0 < k < duration})
+    points.append(duration)
+    gop_bytes = [0] * (len(points) - 1)
+    for t, size in zip(times, sizes):
+        gop = min(max(bisect_right(points, t) - 1, 0), len(gop_bytes) - 1)
+        gop_bytes[gop] += size
+    cum_bytes = [0]
+    for size in gop_bytes:
+        cum_bytes.append(cum_bytes[-1] + size)
+
+    logger.info(
+        "Indexed source packets",
+        extra={
+            "packets": len(times),
+            "keyframes": len(points) - 2,
+            "duration": duration,
+            "size_bytes": cum_bytes[-1],
+        },
+    )
+    return PacketIndex(points, cum_bytes)
+
+
+def plan_segments(
+    index: PacketIndex, max_chunk_dur: float, overlap_dur: float
+) -> List[Dict[str, float]]:
+    """
+    Plan chunk cuts on keyframes so every chunk meets the duration and size
+    limits without a trial cut. Overlap handling matches the legacy loop; a
+    single GOP larger than the size limit becomes its own (oversize) chunk.
+    """
+    points, cum = index.points, index.cum_bytes
+    total_duration = points[-1]
+    budget = MAX_CHUNK_SIZE_BYTES * SAFE_MARGIN
+    last = len(points) - 1
+
+    plan: List[Dict[str, float]] = []
+    current_start = 0.0
+    prev_end = 0
+    while current_start < total_duration and prev_end < last:
+        actual_start, actual_max_dur = _compute_chunk_bounds(
+            current_start, max_chunk_dur, overlap_dur, total_duration, not plan
+        )
+        # Stream copy starts at the keyframe at or before the requested time
+        first = max(bisect_right(points, actual_start + CUT_TIME_DELTA) - 1, 0)
+        limit = actual_start + actual_max_dur + CUT_TIME_DELTA
+        by_time = bisect_right(points, limit) - 1
+        by_size = bisect_right(cum, cum[first] + budget) - 1
+        # Always move past the previous chunk, even if one GOP is too big
+        end = max(min(by_time, by_size), prev_end + 1, first + 1)
+        if cum[end] - cum[first] > budget:
+            # Give up overlap before giving up the size limit
+            latest = bisect_right(points, current_start + CUT_TIME_DELTA) - 1
+            latest = max(latest, first)
+            first = min(max(bisect_left(cum, cum[end] - budget), first), latest)
+        if cum[end] - cum[first] > MAX_CHUNK_SIZE_BYTES:
+            logger.warning(
+                f"GOP at {points[end - 1]:.2f}s exceeds the chunk size limit; "
+                "keeping it whole (no re‑encode)"
+            )
+
+        start, this_chunk_end = points[first], points[end]
+        logical_end = current_start + max_chunk_dur
+        plan.append(
+            {
+                "start_time": start,
+                "logical_start_time": current_start,
+                "duration": this_chunk_end - start,
+                "overlap_before": current_start - start,
+                "overlap_after": max(
+                    0.0, this_chunk_end - min(logical_end, total_duration)
+                ),
+            }
+        )
+        prev_end = end
+
+        if overlap_dur == 0:
+            current_start = this_chunk_end
+        else:
+            next_current_start = current_start + max_chunk_dur
+            next_planned_actual_start = max(0.0, next_current_start - overlap_dur)
+            if this_chunk_end < next_planned_actual_start:
+                current_start = this_chunk_end
+            else:
+                current_start = next_current_start
+    return plan
+
+
+def _is_contiguous(plan: List[Dict[str, float]]) -> bool:
+    return all(
+        abs(nxt["start_time"] - (seg["start_time"] + seg["duration"])) < 1e-6
+        for seg, nxt in zip(plan, plan[1:])
+    )
+
+
+SegmentCallback = Callable[[int, str, Dict[str, float]], None]
+
+
+def split_single_pass(
+    src: str,
+    output_dir: str,
+    base_name: str,
+    plan: List[Dict[str, float]],
+    on_segment: SegmentCallback,
+) -> None:
+    """
+    Write all chunks of a contiguous plan with one ffmpeg segment‑muxer run.
+
+    `on_segment(index, path, segment)` is called for each chunk once ffmpeg
+    has moved on to the next one (or exited), with the start and duration as
+    cut.
+    """
+    list_path = os.path.join(output_dir, f"{base_name}_segments.csv")
+    pattern = os.path.join(
+        output_dir, base_name.replace("%", "%%") + "_segment_%03d.mp4"
+    )
+    cmd = [
+        FFMPEG,
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        src,
+        "-map",
+        "0",
+        "-c",
+        "copy",
+        "-f",
+        "segment",
+        "-segment_times",
+        ",".join(f"{seg['start_time']:.6f}" for seg in plan[1:]),
+        "-segment_time_delta",
+        str(CUT_TIME_DELTA),
+        "-segment_start_number",
+        "1",
+        "-segment_format",
+        "mp4",
+        "-segment_format_options",
+        "movflags=+faststart",
+        "-segment_list",
+        list_path,
+        "-segment_list_type",
+        "csv",
+        "-reset_timestamps",
+        "1",
+        "-avoid_negative_ts",
+        "make_zero",
+        "-y",
+        pattern,
+    ]
+
+    done = 0
+
+    def collect(final: bool = False) -> None:
+        # ffmpeg appends "filename,start,end" when it closes a chunk, but the
+        # newest chunk is only handed on once the next one is listed or ffmpeg
+        # has exited, so nothing is uploaded while its file may still change
+        nonlocal done
+        if not os.path.exists(list_path):
+            return
+        with open(list_path, newline="") as f:
+            complete = f.read().split("\n")[:-1]
+        ready = complete if final else complete[:-1]
+        for row in csv.reader(ready[done:]):
+            segment = dict(plan[min(done, len(plan) - 1)])
+            segment["start_time"] = float(row[1])
+            segment["duration"] = float(row[2]) - float(row[1])
+            done += 1
+            path = os.path.join(output_dir, os.path.basename(row[0]))
+            on_segment(done, path, segment)
+
+    with tempfile.TemporaryFile(mode="w+") as stderr:
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr)
+        while proc.poll() is None:
+            collect()
+            time.sleep(0.5)
+        if proc.returncode != 0:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(
+                proc.returncode, cmd, stderr=stderr.read()[-2000:]
+            )
+    collect(final=True)
+    os.remove(list_path)
+    if done != len(plan):
+        logger.warning(f"Planned {len(plan)} segments, ffmpeg wrote {done}")
+
+
+def split_parallel(
+    src: str,
+    output_dir: str,
+    base_name: str,
+    plan: List[Dict[str, float]],
+    on_segment: SegmentCallback,
+) -> None:
+    """
+    Cut planned chunks with up to SPLIT_CONCURRENCY ffmpeg processes; used
+    for overlapping chunks, which one segment‑muxer pass cannot produce.
+    """
+
+    def cut(idx: int, seg: Dict[str, float]) -> None:
+        path = os.path.join(output_dir, f"{base_name}_segment_{idx:03d}.mp4")
+        # Seek just past the keyframe and stop just short of the next one so
+        # rounding can't pull in a neighbouring GOP
+        cut_segment(
+            src,
+            path,
+            f"{seg['start_time'] + CUT_TIME_DELTA / 2:.6f}",
+            f"{seg['duration'] - CUT_TIME_DELTA:.6f}",
+        )
+        on_segment(idx, path, seg)
+
+    with ThreadPoolExecutor(max_workers=max(1, SPLIT_CONCURRENCY)) as executor:
+        futures = [executor.submit(cut, idx, seg) for idx, seg in enumerate(plan, 1)]
+        for future in futures:
+            future.result()
+
+
+def split_and_upload(
+    src: str,
+    output_dir: str,
+    base_name: str,
+    plan: List[Dict[str, float]],
+    upload: Callable[[int, str, Dict[str, float]], Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Produce the planned chunks and hand each to `upload` as soon as it is
+    written, with up to UPLOAD_CONCURRENCY uploads in flight.
+    Returns the upload results in chunk order.
+    """
+    uploads: Dict[int, Future] = {}
+    with ThreadPoolExecutor(max_workers=max(1, UPLOAD_CONCURRENCY)) as executor:
+
+        def on_segment(idx: int, path: str, seg: Dict[str, float]) -> None:
+            uploads[idx] = executor.submit(upload, idx, path, seg)
+
+        if len(plan) > 1 and _is_contiguous(plan):
+            split_single_pass(src, output_dir, base_name, plan, on_segment)
+        else:
+            split_parallel(src, output_dir, base_name, plan, on_segment)
+        return [uploads[idx].result() for idx in sorted(uploads)]
+
+
+def _chunk_metadata(
+    idx: int,
+    seg: Dict[str, Any],
+    bucket: str,
+    key: str,
+    size_bytes: int,
+    asset_id: str,
+    inventory_id: str,
+) -> Dict[str, Any]:
+    start = seg["start_time"]
+    end = start + seg["duration"]
+    return {
+        "bucket": bucket,
+        "key": key,
+        "url": f"s3://{bucket}/{key}",
+        "index": idx,
+        "start_time": start,
+        "end_time": end,
+        "start_time_formatted": format_duration(start),
+        "end_time_formatted": format_duration(end),
+        "duration": seg["duration"],
+        "duration_formatted": format_duration(seg["duration"]),
+        "size_bytes": size_bytes,
+        "size_mb": size_bytes / (1024 * 1024),
+        "mediaType": "Video",
+        "asset_id": asset_id,
+        "inventory_id": inventory_id,
+        "logical_start_time": seg["logical_start_time"],
+        "overlap_before": seg["overlap_before"],
+        "overlap_after": seg["overlap_after"],
+        "is_chunk": True,
+    }
+
+
 # ────────────────────────────────────────────────────────── handler ──
 @lambda_middleware(event_bus_name=os.getenv("EVENT_BUS_NAME", "default-event-bus"))
 @logger.inject_lambda_context
@@ -258,10 +639,47 @@ def lambda_handler(event: Dict[str, Any], context) -> Any:
             with open(input_path, "wb") as f:
                 f.write(r.content)
 
-        # Split
-        total_duration, _ = get_media_info(input_path)
         output_dir = ensure_tmp_dir()
         base_name = os.path.splitext(os.path.basename(source_key))[0]
+        upload_bucket = os.getenv("MEDIA_ASSETS_BUCKET_NAME", source_bucket)
+
+        plan = None
+        if SPLIT_MODE == "keyframe":
+            try:
+                plan = plan_segments(
+                    build_packet_index(input_path), max_chunk_dur, overlap_dur
+                )
+            except (subprocess.CalledProcessError, ValueError) as e:
+                logger.warning(
+                    f"Keyframe planning unavailable, using legacy split: {e}"
+                )
+
+        if plan:
+            # Each chunk is uploaded while ffmpeg is still writing the next
+            def upload_segment(
+                idx: int, path: str, seg: Dict[str, float]
+            ) -> Dict[str, Any]:
+                seg_key = f"chunks/{asset_id}/{os.path.basename(path)}"
+                size_bytes = os.path.getsize(path)
+                s3_client.upload_file(path, upload_bucket, seg_key)
+                os.remove(path)
+                return _chunk_metadata(
+                    idx, seg, upload_bucket, seg_key, size_bytes, asset_id, inventory_id
+                )
+
+            logger.info(f"Splitting into {len(plan)} keyframe‑aligned segments")
+            chunk_meta = split_and_upload(
+                input_path, output_dir, base_name, plan, upload_segment
+            )
+            logger.info(
+                f"Created {len(chunk_meta)} segments; total duration "
+                f"{sum(c['duration'] for c in chunk_meta):.2f}s"
+            )
+            return chunk_meta
+
+        # Split
+        source_info = get_media_info(input_path)
+        total_duration = source_info[0]
 
         segments: List[Dict[str, Any]] = []
         seg_idx = 0
@@ -281,7 +699,7 @@ def lambda_handler(event: Dict[str, Any], context) -> Any:
             logger.info(f"Creating segment {seg_idx} @ {actual_start:.2f}s")
 
             ok, actual_dur = create_size_constrained_segment_copy(
-                input_path, seg_path, actual_start, actual_max_dur
+                input_path, seg_path, actual_start, actual_max_dur, source_info
             )
             if not ok:
                 return _error(500, f"Failed to create segment {seg_idx}")
@@ -315,38 +733,22 @@ def lambda_handler(event: Dict[str, Any], context) -> Any:
                     current_start = next_current_start
 
         # Upload & build response
-        upload_bucket = os.getenv("MEDIA_ASSETS_BUCKET_NAME", source_bucket)
         chunk_meta: List[Dict[str, Any]] = []
 
         for idx, seg in enumerate(segments, 1):
             seg_key = f"chunks/{asset_id}/{seg['filename']}"
             s3_client.upload_file(seg["path"], upload_bucket, seg_key)
 
-            start = seg["start_time"]
-            end = start + seg["duration"]
-
             chunk_meta.append(
-                {
-                    "bucket": upload_bucket,
-                    "key": seg_key,
-                    "url": f"s3://{upload_bucket}/{seg_key}",
-                    "index": idx,
-                    "start_time": start,
-                    "end_time": end,
-                    "start_time_formatted": format_duration(start),
-                    "end_time_formatted": format_duration(end),
-                    "duration": seg["duration"],
-                    "duration_formatted": format_duration(seg["duration"]),
-                    "size_bytes": os.path.getsize(seg["path"]),
-                    "size_mb": seg["size_mb"],
-                    "mediaType": "Video",
-                    "asset_id": asset_id,
-                    "inventory_id": inventory_id,
-                    "logical_start_time": seg["logical_start_time"],
-                    "overlap_before": seg["overlap_before"],
-                    "overlap_after": seg["overlap_after"],
-                    "is_chunk": True,
-                }
+                _chunk_metadata(
+                    idx,
+                    seg,
+                    upload_bucket,
+                    seg_key,
+                    os.path.getsize(seg["path"]),
+                    asset_id,
+                    inventory_id,
+                )
             )
 
         logger.info(
@@ -0,0 +1,186 @@
+"""
+Unit tests for the keyframe video splitter.
+
+Tests that ffmpeg framecrc output is indexed into keyframe cut points and GOP
+sizes, that planned chunks respect the duration and size limits on keyframes,
+and that single-pass chunks are only handed on once ffmpeg has moved past them.
+"""
+
+import os
+from unittest.mock import MagicMock
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("EXTERNAL_PAYLOAD_BUCKET", "payloads")
+
+import index
+import pytest
+from index import PacketIndex, build_packet_index, plan_segments, split_single_pass
+
+FRAMECRC = """\
+#tb 0: 1/1000
+#media_type 0: video
+#tb 1: 1/100
+#media_type 1: audio
+0,          0,          0,     1000,      500, 0x00000001
+1,          0,          0,      100,       10, 0x00000002
+0,       1000,       1000,     1000,      100, 0x00000003, F=0x0
+1,        100,        100,      100,       10, 0x00000004
+0,       2000,       2000,     1000,      400, 0x00000005, F=0x1
+0,       3000,       3000,     1000,      100, 0x00000006, F=0x0
+0,       4000, -9223372036854775808, 1000,  50, 0x00000007, F=0x0
+"""
+
+
+class FakeProcess:
+    """Popen stand-in that prints framecrc lines and an ffmpeg banner"""
+
+    def __init__(self, stdout, stderr, returncode=0):
+        self.stdout = iter(stdout.splitlines(keepends=True))
+        self.returncode = returncode
+        stderr.write("  Duration: 00:00:05.00, start: 0.000000\n")
+
+    def wait(self):
+        return self.returncode
+
+
+def _popen(stdout, returncode=0):
+    return lambda cmd, stderr, **kwargs: FakeProcess(stdout, stderr, returncode)
+
+
+class TestBuildPacketIndex:
+    """Test suite for indexing framecrc packet headers"""
+
+    def test_keyframes_and_gop_bytes(self, monkeypatch):
+        """Test that video keyframes split the file and every stream is counted"""
+        monkeypatch.setattr(index.subprocess, "Popen", _popen(FRAMECRC))
+
+        packet_index = build_packet_index("clip.mp4")
+
+        assert packet_index.points == [0.0, 2.0, 5.0]
+        assert packet_index.cum_bytes == [0, 620, 1170]
+
+    def test_missing_pts_falls_back_to_dts(self, monkeypatch):
+        """Test that a NOPTS packet is placed by its decode timestamp"""
+        lines = FRAMECRC.replace("0,       2000,       2000", "0, 2000, 4500")
+        monkeypatch.setattr(index.subprocess, "Popen", _popen(lines))
+
+        packet_index = build_packet_index("clip.mp4")
+
+        assert packet_index.points == [0.0, 4.5, 5.0]
+        assert packet_index.cum_bytes[-1] == 1170
+
+    def test_no_video_keyframes_is_an_error(self, monkeypatch):
+        """Test that an audio-only source cannot be planned on keyframes"""
+        audio_only = "#tb 1: 1/100\n#media_type 1: audio\n1, 0, 0, 100, 10, 0x1\n"
+        monkeypatch.setattr(index.subprocess, "Popen", _popen(audio_only))
+
+        with pytest.raises(ValueError):
+            build_packet_index("clip.mp3")
+
+    def test_ffmpeg_failure_is_raised(self, monkeypatch):
+        """Test that a non-zero ffmpeg exit surfaces as CalledProcessError"""
+        monkeypatch.setattr(index.subprocess, "Popen", _popen(FRAMECRC, 1))
+
+        with pytest.raises(index.subprocess.CalledProcessError):
+            build_packet_index("clip.mp4")
+
+
+def _uniform_index(gops, gop_seconds=1.0, gop_bytes=100):
+    return PacketIndex(
+        [i * gop_seconds for i in range(gops + 1)],
+        [i * gop_bytes for i in range(gops + 1)],
+    )
+
+
+def _bounds(plan):
+    return [(seg["start_time"], seg["start_time"] + seg["duration"]) for seg in plan]
+
+
+class TestPlanSegments:
+    """Test suite for planning keyframe-aligned chunks"""
+
+    @pytest.fixture(autouse=True)
+    def size_limit(self, monkeypatch):
+        monkeypatch.setattr(index, "MAX_CHUNK_SIZE_BYTES", 1000)
+        monkeypatch.setattr(index, "SAFE_MARGIN", 1.0)
+
+    def test_duration_limit_cuts_on_keyframes(self):
+        """Test that chunks end on the last keyframe within the duration"""
+        plan = plan_segments(_uniform_index(10), max_chunk_dur=4, overlap_dur=0)
+
+        assert _bounds(plan) == [(0.0, 4.0), (4.0, 8.0), (8.0, 10.0)]
+
+    def test_size_limit_cuts_before_the_duration(self):
+        """Test that a chunk stops at the GOP that would exceed the size limit"""
+        packet_index = _uniform_index(10, gop_bytes=300)
+
+        plan = plan_segments(packet_index, max_chunk_dur=10, overlap_dur=0)
+
+        assert _bounds(plan) == [(0.0, 3.0), (3.0, 6.0), (6.0, 9.0), (9.0, 10.0)]
+
+    def test_oversize_gop_is_kept_whole(self):
+        """Test that a GOP larger than the limit becomes its own chunk"""
+        packet_index = PacketIndex([0.0, 1.0, 2.0, 3.0], [0, 100, 2100, 2200])
+
+        plan = plan_segments(packet_index, max_chunk_dur=10, overlap_dur=0)
+
+        assert _bounds(plan) == [(0.0, 1.0), (1.0, 2.0), (2.0, 3.0)]
+
+    def test_overlap_extends_chunks_on_both_sides(self):
+        """Test that overlapping chunks start and end one GOP into neighbours"""
+        plan = plan_segments(_uniform_index(12), max_chunk_dur=4, overlap_dur=1)
+
+        assert _bounds(plan) == [(0.0, 5.0), (3.0, 9.0), (7.0, 12.0)]
+        assert [seg["logical_start_time"] for seg in plan] == [0.0, 4.0, 8.0]
+        assert plan[1]["overlap_before"] == 1.0
+
+    def test_single_chunk_covers_short_source(self):
+        """Test that a source within both limits is one chunk"""
+        plan = plan_segments(_uniform_index(3), max_chunk_dur=60, overlap_dur=0)
+
+        assert _bounds(plan) == [(0.0, 3.0)]
+
+
+class SegmentMuxer:
+    """Popen stand-in that lists one more finished chunk on every poll"""
+
+    def __init__(self, list_path, rows):
+        self.list_path = list_path
+        self.rows = rows
+        self.listed = 0
+        self.returncode = None
+
+    def poll(self):
+        if self.listed == len(self.rows):
+            self.returncode = 0
+            return 0
+        with open(self.list_path, "a") as f:
+            f.write(self.rows[self.listed] + "\n")
+        self.listed += 1
+        return None
+
+
+class TestSplitSinglePass:
+    """Test suite for handing on chunks from the segment muxer"""
+
+    def test_chunk_is_handed_on_after_ffmpeg_moves_past_it(self, tmp_path, monkeypatch):
+        """Test that the newest listed chunk waits for the next one or the exit"""
+        rows = ["clip_segment_001.mp4,0.0,4.0", "clip_segment_002.mp4,4.0,6.0"]
+        plan = plan_segments(_uniform_index(6), max_chunk_dur=4, overlap_dur=0)
+        muxer = SegmentMuxer(str(tmp_path / "clip_segments.csv"), rows)
+        monkeypatch.setattr(index.subprocess, "Popen", lambda *a, **kw: muxer)
+        monkeypatch.setattr(index.time, "sleep", lambda seconds: None)
+        seen = []
+        on_segment = MagicMock(
+            side_effect=lambda idx, path, seg: seen.append((idx, muxer.listed))
+        )
+
+        split_single_pass("clip.mp4", str(tmp_path), "clip", plan, on_segment)
+
+        assert seen == [(1, 2), (2, 2)]
+        assert muxer.returncode == 0
+        path, segment = on_segment.call_args.args[1:]
+        assert path == str(tmp_path / "clip_segment_002.mp4")
+        assert (segment["start_time"], segment["duration"]) == (4.0, 2.0)
+        assert not os.path.exists(muxer.list_path)
@@ -5,8 +5,10 @@ import time
 
 import boto3
 from aws_lambda_powertools import Logger, Metrics, Tracer
+from aws_lambda_powertools.metrics import MetricUnit
 from botocore.config import Config
 from botocore.exceptions import ClientError
+from pipeline_concurrency import ExecutionSemaphore, new_execution_name
 
 # Configuration variables
 # MAX_CONCURRENT_EXECUTIONS can be configured per pipeline via environment variable
@@ -16,6 +18,15 @@ MAX_API_RETRIES = 20
 BASE_BACKOFF = 0.5  # seconds
 EXECUTION_COUNT_CACHE_TTL = 20  # seconds
 
+# Distributed admission control. When the concurrency table is configured,
+# slots are acquired in DynamoDB and released by the executions event
+# processor; otherwise the trigger falls back to counting RUNNING executions.
+CONCURRENCY_TABLE_NAME = os.environ.get("PIPELINE_CONCURRENCY_TABLE_NAME", "")
+LEASE_TIMEOUT_SECONDS = int(
+    os.environ.get("PIPELINE_LEASE_TIMEOUT_SECONDS", str(24 * 60 * 60))
+)
+LEASE_RECLAIM_INTERVAL = 60  # seconds between expired-lease sweeps per container
+
 # Default State Machine ARN for EventBridge-style messages
 DEFAULT_STATE_MACHINE_ARN = os.environ["DEFAULT_STATE_MACHINE_ARN"]
 
@@ -31,6 +42,18 @@ sqs_client = boto3.client("sqs")
 # In-memory execution count cache
 execution_count_cache = {"count": 0, "last_updated": 0, "state_machine_arn": None}
 
+semaphore = (
+    ExecutionSemaphore(
+        CONCURRENCY_TABLE_NAME,
+        DEFAULT_STATE_MACHINE_ARN,
+        MAX_CONCURRENT_EXECUTIONS,
+        lease_timeout_seconds=LEASE_TIMEOUT_SECONDS,
+    )
+    if CONCURRENCY_TABLE_NAME
+    else None
+)
+last_lease_reclaim = {"at": 0.0}
+
 
 def get_running_executions_count(state_machine_arn):
     """Cached list_executions('RUNNING') count."""
@@ -92,14 +115,18 @@ def _count_running_executions(state_machine_arn):
     return total
 
 
-def start_execution_with_backoff(state_machine_arn, execution_input):
+def start_execution_with_backoff(state_machine_arn, execution_input, name=None):
     """Start execution with exponential backoff on ThrottlingException."""
+    params = {
+        "stateMachineArn": state_machine_arn,
+        "input": json.dumps(execution_input),
+    }
+    if name:
+        # A fixed name makes retried starts idempotent
+        params["name"] = name
     for attempt in range(MAX_API_RETRIES):
         try:
-            return sfn_client.start_execution(
-                stateMachineArn=state_machine_arn,
-                input=json.dumps(execution_input),
-            )
+            return sfn_client.start_execution(**params)
         except ClientError as e:
             if (
                 e.response["Error"]["Code"] == "ThrottlingException"
@@ -121,6 +148,78 @@ def start_execution_with_backoff(state_machine_arn, execution_input):
     )
 
 
+def acquire_slot(execution_name):
+    """Take a semaphore slot, sweeping expired leases once if it is full."""
+    if semaphore.try_acquire(execution_name):
+        return True
+
+    now = time.time()
+    if now - last_lease_reclaim["at"] < LEASE_RECLAIM_INTERVAL:
+        return False
+    last_lease_reclaim["at"] = now
+    if semaphore.reclaim_expired():
+        return semaphore.try_acquire(execution_name)
+    return False
+
+
+def record_admission_metrics(record):
+    """Queue wait time of the admitted message and current slot utilisation."""
+    sent_ms = record.get("attributes", {}).get("SentTimestamp")
+    if sent_ms:
+        metrics.add_metric(
+            name="AdmissionQueueWaitTime",
+            unit=MetricUnit.Milliseconds,
+            value=max(0, time.time() * 1000 - int(sent_ms)),
+        )
+    try:
+        in_flight = semaphore.in_flight()
+    except ClientError as e:
+        logger.warning(f"Could not read semaphore utilisation: {e}")
+        return
+    if in_flight is not None:
+        metrics.add_metric(
+            name="SlotUtilization",
+            unit=MetricUnit.Percent,
+            value=100.0 * in_flight / max(1, MAX_CONCURRENT_EXECUTIONS),
+        )
+
+
+def admit_and_start(record, body, state_machine_arn, processed, failures):
+    """Start an execution only if a distributed concurrency slot is available."""
+    execution_name = new_execution_name()
+    try:
+        admitted = acquire_slot(execution_name)
+    except ClientError as e:
+        logger.error(f"Failed to acquire concurrency slot: {e}")
+        failures.append(record["messageId"])
+        return
+
+    if not admitted:
+        logger.info(
+            "Concurrency limit reached (%d), message will be retried",
+            MAX_CONCURRENT_EXECUTIONS,
+        )
+        metrics.add_metric(name="AdmissionRejected", unit=MetricUnit.Count, value=1)
+        failures.append(record["messageId"])
+        return
+
+    metrics.add_metric(name="AdmissionGranted", unit=MetricUnit.Count, value=1)
+    record_admission_metrics(record)
+
+    try:
+        resp = start_execution_with_backoff(state_machine_arn, body, execution_name)
+        logger.info("Started %s ", resp["executionArn"])
+        processed.append({"execution_arn": resp["executionArn"]})
+    except Exception as e:
+        logger.error("Failed processing %s:", e)
+        # The execution never started, so no terminal event will free the slot
+        try:
+            semaphore.release(execution_name)
+        except ClientError as release_error:
+            logger.error(f"Failed to release concurrency slot: {release_error}")
+        failures.append(record["messageId"])
+
+
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
 @metrics.log_metrics(capture_cold_start_metric=True)
@@ -134,6 +233,10 @@ def lambda_handler(event, context):
 
         state_machine_arn = DEFAULT_STATE_MACHINE_ARN
 
+        if semaphore is not None:
+            admit_and_start(record, body, state_machine_arn, processed, failures)
+            continue
+
         # Concurrency check
         running = get_running_executions_count(state_machine_arn)
         if running >= MAX_CONCURRENT_EXECUTIONS:
@@ -0,0 +1,112 @@
+"""
+Unit tests for pipeline trigger admission control.
+
+Tests that messages are rejected back to SQS while the semaphore is full,
+that expired leases are swept at most once per interval, and that a slot is
+given back when the execution fails to start.
+"""
+
+import os
+from unittest.mock import MagicMock
+
+# Set env vars before import
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault(
+    "DEFAULT_STATE_MACHINE_ARN",
+    "arn:aws:states:us-east-1:123456789012:stateMachine:pipeline",
+)
+
+import index
+import pytest
+from botocore.exceptions import ClientError
+
+
+@pytest.fixture
+def semaphore(monkeypatch):
+    fake = MagicMock()
+    fake.in_flight.return_value = 1
+    monkeypatch.setattr(index, "semaphore", fake)
+    monkeypatch.setattr(index, "metrics", MagicMock())
+    monkeypatch.setattr(index, "last_lease_reclaim", {"at": 0.0})
+    monkeypatch.setattr(index, "new_execution_name", lambda: "exec-1")
+    return fake
+
+
+def _admit(record=None):
+    processed, failures = [], []
+    index.admit_and_start(
+        record or {"messageId": "m-1", "attributes": {}},
+        {"asset": "a-1"},
+        index.DEFAULT_STATE_MACHINE_ARN,
+        processed,
+        failures,
+    )
+    return processed, failures
+
+
+class TestAdmitAndStart:
+    """Test suite for starting executions through the semaphore"""
+
+    def test_admitted_message_starts_a_named_execution(self, semaphore, monkeypatch):
+        """Test that the execution is started under the lease's name"""
+        semaphore.try_acquire.return_value = True
+        start = MagicMock(return_value={"executionArn": "arn:exec-1"})
+        monkeypatch.setattr(index, "start_execution_with_backoff", start)
+
+        processed, failures = _admit()
+
+        assert processed == [{"execution_arn": "arn:exec-1"}]
+        assert failures == []
+        assert start.call_args.args[2] == "exec-1"
+
+    def test_full_semaphore_rejects_the_message(self, semaphore, monkeypatch):
+        """Test that a full semaphore returns the message to SQS without starting"""
+        semaphore.try_acquire.return_value = False
+        semaphore.reclaim_expired.return_value = 0
+        start = MagicMock()
+        monkeypatch.setattr(index, "start_execution_with_backoff", start)
+
+        processed, failures = _admit()
+
+        assert failures == ["m-1"]
+        start.assert_not_called()
+
+    def test_reclaimed_leases_admit_on_retry(self, semaphore, monkeypatch):
+        """Test that a sweep freeing slots is followed by a second acquire"""
+        semaphore.try_acquire.side_effect = [False, True]
+        semaphore.reclaim_expired.return_value = 2
+        monkeypatch.setattr(
+            index,
+            "start_execution_with_backoff",
+            MagicMock(return_value={"executionArn": "arn:exec-1"}),
+        )
+
+        processed, failures = _admit()
+
+        assert failures == []
+        assert semaphore.try_acquire.call_count == 2
+
+    def test_lease_sweep_is_rate_limited(self, semaphore):
+        """Test that a full semaphore is swept once per reclaim interval"""
+        semaphore.try_acquire.return_value = False
+        semaphore.reclaim_expired.return_value = 0
+
+        assert not index.acquire_slot("exec-1")
+        assert not index.acquire_slot("exec-2")
+
+        semaphore.reclaim_expired.assert_called_once()
+
+    def test_failed_start_releases_the_slot(self, semaphore, monkeypatch):
+        """Test that a slot is freed when no execution will ever end it"""
+        semaphore.try_acquire.return_value = True
+        error = ClientError(
+            {"Error": {"Code": "StateMachineDoesNotExist"}}, "StartExecution"
+        )
+        monkeypatch.setattr(
+            index, "start_execution_with_backoff", MagicMock(side_effect=error)
+        )
+
+        processed, failures = _admit()
+
+        assert failures == ["m-1"]
+        semaphore.release.assert_called_once_with("exec-1")
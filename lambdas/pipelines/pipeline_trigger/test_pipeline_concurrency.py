@@ -0,0 +1,200 @@
+"""
+Unit tests for the DynamoDB execution semaphore.
+
+Tests that concurrent acquires never admit more executions than the limit,
+that release is idempotent and only frees slots that were taken, and that
+expired leases are reclaimed across query pages.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from botocore.exceptions import ClientError
+from pipeline_concurrency import COUNT_SK, LEASE_PREFIX, ExecutionSemaphore
+
+ARN = "arn:aws:states:us-east-1:123456789012:stateMachine:pipeline"
+
+
+class TransactionCanceledException(ClientError):
+    pass
+
+
+class FakeDynamoDB:
+    """Low-level client stand-in applying semaphore transactions atomically"""
+
+    exceptions = SimpleNamespace(
+        TransactionCanceledException=TransactionCanceledException
+    )
+
+    def __init__(self, page_size=100):
+        self.items = {}
+        self.page_size = page_size
+        self._lock = threading.Lock()
+
+    def _check(self, action):
+        """Evaluate an action's condition; return the change to apply or None"""
+        if "Put" in action:
+            item = action["Put"]["Item"]
+            key = (item["PK"]["S"], item["SK"]["S"])
+            return None if key in self.items else ("put", key, item)
+        if "Delete" in action:
+            key_attrs = action["Delete"]["Key"]
+            key = (key_attrs["PK"]["S"], key_attrs["SK"]["S"])
+            return ("delete", key, None) if key in self.items else None
+
+        update = action["Update"]
+        key = (update["Key"]["PK"]["S"], update["Key"]["SK"]["S"])
+        values = update["ExpressionAttributeValues"]
+        in_flight = int(self.items.get(key, {}).get("inFlight", {"N": "0"})["N"])
+        if ":one" in values:
+            if in_flight >= int(values[":limit"]["N"]):
+                return None
+            return ("count", key, in_flight + 1)
+        if in_flight <= 0:
+            return None
+        return ("count", key, in_flight - 1)
+
+    def transact_write_items(self, TransactItems):
+        with self._lock:
+            changes = [self._check(action) for action in TransactItems]
+            if None in changes:
+                raise TransactionCanceledException(
+                    {
+                        "Error": {"Code": "TransactionCanceledException"},
+                        "CancellationReasons": [
+                            {"Code": "None" if c else "ConditionalCheckFailed"}
+                            for c in changes
+                        ],
+                    },
+                    "TransactWriteItems",
+                )
+            for kind, key, value in changes:
+                if kind == "put":
+                    self.items[key] = value
+                elif kind == "delete":
+                    del self.items[key]
+                else:
+                    self.items[key] = {"inFlight": {"N": str(value)}}
+
+    def get_item(self, TableName, Key, ProjectionExpression=None):
+        item = self.items.get((Key["PK"]["S"], Key["SK"]["S"]))
+        return {"Item": item} if item else {}
+
+    def query(self, ExpressionAttributeValues, ExclusiveStartKey=None, **kwargs):
+        pk = ExpressionAttributeValues[":pk"]["S"]
+        now = int(ExpressionAttributeValues[":now"]["N"])
+        # Like DynamoDB, resume after the last evaluated key even if it is gone
+        leases = sorted(
+            sk
+            for (item_pk, sk) in self.items
+            if item_pk == pk
+            and sk.startswith(LEASE_PREFIX)
+            and sk > (ExclusiveStartKey or "")
+        )
+        page = leases[: self.page_size]
+        response = {
+            "Items": [
+                {"SK": {"S": sk}}
+                for sk in page
+                if int(self.items[(pk, sk)]["expiresAt"]["N"]) < now
+            ]
+        }
+        if len(leases) > self.page_size:
+            response["LastEvaluatedKey"] = page[-1]
+        return response
+
+
+def _semaphore(client, limit=3, lease_timeout_seconds=3600):
+    return ExecutionSemaphore(
+        "concurrency",
+        ARN,
+        limit,
+        lease_timeout_seconds=lease_timeout_seconds,
+        client=client,
+    )
+
+
+class TestExecutionSemaphore:
+    """Test suite for acquiring and releasing execution slots"""
+
+    def test_concurrent_acquires_respect_the_limit(self):
+        """Test that racing trigger containers admit exactly limit executions"""
+        client = FakeDynamoDB()
+        semaphore = _semaphore(client, limit=3)
+        results = []
+        barrier = threading.Barrier(12)
+
+        def acquire(i):
+            barrier.wait()
+            results.append(semaphore.try_acquire(f"exec-{i}"))
+
+        threads = [threading.Thread(target=acquire, args=(i,)) for i in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == 3
+        assert semaphore.in_flight() == 3
+
+    def test_release_frees_a_slot_for_the_next_execution(self):
+        """Test that a released slot can be acquired again"""
+        semaphore = _semaphore(FakeDynamoDB(), limit=1)
+        assert semaphore.try_acquire("exec-1")
+        assert not semaphore.try_acquire("exec-2")
+
+        assert semaphore.release("exec-1")
+
+        assert semaphore.try_acquire("exec-2")
+
+    def test_duplicate_release_is_a_no_op(self):
+        """Test that a repeated terminal event does not decrement twice"""
+        semaphore = _semaphore(FakeDynamoDB())
+        semaphore.try_acquire("exec-1")
+        semaphore.try_acquire("exec-2")
+
+        assert semaphore.release("exec-1")
+        assert not semaphore.release("exec-1")
+
+        assert semaphore.in_flight() == 1
+
+    def test_unadmitted_execution_release_is_a_no_op(self):
+        """Test that releasing an execution without a lease leaves the count"""
+        semaphore = _semaphore(FakeDynamoDB())
+        semaphore.try_acquire("exec-1")
+
+        assert not semaphore.release("manual-redrive")
+
+        assert semaphore.in_flight() == 1
+
+    def test_in_flight_is_none_before_first_acquire(self):
+        """Test that an unused semaphore reports no counter"""
+        assert _semaphore(FakeDynamoDB()).in_flight() is None
+
+    def test_expired_leases_are_reclaimed_across_pages(self):
+        """Test that only leases past their timeout are released"""
+        client = FakeDynamoDB(page_size=2)
+        semaphore = _semaphore(client, limit=5, lease_timeout_seconds=-1)
+        for i in range(3):
+            semaphore.try_acquire(f"stale-{i}")
+        semaphore.lease_timeout_seconds = 3600
+        semaphore.try_acquire("live")
+
+        reclaimed = semaphore.reclaim_expired()
+
+        assert reclaimed == 3
+        assert semaphore.in_flight() == 1
+        assert sorted(sk for _, sk in client.items if sk != COUNT_SK) == [
+            f"{LEASE_PREFIX}live"
+        ]
+
+    def test_lease_records_its_expiry(self):
+        """Test that a lease expires lease_timeout_seconds after acquisition"""
+        client = FakeDynamoDB()
+        before = int(time.time())
+
+        _semaphore(client, lease_timeout_seconds=60).try_acquire("exec-1")
+
+        lease = client.items[(f"SEM#{ARN}", f"{LEASE_PREFIX}exec-1")]
+        assert before + 60 <= int(lease["expiresAt"]["N"]) <= before + 61
@@ -248,6 +248,8 @@ class AssetsConstruct(Construct):
                     "ASSET_EMBEDDINGS_INDEX": "asset-embeddings",
                     "VECTOR_BUCKET_NAME": props.s3_vector_bucket_name,
                     "VECTOR_INDEX_NAME": props.s3_vector_index_name,
+                    # Deterministic name, mirrors BaseInfrastructureStack
+                    "VECTOR_KEY_REGISTRY_TABLE_NAME": f"{config.resource_prefix}-vector-keys-{config.environment}",
                     "SYSTEM_SETTINGS_TABLE_NAME": props.system_settings_table,
                     "ASSET_EVENT_BUS_NAME": props.asset_events_bus.event_bus_name,
                 },
@@ -289,6 +291,20 @@ class AssetsConstruct(Construct):
             )
         )
 
+        # Vector key registry: look up, then forget, the asset's vector keys
+        delete_asset_lambda.function.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=[
+                    "dynamodb:Query",
+                    "dynamodb:GetItem",
+                    "dynamodb:BatchWriteItem",
+                ],
+                resources=[
+                    f"arn:aws:dynamodb:{Stack.of(self).region}:{Stack.of(self).account}:table/{config.resource_prefix}-vector-keys-{config.environment}"
+                ],
+            )
+        )
+
         # Add DynamoDB permissions for GET Lambda
         get_asset_lambda.function.add_to_role_policy(
             iam.PolicyStatement(
@@ -955,6 +971,9 @@ class AssetsConstruct(Construct):
                 name="rename_asset",
                 layers=[search_layer.layer],
                 entry="lambdas/api/assets/rp_assets_id/rename/post_rename",
+                # Renames of large masters continue in an asynchronous
+                # self-invocation that can run well past the API timeout
+                timeout_minutes=15,
                 environment_variables={
                     "X_ORIGIN_VERIFY_SECRET_ARN": props.x_origin_verify_secret.secret_arn,
                     "MEDIALAKE_ASSET_TABLE": props.asset_table.table_name,
@@ -963,11 +982,13 @@ class AssetsConstruct(Construct):
         )
 
         # Add DynamoDB and S3 permissions for rename Lambda
+        # (UpdateItem records the status of asynchronous rename jobs)
         rename_asset_lambda.function.add_to_role_policy(
             iam.PolicyStatement(
                 actions=[
                     "dynamodb:GetItem",
                     "dynamodb:PutItem",
+                    "dynamodb:UpdateItem",
                 ],
                 resources=[props.asset_table.table_arn],
             )
@@ -996,6 +1017,7 @@ class AssetsConstruct(Construct):
                     "s3:PutObjectTagging",
                     "s3:GetObjectTagging",  # Add missing permission for reading object tags
                     "s3:CopyObject",  # Add missing permission for copying objects
+                    "s3:AbortMultipartUpload",  # Roll back failed multipart copies
                 ],
                 resources=[
                     "arn:aws:s3:::*/*",  # Access to all objects in all buckets
@@ -1003,6 +1025,17 @@ class AssetsConstruct(Construct):
                 ],
             )
         )
+        # Large renames are handed off to an asynchronous self-invocation
+        rename_asset_lambda.function.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=["lambda:InvokeFunction"],
+                resources=[
+                    f"arn:aws:lambda:{Stack.of(self).region}:{Stack.of(self).account}:"
+                    f"function:{config.resource_prefix}_rename_asset_"
+                    f"{config.environment}"
+                ],
+            )
+        )
 
         # Add POST method to /assets/{id}/rename
         rename_post = rename_resource.add_method(
@@ -1693,6 +1726,7 @@ class AssetsConstruct(Construct):
                         "s3:PutObject",
                         "s3:DeleteObject",
                         "s3:ListBucket",
+                        "s3:AbortMultipartUpload",
                     ],
                     resources=[
                         props.media_assets_bucket.bucket_arn,
@@ -1805,7 +1839,7 @@ class AssetsConstruct(Construct):
         small_files_map = sfn.Map(
             self,
             "ProcessSmallFilesMap",
-            max_concurrency=1,  # Limit to 1 to prevent concurrent file access issues
+            max_concurrency=10,  # Each file is written to its own zip segment
             items_path="$.smallFiles",
             result_path="$.processedFiles",
             item_selector={
@@ -1813,6 +1847,7 @@ class AssetsConstruct(Construct):
                 "userId.$": "$.userId",
                 "zipPath.$": "$.zipPath",
                 "mapItem.$": "$$.Map.Item.Value",
+                "itemIndex.$": "$$.Map.Item.Index",  # Orders entries in the archive
             },
         ).item_processor(
             tasks.LambdaInvoke(
@@ -1828,6 +1863,7 @@ class AssetsConstruct(Construct):
                         "type.$": "$.mapItem.type",
                         "options.$": "$.mapItem.options",
                         "zipPath.$": "$.zipPath",
+                        "itemIndex.$": "$.itemIndex",
                     }
                 ),
                 output_path="$.Payload",
@@ -1945,7 +1981,7 @@ class AssetsConstruct(Construct):
                             "partNumber.$": "$.part.partNumber",
                             "startByte.$": "$.part.startByte",
                             "endByte.$": "$.part.endByte",
-                            "localPath.$": "$.part.localPath",
+                            "layoutKey.$": "$.part.layoutKey",
                         },
                     }
                 ),
@@ -2520,6 +2556,7 @@ class AssetsConstruct(Construct):
             "VECTOR_BUCKET_NAME": props.s3_vector_bucket_name,  # For TwelveLabs plugin
             "S3_VECTOR_INDEX": props.s3_vector_index_name,
             "VECTOR_INDEX_NAME": props.s3_vector_index_name,  # For TwelveLabs plugin
+            "VECTOR_KEY_REGISTRY_TABLE_NAME": f"{config.resource_prefix}-vector-keys-{config.environment}",
             "SYSTEM_SETTINGS_TABLE_NAME": props.system_settings_table,
             "ASSET_EVENT_BUS_NAME": props.asset_events_bus.event_bus_name,
         }
@@ -2691,6 +2728,20 @@ class AssetsConstruct(Construct):
             )
         )
 
+        # Grant vector key registry access for processor Lambda
+        self._batch_delete_processor_lambda.function.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=[
+                    "dynamodb:Query",
+                    "dynamodb:GetItem",
+                    "dynamodb:BatchWriteItem",
+                ],
+                resources=[
+                    f"arn:aws:dynamodb:{Stack.of(self).region}:{Stack.of(self).account}:table/{config.resource_prefix}-vector-keys-{config.environment}"
+                ],
+            )
+        )
+
         # Grant KMS permissions for processor Lambda (for encrypted S3 objects)
         self._batch_delete_processor_lambda.function.add_to_role_policy(
             iam.PolicyStatement(
@@ -2711,18 +2762,13 @@ class AssetsConstruct(Construct):
 
     def _create_batch_delete_state_machine(self, props: AssetsProps):
         """Create Step Functions state machine for batch delete orchestration."""
-        # Create processor task
+        # Create processor task; each invocation receives a whole ItemBatcher
+        # batch ({"Items": [...], "BatchInput": {...}})
         process_deletion_task = tasks.LambdaInvoke(
             self,
             "ProcessAssetDeletion",
             lambda_function=self._batch_delete_processor_lambda.function,
-            payload=sfn.TaskInput.from_object(
-                {
-                    "jobId.$": "$.jobId",
-                    "assetId.$": "$.assetId",
-                    "userId.$": "$.userId",
-                }
-            ),
+            payload=sfn.TaskInput.from_json_path_at("$"),
             output_path="$.Payload",
         )
 
@@ -2736,6 +2782,8 @@ class AssetsConstruct(Construct):
 
         # Define Distributed Map for parallel processing
         # Use DISCARD to prevent hitting 256KB output limit with large batches
+        # Assets are handed to the processor in batches so S3, OpenSearch and
+        # DynamoDB deletions are grouped into bulk requests
         distributed_map = sfn.DistributedMap(
             self,
             "ProcessAssetsInParallel",
@@ -2743,11 +2791,16 @@ class AssetsConstruct(Construct):
             items_path="$.assetIds",
             result_path=sfn.JsonPath.DISCARD,
             item_selector={
-                "jobId.$": "$.jobId",
-                "userId.$": "$.userId",
                 "assetId.$": "$$.Map.Item.Value",
-                "totalAssets.$": "$.totalAssets",
             },
+            item_batcher=sfn.ItemBatcher(
+                max_items_per_batch=50,
+                batch_input={
+                    "jobId.$": "$.jobId",
+                    "userId.$": "$.userId",
+                    "totalAssets.$": "$.totalAssets",
+                },
+            ),
         )
         distributed_map.item_processor(process_deletion_task)
 
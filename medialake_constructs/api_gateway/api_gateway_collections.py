@@ -15,6 +15,7 @@ The module handles:
 - Lambda function configuration
 """
 
+import json
 from dataclasses import dataclass
 from typing import Optional
 
@@ -149,6 +150,18 @@ class CollectionsApi(Construct):
                 ),
                 projection_type=dynamodb.ProjectionType.ALL,
             ),
+            # GSI7: AssetMembershipGSI - Find every item row (full file, clips,
+            # legacy ITEM# rows) referencing an asset; used by deletion cleanup
+            dynamodb.GlobalSecondaryIndexPropsV2(
+                index_name="AssetMembershipGSI",
+                partition_key=dynamodb.Attribute(
+                    name="GSI7_PK", type=dynamodb.AttributeType.STRING
+                ),
+                sort_key=dynamodb.Attribute(
+                    name="GSI7_SK", type=dynamodb.AttributeType.STRING
+                ),
+                projection_type=dynamodb.ProjectionType.KEYS_ONLY,
+            ),
         ]
 
         self._collections_table = DynamoDB(
@@ -273,6 +286,7 @@ class CollectionsApi(Construct):
         # event is published to the internal application-service-events bus.
         # This Lambda removes the asset (full file + any clips) from every
         # collection that referenced it, preventing orphaned collection items.
+        # Events are buffered in SQS so bulk deletes are cleaned up in batches.
         asset_cleanup_lambda = Lambda(
             self,
             "CollectionsAssetCleanupLambda",
@@ -287,13 +301,41 @@ class CollectionsApi(Construct):
             ),
         )
 
-        # Cleanup Lambda scans the collections table by asset id and deletes
+        # Cleanup Lambda queries the AssetMembershipGSI by asset id and deletes
         # matching item rows.
         self._collections_table.table.grant_read_write_data(
             asset_cleanup_lambda.function
         )
 
-        # Route AssetDeleted events from the internal bus to the cleanup Lambda
+        # The membership backfill ({"action": "backfillMembershipIndex"}) hands
+        # off to itself; the ARN is built from the deterministic name to avoid
+        # a dependency cycle.
+        asset_cleanup_lambda.function.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=["lambda:InvokeFunction"],
+                resources=[
+                    f"arn:aws:lambda:{Stack.of(self).region}:{Stack.of(self).account}:"
+                    f"function:{config.resource_prefix}_"
+                    f"collections_asset_deleted_cleanup_{config.environment}"
+                ],
+            )
+        )
+
+        asset_cleanup_queue = SQSConstruct(
+            self,
+            "CollectionsAssetCleanupQueue",
+            props=SQSProps(
+                queue_name="collections-asset-cleanup",
+                # 5 min Lambda timeout + 1 min buffer
+                visibility_timeout=Duration.minutes(6),
+                encryption=False,  # Use SSE-SQS (AWS managed) for consistency
+                enforce_ssl=True,
+                max_receive_count=5,
+                removal_policy=RemovalPolicy.DESTROY,
+            ),
+        )
+
+        # Route AssetDeleted events from the internal bus to the cleanup queue
         events.Rule(
             self,
             "CollectionsAssetDeletedRule",
@@ -306,7 +348,48 @@ class CollectionsApi(Construct):
                 source=["medialake.assets"],
                 detail_type=["AssetDeleted"],
             ),
-            targets=[targets.LambdaFunction(asset_cleanup_lambda.function)],
+            targets=[targets.SqsQueue(asset_cleanup_queue.queue)],
+        )
+
+        # Up to 100 assets per invocation: the IN-list limit of the legacy
+        # fallback scan
+        asset_cleanup_lambda.function.add_event_source(
+            lambda_event_sources.SqsEventSource(
+                asset_cleanup_queue.queue,
+                batch_size=100,
+                max_batching_window=Duration.seconds(10),
+                report_batch_item_failures=True,
+            )
+        )
+
+        # Start the membership backfill on deploy. Until it writes its
+        # completion marker, cleanup batches fall back to a filtered scan for
+        # assets with no indexed rows. Invoked asynchronously: the backfill
+        # hands off to itself on large tables.
+        backfill_payload = json.dumps({"action": "backfillMembershipIndex"})
+        cr.AwsCustomResource(
+            self,
+            "CollectionsMembershipBackfill",
+            on_create=cr.AwsSdkCall(
+                service="Lambda",
+                action="invoke",
+                parameters={
+                    "FunctionName": asset_cleanup_lambda.function.function_name,
+                    "InvocationType": "Event",
+                    "Payload": backfill_payload,
+                },
+                physical_resource_id=cr.PhysicalResourceId.of(
+                    "CollectionsMembershipBackfill-AssetMembershipGSI"
+                ),
+            ),
+            policy=cr.AwsCustomResourcePolicy.from_statements(
+                [
+                    iam.PolicyStatement(
+                        actions=["lambda:InvokeFunction"],
+                        resources=[asset_cleanup_lambda.function.function_arn],
+                    )
+                ]
+            ),
         )
 
         # Grant Cognito permissions for /collections/users endpoint
@@ -65,6 +65,7 @@ class ConnectorsProps:
     asset_table_file_hash_index_arn: str
     asset_table_asset_id_index_arn: str
     asset_table_s3_path_index_arn: str
+    asset_table_file_hash_path_index_arn: str
     asset_sync_job_table: dynamodb.TableV2
     asset_sync_engine_lambda: lambda_.Function
     open_search_endpoint: str
@@ -581,6 +582,7 @@ class ConnectorsConstruct(Construct):
             "MEDIALAKE_ASSET_TABLE_FILE_HASH_INDEX": props.asset_table_file_hash_index_arn,
             "MEDIALAKE_ASSET_TABLE_ASSET_ID_INDEX": props.asset_table_asset_id_index_arn,
             "MEDIALAKE_ASSET_TABLE_S3_PATH_INDEX": props.asset_table_s3_path_index_arn,
+            "MEDIALAKE_ASSET_TABLE_FILE_HASH_PATH_INDEX": props.asset_table_file_hash_path_index_arn,
             "RESOURCE_PREFIX": config.resource_prefix,
             "RESOURCE_APPLICATION_TAG": config.resource_application_tag,
             "REGION": config.primary_region,
@@ -600,6 +602,10 @@ class ConnectorsConstruct(Construct):
             # S3 Vector Store configuration
             "VECTOR_BUCKET_NAME": props.s3_vector_bucket_name,
             "VECTOR_INDEX_NAME": props.s3_vector_index_name,
+            # Vector key registry — passed through to each S3 ingest Lambda so
+            # vector deletion can skip the index scan. Deterministic name,
+            # mirrors BaseInfrastructureStack; post_s3 derives the ARN.
+            "VECTOR_KEY_REGISTRY_TABLE_NAME": f"{config.resource_prefix}-vector-keys-{config.environment}",
             # SSM Parameter name for CloudFront domain (read at runtime by Lambda)
             # The Lambda will read this parameter to get the CORS origin dynamically
             "CLOUDFRONT_DOMAIN_SSM_PARAM": config.ssm_param(
@@ -64,6 +64,7 @@ class ApiGatewayPipelinesProps:
     get_pipelines_executions_lambda: lambda_.IFunction
     post_retry_pipelines_executions_lambda: lambda_.IFunction
     pipeline_groups_table: Optional[dynamodb.ITable] = None
+    pipeline_concurrency_table: Optional[dynamodb.ITable] = None
     system_settings_table_name: Optional[str] = None
     system_settings_table_arn: Optional[str] = None
     mediaconvert_queue_arn: Optional[str] = None
@@ -326,6 +327,20 @@ class ApiGatewayPipelinesConstruct(Construct):
                     if props.pipeline_groups_table is not None
                     else ""
                 ),
+                # Pipeline concurrency table — passed to each pipeline's trigger
+                # Lambda for distributed admission control. Left empty when the
+                # deployment has no concurrency table; triggers then fall back
+                # to counting RUNNING executions.
+                "PIPELINE_CONCURRENCY_TABLE_NAME": (
+                    props.pipeline_concurrency_table.table_name
+                    if props.pipeline_concurrency_table is not None
+                    else ""
+                ),
+                "PIPELINE_CONCURRENCY_TABLE_ARN": (
+                    props.pipeline_concurrency_table.table_arn
+                    if props.pipeline_concurrency_table is not None
+                    else ""
+                ),
                 "INTEGRATIONS_TABLE": props.integrations_table.table_arn,
                 "IAC_ASSETS_BUCKET": props.iac_assets_bucket.bucket.bucket_name,
                 "EXTERNAL_PAYLOAD_BUCKET": props.external_payload_bucket.bucket_name,
@@ -352,6 +367,11 @@ class ApiGatewayPipelinesConstruct(Construct):
                 "VECTOR_BUCKET_NAME": props.s3_vector_bucket_name,
                 "INDEX_NAME": props.s3_vector_index_name,
                 "VECTOR_DIMENSION": str(props.s3_vector_dimension),
+                # Vector key registry — the s3_vector_store node records every
+                # key it writes so asset deletion never has to list the index.
+                # Name is deterministic (mirrors BaseInfrastructureStack).
+                "VECTOR_KEY_REGISTRY_TABLE_NAME": f"{config.resource_prefix}-vector-keys-{config.environment}",
+                "VECTOR_KEY_REGISTRY_TABLE_ARN": f"arn:aws:dynamodb:{self.region}:{self.account_id}:table/{config.resource_prefix}-vector-keys-{config.environment}",
                 # Marengo 3.0 embeddings index - separate from media index for vector search
                 "ASSET_EMBEDDINGS_INDEX": "asset-embeddings",
                 "CLOUDFRONT_DOMAIN": props.cloudfront_domain,
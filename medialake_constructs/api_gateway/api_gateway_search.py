@@ -14,6 +14,7 @@ from constructs import Construct
 from config import config
 from constants import Lambda as LambdaConstants
 from medialake_constructs.api_gateway.api_gateway_utils import add_cors_options_method
+from medialake_constructs.shared_constructs.dynamodb import DynamoDB, DynamoDBProps
 from medialake_constructs.shared_constructs.lambda_base import Lambda, LambdaConfig
 from medialake_constructs.shared_constructs.lambda_layers import SearchLayer
 from medialake_constructs.shared_constructs.s3bucket import S3Bucket
@@ -63,6 +64,21 @@ class SearchConstruct(Construct):
 
         search_layer = SearchLayer(self, "SearchLayer")
 
+        # Query embeddings shared by every search container, so a later page
+        # served by another container is not embedded again. Entries expire
+        # through the ttl attribute (EMBEDDING_CACHE_TTL_SECONDS).
+        embedding_cache_table = DynamoDB(
+            self,
+            "EmbeddingCacheTable",
+            props=DynamoDBProps(
+                name=f"{config.resource_prefix}_search_embedding_cache_{config.environment}",
+                partition_key_name="cacheKey",
+                partition_key_type=dynamodb.AttributeType.STRING,
+                point_in_time_recovery=False,
+                ttl_attribute="ttl",
+            ),
+        )
+
         # Create connectors resource
         search_resource = props.api_resource.root.add_resource("search")
         # High-traffic search API with VPC and heavy compute needs
@@ -93,6 +109,7 @@ class SearchConstruct(Construct):
                     "SYSTEM_SETTINGS_TABLE_NAME": props.system_settings_table,
                     "S3_VECTOR_BUCKET_NAME": props.s3_vector_bucket_name,
                     "S3_VECTOR_INDEX_NAME": "media-vectors",
+                    "EMBEDDING_CACHE_TABLE_NAME": embedding_cache_table.table_name,
                     # CLOUDFRONT_DISTRIBUTION_DOMAIN removed to break circular dependency
                     # Lambda will fetch this from SSM parameter at runtime
                     # Bedrock inference profile: Auto-selected based on DynamoDB config (2.7 or 3.0)
@@ -158,6 +175,8 @@ class SearchConstruct(Construct):
             )
         )
 
+        embedding_cache_table.table.grant_read_write_data(search_get_lambda.function)
+
         # Grant read access to connector table for /search/connectors endpoint
         if props.connector_table:
             props.connector_table.grant_read_data(search_get_lambda.function)
@@ -354,10 +373,20 @@ class SearchConstruct(Construct):
         )
         apply_custom_authorization(search_connectors_get, props.authorizer)
 
+        # Create /search/facets resource so facet aggregations can be fetched
+        # once per query instead of being recomputed for every page
+        facets_resource = search_resource.add_resource("facets")
+        search_facets_get = facets_resource.add_method(
+            "GET",
+            apigateway.LambdaIntegration(search_integration_target),
+        )
+        apply_custom_authorization(search_facets_get, props.authorizer)
+
         # Explicit dependency: API Gateway methods must wait for the alias
         if search_get_lambda.function_alias:
             search_get.node.add_dependency(search_get_lambda.function_alias)
             search_connectors_get.node.add_dependency(search_get_lambda.function_alias)
+            search_facets_get.node.add_dependency(search_get_lambda.function_alias)
 
         # Add CORS support
 
@@ -461,6 +490,7 @@ class SearchConstruct(Construct):
 
         add_cors_options_method(search_resource)
         add_cors_options_method(connectors_resource)
+        add_cors_options_method(facets_resource)
         add_cors_options_method(fields_resource)
         add_cors_options_method(mapping_resource)
         add_cors_options_method(values_resource)
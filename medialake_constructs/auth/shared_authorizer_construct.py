@@ -8,6 +8,7 @@ from dataclasses import dataclass
 
 import aws_cdk as cdk
 from aws_cdk import CfnOutput, Duration
+from aws_cdk import aws_dynamodb as dynamodb
 from aws_cdk import aws_events as events
 from aws_cdk import aws_events_targets as targets
 from aws_cdk import aws_iam as iam
@@ -16,6 +17,7 @@ from constructs import Construct
 
 from config import config
 from constants import Lambda as LambdaConstants
+from medialake_constructs.shared_constructs.dynamodb import DynamoDB, DynamoDBProps
 from medialake_constructs.shared_constructs.lambda_base import Lambda, LambdaConfig
 
 
@@ -44,12 +46,28 @@ class SharedAuthorizerConstruct(Construct):
     ):
         super().__init__(scope, id, **kwargs)
 
+        # SHA-256 digests of API-key secrets shared by every authorizer
+        # container, so scale-out cold starts do not all call Secrets Manager.
+        # Entries expire through the ttl attribute (SECRET_DIGEST_TTL_SECONDS).
+        self._authorizer_cache_table = DynamoDB(
+            self,
+            "AuthorizerCacheTable",
+            props=DynamoDBProps(
+                name=f"{config.resource_prefix}_authorizer_cache_{config.environment}",
+                partition_key_name="cacheKey",
+                partition_key_type=dynamodb.AttributeType.STRING,
+                point_in_time_recovery=False,
+                ttl_attribute="ttl",
+            ),
+        )
+
         # Environment variables for the authorizer lambda
         common_env_vars = {
             "AUTH_TABLE_NAME": props.auth_table_name,
             "AVP_POLICY_STORE_ID": props.avp_policy_store_id,
             "COGNITO_USER_POOL_ID": props.cognito_user_pool_id,
             "API_KEYS_TABLE_NAME": props.api_keys_table_name,
+            "AUTHORIZER_CACHE_TABLE_NAME": self._authorizer_cache_table.table_name,
             "DEBUG_MODE": "False",  # Temporarily enabled for debugging user creation issue
             "NAMESPACE": "MediaLake",
             "TOKEN_TYPE": "identityToken",
@@ -94,6 +112,10 @@ class SharedAuthorizerConstruct(Construct):
             )
         )
 
+        self._authorizer_cache_table.table.grant_read_write_data(
+            self._authorizer_lambda.function
+        )
+
         # Grant permissions to access Secrets Manager for API key validation
         self._authorizer_lambda.function.add_to_role_policy(
             iam.PolicyStatement(
@@ -51,6 +51,7 @@ class ApiGatewayStackProps:
     asset_table_file_hash_index_arn: str
     asset_table_asset_id_index_arn: str
     asset_table_s3_path_index_arn: str
+    asset_table_file_hash_path_index_arn: str
     pipelines_event_bus: events.EventBus
     application_service_events_internal_event_bus: events.IEventBus
     vpc: ec2.Vpc
@@ -220,6 +221,7 @@ class ApiGatewayStack(cdk.NestedStack):
                 asset_table_file_hash_index_arn=props.asset_table_file_hash_index_arn,
                 asset_table_asset_id_index_arn=props.asset_table_asset_id_index_arn,
                 asset_table_s3_path_index_arn=props.asset_table_s3_path_index_arn,
+                asset_table_file_hash_path_index_arn=props.asset_table_file_hash_path_index_arn,
                 iac_assets_bucket=props.iac_assets_bucket,
                 media_assets_bucket=props.media_assets_bucket,  # Added for cross-bucket deletion
                 api_resource=self._rest_api,
@@ -5,6 +5,7 @@ from aws_cdk import aws_dynamodb as dynamodb
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_events as events
 from aws_cdk import aws_events_targets as targets
+from aws_cdk import aws_iam as iam
 from aws_cdk import aws_s3 as s3
 from constructs import Construct
 
@@ -17,6 +18,7 @@ from medialake_constructs.asset_table_stream import (
 )
 from medialake_constructs.shared_constructs.dynamodb import DynamoDB, DynamoDBProps
 from medialake_constructs.shared_constructs.eventbridge import EventBus, EventBusConfig
+from medialake_constructs.shared_constructs.lambda_base import Lambda, LambdaConfig
 from medialake_constructs.shared_constructs.opensearch_managed_cluster import (
     OpenSearchCluster,
     OpenSearchClusterProps,
@@ -315,6 +317,71 @@ class BaseInfrastructureStack(Stack):
             ),
         )
 
+        # Vector key registry — maps each asset to the S3 Vectors keys stored
+        # for it (PK=inventoryId, SK={index}#{key}) so deletion can address
+        # vectors directly instead of listing the whole index. Written by the
+        # s3_vector_store node; consumers reference the deterministic name.
+        self._vector_key_registry_table = dynamodb.Table(
+            self,
+            "VectorKeyRegistryTable",
+            table_name=f"{config.resource_prefix}-vector-keys-{config.environment}",
+            partition_key=dynamodb.Attribute(
+                name="PK", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            point_in_time_recovery=True,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+        # One-off backfill of vectors stored before the registry existed
+        self._vector_key_registry_backfill_lambda = Lambda(
+            self,
+            "VectorKeyRegistryBackfill",
+            config=LambdaConfig(
+                name="vector_key_registry_backfill",
+                entry="lambdas/back_end/vector_key_registry_backfill",
+                timeout_minutes=15,
+                memory_size=512,
+                environment_variables={
+                    "VECTOR_BUCKET_NAME": self._s3_vector_cluster.bucket_name,
+                    "VECTOR_INDEX_NAME": s3_vector_index_name,
+                    "VECTOR_KEY_REGISTRY_TABLE_NAME": self._vector_key_registry_table.table_name,
+                },
+            ),
+        )
+        self._vector_key_registry_table.grant_read_write_data(
+            self._vector_key_registry_backfill_lambda.function
+        )
+        self._vector_key_registry_backfill_lambda.function.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=["s3vectors:ListVectors", "s3vectors:GetVectors"],
+                resources=[
+                    self._s3_vector_cluster.bucket_arn,
+                    f"{self._s3_vector_cluster.bucket_arn}/*",
+                ],
+            )
+        )
+        # Workers re-invoke the function to fan out segments and hand off
+        # continuation tokens. The ARN is built from the deterministic name;
+        # referencing the function itself would create a dependency cycle.
+        self._vector_key_registry_backfill_lambda.function.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=["lambda:InvokeFunction"],
+                resources=[
+                    f"arn:aws:lambda:{region}:{self.account}:function:"
+                    f"{config.resource_prefix}_vector_key_registry_backfill_"
+                    f"{config.environment}"
+                ],
+            )
+        )
+        CfnOutput(
+            self,
+            "VectorKeyRegistryBackfillFunctionName",
+            value=self._vector_key_registry_backfill_lambda.function.function_name,
+            description="Invoke once with {} to backfill the vector key registry",
+        )
+
         # Create new media asset bucket
         # Build CORS allowed origins for the media assets bucket
         media_assets_cors_origins = [
@@ -376,6 +443,12 @@ class BaseInfrastructureStack(Stack):
                         prefix="temp/subClips/",
                         expiration=Duration.days(7),
                     ),
+                    s3.LifecycleRule(
+                        id="ExpireBedrockResultCache",
+                        enabled=True,
+                        prefix="bedrock-cache/",
+                        expiration=Duration.days(30),
+                    ),
                     s3.LifecycleRule(
                         enabled=True,
                         transitions=[
@@ -510,6 +583,21 @@ class BaseInfrastructureStack(Stack):
             projection_type=dynamodb.ProjectionType.ALL,
         )
 
+        # Duplicate detection at ingest: "same content at this path?" is one
+        # fully keyed Query and "same content anywhere?" a Limit=1 Query. Keys
+        # only, so the lookups read a few bytes per match instead of whole
+        # asset records.
+        self._asset_table.add_global_secondary_index(
+            index_name="FileHashPathIndex",
+            partition_key=dynamodb.Attribute(
+                name="FileHash", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="StoragePath", type=dynamodb.AttributeType.STRING
+            ),
+            projection_type=dynamodb.ProjectionType.KEYS_ONLY,
+        )
+
         # Upload directives table — backs the overflow path for collection metadata
         # that exceeds the S3 user-metadata budget (§6.5). Keyed by
         # UPLOADDIR#<bucket>#<key>, auto-expired via DynamoDB TTL on `expiresAt`.
@@ -867,6 +955,23 @@ class BaseInfrastructureStack(Stack):
         """
         return f"{self._asset_table.table_arn}/index/S3PathIndex"
 
+    @property
+    def asset_table_file_hash_path_index_name(self) -> str:
+        """
+        Returns the name of the FileHash + StoragePath GSI on the asset table.
+
+        Returns:
+            str: Name of the FileHashPath global secondary index
+        """
+        return "FileHashPathIndex"
+
+    @property
+    def asset_table_file_hash_path_index_arn(self) -> str:
+        """
+        Returns the ARN of the FileHash + StoragePath GSI on the asset table.
+        """
+        return f"{self._asset_table.table_arn}/index/FileHashPathIndex"
+
     @property
     def collection_dashboards_url(self) -> str:
         """
@@ -1013,6 +1118,16 @@ class BaseInfrastructureStack(Stack):
         indexes = self._s3_vector_cluster.indexes
         return indexes[0] if indexes else "media-vectors"
 
+    @property
+    def vector_key_registry_table(self) -> dynamodb.Table:
+        """
+        Returns the vector key registry DynamoDB table.
+
+        Returns:
+            dynamodb.Table: Table mapping assets to their S3 Vectors keys
+        """
+        return self._vector_key_registry_table
+
     @property
     def upload_directives_table(self) -> dynamodb.Table:
         """
@@ -128,6 +128,7 @@ class PipelineStack(cdk.NestedStack):
                 get_pipelines_executions_lambda=self._pipelines_executions_stack.get_pipelines_executions_lambda,
                 post_retry_pipelines_executions_lambda=self._pipelines_executions_stack.post_retry_pipelines_executions_lambda,
                 pipeline_groups_table=self._pipelines_executions_stack.pipeline_groups_table,
+                pipeline_concurrency_table=self._pipelines_executions_stack.pipeline_concurrency_table,
                 # S3 Vector configuration
                 s3_vector_bucket_name=props.s3_vector_bucket_name,
                 s3_vector_index_name=props.s3_vector_index_name,
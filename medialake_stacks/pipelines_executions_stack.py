@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from aws_cdk import Duration, RemovalPolicy, Stack
+from aws_cdk import CfnOutput, Duration, RemovalPolicy, Stack
 from aws_cdk import aws_dynamodb as dynamodb
 from aws_cdk import aws_events as events
 from aws_cdk import aws_events_targets as targets
@@ -64,6 +64,43 @@ class PipelinesExecutionsStack(Stack):
             targets=[targets.EventBus(self._pipelines_executions_event_bus.event_bus)],
         )
 
+        # A new table is created with all of these. CloudFormation adds at
+        # most one GSI per update to an existing table, so an upgraded table
+        # gains them over several deploys: only the first
+        # pipeline_executions_index_count (default all five) are declared.
+        # The order matches EXECUTIONS_TABLE_INDEXES in
+        # pipeline_execution_index.py, and the Lambdas below fall back to
+        # scans for indexes not deployed yet.
+        executions_indexes = [
+            # Parent lookup for the event processor; only the fields a
+            # child execution inherits are projected
+            self._executions_index(
+                "traceId-startTime-index",
+                "pipeline_trace_id",
+                "start_time",
+                non_key_attributes=[
+                    "inventory_id",
+                    "dsa_type",
+                    "object_key_name",
+                ],
+            ),
+            self._executions_index(
+                "startMonth-startTime-index", "start_month", "start_time"
+            ),
+            self._executions_index("status-startTime-index", "status", "start_time"),
+            self._executions_index(
+                "pipelineName-startTime-index", "pipeline_name", "start_time"
+            ),
+            self._executions_index(
+                "startMonth-objectKey-index",
+                "start_month",
+                "object_key_name_lower",
+            ),
+        ][: config.pipeline_executions_index_count]
+        executions_index_names = ",".join(
+            index.index_name for index in executions_indexes
+        )
+
         dynamodb_table = DynamoDB(
             self,
             "PipelinesExecutionsTable",
@@ -73,10 +110,49 @@ class PipelinesExecutionsStack(Stack):
                 partition_key_type=dynamodb.AttributeType.STRING,
                 sort_key_name="start_time",
                 sort_key_type=dynamodb.AttributeType.NUMBER,
+                global_secondary_indexes=executions_indexes,
             ),
         )
         self._pipelnes_executions_table = dynamodb_table.table
 
+        # One-off backfill of the derived index keys (start_month,
+        # object_key_name_lower) on executions recorded before they existed
+        self._executions_index_backfill_lambda = Lambda(
+            self,
+            "PipelineExecutionsIndexBackfill",
+            config=LambdaConfig(
+                name="pipeline_executions_index_backfill",
+                entry="lambdas/back_end/pipeline_executions_index_backfill",
+                timeout_minutes=15,
+                snap_start=False,
+                environment_variables={
+                    "PIPELINES_EXECUTIONS_TABLE_NAME": self._pipelnes_executions_table.table_name,
+                },
+            ),
+        )
+        self._pipelnes_executions_table.grant_read_write_data(
+            self._executions_index_backfill_lambda.function
+        )
+        # Workers re-invoke the function to fan out segments and hand off
+        # continuation keys. The ARN is built from the deterministic name;
+        # referencing the function itself would create a dependency cycle.
+        self._executions_index_backfill_lambda.function.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=["lambda:InvokeFunction"],
+                resources=[
+                    f"arn:aws:lambda:{self.region}:{self.account}:function:"
+                    f"{config.resource_prefix}_pipeline_executions_index_backfill_"
+                    f"{config.environment}"
+                ],
+            )
+        )
+        CfnOutput(
+            self,
+            "PipelineExecutionsIndexBackfillFunctionName",
+            value=self._executions_index_backfill_lambda.function.function_name,
+            description="Invoke once with {} to backfill the executions list indexes",
+        )
+
         # ────────────────────────────────────────────────────────────────
         # Pipeline execution groups table
         #
@@ -131,6 +207,31 @@ class PipelinesExecutionsStack(Stack):
         )
         self._pipeline_groups_table = groups_dynamodb_table.table
 
+        # ────────────────────────────────────────────────────────────────
+        # Pipeline concurrency table
+        #
+        # Distributed admission control for pipeline trigger Lambdas. Each
+        # pipeline state machine has a counting semaphore:
+        #   PK=SEM#{stateMachineArn} SK=COUNT            — inFlight counter
+        #   PK=SEM#{stateMachineArn} SK=LEASE#{execId}   — one item per
+        #                                                  admitted execution
+        #
+        # Triggers acquire a slot before starting an execution; the event
+        # processor below releases it on the execution's terminal event.
+        # ────────────────────────────────────────────────────────────────
+        concurrency_dynamodb_table = DynamoDB(
+            self,
+            "PipelineConcurrencyTable",
+            props=DynamoDBProps(
+                name=f"{config.resource_prefix}-pipelines-concurrency-{config.environment}",
+                partition_key_name="PK",
+                partition_key_type=dynamodb.AttributeType.STRING,
+                sort_key_name="SK",
+                sort_key_type=dynamodb.AttributeType.STRING,
+            ),
+        )
+        self._pipeline_concurrency_table = concurrency_dynamodb_table.table
+
         self._pipeline_executions_event_processor = Lambda(
             self,
             "PipelinesExecutionsEventProcessor",
@@ -140,7 +241,9 @@ class PipelinesExecutionsStack(Stack):
                 entry="lambdas/back_end/pipelines_executions_event_processor",
                 environment_variables={
                     "PIPELINES_EXECUTIONS_TABLE_NAME": self._pipelnes_executions_table.table_arn,
+                    "EXECUTIONS_TABLE_INDEXES": executions_index_names,
                     "PIPELINE_GROUPS_TABLE_NAME": self._pipeline_groups_table.table_name,
+                    "PIPELINE_CONCURRENCY_TABLE_NAME": self._pipeline_concurrency_table.table_name,
                 },
             ),
         )
@@ -149,6 +252,10 @@ class PipelinesExecutionsStack(Stack):
             self._pipeline_executions_event_processor.function
         )
 
+        self._pipeline_concurrency_table.grant_read_write_data(
+            self._pipeline_executions_event_processor.function
+        )
+
         self._pipeline_groups_table.grant_read_write_data(
             self._pipeline_executions_event_processor.function
         )
@@ -345,6 +452,7 @@ class PipelinesExecutionsStack(Stack):
                 environment_variables={
                     # "X_ORIGIN_VERIFY_SECRET_ARN": props.x_origin_verify_secret.secret_arn,
                     "PIPELINES_EXECUTIONS_TABLE_NAME": self._pipelnes_executions_table.table_arn,
+                    "EXECUTIONS_TABLE_INDEXES": executions_index_names,
                 },
             ),
         )
@@ -401,6 +509,33 @@ class PipelinesExecutionsStack(Stack):
             )
         )
 
+    @staticmethod
+    def _executions_index(
+        index_name: str,
+        partition_key: str,
+        sort_key: str,
+        non_key_attributes: list[str] | None = None,
+    ) -> dynamodb.GlobalSecondaryIndexPropsV2:
+        """GSI on the executions table; see pipeline_execution_index.py"""
+        sort_key_type = (
+            dynamodb.AttributeType.NUMBER
+            if sort_key == "start_time"
+            else dynamodb.AttributeType.STRING
+        )
+        return dynamodb.GlobalSecondaryIndexPropsV2(
+            index_name=index_name,
+            partition_key=dynamodb.Attribute(
+                name=partition_key, type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(name=sort_key, type=sort_key_type),
+            projection_type=(
+                dynamodb.ProjectionType.INCLUDE
+                if non_key_attributes
+                else dynamodb.ProjectionType.ALL
+            ),
+            non_key_attributes=non_key_attributes,
+        )
+
     @property
     def pipelnes_executions_table(self) -> dynamodb.TableV2:
         return self._pipelnes_executions_table
@@ -409,6 +544,10 @@ class PipelinesExecutionsStack(Stack):
     def pipeline_groups_table(self) -> dynamodb.ITable:
         return self._pipeline_groups_table
 
+    @property
+    def pipeline_concurrency_table(self) -> dynamodb.ITable:
+        return self._pipeline_concurrency_table
+
     @property
     def pipelines_executions_event_bus(self) -> events.EventBus:
         return self._pipelines_executions_event_bus.event_bus
@@ -188,6 +188,7 @@ class StorageConnectorsStack(cdk.NestedStack):
                     "COLLECTIONS_TABLE_NAME": f"{config.resource_prefix}_collections_{config.environment}",
                     "UPLOAD_DIRECTIVES_TABLE_NAME": f"{config.resource_prefix}-upload-directives-{config.environment}",
                     "USER_TABLE_NAME": f"{config.resource_prefix}-user-{config.environment}",
+                    "VECTOR_KEY_REGISTRY_TABLE_NAME": f"{config.resource_prefix}-vector-keys-{config.environment}",
                 },
             ),
         )
@@ -226,6 +227,10 @@ class StorageConnectorsStack(cdk.NestedStack):
             f"arn:aws:dynamodb:{_region}:{_account}:table/"
             f"{config.resource_prefix}-user-{config.environment}"
         )
+        _vector_key_registry_table_arn = (
+            f"arn:aws:dynamodb:{_region}:{_account}:table/"
+            f"{config.resource_prefix}-vector-keys-{config.environment}"
+        )
         # Collections table: read for existence/permission checks, write
         # idempotent membership rows.
         self._ingest_lambda.function.add_to_role_policy(
@@ -247,6 +252,17 @@ class StorageConnectorsStack(cdk.NestedStack):
                 resources=[_upload_directives_table_arn],
             )
         )
+        # Vector key registry: resolve and forget vector keys on deletion.
+        self._ingest_lambda.function.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=[
+                    "dynamodb:Query",
+                    "dynamodb:GetItem",
+                    "dynamodb:BatchWriteItem",
+                ],
+                resources=[_vector_key_registry_table_arn],
+            )
+        )
         # User table: WRITE recency rows via record_collection_activity.
         self._ingest_lambda.function.add_to_role_policy(
             iam.PolicyStatement(
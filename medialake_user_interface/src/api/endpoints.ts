@@ -19,6 +19,7 @@ export const API_ENDPOINTS = {
     BASE: (id: string) => `/pipelines/executions/${id}/retry`,
   },
   SEARCH: "/search",
+  SEARCH_FACETS: "/search/facets",
   SEARCH_FIELDS_MAPPING: "/search/fields/mapping",
   SEARCH_FIELDS_VALUES: "/search/fields/values",
   SEARCH_CONNECTORS: "/search/connectors",
@@ -63,20 +63,33 @@ export interface SearchError extends Error {
   apiResponse?: SearchResponseType;
 }
 
-export const useSearch = (query: string, params?: SearchParams) => {
-  const page = params?.page || 1;
-  const pageSize = params?.pageSize || 20;
-  const isSemantic = params?.isSemantic ?? false;
-  const searchModes = params?.searchModes || ["visual"];
-  const fields = params?.fields || [];
-  const sortBy = params?.sortBy;
-  const sortDirection = params?.sortDirection || "desc";
+interface SearchFacetsResponseType {
+  status: string;
+  message: string;
+  data: {
+    searchMetadata: {
+      totalResults: number;
+      facets: Record<string, FieldAggregation> | null;
+      facetsInfo?: { limited: boolean } | null;
+    };
+  } | null;
+}
 
-  // Construct the sort parameter (e.g., "-createdAt" for descending)
-  const sort = sortBy ? `${sortDirection === "desc" ? "-" : ""}${sortBy}` : undefined;
+type FacetParams = Pick<
+  SearchParams,
+  | "type"
+  | "extension"
+  | "LargerThan"
+  | "asset_size_lte"
+  | "asset_size_gte"
+  | "ingested_date_lte"
+  | "ingested_date_gte"
+  | "filename"
+  | "customMetadataFilters"
+>;
 
-  // Extract facet parameters from params
-  const facetParams = params
+const getFacetParams = (params?: SearchParams): FacetParams | undefined =>
+  params
     ? {
         type: params.type,
         extension: params.extension,
@@ -90,6 +103,39 @@ export const useSearch = (query: string, params?: SearchParams) => {
       }
     : undefined;
 
+const appendFacetParams = (queryParams: URLSearchParams, params?: FacetParams) => {
+  if (params?.type) queryParams.append("type", params.type);
+  if (params?.extension) queryParams.append("extension", params.extension);
+  if (params?.LargerThan) queryParams.append("LargerThan", params.LargerThan.toString());
+  if (params?.asset_size_lte)
+    queryParams.append("asset_size_lte", params.asset_size_lte.toString());
+  if (params?.asset_size_gte)
+    queryParams.append("asset_size_gte", params.asset_size_gte.toString());
+  if (params?.ingested_date_lte) queryParams.append("ingested_date_lte", params.ingested_date_lte);
+  if (params?.ingested_date_gte) queryParams.append("ingested_date_gte", params.ingested_date_gte);
+  if (params?.filename) queryParams.append("filename", params.filename);
+
+  // Add custom metadata filters as JSON
+  if (params?.customMetadataFilters && params.customMetadataFilters.length > 0) {
+    queryParams.append("filters", JSON.stringify(params.customMetadataFilters));
+  }
+};
+
+export const useSearch = (query: string, params?: SearchParams) => {
+  const page = params?.page || 1;
+  const pageSize = params?.pageSize || 20;
+  const isSemantic = params?.isSemantic ?? false;
+  const searchModes = params?.searchModes || ["visual"];
+  const fields = params?.fields || [];
+  const sortBy = params?.sortBy;
+  const sortDirection = params?.sortDirection || "desc";
+
+  // Construct the sort parameter (e.g., "-createdAt" for descending)
+  const sort = sortBy ? `${sortDirection === "desc" ? "-" : ""}${sortBy}` : undefined;
+
+  // Extract facet parameters from params
+  const facetParams = getFacetParams(params);
+
   return useQuery<SearchResponseType, SearchError>({
     queryKey: QUERY_KEYS.SEARCH.list(
       query,
@@ -115,27 +161,14 @@ export const useSearch = (query: string, params?: SearchParams) => {
           queryParams.append("searchModality", searchModes.join(","));
         }
 
+        // Keyword facets are fetched once per query by useSearchFacets
+        if (!isSemantic) queryParams.append("facets", "false");
+
         // Add sort parameter if specified
         if (sort) queryParams.append("sort", sort);
 
         // Add facet parameters if they exist
-        if (params?.type) queryParams.append("type", params.type);
-        if (params?.extension) queryParams.append("extension", params.extension);
-        if (params?.LargerThan) queryParams.append("LargerThan", params.LargerThan.toString());
-        if (params?.asset_size_lte)
-          queryParams.append("asset_size_lte", params.asset_size_lte.toString());
-        if (params?.asset_size_gte)
-          queryParams.append("asset_size_gte", params.asset_size_gte.toString());
-        if (params?.ingested_date_lte)
-          queryParams.append("ingested_date_lte", params.ingested_date_lte);
-        if (params?.ingested_date_gte)
-          queryParams.append("ingested_date_gte", params.ingested_date_gte);
-        if (params?.filename) queryParams.append("filename", params.filename);
-
-        // Add custom metadata filters as JSON
-        if (params?.customMetadataFilters && params.customMetadataFilters.length > 0) {
-          queryParams.append("filters", JSON.stringify(params.customMetadataFilters));
-        }
+        appendFacetParams(queryParams, facetParams);
 
         // Add fields to the query parameters
         if (params?.fields && params.fields.length > 0) {
@@ -191,3 +224,43 @@ export const useSearch = (query: string, params?: SearchParams) => {
     refetchOnReconnect: false,
   });
 };
+
+/**
+ * Facet counts for a keyword query. Page requests from useSearch skip
+ * aggregations, so facets are fetched here once per query and filter set and
+ * reused across page turns and sort changes.
+ */
+export const useSearchFacets = (
+  query: string,
+  params?: SearchParams,
+  options?: { enabled?: boolean }
+) => {
+  const facetParams = getFacetParams(params);
+
+  return useQuery<SearchFacetsResponseType, SearchError>({
+    queryKey: QUERY_KEYS.SEARCH.facets(query, facetParams),
+    queryFn: async ({ signal }) => {
+      const queryParams = new URLSearchParams();
+      queryParams.append("q", query);
+      appendFacetParams(queryParams, facetParams);
+
+      const response = await apiClient.get<SearchFacetsResponseType>(
+        `${API_ENDPOINTS.SEARCH_FACETS}?${queryParams.toString()}`,
+        { signal }
+      );
+
+      if (response.data?.status && !response.data.status.startsWith("2")) {
+        const error = new Error(response.data.message || "Facet request failed") as SearchError;
+        throw error;
+      }
+
+      return response.data;
+    },
+    enabled: (options?.enabled ?? true) && !!query,
+    placeholderData: keepPreviousData,
+    staleTime: 1000 * 60 * 5, // Facets only change as assets are ingested
+    gcTime: 1000 * 60 * 10,
+    refetchOnWindowFocus: false,
+    refetchOnReconnect: false,
+  });
+};
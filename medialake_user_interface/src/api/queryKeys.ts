@@ -84,6 +84,8 @@ export const QUERY_KEYS = {
         ...QUERY_KEYS.SEARCH.lists(),
         { query, page, pageSize, isSemantic, fields, facetParams, sort, searchModes },
       ] as const,
+    facets: (query: string, facetParams?: Record<string, any>) =>
+      [...QUERY_KEYS.SEARCH.all, "facets", { query, facetParams }] as const,
     fields: () => [...QUERY_KEYS.SEARCH.all, "fields"] as const,
     fieldValues: (fieldNames: string[]) =>
       [...QUERY_KEYS.SEARCH.all, "fieldValues", [...fieldNames].sort()] as const,
@@ -28,6 +28,7 @@ export interface PipelineExecutionsSearchMetadata {
   totalResults: number;
   pageSize: number;
   nextToken?: string;
+  hasMore?: boolean;
 }
 
 export interface PipelineExecutionsResponse {
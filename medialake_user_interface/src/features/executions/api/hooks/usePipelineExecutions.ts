@@ -30,6 +30,9 @@ export const usePipelineExecutions = (
         if (filters?.status) {
           params.status = filters.status;
         }
+        if (filters?.pipeline_name) {
+          params.pipelineName = filters.pipeline_name;
+        }
         if (filters?.startDate) {
           params.startDate = filters.startDate;
         }
@@ -37,6 +37,7 @@ export interface PipelineExecution {
 
 export interface PipelineExecutionFilters {
   status?: string;
+  pipeline_name?: string;
   startDate?: string;
   endDate?: string;
   sortBy?: string;
@@ -48,6 +49,7 @@ export interface PipelineExecutionsSearchMetadata {
   totalResults: number;
   pageSize: number;
   nextToken?: string;
+  hasMore?: boolean;
 }
 
 export interface PipelineExecutionsResponse {
@@ -23,7 +23,7 @@ import SearchFilters from "../components/search/SearchFilters";
 import MasterResultsView from "../components/search/MasterResultsView";
 import NoResultsFound from "../components/search/NoResultsFound";
 import { zIndexTokens } from "@/theme/tokens";
-import { useSearch } from "../api/hooks/useSearch";
+import { useSearch, useSearchFacets } from "../api/hooks/useSearch";
 import { useAssetOperations } from "@/hooks/useAssetOperations";
 import { type ImageItem, type VideoItem, type AudioItem } from "@/types/search/searchResults";
 import { type CellContext } from "@tanstack/react-table";
@@ -201,6 +201,12 @@ const SearchPage: React.FC = () => {
     ...facetFilters,
   });
 
+  // Keyword pages are fetched without aggregations; facets come from a
+  // separate request that is shared by every page of the same query
+  const { data: facetsData } = useSearchFacets(currentQuery, facetFilters, {
+    enabled: !currentSemantic,
+  });
+
   // Detect when the search mode (keyword ↔ semantic) has changed.
   // During the transition, keepPreviousData shows stale results from the
   // old mode which causes a visual flash (keyword results with semantic UI
@@ -223,16 +229,23 @@ const SearchPage: React.FC = () => {
   const prevFacetsRef = useRef<any>(null);
   const prevFacetsInfoRef = useRef<any>(null);
   const { setAggregations, setFacetsInfo } = useSearchUIActions();
+  const facetsMetadata = currentSemantic ? undefined : facetsData?.data?.searchMetadata;
+  const facets = currentSemantic ? searchMetadata?.facets : facetsMetadata?.facets;
+  const facetsInfo = currentSemantic ? searchData?.facetsInfo : facetsMetadata?.facetsInfo;
+  // Keyword pages count hits only up to the backend's track_total_hits cap;
+  // the facets response carries the exact total (0 if facets failed)
+  const totalResults =
+    searchMetadata && Math.max(searchMetadata.totalResults || 0, facetsMetadata?.totalResults || 0);
   useEffect(() => {
-    if (searchMetadata?.facets && searchMetadata.facets !== prevFacetsRef.current) {
-      prevFacetsRef.current = searchMetadata.facets;
-      setAggregations(searchMetadata.facets);
+    if (facets && facets !== prevFacetsRef.current) {
+      prevFacetsRef.current = facets;
+      setAggregations(facets);
     }
-    if (searchData?.facetsInfo && searchData.facetsInfo !== prevFacetsInfoRef.current) {
-      prevFacetsInfoRef.current = searchData.facetsInfo;
-      setFacetsInfo(searchData.facetsInfo);
+    if (facetsInfo && facetsInfo !== prevFacetsInfoRef.current) {
+      prevFacetsInfoRef.current = facetsInfo;
+      setFacetsInfo(facetsInfo);
     }
-  }, [searchMetadata?.facets, searchData?.facetsInfo, setAggregations, setFacetsInfo]);
+  }, [facets, facetsInfo, setAggregations, setFacetsInfo]);
 
   // Store search results in sessionStorage for access by other components
   useEffect(() => {
@@ -654,7 +667,7 @@ const SearchPage: React.FC = () => {
               minHeight: 0,
             }}
           >
-            {searchMetadata?.totalResults === 0 && currentQuery && (
+            {totalResults === 0 && currentQuery && (
               <NoResultsFound query={currentQuery} />
             )}
 
@@ -662,7 +675,7 @@ const SearchPage: React.FC = () => {
               <MasterResultsView
                 results={error ? [] : filteredResults}
                 searchMetadata={{
-                  totalResults: error ? 0 : searchMetadata?.totalResults || 0,
+                  totalResults: error ? 0 : totalResults || 0,
                   page: currentPage,
                   pageSize: pageSize,
                 }}